@@ -18,7 +18,9 @@ Lifecycle:
 * First :meth:`_execute_via_runtime` call hits the runtime.
 * :meth:`rotate_session` drops the runtime's accumulated scope (used
   between beads) — ``runtime.reset()`` when no session was opened, or a
-  close-and-reopen of the session otherwise.
+  close-and-reopen of the session otherwise. :meth:`defer_rotation`
+  marks the same rotation to run at the start of the agent's next send
+  instead, so an agent that sits a bead out never pays for it.
 * :meth:`close` tears down the session (if any) then the runtime.
 
 Async context-manager support (``async with Agent(...)``) calls
@@ -63,8 +65,10 @@ from airframe.protocol import AgentRuntime
 from pydantic import BaseModel, ValidationError
 
 from maverick.logging import get_logger
+from maverick.prompt_cache import PromptLayout
 
 if TYPE_CHECKING:
+    from airframe.cache import CacheConfig
     from airframe.protocol import AgentSession, RuntimeResult
 
     from maverick.protection.policy import PermissionGate, ProtectionPolicy
@@ -154,6 +158,8 @@ class Agent:
         self._baseline_manifest = baseline_manifest
         self._permission_gate: PermissionGate | None = None
         self._session: AgentSession | None = None
+        # Set by :meth:`defer_rotation`; the next send rotates first.
+        self._rotation_pending = False
 
     # ------------------------------------------------------------------
     # Public lifecycle
@@ -182,6 +188,7 @@ class Agent:
         swallows per-agent teardown errors, so a leak here would be
         completely silent.
         """
+        self._rotation_pending = False
         try:
             if self._session is not None:
                 await self._close_session_only()
@@ -215,8 +222,9 @@ class Agent:
         ``self._protection_policy`` fresh on every send) immediately.
         Layer 1 (the pre-write `PermissionGate`) is cached on the open
         session and is only rebuilt the next time a session is opened —
-        callers that need Layer 1 re-rooted immediately must follow this
-        with :meth:`rotate_session`.
+        callers that need Layer 1 re-rooted must follow this with
+        :meth:`rotate_session` (now) or :meth:`defer_rotation` (before
+        the next send).
 
         Args:
             policy: The new policy, or ``None`` to disable protection
@@ -244,12 +252,41 @@ class Agent:
         :meth:`rebind_protection` cleared it since the last open, in
         which case a fresh gate is built against the rebound policy.
         """
+        self._reset_bead_state()
+        await self._rotate_runtime()
+
+    async def _rotate_runtime(self) -> None:
+        """Reset the runtime (or close and reopen the session) only.
+
+        Leaves per-bead bookkeeping alone: a deferred rotation runs after
+        the domain method has already updated it for the current send.
+        """
+        self._rotation_pending = False
         if self._session is None:
             await self._runtime.reset()
             return
         await self._close_session_only()
         await self._open_session()
 
+    def defer_rotation(self) -> None:
+        """Mark the session for rotation on the agent's next send.
+
+        Per-bead bookkeeping (:meth:`_reset_bead_state`) is reset now;
+        the runtime reset or session close-and-reopen waits until
+        :meth:`_execute_protected` is next entered. Deferring twice
+        rotates once, and an explicit :meth:`rotate_session` in between
+        satisfies the deferral.
+        """
+        self._reset_bead_state()
+        self._rotation_pending = True
+
+    def _reset_bead_state(self) -> None:
+        """Clear per-bead bookkeeping; runs on every (deferred) rotation.
+
+        Synchronous so that :meth:`defer_rotation` takes effect before the
+        next domain call reads the state. No-op by default.
+        """
+
     @property
     def last_cost_record(self) -> CostRecord | None:
         return self._last_cost_record
@@ -277,9 +314,16 @@ class Agent:
             on_permission = self._permission_gate
 
         persona = self._persona_name_instance or self.persona_name
+        extra: dict[str, Any] = {}
+        # A session's cache key is fixed when it opens, so it names the
+        # agent rather than any one prompt's prefix.
+        cache = self._cache_config(self._cache_namespace())
+        if cache is not None:
+            extra["cache"] = cache
         self._session = self._runtime.session(
             system=load_persona_system_prompt(persona),
             on_permission=on_permission,
+            **extra,
         )
 
     def _build_permission_gate(self) -> PermissionGate | None:
@@ -312,7 +356,7 @@ class Agent:
 
     async def _execute_via_runtime(
         self,
-        prompt: str,
+        prompt: str | PromptLayout,
         *,
         schema: type[BaseModel] | None = None,
         timeout: float = DEFAULT_STRUCTURED_TIMEOUT_SECONDS,
@@ -323,7 +367,10 @@ class Agent:
         to the agent's effective result model), captures the cost record
         on ``self._last_cost_record``, and emits the ``agent.cost``
         structured-log row. When ``protection_policy`` is set, brackets
-        the send with the backstop snapshot/restore pass (Layer 2).
+        the send with the backstop snapshot/restore pass (Layer 2). A
+        :class:`~maverick.prompt_cache.PromptLayout` is rendered most
+        stable section first and keys the provider's prompt cache by its
+        cacheable prefix.
 
         Raises:
             RuntimeStructuredOutputError: when ``result.structured`` is None.
@@ -331,9 +378,10 @@ class Agent:
                 validation.
         """
         target = schema or self._effective_result_model()
+        text, cache_key = self._render(prompt)
 
         async def _send() -> RuntimeResult:
-            return await self._dispatch(prompt, schema=target, timeout=timeout)
+            return await self._dispatch(text, schema=target, timeout=timeout, cache_key=cache_key)
 
         result = await self._execute_protected(_send)
         if result.structured is None:
@@ -354,7 +402,7 @@ class Agent:
 
     async def _execute_text_via_runtime(
         self,
-        prompt: str,
+        prompt: str | PromptLayout,
         *,
         timeout: float = DEFAULT_TEXT_TIMEOUT_SECONDS,
     ) -> str:
@@ -371,11 +419,13 @@ class Agent:
         (e.g. a tool-only turn that wrote files and finished); callers
         decide whether empty means failure. When ``protection_policy`` is
         set, brackets the send with the backstop snapshot/restore pass
-        (Layer 2), same as :meth:`_execute_via_runtime`.
+        (Layer 2), same as :meth:`_execute_via_runtime`, and keys the
+        prompt cache from a ``PromptLayout`` the same way.
         """
+        text, cache_key = self._render(prompt)
 
         async def _send() -> RuntimeResult:
-            return await self._dispatch(prompt, schema=None, timeout=timeout)
+            return await self._dispatch(text, schema=None, timeout=timeout, cache_key=cache_key)
 
         result = await self._execute_protected(_send)
         self._last_cost_record = result.cost
@@ -388,6 +438,7 @@ class Agent:
         *,
         schema: type[BaseModel] | None,
         timeout: float,
+        cache_key: str | None = None,
     ) -> RuntimeResult:
         """Issue one send — via the session when protection is active, via
         the legacy ``runtime.execute()`` sugar otherwise.
@@ -395,7 +446,10 @@ class Agent:
         ``persona=``/``system=`` are session-construction-time concerns
         when a session is open (baked in by :meth:`_open_session`); on
         the legacy path they're passed per-call exactly as before this
-        feature existed.
+        feature existed, plus ``cache=`` when the runtime has a native
+        cache-key channel and the prompt has a cacheable prefix. A
+        session's cache key is fixed at open, so ``cache_key`` only
+        applies on the legacy path.
         """
         if self._session is not None:
             return await self._session.execute(prompt, schema=schema, timeout=timeout)
@@ -403,14 +457,46 @@ class Agent:
         from maverick.agents.system_prompts import load_persona_system_prompt
 
         persona = self._persona_name_instance or self.persona_name
+        extra: dict[str, Any] = {}
+        cache = self._cache_config(cache_key)
+        if cache is not None:
+            extra["cache"] = cache
         return await self._runtime.execute(
             prompt,
             schema=schema,
             persona=persona,
             system=load_persona_system_prompt(persona),
             timeout=timeout,
+            **extra,
         )
 
+    # ------------------------------------------------------------------
+    # Prompt cache
+    # ------------------------------------------------------------------
+
+    def _cache_namespace(self) -> str:
+        """Prefix of this agent's prompt-cache keys: its tier and persona."""
+        persona = self._persona_name_instance or self.persona_name or self._tag
+        return f"maverick.{self.provider_tier or 'inline'}.{persona}"
+
+    def _render(self, prompt: str | PromptLayout) -> tuple[str, str | None]:
+        """Prompt text to send, and the cache key for it (``None`` for a plain string)."""
+        if isinstance(prompt, PromptLayout):
+            return prompt.render(), prompt.cache_key(self._cache_namespace())
+        return prompt, None
+
+    def _cache_config(self, key: str | None) -> CacheConfig | None:
+        """``CacheConfig`` for *key*, or ``None`` when the runtime can't use one."""
+        if key is None:
+            return None
+        from maverick.runtime.agent_factory import supports_prompt_cache
+
+        if not supports_prompt_cache(self._runtime):
+            return None
+        from airframe.cache import CacheConfig
+
+        return CacheConfig(key=key, retention="short")
+
     async def _execute_protected(
         self, send: Callable[[], Awaitable[RuntimeResult]]
     ) -> RuntimeResult:
@@ -425,7 +511,19 @@ class Agent:
         behind — and a failure *inside* the restore is logged rather than
         raised, because raising from a ``finally`` would replace the
         real error from ``send()`` with a protection-internal one.
+
+        A rotation left pending by :meth:`defer_rotation` runs first,
+        without touching the per-bead state :meth:`defer_rotation` already
+        reset; a failed rotation is logged and the send goes ahead on the
+        current session, as an eager rotation failure would have left it.
         """
+        if self._rotation_pending:
+            try:
+                await self._rotate_runtime()
+            except Exception as exc:  # noqa: BLE001 — rotation is best-effort
+                self._rotation_pending = False
+                logger.debug("agent_deferred_rotate_failed", agent=self._tag, error=str(exc))
+
         policy = self._protection_policy
         if policy is None:
             return await send()
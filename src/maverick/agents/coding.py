@@ -24,6 +24,7 @@ if TYPE_CHECKING:
     from airframe.protocol import AgentRuntime
 
     from maverick.executor.config import StepConfig
+    from maverick.prompt_cache import PromptLayout
     from maverick.protection.policy import ProtectionPolicy
     from maverick.protection.records import BlockCollector
     from maverick.protection.snapshot import SnapshotManifest
@@ -65,7 +66,7 @@ class CodingAgent(Agent):
             baseline_manifest=baseline_manifest,
         )
 
-    async def implement(self, prompt: str) -> SubmitImplementationPayload:
+    async def implement(self, prompt: str | PromptLayout) -> SubmitImplementationPayload:
         """Run the implement-phase prompt and return the typed payload.
 
         Bead identity (and any other workflow vocabulary) flows in via
@@ -81,7 +82,7 @@ class CodingAgent(Agent):
         assert isinstance(payload, SubmitImplementationPayload)
         return payload
 
-    async def fix(self, prompt: str) -> SubmitFixResultPayload:
+    async def fix(self, prompt: str | PromptLayout) -> SubmitFixResultPayload:
         """Run the fix-phase prompt and return the typed payload.
 
         Reuses the same airframe runtime scope as :meth:`implement`
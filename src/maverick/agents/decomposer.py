@@ -24,6 +24,7 @@ from maverick.payloads import (
     SubmitFixPayload,
     SubmitOutlinePayload,
 )
+from maverick.prompt_cache import PromptLayout, PromptSection, Stability
 
 if TYPE_CHECKING:
     from airframe.protocol import AgentRuntime
@@ -93,11 +94,10 @@ class DecomposerAgent(Agent):
     def role(self) -> str:
         return self._role
 
-    async def rotate_session(self) -> None:
-        """Reset per-bead session-mode bookkeeping, then drop the runtime scope."""
+    def _reset_bead_state(self) -> None:
+        """Reset per-bead session-mode bookkeeping."""
         self._session_mode = None
         self._session_turns_in_mode = 0
-        await super().rotate_session()
 
     async def set_context(
         self,
@@ -158,6 +158,7 @@ class DecomposerAgent(Agent):
         *,
         coverage_gaps: Sequence[str],
         overloaded: Sequence[str],
+        structural_gaps: Sequence[str] = (),
         outline_json: str | None = None,
         details_json: str | None = None,
         verification_properties: str | None = None,
@@ -170,7 +171,9 @@ class DecomposerAgent(Agent):
         if verification_properties:
             self._fix_verification = verification_properties
         prompt, refreshed_seed = self._build_fix_prompt(
-            coverage_gaps=list(coverage_gaps), overloaded=list(overloaded)
+            coverage_gaps=list(coverage_gaps),
+            overloaded=list(overloaded),
+            structural_gaps=list(structural_gaps),
         )
         await self._maybe_rotate_session(
             mode="fix",
@@ -228,6 +231,10 @@ class DecomposerAgent(Agent):
 
     # ------------------------------------------------------------------
     # Prompt builders (delegate to the existing decompose helpers)
+    #
+    # Each prompt is a layout of pass header (static), shared seed (fixed
+    # for the run) and the turn itself, so detail and fix calls over the
+    # same outline share one cacheable prefix.
     # ------------------------------------------------------------------
 
     def _build_outline_prompt(
@@ -238,7 +245,7 @@ class DecomposerAgent(Agent):
         briefing: Any,
         runway_context: str | None,
         validation_feedback: str | None,
-    ) -> str:
+    ) -> PromptLayout:
         from maverick.library.actions.decompose import build_outline_prompt
 
         body = build_outline_prompt(
@@ -247,64 +254,88 @@ class DecomposerAgent(Agent):
             briefing=briefing,
             runway_context=runway_context,
         )
+        feedback = None
         if validation_feedback:
-            body += (
-                "\n\n## PREVIOUS ATTEMPT FAILED VALIDATION\n"
+            feedback = PromptSection(
+                "## PREVIOUS ATTEMPT FAILED VALIDATION\n"
                 f"{validation_feedback}\n"
                 "Fix these issues in your new decomposition."
             )
-        return f"# Decomposition input — outline pass (flight plan + briefing)\n\n{body}"
+        return PromptLayout.of(
+            PromptSection(
+                "# Decomposition input — outline pass (flight plan + briefing)",
+                Stability.STATIC,
+            ),
+            PromptSection(body, Stability.RUN),
+            feedback,
+        )
 
-    def _build_detail_prompt(self, *, unit_ids: list[str]) -> tuple[str, bool]:
+    def _build_detail_prompt(self, *, unit_ids: list[str]) -> tuple[PromptLayout, bool]:
         from maverick.library.actions.decompose import (
             build_detail_seed_prompt,
             build_detail_turn_prompt,
         )
 
         needs_seed = self._detail_seed_stale or self._session_mode != "detail"
-        prompt_parts: list[str] = []
+        seed = None
         if needs_seed:
-            prompt_parts.append(
+            seed = PromptSection(
                 build_detail_seed_prompt(
                     flight_plan_content=self._detail_flight_plan,
                     outline_json=self._detail_outline_json,
                     verification_properties=self._detail_verification,
-                )
+                ),
+                Stability.RUN,
             )
-        prompt_parts.append(build_detail_turn_prompt(unit_ids=unit_ids))
-        body = "\n\n".join(prompt_parts)
-        return (
-            f"# Decomposition input — detail pass (outline + details turn)\n\n{body}",
-            needs_seed,
+        layout = PromptLayout.of(
+            PromptSection(
+                "# Decomposition input — detail pass (outline + details turn)",
+                Stability.STATIC,
+            ),
+            seed,
+            PromptSection(build_detail_turn_prompt(unit_ids=unit_ids)),
         )
+        return layout, needs_seed
 
     def _build_fix_prompt(
-        self, *, coverage_gaps: list[str], overloaded: list[str]
-    ) -> tuple[str, bool]:
+        self,
+        *,
+        coverage_gaps: list[str],
+        overloaded: list[str],
+        structural_gaps: list[str],
+    ) -> tuple[PromptLayout, bool]:
         from maverick.library.actions.decompose import (
             build_fix_seed_prompt,
             build_fix_turn_prompt,
         )
 
         needs_seed = self._fix_seed_stale or self._session_mode != "fix"
-        prompt_parts: list[str] = []
+        seed = None
         if needs_seed:
-            prompt_parts.append(
+            seed = PromptSection(
                 build_fix_seed_prompt(
                     outline_json=self._fix_outline_json,
                     details_json=self._fix_details_json,
                     verification_properties=self._fix_verification,
-                )
+                ),
+                Stability.RUN,
             )
-        prompt_parts.append(
-            build_fix_turn_prompt(coverage_gaps=coverage_gaps, overloaded=overloaded)
-        )
-        body = "\n\n".join(prompt_parts)
-        return (
-            "# Decomposition input — fix pass (submit the COMPLETE updated "
-            f"work_units and details, not just the changes)\n\n{body}",
-            needs_seed,
+        layout = PromptLayout.of(
+            PromptSection(
+                "# Decomposition input — fix pass (submit the COMPLETE updated "
+                "work_units and details, not just the changes)",
+                Stability.STATIC,
+            ),
+            seed,
+            PromptSection(
+                build_fix_turn_prompt(
+                    coverage_gaps=coverage_gaps,
+                    overloaded=overloaded,
+                    structural_gaps=structural_gaps,
+                )
+            ),
         )
+        return layout, needs_seed
 
     def _build_nudge_prompt(
         self, *, expected_tool: str, unit_id: str | None, reason: str | None
@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from maverick.agents.base import Agent
 from maverick.payloads import SubmitReviewPayload
+from maverick.prompt_cache import PromptLayout, PromptSection, Stability
 
 if TYPE_CHECKING:
     from airframe.protocol import AgentRuntime
@@ -78,10 +79,9 @@ class ReviewerAgent(Agent):
     def review_kind(self) -> ReviewKind:
         return self._review_kind
 
-    async def rotate_session(self) -> None:
-        """Reset the per-bead review-round counter and drop the runtime scope."""
+    def _reset_bead_state(self) -> None:
+        """Reset the per-bead review-round counter."""
         self._review_count = 0
-        await super().rotate_session()
 
     async def review(
         self,
@@ -89,6 +89,8 @@ class ReviewerAgent(Agent):
         bead_description: str,
         work_unit_md: str | None,
         briefing_context: str | None,
+        shared_context: str | None = None,
+        runway_included: bool = False,
     ) -> SubmitReviewPayload:
         """Run a per-bead review and return the provenance-stamped payload.
 
@@ -97,6 +99,12 @@ class ReviewerAgent(Agent):
         send a short "did you address my prior findings?" prompt that
         relies on the persistent airframe-runtime scope for context.
 
+        ``shared_context`` is the review context the caller prepared once
+        for both reviewers (diff summary, relevant runway history); it is
+        sent inline. ``runway_included`` says whether it carries the
+        episodic runway history: only then is the reviewer told not to
+        re-read ``episodic/`` (``semantic/`` is still left to the reviewer).
+
         Bead identity flows in via
         :func:`~maverick.agents.context.tagged` — the caller wraps the
         call in ``with tagged(bead_id=...):`` for cost attribution.
@@ -106,6 +114,8 @@ class ReviewerAgent(Agent):
             bead_description=bead_description,
             work_unit_md=work_unit_md,
             briefing_context=briefing_context,
+            shared_context=shared_context,
+            runway_included=runway_included,
         )
         payload = await self._execute_via_runtime(prompt, timeout=REVIEW_PROMPT_TIMEOUT_SECONDS)
         assert isinstance(payload, SubmitReviewPayload)
@@ -146,29 +156,56 @@ class ReviewerAgent(Agent):
         bead_description: str,
         work_unit_md: str | None,
         briefing_context: str | None,
-    ) -> str:
+        shared_context: str | None = None,
+        runway_included: bool = False,
+    ) -> PromptLayout | str:
         if self._review_count == 1:
-            sections: list[str] = []
+            # Instructions, then the run's briefing, then this bead's spec
+            # and context: beads reviewed in one run share the prefix.
             if work_unit_md:
-                sections.append(f"## Work Unit Specification\n\n{work_unit_md}")
+                spec = f"## Work Unit Specification\n\n{work_unit_md}"
             else:
-                sections.append(f"## Task Description\n\n{bead_description}")
+                spec = f"## Task Description\n\n{bead_description}"
+            briefing = None
             if briefing_context:
-                sections.append(
+                briefing = PromptSection(
                     "## Pre-Flight Briefing (risks & contrarian findings)\n\n"
-                    f"{briefing_context[:4000]}"
+                    f"{briefing_context[:4000]}",
+                    Stability.RUN,
+                )
+            shared = None
+            if shared_context:
+                shared = PromptSection(f"## Shared Review Context\n\n{shared_context}")
+            if shared_context and runway_included:
+                runway_hint = (
+                    "Runway history (`.maverick/runway/episodic/`) relevant "
+                    "to the changed files is already included below; do not "
+                    "re-read it. Still consult `.maverick/runway/semantic/` "
+                    "for project context if it exists."
                 )
-            user_content = "\n\n".join(sections)
-            return (
-                "Review the implementation already in the working "
-                "directory against the spec below. Also consult "
-                "`.maverick/runway/` (`episodic/review-findings.jsonl`, "
-                "`episodic/bead-outcomes.jsonl`, `semantic/`) for "
-                "project context if it exists.\n\n"
-                "Only flag CRITICAL or MAJOR issues. Set "
-                "approved=true with an empty findings array when no "
-                "critical/major issues remain.\n\n"
-                f"# Review context\n\n{user_content}"
+            else:
+                runway_hint = (
+                    "Also consult `.maverick/runway/` "
+                    "(`episodic/review-findings.jsonl`, "
+                    "`episodic/bead-outcomes.jsonl`, `semantic/`) for "
+                    "project context if it exists."
+                )
+            return PromptLayout.of(
+                PromptSection(
+                    "Review the implementation already in the working "
+                    "directory against the spec below. "
+                    "Only flag CRITICAL or MAJOR issues. Set "
+                    "approved=true with an empty findings array when no "
+                    "critical/major issues remain.",
+                    Stability.STATIC,
+                ),
+                # One of two fixed texts, depending on whether this bead's
+                # shared context carries runway history, so not STATIC;
+                # still ahead of the per-bead sections.
+                PromptSection(f"{runway_hint}\n\n# Review context", Stability.RUN),
+                briefing,
+                PromptSection(spec),
+                shared,
             )
         return (
             "The implementer has made changes since your previous review. "
@@ -181,22 +218,25 @@ class ReviewerAgent(Agent):
         objective: str,
         bead_list: str,
         diff_stat: str,
-    ) -> str:
-        return (
-            "Review the AGGREGATE changes across all beads in this epic.\n\n"
-            f"## Flight Plan\n\n{objective}\n\n"
-            f"## Beads Completed\n\n{bead_list}\n\n"
-            f"## Full Diff Stats\n\n```\n{diff_stat}\n```\n\n"
-            "## Focus Areas\n\n"
-            "- Cross-bead consistency: are deleted modules still referenced "
-            "elsewhere?\n"
-            "- Architectural coherence: do the approaches across beads align "
-            "with each other?\n"
-            "- Missing integration between beads\n"
-            "- Dead code left behind by one bead that another bead depended on\n\n"
-            "Do NOT re-review individual bead correctness — that was already "
-            "done per-bead.\n\n"
-            "Set approved=true if no cross-bead concerns found."
+    ) -> PromptLayout:
+        return PromptLayout.of(
+            PromptSection(
+                "Review the AGGREGATE changes across all beads in this epic.\n\n"
+                "## Focus Areas\n\n"
+                "- Cross-bead consistency: are deleted modules still referenced "
+                "elsewhere?\n"
+                "- Architectural coherence: do the approaches across beads align "
+                "with each other?\n"
+                "- Missing integration between beads\n"
+                "- Dead code left behind by one bead that another bead depended on\n\n"
+                "Do NOT re-review individual bead correctness — that was already "
+                "done per-bead.\n\n"
+                "Set approved=true if no cross-bead concerns found.",
+                Stability.STATIC,
+            ),
+            PromptSection(f"## Flight Plan\n\n{objective}", Stability.RUN),
+            PromptSection(f"## Beads Completed\n\n{bead_list}"),
+            PromptSection(f"## Changes Across All Beads\n\n```\n{diff_stat}\n```"),
         )
 
 
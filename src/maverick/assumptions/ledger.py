@@ -8,7 +8,7 @@ no ``Path.cwd()`` defaults) and returns frozen dataclasses from
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from dataclasses import replace
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Literal
@@ -50,6 +50,7 @@ from maverick.assumptions.models import (
     BulkWaiveResult,
     Severity,
     StampResult,
+    SweptBead,
     coerce_severity,
     nnn_prefix,
     normalize_answer,
@@ -60,6 +61,7 @@ from maverick.logging import get_logger
 
 if TYPE_CHECKING:
     from maverick.beads.client import BeadClient
+    from maverick.beads.models import BeadSummary
     from maverick.payloads import AssumptionPayload
 
 logger = get_logger(__name__)
@@ -67,6 +69,7 @@ logger = get_logger(__name__)
 __all__ = [
     "answer",
     "answered_unreconciled_entries",
+    "bead_fingerprint",
     "bulk_waive",
     "create_reconcile_escalation",
     "is_answered_unreconciled",
@@ -81,6 +84,7 @@ __all__ = [
     "report_entries",
     "report_entry_from_details",
     "stamp_change_id",
+    "sweep_ledger",
     "waive",
 ]
 
@@ -1160,6 +1164,46 @@ async def report_entries(client: BeadClient) -> tuple[AssumptionReportEntry, ...
     mid-flight reconcile can never disagree about which entries are pending
     (research R4) *and* the gate costs one bd sweep rather than two.
 
+    Raises:
+        AssumptionLedgerError: On any bd-layer failure.
+    """
+    entries, _ = await sweep_ledger(client)
+    return entries
+
+
+def bead_fingerprint(summary: BeadSummary) -> str | None:
+    """Change marker for *summary*: its status and ``updated_at``.
+
+    ``None`` when bd reported no ``updated_at`` — without it a change
+    cannot be ruled out, so the bead must be re-loaded.
+    """
+    if summary.updated_at is None:
+        return None
+    return f"{summary.status}@{summary.updated_at}"
+
+
+async def sweep_ledger(
+    client: BeadClient, *, known: Mapping[str, SweptBead] | None = None
+) -> tuple[tuple[AssumptionReportEntry, ...], dict[str, SweptBead]]:
+    """:func:`report_entries`, skipping ``bd show`` for unchanged beads.
+
+    The ``bd query`` still runs every time — it is what reveals changes —
+    but a candidate whose :func:`bead_fingerprint` matches its entry in
+    *known* is rebuilt from the details loaded then instead of being
+    shown again. A caller that persists the returned mapping between runs
+    (``maverick notify``) pays one ``bd show`` per changed bead rather
+    than one per ledger entry.
+
+    Args:
+        client: The bead client to sweep through.
+        known: The mapping a previous sweep returned, minus anything the
+            caller no longer trusts.
+
+    Returns:
+        The report entries, and one :class:`SweptBead` per current
+        candidate to pass as *known* next time (beads bd no longer
+        returns are dropped).
+
     Raises:
         AssumptionLedgerError: On any bd-layer failure.
     """
@@ -1168,18 +1212,36 @@ async def report_entries(client: BeadClient) -> tuple[AssumptionReportEntry, ...
     except BeadError as exc:
         raise AssumptionLedgerError(f"Failed to query task beads: {exc}") from exc
 
+    known = known or {}
+    swept: dict[str, SweptBead] = {}
     entries: list[AssumptionReportEntry] = []
+    shown = 0
     for candidate in candidates:
-        try:
-            details = await client.show(candidate.id)
-        except BeadError as exc:
-            raise AssumptionLedgerError(f"Failed to load bead {candidate.id}: {exc}") from exc
-
-        entry = report_entry_from_details(details)
+        fingerprint = bead_fingerprint(candidate)
+        previous = known.get(candidate.id)
+        if (
+            fingerprint is not None
+            and previous is not None
+            and previous.fingerprint == fingerprint
+        ):
+            details = previous.details
+        else:
+            try:
+                details = await client.show(candidate.id)
+            except BeadError as exc:
+                raise AssumptionLedgerError(f"Failed to load bead {candidate.id}: {exc}") from exc
+            shown += 1
+
+        entry = report_entry_from_details(details) if details is not None else None
         if entry is not None:
             entries.append(entry)
+        swept[candidate.id] = SweptBead(
+            fingerprint=fingerprint, details=details if entry is not None else None
+        )
 
-    return tuple(entries)
+    if known:
+        logger.debug("ledger_swept", candidates=len(candidates), shown=shown)
+    return tuple(entries), swept
 
 
 async def mark_reconciled(
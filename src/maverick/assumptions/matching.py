@@ -9,7 +9,15 @@ deterministic best-candidate selector.
 This module is pure and synchronous: no I/O, no model calls, no third-party
 dependencies beyond the standard library (``difflib``, ``re``, ``string``).
 Callers own corpus preparation (collapsing records, self-match exclusion)
-and persistence; this module only scores and selects.
+and persistence; this module only scores, prunes and selects.
+
+:class:`CandidateIndex` keeps batch matching sub-quadratic without changing
+any result: because rejection feedback only ever lowers a score, a
+candidate can clear :data:`PRESENTATION_THRESHOLD` only if its base score
+does, and ``0.5 * ratio + 0.5 * jaccard >= 0.75`` with ``ratio <= 1``
+forces ``jaccard >= 0.5``. The index finds exactly the candidates meeting
+that Jaccard bound (prefix filtering over a token inverted index), so the
+expensive :func:`base_score` runs only where it could matter.
 
 ``PRESENTATION_THRESHOLD`` and ``REJECTION_PENALTY`` are contract constants,
 not tuning knobs — see the contract doc for the derivation. Changing either
@@ -19,13 +27,17 @@ change, not a tuning adjustment.
 
 from __future__ import annotations
 
+import math
 import string
+from collections import Counter
+from collections.abc import Sequence
 from difflib import SequenceMatcher
-from typing import Final, NamedTuple, TypeVar
+from typing import Final, Generic, NamedTuple, TypeVar
 
 __all__ = [
     "PRESENTATION_THRESHOLD",
     "REJECTION_PENALTY",
+    "CandidateIndex",
     "ScoredCandidate",
     "base_score",
     "effective_confidence",
@@ -49,6 +61,11 @@ _PUNCTUATION_TABLE: Final[dict[int, int | None]] = str.maketrans("", "", string.
 #: store's ``_tokenize`` convention of dropping single-character tokens).
 _MIN_TOKEN_LENGTH: Final[int] = 2
 
+#: Lowest token-set Jaccard at which :func:`base_score` can still reach
+#: :data:`PRESENTATION_THRESHOLD` (the sequence term contributes at most
+#: 0.5). Derived, not tuned — see the module docstring.
+_MIN_JACCARD: Final[float] = 2 * PRESENTATION_THRESHOLD - 1
+
 T = TypeVar("T")
 
 
@@ -138,6 +155,64 @@ def base_score(a: str, b: str) -> float:
     return 0.5 * sequence_ratio + 0.5 * jaccard
 
 
+class CandidateIndex(Generic[T]):
+    """Token index returning only candidates that could clear the threshold.
+
+    Built once per corpus; :meth:`candidates` is then proportional to the
+    candidates sharing a rare token with the question rather than to the
+    corpus size. It is exact, not approximate: every candidate whose
+    :func:`base_score` against the question could reach
+    :data:`PRESENTATION_THRESHOLD` is returned (see the module docstring),
+    so scoring only the returned candidates selects the same suggestion as
+    scoring all of them.
+
+    Uses prefix filtering: with tokens ordered rarest-first, two sets with
+    Jaccard >= t must share a token among the first ``n - ceil(t * n) + 1``
+    of each, so only those prefixes are indexed and probed. Survivors are
+    then checked against the exact Jaccard bound.
+
+    Args:
+        items: ``(question, payload)`` pairs; questions may be raw text.
+    """
+
+    def __init__(self, items: Sequence[tuple[str, T]]) -> None:
+        self._payloads = [payload for _, payload in items]
+        self._token_sets = [_tokenize(normalize_question(question)) for question, _ in items]
+        self._frequency: Counter[str] = Counter(
+            token for tokens in self._token_sets for token in tokens
+        )
+        self._postings: dict[str, list[int]] = {}
+        for position, tokens in enumerate(self._token_sets):
+            for token in self._prefix(tokens):
+                self._postings.setdefault(token, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def candidates(self, question: str) -> list[T]:
+        """Payloads whose question could score at or above the threshold.
+
+        Returned in their original order, so downstream selection sees the
+        same sequence an exhaustive scan would (minus impossible entries).
+        """
+        tokens = _tokenize(normalize_question(question))
+        probed: set[int] = set()
+        for token in self._prefix(tokens):
+            probed.update(self._postings.get(token, ()))
+        survivors = []
+        for position in sorted(probed):
+            other = self._token_sets[position]
+            shared = len(tokens & other)
+            if shared / len(tokens | other) >= _MIN_JACCARD:
+                survivors.append(self._payloads[position])
+        return survivors
+
+    def _prefix(self, tokens: set[str]) -> list[str]:
+        """The rarest ``n - ceil(t * n) + 1`` tokens (ties broken by text)."""
+        ordered = sorted(tokens, key=lambda token: (self._frequency[token], token))
+        return ordered[: len(ordered) - math.ceil(_MIN_JACCARD * len(ordered)) + 1]
+
+
 def effective_confidence(base: float, *, rejections: int, acceptances: int) -> float:
     """Fold rejection feedback into a base score to get effective confidence.
 
@@ -12,6 +12,10 @@ import json
 import re
 from dataclasses import dataclass
 from enum import StrEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from maverick.beads.models import BeadDetails
 
 
 class Severity(StrEnum):
@@ -470,3 +474,22 @@ class BulkWaiveResult:
 
     waived: tuple[AssumptionRecord, ...]
     failed: dict[str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class SweptBead:
+    """One ``bd query`` candidate as a ledger sweep last loaded it.
+
+    Lets :func:`~maverick.assumptions.ledger.sweep_ledger` skip the
+    ``bd show`` for a bead that has not changed since the previous sweep.
+
+    Attributes:
+        fingerprint: The bead's status and ``updated_at`` when it was
+            loaded, or ``None`` when bd reported no ``updated_at`` (such a
+            bead is re-loaded on every sweep).
+        details: The loaded bead, or ``None`` when it is not a ledger
+            entry.
+    """
+
+    fingerprint: str | None
+    details: BeadDetails | None
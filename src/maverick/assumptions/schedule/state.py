@@ -20,14 +20,16 @@ from __future__ import annotations
 import asyncio
 import json
 import os
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
+from maverick.assumptions.models import SweptBead
 from maverick.assumptions.schedule.models import DecisionKind, format_utc, parse_utc
+from maverick.beads.models import BeadDetails
 from maverick.exceptions.base import MaverickError
 from maverick.logging import get_logger
 from maverick.utils.atomic import atomic_write_json
@@ -39,13 +41,16 @@ __all__ = [
     "DeliveryRecord",
     "DeliveryState",
     "DeliveryStateSchemaError",
+    "EntrySnapshot",
     "EntryTrackingRecord",
     "TerminalOutcome",
     "WindowDecisionRecord",
     "acquire_lock",
     "finalize_state",
+    "known_beads",
     "load_state",
     "prune",
+    "record_sweep",
     "release_lock",
     "save_state",
 ]
@@ -65,6 +70,11 @@ _SUPPORTED_SCHEMA_VERSION = 1
 #: entries) become prunable 90 days after the terminal transition.
 _RETENTION = timedelta(days=90)
 
+#: An entry snapshot loaded longer ago than this is re-loaded even when its
+#: fingerprint still matches — a backstop for any bd write that does not
+#: bump the bead's ``updated_at``.
+_SNAPSHOT_MAX_AGE = timedelta(hours=24)
+
 
 class DeliveryStateSchemaError(MaverickError):
     """Raised when persisted notify state carries an unsupported schema_version.
@@ -146,6 +156,20 @@ class DeliveryRecord(BaseModel):
     summary: dict[str, Any] = Field(description="Serialized BatchSummary")
 
 
+class EntrySnapshot(BaseModel):
+    """One ledger-sweep candidate as last loaded, keyed by bead id in
+    :attr:`DeliveryState.entry_snapshots` — lets the next run skip its
+    ``bd show`` while the bead is unchanged."""
+
+    model_config = ConfigDict(frozen=True)
+
+    fingerprint: str = Field(description="bd status@updated_at when loaded")
+    evaluated_at: str = Field(description="UTC ISO-8601 watermark: when the bead was loaded")
+    details: dict[str, Any] | None = Field(
+        default=None, description="Serialized BeadDetails; null when not a ledger entry"
+    )
+
+
 class DeliveryState(BaseModel):
     """Top-level persisted state, round-tripped to
     ``<cwd>/.maverick/notify/state.json`` (contracts/delivery-state-schema.md)."""
@@ -163,6 +187,9 @@ class DeliveryState(BaseModel):
     deliveries: list[DeliveryRecord] = Field(
         default_factory=list, description="Append-only audit trail (FR-011)"
     )
+    entry_snapshots: dict[str, EntrySnapshot] = Field(
+        default_factory=dict, description="Ledger-sweep cache, keyed by bead id"
+    )
 
 
 def _utc_now_iso() -> str:
@@ -243,6 +270,75 @@ async def save_state(state: DeliveryState, cwd: Path) -> None:
     await asyncio.to_thread(atomic_write_json, path, content)
 
 
+def known_beads(state: DeliveryState, now: datetime) -> dict[str, SweptBead]:
+    """The snapshots in *state* a ledger sweep may still trust at *now*.
+
+    Drops snapshots whose ``evaluated_at`` watermark is older than
+    :data:`_SNAPSHOT_MAX_AGE` (or unparseable), and any whose details no
+    longer validate, so those beads are loaded afresh.
+
+    Args:
+        state: Persisted state from :func:`load_state`.
+        now: Aware evaluation clock.
+
+    Returns:
+        ``known`` for :func:`~maverick.assumptions.ledger.sweep_ledger`.
+    """
+    known: dict[str, SweptBead] = {}
+    for bead_id, snapshot in state.entry_snapshots.items():
+        loaded = parse_utc(snapshot.evaluated_at)
+        if loaded is None or now - loaded >= _SNAPSHOT_MAX_AGE:
+            continue
+        try:
+            details = (
+                BeadDetails.model_validate(snapshot.details)
+                if snapshot.details is not None
+                else None
+            )
+        except ValidationError:
+            continue
+        known[bead_id] = SweptBead(fingerprint=snapshot.fingerprint, details=details)
+    return known
+
+
+def record_sweep(
+    state: DeliveryState,
+    swept: Mapping[str, SweptBead],
+    known: Mapping[str, SweptBead],
+    now: datetime,
+) -> DeliveryState:
+    """Replace *state*'s entry snapshots with this run's ledger sweep.
+
+    A bead the sweep reused from *known* keeps its ``evaluated_at``
+    watermark, so :data:`_SNAPSHOT_MAX_AGE` still forces a periodic
+    re-load; a freshly loaded bead is stamped with *now*. Beads without a
+    fingerprint are not persisted — they are re-loaded every run anyway.
+
+    Args:
+        state: The state about to be persisted.
+        swept: The mapping :func:`~maverick.assumptions.ledger.sweep_ledger`
+            returned.
+        known: The mapping it was called with (:func:`known_beads`).
+        now: The same evaluation clock passed to :func:`known_beads`.
+
+    Returns:
+        A new :class:`DeliveryState`; *state* itself is never mutated.
+    """
+    stamp = format_utc(now)
+    snapshots: dict[str, EntrySnapshot] = {}
+    for bead_id, bead in swept.items():
+        if bead.fingerprint is None:
+            continue
+        previous = state.entry_snapshots.get(bead_id)
+        reused = bead_id in known and known[bead_id].fingerprint == bead.fingerprint
+        snapshots[bead_id] = EntrySnapshot(
+            fingerprint=bead.fingerprint,
+            evaluated_at=previous.evaluated_at if reused and previous is not None else stamp,
+            details=bead.details.model_dump(mode="json") if bead.details is not None else None,
+        )
+    return state.model_copy(update={"entry_snapshots": snapshots})
+
+
 def _pid_is_alive(pid: int) -> bool:
     """Whether *pid* refers to a live process.
 
@@ -20,6 +20,7 @@ from typing import TYPE_CHECKING, Final, Literal
 
 from maverick.assumptions import ledger
 from maverick.assumptions.matching import (
+    CandidateIndex,
     base_score,
     effective_confidence,
     normalize_question,
@@ -208,7 +209,9 @@ def evaluate_suggestion(
        *record*'s own bead id (R12: a re-opened/re-answered entry must
        never match the decision record produced by its own earlier
        resolution).
-    3. Score each remaining candidate via :func:`matching.base_score`,
+    3. Score each remaining candidate that could clear the threshold
+       (:class:`matching.CandidateIndex` — exact pruning, not sampling)
+       via :func:`matching.base_score`,
        penalized by :func:`matching.effective_confidence` using net
        rejection/acceptance counts from *feedback* for that exact
        (normalized question, candidate) pairing.
@@ -227,23 +230,32 @@ def evaluate_suggestion(
         A single :class:`Suggestion` for the best-matching candidate, or
         ``None`` when no candidate clears the presentation threshold.
     """
-    return _evaluate(record, collapse_decisions(corpus), _index_feedback(feedback))
+    return _evaluate(
+        record, _index_candidates(collapse_decisions(corpus)), _index_feedback(feedback)
+    )
+
+
+def _index_candidates(candidates: Sequence[DecisionRecord]) -> CandidateIndex[DecisionRecord]:
+    """Index a collapsed corpus by question text for threshold-safe pruning."""
+    return CandidateIndex([(c.question, c) for c in candidates])
 
 
 def _evaluate(
     record: AssumptionReportEntry,
-    candidates: Sequence[DecisionRecord],
+    candidates: CandidateIndex[DecisionRecord],
     feedback_index: _FeedbackIndex,
 ) -> Suggestion | None:
     """Score *record* against a pre-collapsed, pre-indexed corpus.
 
     The batch-friendly core of :func:`evaluate_suggestion`: *candidates*
-    must already be collapsed (:func:`collapse_decisions`) and
-    *feedback_index* already tallied (:func:`_index_feedback`), both of
-    which are per-corpus rather than per-record work.
+    must already be collapsed (:func:`collapse_decisions`) and indexed
+    (:func:`_index_candidates`), and *feedback_index* already tallied
+    (:func:`_index_feedback`) — all per-corpus rather than per-record work.
     """
     self_id = record.record.bead_id
-    scoreable = [c for c in candidates if c.source_entry_id != self_id]
+    scoreable = [
+        c for c in candidates.candidates(record.record.question) if c.source_entry_id != self_id
+    ]
     if not scoreable:
         return None
 
@@ -375,7 +387,9 @@ async def record_feedback(
     return True
 
 
-async def _load_corpus(store: RunwayStore) -> tuple[list[DecisionRecord], _FeedbackIndex]:
+async def _load_corpus(
+    store: RunwayStore,
+) -> tuple[CandidateIndex[DecisionRecord], _FeedbackIndex]:
     """Load and pre-process the decision corpus for a batch, never raising.
 
     ``decisions.jsonl`` / ``match-feedback.jsonl`` are append-only and
@@ -386,22 +400,22 @@ async def _load_corpus(store: RunwayStore) -> tuple[list[DecisionRecord], _Feedb
     rather than leaving every caller responsible for wrapping the call.
 
     Returns the corpus already collapsed to one authoritative record per
-    entry and the feedback already tallied — both per-corpus, not
-    per-record, work.
+    entry and indexed for candidate pruning, and the feedback already
+    tallied — all per-corpus, not per-record, work.
     """
     try:
         corpus = await store.get_decisions()
         feedback = await store.get_match_feedback()
     except Exception as exc:  # noqa: BLE001 — best-effort corpus read (FR-004 pattern)
         logger.warning("decision_corpus_read_failed", path=str(store.path), error=str(exc))
-        return [], {}
-    return collapse_decisions(corpus), _index_feedback(feedback)
+        return _index_candidates([]), {}
+    return _index_candidates(collapse_decisions(corpus)), _index_feedback(feedback)
 
 
 async def _evaluate_and_persist(
     client: BeadClient,
     record: AssumptionReportEntry,
-    candidates: Sequence[DecisionRecord],
+    candidates: CandidateIndex[DecisionRecord],
     feedback_index: _FeedbackIndex,
 ) -> Suggestion | None:
     """Evaluate one entry and persist a resulting suggestion, best-effort.
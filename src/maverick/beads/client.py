@@ -7,9 +7,11 @@ for async-safe subprocess execution with timeouts and retries.
 from __future__ import annotations
 
 import json
+import os
+import tempfile
 from enum import StrEnum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from maverick.beads.models import (
     BeadDefinition,
@@ -25,12 +27,16 @@ from maverick.exceptions.beads import (
     BeadCreationError,
     BeadDependencyError,
     BeadError,
+    BeadGraphUnsupportedError,
     BeadLifecycleError,
     BeadQueryError,
 )
 from maverick.logging import get_logger
 from maverick.runners.command import CommandRunner
 
+if TYPE_CHECKING:
+    from maverick.beads.graph import GraphPlan
+
 logger = get_logger(__name__)
 
 # Timeout for bd operations (seconds)
@@ -40,6 +46,10 @@ BD_TIMEOUT: float = 30.0
 # than a single read/write. Bumped above BD_TIMEOUT.
 BD_LIFECYCLE_TIMEOUT: float = 60.0
 
+# A graph plan is one Dolt transaction over every node and edge; it is
+# bounded by the plan's size rather than a single write.
+BD_GRAPH_TIMEOUT: float = 180.0
+
 
 class LifecycleAction(StrEnum):
     """Action chosen by :meth:`BeadClient.init_or_bootstrap`."""
@@ -202,6 +212,73 @@ class BeadClient:
 
         return CreatedBead(bd_id=bd_id, definition=definition)
 
+    async def create_graph(self, plan: GraphPlan) -> dict[str, str]:
+        """Create every node and edge of *plan* via ``bd create --graph``.
+
+        One subprocess and one Dolt transaction, however large the plan:
+        either every bead and dependency is created or none is. The plan
+        is written to the system temp directory (never the user's repo)
+        and removed afterwards.
+
+        Args:
+            plan: The beads and dependencies to create; checked with
+                :meth:`GraphPlan.validate_local` first.
+
+        Returns:
+            Mapping from node key to created bead ID.
+
+        Raises:
+            BeadGraphUnsupportedError: The installed bd has no ``--graph``
+                flag — callers fall back to :meth:`create_bead`.
+            BeadCreationError: The plan is invalid or the transaction
+                failed (nothing was created).
+        """
+        from maverick.workspace import assert_checkout
+
+        assert_checkout(self._cwd)
+        plan.validate_local()
+
+        fd, plan_path = tempfile.mkstemp(prefix="maverick-graph-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(plan.to_json())
+            result = await self._runner.run(
+                ["bd", "create", "--graph", plan_path, "--json"],
+                cwd=self._cwd,
+                timeout=BD_GRAPH_TIMEOUT,
+            )
+        finally:
+            Path(plan_path).unlink(missing_ok=True)
+
+        if not result.success:
+            detail = result.stderr.strip() or "(no output — command may have timed out)"
+            if "unknown flag: --graph" in detail:
+                raise BeadGraphUnsupportedError(f"bd does not support --graph: {detail}")
+            raise BeadCreationError(f"Failed to create graph of {len(plan.nodes)} beads: {detail}")
+
+        try:
+            data = json.loads(result.stdout)
+        except json.JSONDecodeError as e:
+            raise BeadCreationError(f"Failed to parse bd create --graph output: {e}") from e
+        if isinstance(data, list):
+            data = data[0] if data else {}
+        ids = data.get("ids") if isinstance(data, dict) else None
+        if not isinstance(ids, dict):
+            raise BeadCreationError(f"bd create --graph returned no ids: {result.stdout[:200]}")
+
+        # bd drops unknown fields with a warning rather than failing; the
+        # transaction has committed by now, so surface it and move on.
+        if "has unknown field(s)" in result.stderr:
+            logger.warning("bead_graph_unknown_fields", stderr=result.stderr.strip())
+
+        logger.info(
+            "bead_graph_created",
+            nodes=len(plan.nodes),
+            edges=len(plan.edges),
+            created=len(ids),
+        )
+        return {str(key): str(bead_id) for key, bead_id in ids.items()}
+
     async def add_dependency(self, dep: BeadDependency) -> None:
         """Add a dependency between two beads using ``bd dep add``.
 
@@ -495,6 +572,10 @@ class BeadClient:
                 the safest key last (e.g. ``ledger.answer`` writes
                 ``assumption_status`` last, so a mid-loop failure leaves
                 the entry still open rather than answered-but-stale).
+                State known when a bead is created is cheaper seeded as
+                labels in a :meth:`create_graph` plan (see
+                :func:`~maverick.beads.graph.state_to_labels`) — no
+                per-key subprocess and no event beads.
         """
         from maverick.workspace import assert_checkout
 
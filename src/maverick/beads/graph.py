@@ -0,0 +1,211 @@
+"""Plan models for one-shot ``bd create --graph`` creation.
+
+``bd create --graph <plan.json> --json`` creates every node and edge of a
+plan in a single Dolt transaction and answers ``{"ids": {key: bead_id}}``
+(docs/bead-cost-and-workspace-plan.md, "Verified facts"). These models
+describe only what Maverick emits — ``extra="forbid"`` makes it
+structurally impossible to send a field bd does not know (bd would drop it
+with nothing more than a stderr warning).
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from maverick.beads.models import BeadDefinition, DependencyType
+from maverick.exceptions.beads import BeadCreationError
+
+__all__ = [
+    "GraphEdge",
+    "GraphNode",
+    "GraphPlan",
+    "blocks_edge",
+    "node_from_definition",
+    "state_to_labels",
+]
+
+
+class GraphNode(BaseModel):
+    """One bead to create.
+
+    Attributes:
+        key: Plan-local identifier; edges and children refer to it and the
+            result maps it to the created bead ID.
+        title: Bead title.
+        type: Bead type (``epic``/``task``).
+        description: Bead description.
+        assignee: Optional assignee.
+        priority: Numeric priority.
+        labels: Labels, as a JSON array (no comma-splitting).
+        parent_key: Key of a parent node in the same plan.
+        parent_id: ID of an existing parent bead.
+    """
+
+    key: str = Field(min_length=1)
+    title: str = Field(min_length=1)
+    type: str | None = None
+    description: str | None = None
+    assignee: str | None = None
+    priority: int | None = None
+    labels: list[str] | None = None
+    parent_key: str | None = None
+    parent_id: str | None = None
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class GraphEdge(BaseModel):
+    """One dependency, in bd's orientation: ``to`` blocks ``from``.
+
+    Build these with :func:`blocks_edge` rather than by hand.
+    """
+
+    from_key: str | None = None
+    from_id: str | None = None
+    to_key: str | None = None
+    to_id: str | None = None
+    type: str | None = None
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class GraphPlan(BaseModel):
+    """A ``bd create --graph`` plan.
+
+    Attributes:
+        commit_message: Optional Dolt commit message for the transaction.
+        nodes: Beads to create.
+        edges: Dependencies to wire between them (or to existing beads).
+    """
+
+    commit_message: str | None = None
+    nodes: list[GraphNode] = Field(default_factory=list)
+    edges: list[GraphEdge] = Field(default_factory=list)
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    def validate_local(self) -> None:
+        """Mirror bd's own plan checks so failures surface before a subprocess.
+
+        Raises:
+            BeadCreationError: Duplicate node keys, a node with both (or a
+                dangling) parent reference, an edge endpoint that is not
+                exactly one of ``*_key``/``*_id`` or names an unknown key,
+                or an edge duplicating a parent-child pair.
+        """
+        keys: set[str] = set()
+        for node in self.nodes:
+            if node.key in keys:
+                raise BeadCreationError(f"graph plan has duplicate node key {node.key!r}")
+            keys.add(node.key)
+
+        children: set[tuple[str, str]] = set()
+        for node in self.nodes:
+            if node.parent_key is not None and node.parent_id is not None:
+                raise BeadCreationError(
+                    f"graph node {node.key!r} sets both parent_key and parent_id",
+                    bead_title=node.title,
+                )
+            if node.parent_key is not None:
+                if node.parent_key not in keys:
+                    raise BeadCreationError(
+                        f"graph node {node.key!r} has unknown parent_key {node.parent_key!r}",
+                        bead_title=node.title,
+                    )
+                children.add((node.key, node.parent_key))
+
+        for edge in self.edges:
+            for side, key, bead_id in (
+                ("from", edge.from_key, edge.from_id),
+                ("to", edge.to_key, edge.to_id),
+            ):
+                if (key is None) == (bead_id is None):
+                    raise BeadCreationError(
+                        f"graph edge needs exactly one of {side}_key/{side}_id: {edge!r}"
+                    )
+                if key is not None and key not in keys:
+                    raise BeadCreationError(f"graph edge {side}_key {key!r} is not a plan node")
+            if (edge.from_key, edge.to_key) in children:
+                raise BeadCreationError(
+                    f"graph edge {edge.from_key!r} -> {edge.to_key!r} "
+                    "duplicates a parent-child pair"
+                )
+
+    def to_json(self) -> str:
+        """Serialize for ``--graph``, omitting every unset field."""
+        return json.dumps(self.model_dump(mode="json", exclude_none=True), indent=2)
+
+
+def state_to_labels(state: Mapping[str, str]) -> list[str]:
+    """Encode state dimensions as ``key:value`` labels, sorted by key.
+
+    ``bd state list`` derives state from exactly these labels, so a
+    dimension seeded at creation reads back the same as one written by
+    ``bd set-state`` — without the event bead ``set-state`` records.
+    """
+    return [f"{key}:{value}" for key, value in sorted(state.items())]
+
+
+def node_from_definition(
+    key: str,
+    definition: BeadDefinition,
+    *,
+    parent_key: str | None = None,
+    parent_id: str | None = None,
+    state: Mapping[str, str] | None = None,
+) -> GraphNode:
+    """Translate a :class:`BeadDefinition` into a graph node.
+
+    Args:
+        key: Plan-local node key.
+        definition: The bead to create.
+        parent_key: Parent node in the same plan.
+        parent_id: Existing parent bead.
+        state: State dimensions to seed as labels (see
+            :func:`state_to_labels`).
+    """
+    labels = [*definition.labels, *state_to_labels(state or {})]
+    return GraphNode(
+        key=key,
+        title=definition.title,
+        type=definition.bead_type.value,
+        description=definition.description or None,
+        assignee=definition.assignee,
+        priority=definition.priority,
+        labels=labels or None,
+        parent_key=parent_key,
+        parent_id=parent_id,
+    )
+
+
+def blocks_edge(
+    *,
+    blocker: str,
+    blocked: str,
+    node_keys: frozenset[str] | set[str],
+    dep_type: DependencyType = DependencyType.BLOCKS,
+) -> GraphEdge:
+    """Build the edge for "*blocker* must finish before *blocked*".
+
+    The one place the direction is inverted: bd records
+    ``Dependency{IssueID: from, DependsOnID: to}``, so ``to`` blocks
+    ``from`` — ``from = blocked``, ``to = blocker``. Matches ``bd dep add
+    --file``'s documented ``{"from": "bd-42", "to": "bd-41"}`` and the
+    ``bd dep add <blocked> --blocked-by <blocker>`` :class:`BeadClient`
+    already emits.
+
+    Each endpoint is a ``*_key`` when it names a node in *node_keys* and a
+    ``*_id`` (an existing bead) otherwise.
+    """
+    blocked_in_plan = blocked in node_keys
+    blocker_in_plan = blocker in node_keys
+    return GraphEdge(
+        from_key=blocked if blocked_in_plan else None,
+        from_id=None if blocked_in_plan else blocked,
+        to_key=blocker if blocker_in_plan else None,
+        to_id=None if blocker_in_plan else blocker,
+        type=dep_type.value,
+    )
@@ -228,6 +228,9 @@ class BeadSummary(BaseModel):
         status: Current bead status.
         priority: Numeric priority.
         bead_type: Whether this is an epic or task.
+        updated_at: bd's UTC ISO-8601 last-modified timestamp, bumped by
+            any write to the bead (state and labels included). ``None``
+            when bd omits it.
     """
 
     id: str = Field(min_length=1, description="Bead ID")
@@ -235,5 +238,8 @@ class BeadSummary(BaseModel):
     status: str = Field(default="open", description="Current status")
     priority: int = Field(default=1, description="Priority")
     bead_type: str = Field(default="task", description="Bead type")
+    updated_at: str | None = Field(
+        default=None, description="bd's UTC ISO-8601 last-modified timestamp"
+    )
 
     model_config = ConfigDict(frozen=True)
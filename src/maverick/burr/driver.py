@@ -5,9 +5,11 @@ spikes:
 
 * ``Application.arun()`` runs as a background ``asyncio.Task``.
 * Actions and a :class:`~maverick.burr.hooks.ProgressEventHook` push
-  :class:`maverick.events.ProgressEvent` instances into an
-  ``asyncio.Queue``; the hook enqueues a ``None`` sentinel after the
-  terminal action's ``post_run_step`` to signal end-of-stream.
+  :class:`maverick.events.ProgressEvent` instances into a
+  :class:`~maverick.event_bus.ProgressEventBus` (a bounded
+  ``asyncio.Queue`` that coalesces stream chunks); the hook enqueues a
+  ``None`` sentinel after the terminal action's ``post_run_step`` to
+  signal end-of-stream.
 * :meth:`BurrWorkflowDriver.events` drains the queue, yielding each
   event to the consumer in real time (Spike 3 measured sub-millisecond
   emit→consume lag).
@@ -38,7 +40,7 @@ class BurrWorkflowDriver:
 
     Usage::
 
-        queue: asyncio.Queue[ProgressEvent | None] = asyncio.Queue()
+        queue: asyncio.Queue[ProgressEvent | None] = ProgressEventBus()
         app = build_plan_application(squadron, queue)
         driver = BurrWorkflowDriver(
             app, halt_after=["write_plan"], event_queue=queue,
@@ -52,7 +54,8 @@ class BurrWorkflowDriver:
         halt_after: Action names that, when completed, terminate the
             run. Forwarded to ``app.arun(halt_after=...)``.
         event_queue: The same queue the application's hook and actions
-            push :class:`ProgressEvent` instances into. The driver
+            push :class:`ProgressEvent` instances into — normally a
+            :class:`~maverick.event_bus.ProgressEventBus`. The driver
             drains it until it receives a ``None`` sentinel.
     """
 
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from maverick.checkpoint.data import CheckpointData, compute_inputs_hash
 from maverick.checkpoint.store import (
+    CheckpointEncoding,
     CheckpointStore,
     FileCheckpointStore,
     MemoryCheckpointStore,
@@ -15,6 +16,7 @@ from maverick.checkpoint.store import (
 
 __all__: list[str] = [
     "CheckpointData",
+    "CheckpointEncoding",
     "CheckpointStore",
     "FileCheckpointStore",
     "MemoryCheckpointStore",
@@ -7,13 +7,34 @@ for persisting and loading workflow checkpoints.
 from __future__ import annotations
 
 import contextlib
+import gzip
+import hashlib
 import json
+from enum import StrEnum
 from pathlib import Path
-from typing import Protocol
+from typing import Any, Protocol
 
 from maverick.checkpoint.data import CheckpointData
 from maverick.constants import CHECKPOINT_DIR
-from maverick.utils.atomic import atomic_write_text
+from maverick.logging import get_logger
+from maverick.utils.atomic import atomic_write_bytes
+
+logger = get_logger(__name__)
+
+#: Per-workflow index of checkpoints; also the atomic "latest" pointer
+MANIFEST_NAME = "_manifest.json"
+
+#: Directory (per workflow) holding content-addressed step results
+BLOBS_DIR = "blobs"
+
+#: Checkpoints kept per workflow by default; older ones are pruned on save
+DEFAULT_MAX_CHECKPOINTS = 20
+
+#: On-disk layout version written into manifests and checkpoint files
+_FORMAT_VERSION = 2
+
+#: Hex digits of SHA-256 used to address shared step results
+_BLOB_HASH_LENGTH = 32
 
 
 class CheckpointStore(Protocol):
@@ -60,24 +81,56 @@ class CheckpointStore(Protocol):
         ...
 
 
+class CheckpointEncoding(StrEnum):
+    """On-disk encoding for checkpoint files and shared step results."""
+
+    JSON = "json"
+    GZIP_JSON = "json.gz"
+
+
 class FileCheckpointStore:
     """File-based checkpoint store with atomic writes.
 
-    Stores checkpoints as JSON files under a configurable base directory.
-    Uses atomic write pattern (temp file + rename) to prevent corruption.
+    Stores checkpoints as compact JSON files under a configurable base
+    directory. Uses atomic write pattern (temp file + rename) to prevent
+    corruption.
+
+    Each workflow directory holds a small manifest listing its checkpoints
+    and naming the latest one, rewritten atomically after every save, so
+    :meth:`load_latest` reads two files however long the history is. Step
+    results are stored once, content-addressed under ``blobs/``, and
+    referenced by hash: consecutive checkpoints of a growing run share the
+    results they have in common instead of rewriting them. Only the newest
+    ``max_checkpoints`` checkpoints are retained.
+
+    Directories written by older versions (one pretty-printed JSON file per
+    checkpoint, no manifest) are still readable; their manifest is built on
+    first access.
     """
 
-    def __init__(self, base_path: Path | str | None = None) -> None:
+    def __init__(
+        self,
+        base_path: Path | str | None = None,
+        *,
+        encoding: CheckpointEncoding = CheckpointEncoding.JSON,
+        max_checkpoints: int | None = DEFAULT_MAX_CHECKPOINTS,
+    ) -> None:
         """Initialize file checkpoint store.
 
         Args:
             base_path: Directory for checkpoint storage.
                 If None, uses CHECKPOINT_DIR.
+            encoding: Encoding for newly written files. Files in either
+                encoding are always readable.
+            max_checkpoints: Checkpoints retained per workflow (None keeps
+                all of them).
         """
         if base_path is None:
             self._base_path = Path(CHECKPOINT_DIR)
         else:
             self._base_path = Path(base_path)
+        self._encoding = encoding
+        self._max_checkpoints = max_checkpoints
         # Clean up any orphaned temp files from previous crashes
         self._cleanup_temp_files()
 
@@ -95,17 +148,54 @@ class FileCheckpointStore:
     ) -> None:
         """Save checkpoint with atomic write.
 
+        Writes any step results not already stored, then the checkpoint
+        file, then the manifest; the manifest write is the commit point.
+
         Note: Uses synchronous file I/O for simplicity. Checkpoint files are small
-        (<10KB) and local file operations complete in microseconds, making the
+        and local file operations complete in microseconds, making the
         overhead of async wrappers unnecessary.
         """
         dir_path = self._base_path / workflow_id
-        file_path = dir_path / f"{data.checkpoint_id}.json"
-        content = json.dumps(data.to_dict(), indent=2)
-
-        # Uses atomicwrites library for atomic file operations.
-        # The library handles temp file creation and cleanup on error.
-        atomic_write_text(file_path, content, mkdir=True)
+        manifest = self._read_manifest(dir_path)
+
+        step_refs: list[str] = []
+        for result in data.step_results:
+            payload = _dumps(result)
+            ref = hashlib.sha256(payload).hexdigest()[:_BLOB_HASH_LENGTH]
+            blob_path = dir_path / BLOBS_DIR / f"{ref}.{self._encoding}"
+            if not blob_path.exists():
+                atomic_write_bytes(blob_path, self._encode(payload))
+            step_refs.append(blob_path.name)
+
+        record = {
+            "format": _FORMAT_VERSION,
+            "checkpoint_id": data.checkpoint_id,
+            "workflow_name": data.workflow_name,
+            "inputs_hash": data.inputs_hash,
+            "step_refs": step_refs,
+            "saved_at": data.saved_at,
+            "user_data": data.user_data,
+        }
+        file_name = f"{data.checkpoint_id}.{self._encoding}"
+        atomic_write_bytes(dir_path / file_name, self._encode(_dumps(record)))
+
+        entries = [e for e in manifest["checkpoints"] if e["id"] != data.checkpoint_id]
+        replaced = [e for e in manifest["checkpoints"] if e["id"] == data.checkpoint_id]
+        entries.append(
+            {
+                "id": data.checkpoint_id,
+                "file": file_name,
+                "saved_at": data.saved_at,
+                "steps": step_refs,
+            }
+        )
+        entries.sort(key=lambda e: e["saved_at"])
+        pruned = replaced
+        if self._max_checkpoints is not None and len(entries) > self._max_checkpoints:
+            pruned = pruned + entries[: -self._max_checkpoints]
+            entries = entries[-self._max_checkpoints :]
+        self._write_manifest(dir_path, entries)
+        self._delete_unreferenced(dir_path, pruned, entries)
 
     async def load(
         self,
@@ -113,36 +203,32 @@ class FileCheckpointStore:
         checkpoint_id: str,
     ) -> CheckpointData | None:
         """Load checkpoint from file."""
-        file_path = self._base_path / workflow_id / f"{checkpoint_id}.json"
-
-        if not file_path.exists():
+        dir_path = self._base_path / workflow_id
+        if not dir_path.exists():
             return None
-
-        content = file_path.read_text(encoding="utf-8")
-        data = json.loads(content)
-        return CheckpointData.from_dict(data)
+        manifest = self._read_manifest(dir_path)
+        for entry in manifest["checkpoints"]:
+            if entry["id"] == checkpoint_id:
+                return self._load_file(dir_path, entry["file"])
+        return None
 
     async def load_latest(
         self,
         workflow_id: str,
     ) -> CheckpointData | None:
-        """Load most recent checkpoint by saved_at timestamp."""
+        """Load most recent checkpoint by saved_at timestamp.
+
+        Reads the manifest and the one checkpoint it points to.
+        """
         dir_path = self._base_path / workflow_id
 
         if not dir_path.exists():
             return None
 
-        checkpoints: list[CheckpointData] = []
-        for file_path in dir_path.glob("*.json"):
-            content = file_path.read_text(encoding="utf-8")
-            data = json.loads(content)
-            checkpoints.append(CheckpointData.from_dict(data))
-
-        if not checkpoints:
+        entries = self._read_manifest(dir_path)["checkpoints"]
+        if not entries:
             return None
-
-        checkpoints.sort(key=lambda c: c.saved_at, reverse=True)
-        return checkpoints[0]
+        return self._load_file(dir_path, entries[-1]["file"])
 
     async def clear(
         self,
@@ -152,8 +238,16 @@ class FileCheckpointStore:
         dir_path = self._base_path / workflow_id
 
         if dir_path.exists():
-            for file_path in dir_path.glob("*.json"):
+            blobs_path = dir_path / BLOBS_DIR
+            if blobs_path.exists():
+                for blob_path in blobs_path.iterdir():
+                    blob_path.unlink()
+                with contextlib.suppress(OSError):
+                    blobs_path.rmdir()
+            for file_path in _checkpoint_files(dir_path):
                 file_path.unlink()
+            with contextlib.suppress(FileNotFoundError):
+                (dir_path / MANIFEST_NAME).unlink()
             with contextlib.suppress(OSError):
                 dir_path.rmdir()
 
@@ -161,13 +255,121 @@ class FileCheckpointStore:
         self,
         workflow_id: str,
     ) -> list[str]:
-        """List checkpoint IDs."""
+        """List checkpoint IDs, oldest first."""
         dir_path = self._base_path / workflow_id
 
         if not dir_path.exists():
             return []
 
-        return [file_path.stem for file_path in dir_path.glob("*.json")]
+        return [entry["id"] for entry in self._read_manifest(dir_path)["checkpoints"]]
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    def _read_manifest(self, dir_path: Path) -> dict[str, Any]:
+        """Return the workflow's manifest, rebuilding it if missing or unreadable."""
+        manifest_path = dir_path / MANIFEST_NAME
+        try:
+            manifest = json.loads(manifest_path.read_bytes())
+            if manifest.get("format") == _FORMAT_VERSION:
+                return manifest
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as exc:
+            logger.warning(
+                "checkpoint_manifest_unreadable", path=str(manifest_path), error=str(exc)
+            )
+        return self._rebuild_manifest(dir_path)
+
+    def _rebuild_manifest(self, dir_path: Path) -> dict[str, Any]:
+        """Index checkpoint files by scanning the directory (legacy/recovery path)."""
+        entries: list[dict[str, Any]] = []
+        for file_path in _checkpoint_files(dir_path):
+            try:
+                record = json.loads(self._decode(file_path.name, file_path.read_bytes()))
+            except (OSError, ValueError) as exc:
+                logger.warning("checkpoint_unreadable", path=str(file_path), error=str(exc))
+                continue
+            entries.append(
+                {
+                    "id": record["checkpoint_id"],
+                    "file": file_path.name,
+                    "saved_at": record["saved_at"],
+                    "steps": record.get("step_refs", []),
+                }
+            )
+        entries.sort(key=lambda e: e["saved_at"])
+        if entries:
+            self._write_manifest(dir_path, entries)
+        return {"format": _FORMAT_VERSION, "checkpoints": entries}
+
+    def _write_manifest(self, dir_path: Path, entries: list[dict[str, Any]]) -> None:
+        manifest = {"format": _FORMAT_VERSION, "checkpoints": entries}
+        atomic_write_bytes(dir_path / MANIFEST_NAME, _dumps(manifest))
+
+    def _delete_unreferenced(
+        self,
+        dir_path: Path,
+        dropped: list[dict[str, Any]],
+        kept: list[dict[str, Any]],
+    ) -> None:
+        """Delete files of dropped checkpoints that no kept checkpoint uses."""
+        if not dropped:
+            return
+        kept_files = {entry["file"] for entry in kept}
+        kept_refs = {ref for entry in kept for ref in entry["steps"]}
+        for entry in dropped:
+            if entry["file"] not in kept_files:
+                with contextlib.suppress(FileNotFoundError):
+                    (dir_path / entry["file"]).unlink()
+            for ref in entry["steps"]:
+                if ref not in kept_refs:
+                    with contextlib.suppress(FileNotFoundError):
+                        (dir_path / BLOBS_DIR / ref).unlink()
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def _load_file(self, dir_path: Path, file_name: str) -> CheckpointData | None:
+        file_path = dir_path / file_name
+        try:
+            record = json.loads(self._decode(file_name, file_path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        if "step_refs" in record:
+            record["step_results"] = [
+                json.loads(self._decode(ref, (dir_path / BLOBS_DIR / ref).read_bytes()))
+                for ref in record["step_refs"]
+            ]
+        return CheckpointData.from_dict(record)
+
+    def _encode(self, payload: bytes) -> bytes:
+        if self._encoding is CheckpointEncoding.GZIP_JSON:
+            return gzip.compress(payload, mtime=0)
+        return payload
+
+    @staticmethod
+    def _decode(file_name: str, content: bytes) -> bytes:
+        if file_name.endswith(".gz"):
+            return gzip.decompress(content)
+        return content
+
+
+def _dumps(value: Any) -> bytes:
+    """Compact, deterministic JSON (so equal step results hash equally)."""
+    return json.dumps(value, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def _checkpoint_files(dir_path: Path) -> list[Path]:
+    """Checkpoint files in ``dir_path`` (excluding the manifest)."""
+    return [
+        path
+        for pattern in ("*.json", "*.json.gz")
+        for path in dir_path.glob(pattern)
+        if path.name != MANIFEST_NAME
+    ]
 
 
 class MemoryCheckpointStore:
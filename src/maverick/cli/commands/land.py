@@ -25,9 +25,10 @@ those automations once the underlying state machine lands.
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import click
 from rich.panel import Panel
@@ -35,10 +36,11 @@ from rich.table import Table
 
 from maverick.cli.commands.land_gate import (
     build_report,
-    check_assumption_gate,
     display_verification,
+    evaluate_assumption_gate,
     persist_report_json,
     render_and_persist_land_report,
+    show_gate_evaluation,
 )
 from maverick.cli.commands.land_status import run_status
 from maverick.cli.console import console, err_console
@@ -52,6 +54,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+#: Runway store location, relative to the project root
+_RUNWAY_RELATIVE_PATH = ".maverick/runway"
+
 
 @click.command()
 @click.option(
@@ -180,33 +185,30 @@ async def land(
     out = err_console if json_output else console
 
     # ── 1. Check there are commits to land ──────────────────────────
-    curation_ctx = await gather_curation_context(base, cwd=cwd)
+    # The commit listing (jj) and the assumption gate (bd) read disjoint
+    # state, so the gate evaluates while the commits are listed. Only the
+    # cheap listing happens here: the per-commit diff stats are input to
+    # the curator agent alone, and wait until the gate has cleared.
+    gate_task = asyncio.create_task(evaluate_assumption_gate(cwd))
+    try:
+        curation_ctx = await gather_curation_context(base, cwd=cwd, with_stats=False)
+    except BaseException:
+        await _discard(gate_task)
+        raise
     if not curation_ctx["success"]:
-        if json_output:
-            emit_json(
-                JsonEnvelope.failure(
-                    "land.run",
-                    ErrorKind.VCS,
-                    f"Failed to gather commit context: {curation_ctx['error']}",
-                )
-            )
-        else:
-            err_console.print(
-                format_error(
-                    f"Failed to gather commit context: {curation_ctx['error']}",
-                )
-            )
-        raise SystemExit(ExitCode.FAILURE)
+        await _discard(gate_task)
+        _fail_context(curation_ctx["error"], json_mode=json_output)
 
     commits = curation_ctx["commits"]
     if not commits:
+        await _discard(gate_task)
         if json_output:
             # Same key set as every other `land.run` success document —
             # a consumer reading `result["verification"]` or
             # `result["report"]` must not KeyError just because there was
             # nothing above base. `report` is null here (and only here):
-            # the gate is never evaluated on this path, since there is no
-            # landing to gate.
+            # the gate's result is discarded on this path, since there is
+            # no landing to gate.
             emit_json(
                 JsonEnvelope.success(
                     "land.run",
@@ -243,8 +245,12 @@ async def land(
     # dry-run, successful) renders and persists the grouped provenance
     # report (contracts/cli-land.md); `--dry-run` still evaluates and
     # renders, but only exits non-zero at the end (after the rest of the
-    # preview runs) rather than short-circuiting immediately.
-    gate_blocks, gate_entries, verification = await check_assumption_gate(cwd, quiet=json_output)
+    # preview runs) rather than short-circuiting immediately. A blocked
+    # gate therefore stops a real landing before any diff stats are
+    # gathered or any agent is started.
+    gate = await gate_task
+    show_gate_evaluation(gate, quiet=json_output)
+    gate_blocks, gate_entries, verification = gate.blocks, gate.entries, gate.verification
     degraded = verification is None
     report: LandReport | None = None
     report_paths: dict[str, str | None] = {}
@@ -262,65 +268,86 @@ async def land(
         raise SystemExit(ExitCode.FAILURE)
 
     # ── 2. Curation ────────────────────────────────────────────────
-    curation: dict[str, object] = _curation_summary("none")
-
-    if no_curate:
-        out.print("Skipping curation (--no-curate).")
-    elif heuristic_only and dry_run:
-        # `curate_history` rewrites history (jj absorb + squash). A
-        # dry run is a preview on every other curation path, so it must
-        # be one here too — the agent path already stops at the plan.
-        curation = _curation_summary("heuristic")
-        out.print("Dry run — heuristic curation not applied.")
-    elif heuristic_only:
-        result = await curate_history(base, cwd=cwd)
-        if result["success"]:
-            squashed = result["squashed_count"]
-            absorb_ran = bool(result["absorb_ran"])
-            # `absorb_ran` is a distinct signal from `squashed_count`:
-            # absorb alone rewrites history with zero squashes, which
-            # would otherwise be indistinguishable from "nothing done".
-            curation = _curation_summary(
-                "heuristic",
-                executed_count=squashed,
-                total_count=squashed,
-                absorb_ran=absorb_ran,
-                squashed_count=squashed,
-            )
-            out.print(
-                f"Heuristic curation: absorb={'yes' if absorb_ran else 'no'}, "
-                f"squashed={squashed} commits."
-            )
-        else:
+    # Runway consolidation only touches `.maverick/runway/`. When the VCS
+    # ignores that directory, no jj rewrite below can snapshot it, so the
+    # two run side by side; otherwise consolidation waits for curation to
+    # settle history first (step 3). Once started, consolidation is
+    # awaited even when curation fails — cancelling it could leave the
+    # store half-written.
+    consolidation: asyncio.Task[None] | None = None
+    if not dry_run and not no_consolidate and await _runway_untracked(cwd):
+        consolidation = asyncio.create_task(
+            _maybe_consolidate(cwd, no_consolidate, json_mode=json_output)
+        )
+
+    try:
+        curation: dict[str, object] = _curation_summary("none")
+
+        if no_curate:
+            out.print("Skipping curation (--no-curate).")
+        elif heuristic_only and dry_run:
+            # `curate_history` rewrites history (jj absorb + squash). A
+            # dry run is a preview on every other curation path, so it must
+            # be one here too — the agent path already stops at the plan.
             curation = _curation_summary("heuristic")
-            if json_output:
-                emit_json(
-                    JsonEnvelope.failure(
-                        "land.run",
-                        ErrorKind.CURATION_FAILED,
-                        f"Heuristic curation failed: {result['error']}",
-                    )
+            out.print("Dry run — heuristic curation not applied.")
+        elif heuristic_only:
+            result = await curate_history(base, cwd=cwd)
+            if result["success"]:
+                squashed = result["squashed_count"]
+                absorb_ran = bool(result["absorb_ran"])
+                # `absorb_ran` is a distinct signal from `squashed_count`:
+                # absorb alone rewrites history with zero squashes, which
+                # would otherwise be indistinguishable from "nothing done".
+                curation = _curation_summary(
+                    "heuristic",
+                    executed_count=squashed,
+                    total_count=squashed,
+                    absorb_ran=absorb_ran,
+                    squashed_count=squashed,
+                )
+                out.print(
+                    f"Heuristic curation: absorb={'yes' if absorb_ran else 'no'}, "
+                    f"squashed={squashed} commits."
                 )
             else:
-                err_console.print(
-                    format_error(
-                        f"Heuristic curation failed: {result['error']}",
+                curation = _curation_summary("heuristic")
+                if json_output:
+                    emit_json(
+                        JsonEnvelope.failure(
+                            "land.run",
+                            ErrorKind.CURATION_FAILED,
+                            f"Heuristic curation failed: {result['error']}",
+                        )
                     )
-                )
-            raise SystemExit(ExitCode.FAILURE)
-    else:
-        agent_executed, agent_total = await _agent_curate(
-            curation_ctx=curation_ctx,
-            base=base,
-            dry_run=dry_run,
-            auto_approve=yes,
-            cwd=cwd,
-            json_mode=json_output,
-            run_id=run_id,
-        )
-        curation = _curation_summary(
-            "agent", executed_count=agent_executed, total_count=agent_total
-        )
+                else:
+                    err_console.print(
+                        format_error(
+                            f"Heuristic curation failed: {result['error']}",
+                        )
+                    )
+                raise SystemExit(ExitCode.FAILURE)
+        else:
+            # The curator reads per-commit diff stats; only this path
+            # pays one `jj diff --stat` per commit for them.
+            curation_ctx = await gather_curation_context(base, cwd=cwd)
+            if not curation_ctx["success"]:
+                _fail_context(curation_ctx["error"], json_mode=json_output)
+            agent_executed, agent_total = await _agent_curate(
+                curation_ctx=curation_ctx,
+                base=base,
+                dry_run=dry_run,
+                auto_approve=yes,
+                cwd=cwd,
+                json_mode=json_output,
+                run_id=run_id,
+            )
+            curation = _curation_summary(
+                "agent", executed_count=agent_executed, total_count=agent_total
+            )
+    finally:
+        if consolidation is not None:
+            await consolidation
 
     if dry_run:
         out.print("Dry run — skipping next-step hint.")
@@ -350,7 +377,8 @@ async def land(
         return
 
     # ── 3. Runway consolidation (best-effort) ─────────────────────
-    await _maybe_consolidate(cwd, no_consolidate, json_mode=json_output)
+    if consolidation is None:
+        await _maybe_consolidate(cwd, no_consolidate, json_mode=json_output)
 
     # ── 4. Mode-specific next-step hint ───────────────────────────
     if json_output:
@@ -446,6 +474,22 @@ def _validate_status_flags(
     raise SystemExit(ExitCode.FAILURE)
 
 
+async def _discard(task: asyncio.Task[Any]) -> None:
+    """Cancel *task* and wait for it, ignoring how it ends."""
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+def _fail_context(error: object, *, json_mode: bool) -> NoReturn:
+    """Report a failed ``gather_curation_context`` and exit non-zero."""
+    message = f"Failed to gather commit context: {error}"
+    if json_mode:
+        emit_json(JsonEnvelope.failure("land.run", ErrorKind.VCS, message))
+    else:
+        err_console.print(format_error(message))
+    raise SystemExit(ExitCode.FAILURE)
+
+
 def _curation_summary(
     strategy: str,
     *,
@@ -489,6 +533,19 @@ def _frontier_blocked_envelope(report: LandReport) -> JsonEnvelope:
 # =====================================================================
 
 
+async def _runway_untracked(cwd: Path) -> bool:
+    """True when the VCS ignores the runway store, so curation never snapshots it.
+
+    jj colocates with git and honours ``.gitignore``; any failure to tell
+    (no git, not a repo) answers False, which keeps consolidation serial.
+    """
+    from maverick.runners.command import CommandRunner
+
+    runner = CommandRunner(cwd=cwd, timeout=10.0)
+    result = await runner.run(["git", "check-ignore", "-q", _RUNWAY_RELATIVE_PATH])
+    return result.success
+
+
 async def _maybe_consolidate(
     cwd: Path,
     no_consolidate: bool,
@@ -19,6 +19,7 @@ advertise a false "verified" classification.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from rich.markup import escape
@@ -39,34 +40,48 @@ if TYPE_CHECKING:
     )
 
 __all__ = [
+    "GateEvaluation",
     "build_report",
     "check_assumption_gate",
     "display_verification",
+    "evaluate_assumption_gate",
     "persist_report_json",
     "render_and_persist_land_report",
     "render_land_report_terminal",
+    "show_gate_evaluation",
 ]
 
 
-async def check_assumption_gate(
-    cwd: Path,
-    *,
-    quiet: bool = False,
-) -> tuple[bool, tuple[AssumptionReportEntry, ...], LandVerification | None]:
-    """Evaluate the strict, repo-wide assumption frontier gate.
-
-    Returns ``(blocks, entries, verification)``. The gate blocks on any
-    open entry (any severity, incl. legacy) or any answered entry pending
-    reconciliation (051's predicate) — strict, no bypass flag
-    (Clarifications 2026-07-24). ``entries`` is the full repo-wide
-    materialization (empty when degraded); ``verification`` is ``None``
-    when bd is unavailable or the ledger query failed — the gate degrades
-    open (never blocks) but must not report a false "verified"
-    classification. Prints the blocking table (grouped by owning spec,
-    per-row action hints) as a side effect when the gate blocks, unless
-    ``quiet`` is set (JSON modes, and any caller that renders the full
-    provenance report itself — the blocking rows appear there too, so
-    printing both duplicates every row).
+@dataclass(frozen=True, slots=True)
+class GateEvaluation:
+    """Outcome of one assumption-gate evaluation, before anything is printed.
+
+    Attributes:
+        blocks: True when the frontier is not clear.
+        entries: Full repo-wide materialization (empty when degraded).
+        verification: ``None`` when bd is unavailable or the query failed.
+        frontier: The blocking entries, when the gate was evaluated.
+        error: Why the ledger query failed, when it did.
+    """
+
+    blocks: bool
+    entries: tuple[AssumptionReportEntry, ...] = ()
+    verification: LandVerification | None = None
+    frontier: LandFrontier | None = None
+    error: str | None = None
+
+
+async def evaluate_assumption_gate(cwd: Path) -> GateEvaluation:
+    """Evaluate the strict, repo-wide assumption frontier gate silently.
+
+    The gate blocks on any open entry (any severity, incl. legacy) or any
+    answered entry pending reconciliation (051's predicate) — strict, no
+    bypass flag (Clarifications 2026-07-24). It degrades open (never
+    blocks) when bd is unavailable or the ledger query fails, but leaves
+    ``verification`` unset so no false "verified" classification is
+    reported. Printing is left to :func:`show_gate_evaluation`, so
+    ``land`` can evaluate the gate while it lists commits and still
+    narrate in its usual order.
     """
     from maverick.assumptions.land_report import classify, frontier
     from maverick.assumptions.ledger import report_entries
@@ -74,24 +89,51 @@ async def check_assumption_gate(
 
     client = BeadClient(cwd=cwd)
     if not await client.verify_available():
-        return False, (), None
+        return GateEvaluation(blocks=False)
 
     try:
         entries = await report_entries(client)
     except Exception as exc:  # noqa: BLE001 — non-fatal; gate passes on query failure
-        out = err_console if quiet else console
-        out.print(format_warning(f"Assumption gate check failed: {exc}"))
-        return False, (), None
+        return GateEvaluation(blocks=False, error=str(exc))
 
     land_frontier = frontier(entries)
-    verification = classify(entries)
+    return GateEvaluation(
+        blocks=not land_frontier.is_empty,
+        entries=entries,
+        verification=classify(entries),
+        frontier=land_frontier,
+    )
 
-    if not land_frontier.is_empty:
-        if not quiet:
-            _display_assumption_gate_table(land_frontier)
-        return True, entries, verification
 
-    return False, entries, verification
+def show_gate_evaluation(evaluation: GateEvaluation, *, quiet: bool = False) -> None:
+    """Print a failed query's warning, or the blocking table when the gate blocks.
+
+    ``quiet`` (JSON modes, and any caller that renders the full
+    provenance report itself — the blocking rows appear there too, so
+    printing both duplicates every row) sends the warning to stderr and
+    suppresses the table.
+    """
+    if evaluation.error is not None:
+        out = err_console if quiet else console
+        out.print(format_warning(f"Assumption gate check failed: {evaluation.error}"))
+    elif evaluation.blocks and not quiet and evaluation.frontier is not None:
+        _display_assumption_gate_table(evaluation.frontier)
+
+
+async def check_assumption_gate(
+    cwd: Path,
+    *,
+    quiet: bool = False,
+) -> tuple[bool, tuple[AssumptionReportEntry, ...], LandVerification | None]:
+    """Evaluate the assumption frontier gate and print its outcome.
+
+    Returns ``(blocks, entries, verification)`` from
+    :func:`evaluate_assumption_gate`, after printing as
+    :func:`show_gate_evaluation` does.
+    """
+    evaluation = await evaluate_assumption_gate(cwd)
+    show_gate_evaluation(evaluation, quiet=quiet)
+    return evaluation.blocks, evaluation.entries, evaluation.verification
 
 
 def _display_assumption_gate_table(land_frontier: LandFrontier) -> None:
@@ -37,6 +37,7 @@ rather than the ``locked`` error kind.
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
@@ -46,7 +47,7 @@ from typing import Any, Final
 import click
 
 from maverick.assumptions.errors import AssumptionLedgerError
-from maverick.assumptions.ledger import report_entries
+from maverick.assumptions.ledger import sweep_ledger
 from maverick.assumptions.ledger import waive as ledger_waive
 from maverick.assumptions.models import Severity
 from maverick.assumptions.schedule.clock import now_local
@@ -67,7 +68,9 @@ from maverick.assumptions.schedule.state import (
     TerminalOutcome,
     acquire_lock,
     finalize_state,
+    known_beads,
     load_state,
+    record_sweep,
     release_lock,
     save_state,
 )
@@ -94,6 +97,11 @@ logger = get_logger(__name__)
 #: reporting (FR-015).
 _AUTO_WAIVE_ACTOR: Final = "maverick-scheduler"
 
+#: ntfy pushes in flight at once. Each push retries on its own (inside
+#: ``NtfyDeliverer.deliver``), so one slow or failing batch no longer holds
+#: up the rest of the run's deliveries.
+_MAX_CONCURRENT_DELIVERIES: Final = 4
+
 #: Machine reason (``maverick.cli.common.bd_ready_reason``) -> the message
 #: the ``bd-unavailable`` envelope/console line carries. Mirrors
 #: ``maverick.cli.commands.reconcile._BD_REASON_MESSAGES``.
@@ -195,8 +203,15 @@ async def _evaluate_and_effect(
     evaluate-deliver-save sequence (research R7); contention is a benign
     skip, not a failure.
 
+    The ledger sweep is incremental: bead snapshots persisted by the
+    previous run (:func:`~maverick.assumptions.schedule.state.known_beads`)
+    stand in for the ``bd show`` of every bead whose fingerprint has not
+    changed, and this run's sweep is persisted back with the state. A
+    ``--dry-run`` reads the snapshots but, like everything else, never
+    writes them.
+
     Raises:
-        AssumptionLedgerError: The ledger sweep (``report_entries``) failed.
+        AssumptionLedgerError: The ledger sweep (``sweep_ledger``) failed.
     """
     if not dry_run:
         acquired = await acquire_lock(cwd)
@@ -213,9 +228,10 @@ async def _evaluate_and_effect(
             )
 
     try:
-        entries = await report_entries(client)
         state = await load_state(cwd)
         now = now_local()
+        known = known_beads(state, now)
+        entries, swept = await sweep_ledger(client, known=known)
         outcome = evaluate(entries, schedule, state, now)
 
         delivered: list[DeliveryDecision] = []
@@ -234,14 +250,7 @@ async def _evaluate_and_effect(
                     "notify: notifications.topic must be validated before delivery"
                 )
             async with NtfyDeliverer(server=notif.server, topic=topic) as deliverer:
-                for index, decision in enumerate(outcome.deliveries):
-                    try:
-                        await deliverer.deliver(decision.kind, decision.summary)
-                        delivered.append(decision)
-                    except DeliveryFailedError as exc:
-                        failed.append(
-                            _DeliveryOutcome(decision=decision, index=index, error=str(exc))
-                        )
+                delivered, failed = await _deliver_all(deliverer, outcome.deliveries)
 
         auto_waived: list[AutoWaiveDecision] = []
         if dry_run:
@@ -257,6 +266,7 @@ async def _evaluate_and_effect(
                 now=now,
             )
             final_state = _apply_auto_waive_terminal(final_state, auto_waived, now)
+            final_state = record_sweep(final_state, swept, known, now)
             await save_state(final_state, cwd)
 
         return _NotifyRun(
@@ -274,6 +284,35 @@ async def _evaluate_and_effect(
             await release_lock(cwd)
 
 
+async def _deliver_all(
+    deliverer: NtfyDeliverer, decisions: Sequence[DeliveryDecision]
+) -> tuple[list[DeliveryDecision], list[_DeliveryOutcome]]:
+    """Push every decision, at most :data:`_MAX_CONCURRENT_DELIVERIES` at once.
+
+    Each push succeeds or fails on its own; a failure is recorded against
+    its index into *decisions* so
+    :func:`~maverick.assumptions.schedule.state.finalize_state` strips
+    exactly that decision's mutations.
+
+    Returns:
+        ``(delivered, failed)``, each in *decisions* order.
+    """
+    limiter = asyncio.Semaphore(_MAX_CONCURRENT_DELIVERIES)
+
+    async def _one(index: int, decision: DeliveryDecision) -> _DeliveryOutcome | None:
+        async with limiter:
+            try:
+                await deliverer.deliver(decision.kind, decision.summary)
+            except DeliveryFailedError as exc:
+                return _DeliveryOutcome(decision=decision, index=index, error=str(exc))
+        return None
+
+    results = await asyncio.gather(*(_one(i, d) for i, d in enumerate(decisions)))
+    delivered = [d for d, result in zip(decisions, results, strict=True) if result is None]
+    failed = [result for result in results if result is not None]
+    return delivered, failed
+
+
 async def _execute_auto_waives(
     *, client: BeadClient, decisions: Sequence[AutoWaiveDecision]
 ) -> list[AutoWaiveDecision]:
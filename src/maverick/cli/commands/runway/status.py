@@ -17,7 +17,8 @@ from maverick.cli.output import format_bytes, format_warning
 @click.pass_context
 @async_command
 async def status(ctx: click.Context) -> None:
-    """Show runway knowledge store status."""
+    """Show runway knowledge store status and per-agent prompt-cache hit ratio."""
+    from maverick.prompt_cache import cache_usage_by_actor
     from maverick.runway.store import RunwayStore
 
     project_path = Path.cwd().resolve()
@@ -47,3 +48,23 @@ async def status(ctx: click.Context) -> None:
     )
 
     console.print(table)
+
+    usage = cache_usage_by_actor(await store.get_cost_entries())
+    if not usage:
+        return
+
+    cache_table = Table(title="Prompt cache", padding=(0, 2))
+    cache_table.add_column("Agent", style="bold")
+    cache_table.add_column("Sends", justify="right")
+    cache_table.add_column("Prompt tokens", justify="right")
+    cache_table.add_column("Cache read", justify="right")
+    cache_table.add_column("Hit ratio", justify="right")
+    for actor, totals in sorted(usage.items()):
+        cache_table.add_row(
+            actor,
+            str(totals.sends),
+            f"{totals.prompt_tokens:,}",
+            f"{totals.cache_read_tokens:,}",
+            f"{totals.hit_ratio:.0%}",
+        )
+    console.print(cache_table)
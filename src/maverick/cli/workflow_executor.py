@@ -8,6 +8,7 @@ See docs/cli-output-rules.md for the rendering rules.
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -26,6 +27,7 @@ from maverick.cli.common import (
 from maverick.cli.console import console, err_console
 from maverick.cli.context import ExitCode
 from maverick.cli.output import format_error
+from maverick.event_bus import ProgressEventBus, broadcast, drain
 from maverick.logging import get_logger
 
 logger = get_logger(__name__)
@@ -180,6 +182,16 @@ async def render_workflow_events(
     Uses Rich Live tables for agent fan-out phases (briefing, decompose
     detail) and sequential output for everything else.
 
+    *events* is drained by its own task into one
+    :class:`~maverick.event_bus.ProgressEventBus` per sink — the terminal
+    and, when given, the journal — each consumed by a separate task. A
+    slow sink falls behind on its own bus, where stream chunks coalesce
+    and interim status lines are superseded; once that bus is full, any
+    event it cannot absorb holds back the workflow, and the other sink
+    with it, until the slow sink catches up. An
+    exception raised by *events* is re-raised here once both sinks have
+    finished.
+
     Args:
         events: Async iterator of ProgressEvent instances.
         console_obj: Rich Console to render to.
@@ -188,6 +200,48 @@ async def render_workflow_events(
         total_steps: Total step count for progress numbering.
         verbosity: Verbosity level. 0 = normal, 1+ = verbose.
     """
+    render_bus = ProgressEventBus()
+    buses: list[asyncio.Queue[ProgressEvent | None]] = [render_bus]
+    journal_task: asyncio.Task[None] | None = None
+    if session_journal is not None:
+        journal_bus = ProgressEventBus()
+        buses.insert(0, journal_bus)
+        journal_task = asyncio.create_task(_record_events(journal_bus, session_journal))
+    pump = asyncio.create_task(broadcast(events, *buses))
+
+    try:
+        await _render_events(
+            drain(render_bus),
+            console_obj,
+            total_steps=total_steps,
+            verbosity=verbosity,
+        )
+    except BaseException:
+        pump.cancel()
+        await asyncio.gather(pump, return_exceptions=True)
+        raise
+    finally:
+        if journal_task is not None:
+            await journal_task
+    await pump
+
+
+async def _record_events(
+    bus: asyncio.Queue[ProgressEvent | None], journal: SessionJournal
+) -> None:
+    """Journal sink: record every event from *bus* until end-of-stream."""
+    async for event in drain(bus):
+        await journal.record(event)
+
+
+async def _render_events(
+    events: AsyncIterator[ProgressEvent],
+    console_obj: Any,
+    *,
+    total_steps: int | None,
+    verbosity: int,
+) -> None:
+    """Terminal sink: the rendering loop behind :func:`render_workflow_events`."""
     from maverick.events import (
         AgentCompleted,
         AgentStarted,
@@ -244,9 +298,6 @@ async def render_workflow_events(
     }
 
     async for event in events:
-        if session_journal is not None:
-            await session_journal.record(event)
-
         if isinstance(event, ValidationStarted):
             console_obj.print("[cyan]Validating workflow...[/]", end="")
 
@@ -642,3 +693,7 @@ async def execute_python_workflow(
                 )
             )
             raise SystemExit(ExitCode.FAILURE) from exc
+        finally:
+            # Drain the journal's buffered events before the process exits.
+            if journal is not None:
+                await journal.aclose()
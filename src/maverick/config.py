@@ -16,6 +16,7 @@ from pydantic_settings import (
 
 from maverick.assumptions.matching import PRESENTATION_THRESHOLD
 from maverick.exceptions import ConfigError
+from maverick.hedging import HedgePolicy
 from maverick.logging import get_logger
 
 __all__ = [
@@ -30,6 +31,7 @@ __all__ = [
     "AutoWaivePolicyConfig",
     "CustomToolConfig",
     "GitHubConfig",
+    "HedgingConfig",
     "MaverickConfig",
     "NotificationConfig",
     "ParallelConfig",
@@ -259,6 +261,45 @@ class DecomposerTiersConfig(BaseModel):
     escalation_threshold: int = Field(default=1, ge=0, le=5)
 
 
+class HedgingConfig(BaseModel):
+    """Hedged duplicates for straggling calls in refuel fan-out phases.
+
+    With ``enabled``, a briefing or detail request that has run longer
+    than ``percentile`` of the same phase's completed calls gets a
+    duplicate (detail requests on the next escalation tier, when one is
+    configured); the first to finish wins and the other is cancelled.
+    See :mod:`maverick.hedging`.
+
+    Attributes:
+        enabled: Opt in to hedging. Default ``False``.
+        percentile: Latency percentile that triggers a duplicate.
+        min_samples: Completed calls a phase needs before it can hedge
+            (briefing, with one call per role, caps this at its number
+            of sibling calls).
+        max_hedges: Duplicates per run, at most.
+        max_cost_usd: Stop hedging once it has cost this much in a run —
+            completed duplicates plus an estimate for cancelled legs
+            (``None`` = capped by ``max_hedges`` only).
+    """
+
+    enabled: bool = False
+    percentile: float = Field(default=0.9, gt=0.0, le=1.0)
+    min_samples: int = Field(default=3, ge=1, le=100)
+    max_hedges: int = Field(default=4, ge=0, le=50)
+    max_cost_usd: float | None = Field(default=None, ge=0.0)
+
+    def to_policy(self) -> HedgePolicy | None:
+        """The :class:`~maverick.hedging.HedgePolicy` to run with, or ``None`` when disabled."""
+        if not self.enabled or self.max_hedges == 0:
+            return None
+        return HedgePolicy(
+            percentile=self.percentile,
+            min_samples=self.min_samples,
+            max_hedges=self.max_hedges,
+            max_cost_usd=self.max_cost_usd,
+        )
+
+
 class ParallelConfig(BaseModel):
     """Settings for concurrency limits.
 
@@ -274,6 +315,15 @@ class ParallelConfig(BaseModel):
             detail phase. Default ``3`` matches the legacy hardcoded
             value. Lower this on resource-constrained hosts (e.g. dev
             containers).
+        decomposer_prewarm: Decomposer agents to open ahead of the refuel
+            detail fan-out, in the background while the outline pass
+            runs (capped by ``decomposer_pool_size``). Default ``0``
+            opens agents on demand, so the first fan-out wave waits on
+            their cold starts.
+        decomposer_batch_units: Most work units one refuel detail request
+            asks for. Default ``4``; small units share a request (and its
+            round-trip) while larger ones are split by estimated token
+            cost. ``1`` requests every unit on its own.
         max_briefing_agents: Cap on briefing agents running in parallel
             during refuel and plan generation. Default ``3`` matches the
             current behaviour (navigator/structuralist/recon — or
@@ -283,13 +333,18 @@ class ParallelConfig(BaseModel):
         max_parallel_reviewers: Cap on parallel review agents
             (completeness + correctness). Default ``2`` matches the current
             behaviour. Setting to ``1`` runs them sequentially.
+        hedging: Hedged duplicates for straggling refuel fan-out calls
+            (:class:`HedgingConfig`); off by default.
     """
 
     max_agents: int = Field(default=3, gt=0, le=10)
     max_tasks: int = Field(default=5, gt=0, le=20)
     decomposer_pool_size: int = Field(default=3, ge=0, le=10)
+    decomposer_prewarm: int = Field(default=0, ge=0, le=10)
+    decomposer_batch_units: int = Field(default=4, ge=1, le=20)
     max_briefing_agents: int = Field(default=3, ge=1, le=10)
     max_parallel_reviewers: int = Field(default=2, ge=1, le=4)
+    hedging: HedgingConfig = Field(default_factory=HedgingConfig)
 
 
 class TuiMetricsConfig(BaseModel):
@@ -372,6 +427,12 @@ class WorkspaceConfig(BaseModel):
         enabled: Opt-in for `maverick fly --isolated`'s default (FR-030,
             SC-011) — off by default; `--isolated`/`--no-isolated` override
             this at the CLI boundary.
+        pool_size: Idle workspaces fly keeps ready in the background so a
+            bead claims one instead of waiting on ``jj workspace add``;
+            a bead that succeeds hands its workspace back. ``0`` (the
+            default) disables the pool. A recycled workspace starts on a
+            fresh jj change, but gitignored files (build output, caches)
+            from earlier beads remain — that is what makes it warm.
 
     ``setup``/``teardown``/``env_files`` (the clone-era bootstrap hooks)
     were removed here (research.md R10): nothing has read them since the
@@ -392,6 +453,7 @@ class WorkspaceConfig(BaseModel):
 
     root: Path = Field(default_factory=lambda: Path.home() / ".maverick" / "workspaces")
     enabled: bool = False
+    pool_size: int = Field(default=0, ge=0, le=16)
 
 
 class RunwayConsolidationConfig(BaseModel):
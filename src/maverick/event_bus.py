@@ -0,0 +1,257 @@
+"""Bounded, coalescing queue for :class:`~maverick.events.ProgressEvent` streams.
+
+Every workflow hands its actions an ``asyncio.Queue[ProgressEvent | None]``
+and drains it into a renderer and a session journal. An unbounded queue
+lets a bursty phase (detail fan-out, briefing fan-out, a streaming agent)
+grow it without limit. :class:`ProgressEventBus` is a drop-in
+``asyncio.Queue`` with a capacity and a per-kind admission policy:
+
+* **Coalesce** — an :class:`~maverick.events.AgentStreamChunk` is appended
+  to the text of the queued chunk from the same agent, step and chunk
+  type when that chunk is still the newest entry (or, once the bus is
+  full, wherever it sits), instead of taking a slot of its own. Tool-call
+  chunks (``"[TOOL] ..."``) are rendered one per line and never merge.
+* **Supersede** — a :class:`~maverick.events.StepOutput` whose
+  ``metadata`` carries :data:`INTERIM_METADATA_KEY` is an interim status
+  line ("Detail 3/45 complete"): it replaces a still-queued line with the
+  same step and key, and is dropped rather than waited on when the bus is
+  full.
+* **Lifecycle** — everything else (step, agent, validation, rollback
+  events, warnings) is never merged or dropped. A ``put`` waits for space
+  when the bus is full, which is the only backpressure producers see.
+
+The ``None`` end-of-stream sentinel is always admitted, even at capacity.
+
+:func:`broadcast` and :func:`drain` wire one producer stream to several
+consumers, each behind its own bus. Events are handed to the buses in
+lockstep: while a slow sink's (the terminal's, the journal's) bus has
+room, or can absorb the event, it only falls behind on its own; an event
+its full bus must queue — a lifecycle event, or a chunk with nothing to
+merge into — holds back the source, and with it every other sink, until
+that sink makes room.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+from collections import deque
+from collections.abc import AsyncIterator, Hashable
+from enum import StrEnum
+from typing import cast
+
+from maverick.events import AgentStreamChunk, ProgressEvent, StepOutput
+from maverick.logging import get_logger
+
+__all__ = [
+    "DEFAULT_BUS_CAPACITY",
+    "INTERIM_METADATA_KEY",
+    "EventPolicy",
+    "ProgressEventBus",
+    "broadcast",
+    "drain",
+    "event_policy",
+]
+
+logger = get_logger(__name__)
+
+#: Default number of queued events before lifecycle ``put`` calls wait
+DEFAULT_BUS_CAPACITY = 1024
+
+#: ``StepOutput.metadata`` key marking an interim status line; its value
+#: names the line, and a newer line with the same step and name replaces it
+INTERIM_METADATA_KEY = "interim"
+
+#: Prefix of tool-call stream chunks, which render as one line each
+_TOOL_CHUNK_PREFIX = "[TOOL] "
+
+
+class EventPolicy(StrEnum):
+    """How :class:`ProgressEventBus` admits an event.
+
+    Attributes:
+        LIFECYCLE: Queued as-is; never merged or dropped.
+        COALESCE: Merged into a queued event with the same key.
+        SUPERSEDE: Replaces a queued event with the same key; dropped
+            when the bus is full.
+    """
+
+    LIFECYCLE = "lifecycle"
+    COALESCE = "coalesce"
+    SUPERSEDE = "supersede"
+
+
+def event_policy(event: ProgressEvent | None) -> tuple[EventPolicy, Hashable | None]:
+    """Classify *event* for admission.
+
+    Returns:
+        The policy and, for ``COALESCE``/``SUPERSEDE``, the key events
+        must share to be merged or replaced (``None`` for ``LIFECYCLE``).
+    """
+    if isinstance(event, AgentStreamChunk) and not event.text.startswith(_TOOL_CHUNK_PREFIX):
+        key = ("chunk", event.step_path, event.step_name, event.agent_name, event.chunk_type)
+        return EventPolicy.COALESCE, key
+    if isinstance(event, StepOutput) and event.metadata:
+        interim = event.metadata.get(INTERIM_METADATA_KEY)
+        if interim is not None:
+            return EventPolicy.SUPERSEDE, ("interim", event.step_path, event.step_name, interim)
+    return EventPolicy.LIFECYCLE, None
+
+
+class _Slot:
+    """A queued event; coalescing and superseding rewrite it in place."""
+
+    __slots__ = ("event", "key")
+
+    def __init__(self, event: ProgressEvent | None, key: Hashable | None) -> None:
+        self.event = event
+        self.key = key
+
+
+class ProgressEventBus(asyncio.Queue[ProgressEvent | None]):
+    """``asyncio.Queue`` of progress events with bounded capacity.
+
+    See the module docstring for the admission policies. ``qsize()`` and
+    ``maxsize`` count queued slots, so a burst of coalesced chunks or
+    superseded status lines occupies one.
+
+    Args:
+        maxsize: Capacity (``0`` means unbounded, as for ``asyncio.Queue``;
+            events are still coalesced and superseded).
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_BUS_CAPACITY) -> None:
+        super().__init__(maxsize)
+        self._closing = False
+        self._coalesced = 0
+        self._dropped = 0
+
+    @property
+    def coalesced_count(self) -> int:
+        """Events merged into, or superseding, an already queued event."""
+        return self._coalesced
+
+    @property
+    def dropped_count(self) -> int:
+        """Interim status lines discarded because the bus was full."""
+        return self._dropped
+
+    def full(self) -> bool:
+        # The end-of-stream sentinel is never refused.
+        return not self._closing and super().full()
+
+    def put_nowait(self, item: ProgressEvent | None) -> None:
+        """Admit *item* without waiting.
+
+        Raises:
+            asyncio.QueueFull: A lifecycle event or unmergeable chunk
+                arrived while the bus is full.
+        """
+        if item is None:
+            self._closing = True
+            try:
+                super().put_nowait(None)
+            finally:
+                self._closing = False
+            return
+        if self._absorb(item):
+            return
+        super().put_nowait(item)
+
+    async def put(self, item: ProgressEvent | None) -> None:
+        """Admit *item*, waiting for space only when it cannot be absorbed."""
+        if item is None or not self._absorb(item):
+            # ``Queue.put`` re-enters ``put_nowait`` once there is room, so
+            # an event that arrives while waiting can still be absorbed.
+            await super().put(item)
+
+    # ------------------------------------------------------------------
+    # asyncio.Queue storage hooks
+    # ------------------------------------------------------------------
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: deque[_Slot] = deque()
+        # Newest queued slot per coalesce/supersede key
+        self._keyed: dict[Hashable, _Slot] = {}
+
+    def _put(self, item: ProgressEvent | None) -> None:
+        _, key = event_policy(item)
+        slot = _Slot(item, key)
+        self._queue.append(slot)
+        if key is not None:
+            self._keyed[key] = slot
+
+    def _get(self) -> ProgressEvent | None:
+        slot = self._queue.popleft()
+        if slot.key is not None and self._keyed.get(slot.key) is slot:
+            del self._keyed[slot.key]
+        return slot.event
+
+    # ------------------------------------------------------------------
+    # Admission
+    # ------------------------------------------------------------------
+
+    def _absorb(self, item: ProgressEvent) -> bool:
+        """Merge, replace or drop *item* in place of queuing it.
+
+        Returns:
+            True when *item* needs no slot of its own.
+        """
+        policy, key = event_policy(item)
+        if policy is EventPolicy.LIFECYCLE:
+            return False
+        slot = self._keyed.get(key)
+
+        if policy is EventPolicy.COALESCE:
+            # Merging anywhere but the tail moves text ahead of events
+            # queued after it, so that is reserved for a full bus.
+            if slot is None or (slot is not self._queue[-1] and not self.full()):
+                return False
+            previous = cast(AgentStreamChunk, slot.event)
+            text = previous.text + cast(AgentStreamChunk, item).text
+            slot.event = dataclasses.replace(previous, text=text)
+            self._coalesced += 1
+            return True
+
+        if slot is not None:
+            slot.event = item
+            self._coalesced += 1
+            return True
+        if self.full():
+            self._dropped += 1
+            return True
+        return False
+
+
+async def broadcast(
+    source: AsyncIterator[ProgressEvent], *buses: asyncio.Queue[ProgressEvent | None]
+) -> None:
+    """Copy every event from *source* onto each of *buses*, then close them.
+
+    Buses are fed in the order given, each ``put`` awaited before the next
+    event is read, so a full bus that must queue an event stalls the source
+    for all of them (see the module docstring). Each receives the ``None`` sentinel
+    when *source* is exhausted, raises, or this coroutine is cancelled, so
+    every :func:`drain` over them terminates; an exception from *source*
+    propagates to whoever awaits this coroutine.
+    """
+    try:
+        async for event in source:
+            for bus in buses:
+                await bus.put(event)
+    finally:
+        for bus in buses:
+            try:
+                bus.put_nowait(None)
+            except asyncio.QueueFull:
+                # A plain asyncio.Queue at capacity; its consumer is gone.
+                logger.warning("event_bus_sentinel_dropped")
+
+
+async def drain(bus: asyncio.Queue[ProgressEvent | None]) -> AsyncIterator[ProgressEvent]:
+    """Yield events from *bus* until its ``None`` sentinel."""
+    while True:
+        event = await bus.get()
+        if event is None:
+            return
+        yield event
@@ -37,6 +37,15 @@ class BeadCreationError(BeadError):
         super().__init__(message)
 
 
+class BeadGraphUnsupportedError(BeadCreationError):
+    """The installed ``bd`` predates ``bd create --graph``.
+
+    Raised only for bd's ``unknown flag: --graph``; callers fall back to
+    creating beads one at a time. Every other ``--graph`` failure is a
+    real :class:`BeadCreationError`.
+    """
+
+
 class BeadDependencyError(BeadError):
     """Failed to add a dependency between beads via ``bd dep add``.
 
@@ -4,7 +4,7 @@ This package provides:
 - FlightPlan and WorkUnit frozen Pydantic models
 - Markdown+YAML frontmatter parsing
 - File loaders (FlightPlanFile, WorkUnitFile)
-- Dependency resolver (resolve_execution_order)
+- Dependency resolver (resolve_execution_order, WorkUnitScheduler)
 - Round-trip serialization
 - Skeleton generator (generate_skeleton)
 - Structural validator (validate_flight_plan_file, ValidationIssue)
@@ -49,7 +49,7 @@ from maverick.flight.parser import (
     parse_frontmatter,
     parse_work_unit_sections,
 )
-from maverick.flight.resolver import resolve_execution_order
+from maverick.flight.resolver import WorkUnitScheduler, resolve_execution_order
 from maverick.flight.serializer import serialize_flight_plan, serialize_work_unit
 from maverick.flight.template import generate_skeleton
 from maverick.flight.validator import ValidationIssue, validate_flight_plan_file
@@ -77,6 +77,7 @@ __all__: list[str] = [
     "FlightPlanFile",
     "WorkUnitFile",
     # Resolver
+    "WorkUnitScheduler",
     "resolve_execution_order",
     # Serializers
     "serialize_flight_plan",
@@ -11,8 +11,9 @@ Algorithm overview:
    :class:`~maverick.flight.errors.WorkUnitDependencyError`).  Then build an
    ID-to-unit lookup map and validate that all ``depends_on`` IDs reference
    known units (raises :exc:`WorkUnitDependencyError` with ``missing_id`` set).
-2. DFS topological sort with explicit ``in_stack`` tracking for cycle
-   detection (raises :exc:`WorkUnitDependencyError` with ``cycle`` set).
+2. Iterative DFS topological sort with explicit ``in_stack`` tracking for
+   cycle detection (raises :exc:`WorkUnitDependencyError` with ``cycle``
+   set).  No recursion, so arbitrarily deep chains are fine.
 3. Compute the dependency *level* for each unit:
    ``level = max(dep_levels) + 1``, or ``0`` when the unit has no deps.
 4. Group units by level into ordered tiers.
@@ -21,11 +22,20 @@ Algorithm overview:
    :class:`ExecutionBatch` with that group label.  Units whose
    ``parallel_group`` is ``None`` are collected into a single ungrouped
    batch for their tier.
+
+Tiers are a barrier: a unit in tier *n* waits for every unit in tier
+*n - 1*, even ones it does not depend on.  For dispatching work, use
+:class:`WorkUnitScheduler` instead, which releases each unit as soon as its
+own dependencies are done and hands out ready units longest-remaining-path
+first, so total time is bounded by the critical path rather than the sum of
+the slowest unit in each tier.
 """
 
 from __future__ import annotations
 
+import heapq
 from collections import defaultdict
+from collections.abc import Iterable, Mapping
 
 from maverick.flight.errors import WorkUnitDependencyError
 from maverick.flight.models import ExecutionBatch, ExecutionOrder, WorkUnit
@@ -33,6 +43,15 @@ from maverick.logging import get_logger
 
 logger = get_logger(__name__)
 
+#: Relative cost of a unit with no recorded duration, by decomposer complexity
+_COMPLEXITY_WEIGHTS: dict[str | None, float] = {
+    "trivial": 0.5,
+    "simple": 1.0,
+    "moderate": 2.0,
+    "complex": 4.0,
+    None: 1.0,
+}
+
 
 def resolve_execution_order(units: list[WorkUnit]) -> ExecutionOrder:
     """Resolve dependency order using topological sort.
@@ -59,56 +78,11 @@ def resolve_execution_order(units: list[WorkUnit]) -> ExecutionOrder:
 
     # --- 1. Build lookup and validate deps -----------------------------------
 
-    # Check for duplicate IDs before building the map.
-    seen_ids: dict[str, int] = {}
-    for u in units:
-        seen_ids[u.id] = seen_ids.get(u.id, 0) + 1
-    duplicates = [uid for uid, count in seen_ids.items() if count > 1]
-    if duplicates:
-        raise WorkUnitDependencyError(
-            f"Duplicate work unit IDs: {', '.join(sorted(duplicates))}",
-        )
-
-    unit_map: dict[str, WorkUnit] = {u.id: u for u in units}
-
-    for unit in units:
-        for dep_id in unit.depends_on:
-            if dep_id not in unit_map:
-                raise WorkUnitDependencyError(
-                    f"Work unit '{unit.id}' depends on unknown unit '{dep_id}'",
-                    missing_id=dep_id,
-                )
+    unit_map = _build_unit_map(units)
 
     # --- 2. DFS topological sort with cycle detection -----------------------
 
-    visited: set[str] = set()
-    in_stack: set[str] = set()
-    path: list[str] = []
-    topo_order: list[str] = []
-
-    def _visit(uid: str) -> None:
-        if uid in in_stack:
-            # Extract the exact cycle from the DFS path.
-            start = path.index(uid)
-            cycle = path[start:] + [uid]
-            raise WorkUnitDependencyError(
-                f"Circular dependency detected involving '{uid}': {' -> '.join(cycle)}",
-                cycle=cycle,
-            )
-        if uid in visited:
-            return
-
-        in_stack.add(uid)
-        path.append(uid)
-        for dep_id in unit_map[uid].depends_on:
-            _visit(dep_id)
-        path.pop()
-        in_stack.remove(uid)
-        visited.add(uid)
-        topo_order.append(uid)
-
-    for uid in unit_map:
-        _visit(uid)
+    topo_order = _topological_order(unit_map)
 
     logger.debug(
         "resolve_execution_order.topo_order",
@@ -151,3 +125,208 @@ def resolve_execution_order(units: list[WorkUnit]) -> ExecutionOrder:
     )
 
     return ExecutionOrder(batches=tuple(batches))
+
+
+class WorkUnitScheduler:
+    """Dynamic ready queue over a set of work units.
+
+    A unit becomes ready the moment every unit in its ``depends_on`` has
+    been marked :meth:`done`; there are no tier barriers.  Ready units are
+    handed out highest priority first, where priority is the weight of the
+    longest dependency path from the unit to the end of the plan (its own
+    weight included).  Starting critical-path work first keeps the total
+    run time close to the critical path length on wide or uneven plans.
+
+    Weights come from ``durations`` (e.g. historical run times, any
+    consistent unit) and fall back to a relative cost by ``complexity``.
+
+    Example:
+        ```python
+        scheduler = WorkUnitScheduler(units, durations=history)
+        while scheduler.is_active():
+            for unit in scheduler.get_ready():
+                start(unit)
+            finished = await next_finished()
+            scheduler.done(finished.id)
+        ```
+
+    Raises:
+        WorkUnitDependencyError: On construction, for the same problems
+            :func:`resolve_execution_order` reports.
+    """
+
+    def __init__(
+        self,
+        units: Iterable[WorkUnit],
+        *,
+        durations: Mapping[str, float] | None = None,
+    ) -> None:
+        self._units = _build_unit_map(list(units))
+        topo_order = _topological_order(self._units)
+        self._sequence = {uid: index for index, uid in enumerate(self._units)}
+
+        durations = durations or {}
+        self._weights = {
+            uid: float(durations.get(uid, _COMPLEXITY_WEIGHTS.get(unit.complexity, 1.0)))
+            for uid, unit in self._units.items()
+        }
+
+        self._dependents: dict[str, list[str]] = defaultdict(list)
+        self._waiting_on: dict[str, int] = {}
+        for uid, unit in self._units.items():
+            self._waiting_on[uid] = len(set(unit.depends_on))
+            for dep_id in dict.fromkeys(unit.depends_on):
+                self._dependents[dep_id].append(uid)
+
+        # Longest remaining path: walk dependents-before-dependencies.
+        self._priority: dict[str, float] = {}
+        self._next_on_path: dict[str, str | None] = {}
+        for uid in reversed(topo_order):
+            best: str | None = None
+            for child in self._dependents.get(uid, ()):
+                if best is None or self._priority[child] > self._priority[best]:
+                    best = child
+            self._next_on_path[uid] = best
+            tail = self._priority[best] if best is not None else 0.0
+            self._priority[uid] = self._weights[uid] + tail
+
+        self._ready: list[tuple[float, int, str]] = []
+        for uid, waiting in self._waiting_on.items():
+            if waiting == 0:
+                self._push(uid)
+        self._outstanding = len(self._units)
+        self._started: set[str] = set()
+        self._done: set[str] = set()
+
+    def priority(self, unit_id: str) -> float:
+        """Longest remaining path weight from ``unit_id`` (inclusive)."""
+        return self._priority[unit_id]
+
+    @property
+    def critical_path(self) -> tuple[str, ...]:
+        """IDs along the heaviest dependency chain, first to last."""
+        roots = [uid for uid, unit in self._units.items() if not unit.depends_on]
+        if not roots:
+            return ()
+        uid: str | None = max(roots, key=lambda r: (self._priority[r], -self._sequence[r]))
+        path: list[str] = []
+        while uid is not None:
+            path.append(uid)
+            uid = self._next_on_path[uid]
+        return tuple(path)
+
+    @property
+    def critical_path_length(self) -> float:
+        """Total weight of :attr:`critical_path`."""
+        return max(self._priority.values(), default=0.0)
+
+    def get_ready(self, limit: int | None = None) -> tuple[WorkUnit, ...]:
+        """Hand out ready units, highest priority first.
+
+        Each unit is returned once; returned units count as started.
+
+        Args:
+            limit: Maximum number of units to return (e.g. free worker
+                slots). ``None`` returns every ready unit.
+        """
+        ready: list[WorkUnit] = []
+        while self._ready and (limit is None or len(ready) < limit):
+            _, _, uid = heapq.heappop(self._ready)
+            self._started.add(uid)
+            ready.append(self._units[uid])
+        return tuple(ready)
+
+    def done(self, unit_id: str) -> None:
+        """Mark a started unit finished, releasing dependents that were waiting on it.
+
+        Raises:
+            ValueError: If ``unit_id`` was not handed out by :meth:`get_ready`
+                or was already marked done.
+        """
+        if unit_id not in self._started or unit_id in self._done:
+            raise ValueError(f"Work unit '{unit_id}' is not in progress")
+        self._done.add(unit_id)
+        self._outstanding -= 1
+        for child in self._dependents.get(unit_id, ()):
+            self._waiting_on[child] -= 1
+            if self._waiting_on[child] == 0:
+                self._push(child)
+
+    def is_active(self) -> bool:
+        """True while any unit has not been marked done."""
+        return self._outstanding > 0
+
+    def _push(self, uid: str) -> None:
+        heapq.heappush(self._ready, (-self._priority[uid], self._sequence[uid], uid))
+
+
+def _build_unit_map(units: list[WorkUnit]) -> dict[str, WorkUnit]:
+    """Index units by ID, rejecting duplicate IDs and unknown dependencies."""
+    # Check for duplicate IDs before building the map.
+    seen_ids: dict[str, int] = {}
+    for u in units:
+        seen_ids[u.id] = seen_ids.get(u.id, 0) + 1
+    duplicates = [uid for uid, count in seen_ids.items() if count > 1]
+    if duplicates:
+        raise WorkUnitDependencyError(
+            f"Duplicate work unit IDs: {', '.join(sorted(duplicates))}",
+        )
+
+    unit_map: dict[str, WorkUnit] = {u.id: u for u in units}
+
+    for unit in units:
+        for dep_id in unit.depends_on:
+            if dep_id not in unit_map:
+                raise WorkUnitDependencyError(
+                    f"Work unit '{unit.id}' depends on unknown unit '{dep_id}'",
+                    missing_id=dep_id,
+                )
+    return unit_map
+
+
+def _topological_order(unit_map: dict[str, WorkUnit]) -> list[str]:
+    """Return unit IDs dependencies-first (DFS post-order, no recursion).
+
+    Raises:
+        WorkUnitDependencyError: With ``cycle`` set to the offending path.
+    """
+    visited: set[str] = set()
+    in_stack: set[str] = set()
+    path: list[str] = []
+    topo_order: list[str] = []
+
+    for root in unit_map:
+        if root in visited:
+            continue
+        # Each frame is (unit ID, index of the next dependency to visit).
+        stack: list[tuple[str, int]] = [(root, 0)]
+        in_stack.add(root)
+        path.append(root)
+        while stack:
+            uid, next_dep = stack[-1]
+            deps = unit_map[uid].depends_on
+            if next_dep < len(deps):
+                stack[-1] = (uid, next_dep + 1)
+                dep_id = deps[next_dep]
+                if dep_id in in_stack:
+                    # Extract the exact cycle from the DFS path.
+                    start = path.index(dep_id)
+                    cycle = path[start:] + [dep_id]
+                    raise WorkUnitDependencyError(
+                        f"Circular dependency detected involving '{dep_id}': {' -> '.join(cycle)}",
+                        cycle=cycle,
+                    )
+                if dep_id not in visited:
+                    in_stack.add(dep_id)
+                    path.append(dep_id)
+                    stack.append((dep_id, 0))
+                continue
+            stack.pop()
+            path.pop()
+            in_stack.remove(uid)
+            visited.add(uid)
+            topo_order.append(uid)
+    return topo_order
+
+
+__all__ = ["WorkUnitScheduler", "resolve_execution_order"]
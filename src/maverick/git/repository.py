@@ -34,10 +34,11 @@ from __future__ import annotations
 import asyncio
 import re
 import warnings
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import Literal
 
 from git import GitCommandError, InvalidGitRepositoryError, Repo
 from git.exc import GitCommandNotFound
@@ -84,6 +85,13 @@ DEFAULT_NETWORK_TIMEOUT: float = 60.0
 #: Maximum retries for network operations
 MAX_NETWORK_RETRIES: int = 3
 
+#: ``git status --untracked-files`` modes accepted by :meth:`GitRepository.status`
+UntrackedMode = Literal["all", "normal", "no"]
+
+#: Space-separated fields before the path in each porcelain v2 entry kind
+#: (ordinary, rename/copy, unmerged); the path itself may contain spaces.
+_PORCELAIN_FIELD_COUNTS: dict[str, int] = {"1": 8, "2": 9, "u": 10}
+
 #: Branch timestamp format for fallback naming
 BRANCH_TIMESTAMP_FORMAT = "%Y%m%d%H%M%S"
 
@@ -256,6 +264,59 @@ def _convert_git_error(exc: GitCommandError, operation: str) -> GitError:
 # =============================================================================
 
 
+def _parse_porcelain_v2(output: str) -> GitStatus:
+    """Build a :class:`GitStatus` from ``git status --porcelain=v2 --branch -z``.
+
+    Single pass over the NUL-separated records. Ordinary (``1``) and
+    unmerged (``u``) entries carry the path as their last field; a rename
+    or copy (``2``) is followed by one extra record holding the original
+    path, which is skipped. A file is staged when its index column ``X`` is
+    not ``.`` and unstaged when its worktree column ``Y`` is not ``.`` — it
+    can be both.
+    """
+    staged: list[str] = []
+    unstaged: list[str] = []
+    untracked: list[str] = []
+    head = oid = ""
+    ahead = behind = 0
+
+    records = iter(output.split("\0"))
+    for record in records:
+        if not record:
+            continue
+        kind = record[0]
+        if kind == "#":
+            key, _, value = record[2:].partition(" ")
+            if key == "branch.head":
+                head = value
+            elif key == "branch.oid":
+                oid = value
+            elif key == "branch.ab":
+                plus, _, minus = value.partition(" ")
+                ahead, behind = int(plus.lstrip("+")), int(minus.lstrip("-"))
+        elif kind == "?":
+            untracked.append(record[2:])
+        elif kind in _PORCELAIN_FIELD_COUNTS:
+            fields = record.split(" ", _PORCELAIN_FIELD_COUNTS[kind])
+            xy, path = fields[1], fields[-1]
+            if xy[0] != ".":
+                staged.append(path)
+            if xy[1] != ".":
+                unstaged.append(path)
+            if kind == "2":
+                next(records, None)  # the rename/copy source path
+
+    return GitStatus(
+        staged=tuple(staged),
+        unstaged=tuple(unstaged),
+        untracked=tuple(untracked),
+        # Detached HEAD reports the commit SHA, as current_branch() does.
+        branch=oid if head == "(detached)" else head,
+        ahead=ahead,
+        behind=behind,
+    )
+
+
 def _is_network_error(exc: BaseException) -> bool:
     """Check if exception is a network-related error that should be retried."""
     if not isinstance(exc, GitCommandError):
@@ -351,52 +412,26 @@ class GitRepository:
             return self._repo.head.commit.hexsha
         return self._repo.active_branch.name
 
-    def status(self) -> GitStatus:
+    def status(self, untracked: UntrackedMode = "all") -> GitStatus:
         """Get repository status.
 
+        One ``git status --porcelain=v2 --branch -z`` call, whatever the
+        history length: git reports ahead/behind itself, so no commits are
+        walked here.
+
+        Args:
+            untracked: ``--untracked-files`` mode — ``"all"`` (default)
+                lists every untracked file, ``"normal"`` collapses wholly
+                untracked directories to ``dir/``, and ``"no"`` skips the
+                scan, which is the expensive part on a large tree.
+
         Returns:
             GitStatus with staged, unstaged, untracked files and branch info.
         """
-        # Get current branch
-        branch = self.current_branch()
-
-        # Get file status
-        staged: list[str] = []
-        unstaged: list[str] = []
-        untracked: list[str] = list(self._repo.untracked_files)
-
-        # Get diff for staged changes
-        if self._repo.head.is_valid():
-            staged_diff = self._repo.index.diff(self._repo.head.commit)
-            staged = [d.a_path or d.b_path or "" for d in staged_diff if d.a_path or d.b_path]
-
-            # Get diff for unstaged changes
-            unstaged_diff = self._repo.index.diff(None)
-            unstaged = [d.a_path or d.b_path or "" for d in unstaged_diff if d.a_path or d.b_path]
-        else:
-            # Initial commit case - all index entries are staged
-            staged = [str(entry.path) for entry in self._repo.index.entries.values()]
-
-        # Get ahead/behind counts
-        ahead = 0
-        behind = 0
-        try:
-            tracking = self._repo.active_branch.tracking_branch()
-            if tracking:
-                ahead = len(list(self._repo.iter_commits(f"{tracking}..HEAD")))
-                behind = len(list(self._repo.iter_commits(f"HEAD..{tracking}")))
-        except (TypeError, ValueError):
-            # No tracking branch or detached HEAD
-            pass
-
-        return GitStatus(
-            staged=tuple(staged),
-            unstaged=tuple(unstaged),
-            untracked=tuple(untracked),
-            branch=branch,
-            ahead=ahead,
-            behind=behind,
+        output = self._repo.git.status(
+            "--porcelain=v2", "--branch", "-z", f"--untracked-files={untracked}"
         )
+        return _parse_porcelain_v2(output)
 
     def log(self, n: int = 10) -> list[CommitInfo]:
         """Get recent commit history.
@@ -706,6 +741,34 @@ class GitRepository:
             result = str(self._repo.git.diff(base))
         return result
 
+    def iter_diff(self, base: str = "HEAD", head: str | None = None) -> Iterator[str]:
+        """Stream diff output line by line.
+
+        Unlike :meth:`diff`, the output is never materialized as a single
+        string. Closing the iterator early (e.g. once a token budget is
+        exhausted) terminates the underlying ``git diff`` process.
+
+        Args:
+            base: Base ref to diff from (default: HEAD).
+            head: Head ref to diff to (default: working tree).
+
+        Yields:
+            Diff lines, each including its trailing newline.
+        """
+        args = [base, head] if head else [base]
+        proc = self._repo.git.diff(*args, as_process=True)
+        completed = False
+        try:
+            for raw in proc.stdout:
+                yield raw.decode("utf-8", errors="replace")
+            completed = True
+        finally:
+            if completed:
+                proc.wait()
+            else:
+                proc.terminate()
+                proc.stdout.close()
+
     def diff_stats(self, base: str = "HEAD") -> DiffStats:
         """Get diff statistics.
 
@@ -934,9 +997,9 @@ class AsyncGitRepository:
         """Get current branch name."""
         return await asyncio.to_thread(self._sync.current_branch)
 
-    async def status(self) -> GitStatus:
+    async def status(self, untracked: UntrackedMode = "all") -> GitStatus:
         """Get repository status."""
-        return await asyncio.to_thread(self._sync.status)
+        return await asyncio.to_thread(self._sync.status, untracked)
 
     async def log(self, n: int = 10) -> list[CommitInfo]:
         """Get recent commit history."""
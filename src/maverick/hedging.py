@@ -0,0 +1,325 @@
+"""Hedged requests for straggling agent calls in fan-out phases.
+
+A fan-out phase (refuel briefings, detail requests) finishes when its
+slowest call returns, and a stalled provider call is only retried once it
+fails — which for a hang means after the full prompt timeout. A
+:class:`Hedger` races a duplicate against a call that has run longer than
+a latency percentile learned from the phase's earlier calls: whichever
+finishes first with an acceptable result wins and the other is
+cancelled.
+
+Hedging is opt-in and capped per run (:class:`HedgePolicy`): at most
+``max_hedges`` duplicates, and none once hedging has spent
+``max_cost_usd``. What hedging spends is every duplicate that ran to
+completion, at its reported cost, plus every leg cancelled after a
+duplicate launched — whichever of the pair lost. A cancelled leg has no
+usage record (the provider never returned one), so it is charged the
+mean cost of the key's completed calls, which each leg reports through
+its :class:`HedgeLeg`. Each leg's agent still reports its own cost
+through the usual cost sink.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from maverick.logging import get_logger
+
+if TYPE_CHECKING:
+    from airframe.cost import CostRecord
+
+__all__ = [
+    "DEFAULT_LATENCY_WINDOW",
+    "HedgeLeg",
+    "HedgePolicy",
+    "Hedger",
+    "LatencyTracker",
+]
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+#: Most recent call latencies kept per key
+DEFAULT_LATENCY_WINDOW = 64
+
+
+@dataclass(frozen=True, slots=True)
+class HedgePolicy:
+    """When to hedge, and how much hedging one run may buy.
+
+    Attributes:
+        percentile: Latency percentile (0-1, exclusive of 0) of earlier
+            calls with the same key after which a duplicate is launched.
+        min_samples: Completed calls a key needs before it can be hedged.
+        max_hedges: Duplicates launched per run, at most.
+        max_cost_usd: Stop hedging once it has cost this much — completed
+            duplicates plus an estimate for cancelled legs (``None`` = no
+            spend cap beyond ``max_hedges``).
+    """
+
+    percentile: float = 0.9
+    min_samples: int = 3
+    max_hedges: int = 4
+    max_cost_usd: float | None = None
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.percentile <= 1.0:
+            raise ValueError(f"percentile must be in (0, 1], got {self.percentile}")
+        if self.min_samples < 1:
+            raise ValueError(f"min_samples must be >= 1, got {self.min_samples}")
+
+
+class LatencyTracker:
+    """Sliding window of call latencies, per key.
+
+    Args:
+        window: Latencies kept per key; older ones are forgotten.
+    """
+
+    def __init__(self, window: int = DEFAULT_LATENCY_WINDOW) -> None:
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._arrivals: dict[str, asyncio.Event] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        """Add a completed call's latency and wake :meth:`next_sample` waiters."""
+        self._samples.setdefault(key, deque(maxlen=self._window)).append(seconds)
+        arrival = self._arrivals.pop(key, None)
+        if arrival is not None:
+            arrival.set()
+
+    def count(self, key: str) -> int:
+        """Latencies currently held for *key*."""
+        return len(self._samples.get(key, ()))
+
+    def percentile(self, key: str, q: float, *, min_samples: int = 1) -> float | None:
+        """Nearest-rank *q* percentile of *key*'s latencies.
+
+        Returns:
+            Seconds, or ``None`` with fewer than *min_samples* latencies.
+        """
+        samples = self._samples.get(key)
+        if not samples or len(samples) < min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+    async def next_sample(self, key: str) -> None:
+        """Wait until the next latency for *key* is recorded."""
+        await self._arrivals.setdefault(key, asyncio.Event()).wait()
+
+
+@dataclass(frozen=True, slots=True)
+class HedgeLeg:
+    """One leg of a (possibly) hedged call, for reporting what it spent.
+
+    Attributes:
+        hedger: The run's hedger.
+        key: The latency key the call runs under.
+        hedge: True for the duplicate, False for the primary.
+    """
+
+    hedger: Hedger
+    key: str
+    hedge: bool = False
+
+    def spent(self, record: CostRecord | None) -> None:
+        """Report a completed send's cost (see :meth:`Hedger.record_cost`)."""
+        self.hedger.record_cost(self.key, record, hedge=self.hedge)
+
+
+class Hedger:
+    """Run calls with a hedged duplicate once they outlast their peers.
+
+    One instance per workflow run: the latency history and the hedge
+    budget are both per run.
+
+    Args:
+        policy: Thresholds and caps.
+        tracker: Latency history (a fresh one by default).
+    """
+
+    def __init__(self, policy: HedgePolicy, *, tracker: LatencyTracker | None = None) -> None:
+        self._policy = policy
+        self._tracker = tracker or LatencyTracker()
+        self._launched = 0
+        self._won = 0
+        self._spent_usd = 0.0
+        self._costs: dict[str, deque[float]] = {}
+
+    @property
+    def policy(self) -> HedgePolicy:
+        return self._policy
+
+    @property
+    def tracker(self) -> LatencyTracker:
+        return self._tracker
+
+    @property
+    def hedges_launched(self) -> int:
+        """Duplicates started so far this run."""
+        return self._launched
+
+    @property
+    def hedges_won(self) -> int:
+        """Duplicates that finished ahead of the call they hedged."""
+        return self._won
+
+    @property
+    def spent_usd(self) -> float:
+        """Cost charged to hedging: completed duplicates and cancelled legs."""
+        return self._spent_usd
+
+    def leg(self, key: str, *, hedge: bool = False) -> HedgeLeg:
+        """A :class:`HedgeLeg` for one side of a :meth:`run` under *key*."""
+        return HedgeLeg(self, key, hedge)
+
+    def charge(self, record: CostRecord | None) -> None:
+        """Count a completed duplicate's cost against the run's hedge budget."""
+        if record is not None and record.cost_usd:
+            self._spent_usd += record.cost_usd
+
+    def record_cost(self, key: str, record: CostRecord | None, *, hedge: bool = False) -> None:
+        """Note a completed send's cost under *key*; charge it when *hedge*.
+
+        The costs noted per key price the legs :meth:`run` cancels.
+        """
+        if record is None or record.cost_usd is None:
+            return
+        window = self._costs.setdefault(key, deque(maxlen=DEFAULT_LATENCY_WINDOW))
+        window.append(record.cost_usd)
+        if hedge:
+            self.charge(record)
+
+    def estimated_cost(self, key: str) -> float:
+        """Mean cost of *key*'s completed sends (0.0 before any is noted)."""
+        window = self._costs.get(key)
+        return sum(window) / len(window) if window else 0.0
+
+    def can_hedge(self) -> bool:
+        """True while the run's hedge budget allows another duplicate."""
+        policy = self._policy
+        if self._launched >= policy.max_hedges:
+            return False
+        return policy.max_cost_usd is None or self._spent_usd < policy.max_cost_usd
+
+    async def run(
+        self,
+        key: str,
+        primary: Callable[[], Awaitable[T]],
+        *,
+        hedge: Callable[[], Awaitable[T]],
+        accept: Callable[[T], bool] | None = None,
+        min_samples: int | None = None,
+    ) -> T:
+        """Await *primary*, racing *hedge* against it if it straggles.
+
+        *hedge* is started once *primary* has run longer than the
+        policy's percentile of *key*'s earlier latencies — recomputed as
+        calls running alongside it complete — and only while
+        :meth:`can_hedge` (checked again at launch, since concurrent
+        calls share the budget). The first leg to return a result *accept*
+        approves (any result, by default) wins and the other is
+        cancelled and charged :meth:`estimated_cost`; only winners'
+        latencies are recorded. *min_samples* overrides the policy's
+        for a key with fewer calls per run than the policy expects.
+
+        Returns:
+            The winning result or, when no leg's result is accepted, the
+            last rejected one.
+
+        Raises:
+            BaseException: The first leg's exception, when every leg
+                raised.
+        """
+        loop = asyncio.get_running_loop()
+        needed = self._policy.min_samples if min_samples is None else max(1, min_samples)
+        first = asyncio.ensure_future(primary())
+        started: dict[asyncio.Future[T], float] = {first: loop.time()}
+        pending: set[asyncio.Future[T]] = {first}
+        failure: BaseException | None = None
+        rejected: list[T] = []
+        try:
+            while pending:
+                waiters: set[asyncio.Future[Any]] = set(pending)
+                timeout: float | None = None
+                arrival: asyncio.Future[None] | None = None
+                if len(started) == 1 and self.can_hedge():
+                    threshold = self._tracker.percentile(
+                        key, self._policy.percentile, min_samples=needed
+                    )
+                    if threshold is None:
+                        arrival = asyncio.ensure_future(self._tracker.next_sample(key))
+                        waiters.add(arrival)
+                    else:
+                        timeout = max(0.0, started[first] + threshold - loop.time())
+
+                done, _ = await asyncio.wait(
+                    waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if arrival is not None:
+                    arrival.cancel()
+
+                for task in done & pending:
+                    pending.discard(task)
+                    exc = asyncio.CancelledError() if task.cancelled() else task.exception()
+                    if exc is not None:
+                        failure = failure or exc
+                        continue
+                    result = task.result()
+                    if accept is not None and not accept(result):
+                        rejected.append(result)
+                        continue
+                    self._tracker.record(key, loop.time() - started[task])
+                    if task is not first:
+                        self._won += 1
+                        logger.info("hedge_won", key=key, hedges_won=self._won)
+                    return result
+
+                if not done and timeout is not None:
+                    if not self.can_hedge():
+                        # Concurrent stragglers spent the budget while this
+                        # one waited; keep waiting on the primary alone.
+                        continue
+                    self._launched += 1
+                    logger.info(
+                        "hedge_launched",
+                        key=key,
+                        after_seconds=round(loop.time() - started[first], 2),
+                        hedges_launched=self._launched,
+                    )
+                    second = asyncio.ensure_future(hedge())
+                    started[second] = loop.time()
+                    pending.add(second)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                if len(started) > 1:
+                    self._charge_cancelled(key, [t for t in pending if t.cancelled()])
+
+        if rejected:
+            return rejected[-1]
+        assert failure is not None
+        raise failure
+
+    def _charge_cancelled(self, key: str, legs: list[asyncio.Future[Any]]) -> None:
+        """Charge legs cancelled mid-send the key's typical cost."""
+        if not legs:
+            return
+        estimate = self.estimated_cost(key) * len(legs)
+        self._spent_usd += estimate
+        logger.info(
+            "hedge_cancelled_charged",
+            key=key,
+            legs=len(legs),
+            estimated_usd=round(estimate, 6),
+            spent_usd=round(self._spent_usd, 6),
+        )
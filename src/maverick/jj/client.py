@@ -331,6 +331,22 @@ class JjClient:
         )
         logger.info("jj_workspace_forget_completed", name=name)
 
+    async def workspace_rename(self, new_name: str) -> None:
+        """Rename this client's workspace via ``jj workspace rename``.
+
+        Must be called with a client bound to the workspace being renamed
+        (jj renames the workspace it runs in).
+
+        Raises:
+            JjError: When the underlying command fails (e.g. the name is
+                already taken).
+        """
+        await self._run_jj(
+            ["jj", "workspace", "rename", new_name],
+            error_msg=f"jj workspace rename failed for {new_name}",
+        )
+        logger.info("jj_workspace_rename_completed", cwd=str(self._cwd), name=new_name)
+
     async def workspace_list(self) -> JjWorkspaceListResult:
         """List every workspace jj has registered for this repo, via
         ``jj workspace list``.
@@ -13,7 +13,7 @@ removed.
 from __future__ import annotations
 
 import json
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -28,11 +28,15 @@ from maverick.logging import get_logger
 
 if TYPE_CHECKING:
     from maverick.beads.client import BeadClient
+    from maverick.beads.models import BeadDefinition, BeadDependency
     from maverick.workflows.spec_chain.models import AnalyzeFinding
     from maverick.workspace import CheckoutPath
 
 logger = get_logger(__name__)
 
+#: Graph-plan key of the epic node; work beads are ``EPIC.1``, ``EPIC.2``, ...
+_EPIC_NODE_KEY = "EPIC"
+
 
 async def create_beads(
     epic_definition: dict[str, Any],
@@ -40,24 +44,37 @@ async def create_beads(
     *,
     cwd: CheckoutPath,
     dry_run: bool = False,
+    extracted_deps: str | None = None,
 ) -> BeadCreationResult:
     """Create epic and work beads via the bd CLI.
 
+    The epic, its children and (with *extracted_deps*) their dependencies
+    are created in one ``bd create --graph`` transaction, so the cost no
+    longer grows with one subprocess per bead and per edge. A bd without
+    ``--graph`` falls back to creating beads one at a time; dependencies
+    are then left to :func:`wire_dependencies`.
+
     Args:
         epic_definition: Serialized BeadDefinition for the epic.
         work_definitions: Serialized BeadDefinitions for work beads.
         cwd: Checkout directory whose ``.beads/`` receives the writes.
             Required — see module docstring.
         dry_run: If True, return synthetic IDs without calling bd.
+        extracted_deps: Inter-story dependency JSON, as accepted by
+            :func:`wire_dependencies`, to wire in the same transaction.
+            ``None`` wires nothing.
 
     Returns:
-        BeadCreationResult with created beads and any errors.
+        BeadCreationResult with created beads, any errors (one per bead
+        bd returned no ID for), and the wired dependencies.
     """
     from maverick.workspace import assert_checkout
 
     assert_checkout(cwd)
     from maverick.beads.client import BeadClient
+    from maverick.beads.graph import GraphPlan, blocks_edge, node_from_definition
     from maverick.beads.models import BeadDefinition
+    from maverick.exceptions.beads import BeadError, BeadGraphUnsupportedError
 
     epic_def = BeadDefinition.model_validate(epic_definition)
     work_defs = [BeadDefinition.model_validate(d) for d in work_definitions]
@@ -79,6 +96,91 @@ async def create_beads(
         )
 
     client = BeadClient(cwd=Path(cwd))
+
+    work_keys = [f"{_EPIC_NODE_KEY}.{i + 1}" for i in range(len(work_defs))]
+    deps = (
+        _compute_dependencies(
+            work_defs,
+            {defn.title: key for defn, key in zip(work_defs, work_keys, strict=True)},
+            extracted_deps,
+        )
+        if extracted_deps is not None
+        else []
+    )
+    node_keys = {_EPIC_NODE_KEY, *work_keys}
+    plan = GraphPlan(
+        commit_message=f"maverick: create epic {epic_def.title}",
+        nodes=[
+            node_from_definition(_EPIC_NODE_KEY, epic_def),
+            *(
+                node_from_definition(key, defn, parent_key=_EPIC_NODE_KEY)
+                for key, defn in zip(work_keys, work_defs, strict=True)
+            ),
+        ],
+        edges=[
+            blocks_edge(
+                blocker=dep.blocker_id,
+                blocked=dep.blocked_id,
+                node_keys=node_keys,
+                dep_type=dep.dep_type,
+            )
+            for dep in deps
+        ],
+    )
+    try:
+        ids = await client.create_graph(plan)
+    except BeadGraphUnsupportedError as e:
+        logger.info("bead_graph_unsupported", error=str(e))
+        return await _create_beads_serially(client, epic_def, work_defs)
+    except BeadError as e:
+        # One transaction: nothing was created, so there is nothing partial
+        # to report beyond the failure itself.
+        logger.debug("bead_graph_creation_failed", error=str(e))
+        return BeadCreationResult(
+            epic=None,
+            work_beads=(),
+            created_map={},
+            errors=(f"Epic creation failed: {e}",),
+        )
+
+    errors: list[str] = []
+    epic_id = ids.get(_EPIC_NODE_KEY)
+    if not epic_id:
+        errors.append(f"bd create --graph returned no ID for epic '{epic_def.title}'")
+    work_data = []
+    created_map = {}
+    for key, defn in zip(work_keys, work_defs, strict=True):
+        created_id = ids.get(key)
+        if not created_id:
+            errors.append(f"bd create --graph returned no ID for '{defn.title}'")
+            continue
+        work_data.append({"bd_id": created_id, "title": defn.title})
+        created_map[defn.title] = created_id
+
+    wired = tuple(
+        dep.model_copy(
+            update={"blocker_id": ids[dep.blocker_id], "blocked_id": ids[dep.blocked_id]}
+        )
+        for dep in deps
+        if dep.blocker_id in ids and dep.blocked_id in ids
+    )
+    return BeadCreationResult(
+        epic={"bd_id": epic_id, "title": epic_def.title} if epic_id else None,
+        work_beads=tuple(work_data),
+        created_map=created_map,
+        errors=tuple(errors),
+        dependencies=(
+            tuple(d.model_dump(mode="json") for d in wired) if extracted_deps is not None else None
+        ),
+    )
+
+
+async def _create_beads_serially(
+    client: BeadClient,
+    epic_def: BeadDefinition,
+    work_defs: Sequence[BeadDefinition],
+) -> BeadCreationResult:
+    """Fallback for a bd without ``--graph``: one ``bd create`` per bead."""
     errors: list[str] = []
 
     # Create epic
@@ -116,46 +218,17 @@ async def create_beads(
     )
 
 
-async def wire_dependencies(
-    work_definitions: list[dict[str, Any]],
-    created_map: dict[str, str],
-    tasks_content: str,
+def _compute_dependencies(
+    work_defs: Sequence[BeadDefinition],
+    ref_for_title: Mapping[str, str],
     extracted_deps: str,
-    *,
-    cwd: CheckoutPath,
-    dry_run: bool = False,
-) -> DependencyWiringResult:
-    """Compute and wire dependencies between created beads.
-
-    Structural dependencies (foundation->stories, stories->cleanup) are
-    deterministic. Inter-story dependencies are parsed from the generator's
-    JSON output.
-
-    Args:
-        work_definitions: Serialized BeadDefinitions for work beads.
-        created_map: Mapping from bead title to bd_id.
-        tasks_content: Raw tasks.md content (used for structural dep context).
-        extracted_deps: JSON string from DependencyExtractor, e.g.
-            '[["US3","US1"],["US7","US1"]]'.
-        cwd: Checkout directory whose ``.beads/`` receives the writes.
-            Required — see module docstring.
-        dry_run: If True, compute dependencies without calling bd.
+) -> list[BeadDependency]:
+    """Structural and inter-story dependencies between *work_defs*.
 
-    Returns:
-        DependencyWiringResult with dependencies and any errors.
+    Endpoints are whatever *ref_for_title* maps each title to — bead IDs
+    when wiring existing beads, graph node keys when creating them.
     """
-    from maverick.workspace import assert_checkout
-
-    assert_checkout(cwd)
-    from maverick.beads.client import BeadClient
-    from maverick.beads.models import (
-        BeadCategory,
-        BeadDefinition,
-        BeadDependency,
-        DependencyType,
-    )
-
-    work_defs = [BeadDefinition.model_validate(d) for d in work_definitions]
+    from maverick.beads.models import BeadCategory, BeadDependency, DependencyType
 
     # Identify beads by category
     foundation_id: str | None = None
@@ -163,7 +236,7 @@ async def wire_dependencies(
     story_defs: list[tuple[BeadDefinition, str]] = []
 
     for defn in work_defs:
-        bd_id = created_map.get(defn.title)
+        bd_id = ref_for_title.get(defn.title)
         if not bd_id:
             continue
         if defn.category == BeadCategory.FOUNDATION:
@@ -234,6 +307,50 @@ async def wire_dependencies(
                 )
             )
 
+    return deps
+
+
+async def wire_dependencies(
+    work_definitions: list[dict[str, Any]],
+    created_map: dict[str, str],
+    tasks_content: str,
+    extracted_deps: str,
+    *,
+    cwd: CheckoutPath,
+    dry_run: bool = False,
+) -> DependencyWiringResult:
+    """Compute and wire dependencies between created beads.
+
+    Structural dependencies (foundation->stories, stories->cleanup) are
+    deterministic. Inter-story dependencies are parsed from the generator's
+    JSON output.
+
+    Prefer passing *extracted_deps* to :func:`create_beads`, which wires
+    them in the creation transaction; this one ``bd dep add`` per edge is
+    the path for beads that already exist (or a bd without ``--graph``).
+
+    Args:
+        work_definitions: Serialized BeadDefinitions for work beads.
+        created_map: Mapping from bead title to bd_id.
+        tasks_content: Raw tasks.md content (used for structural dep context).
+        extracted_deps: JSON string from DependencyExtractor, e.g.
+            '[["US3","US1"],["US7","US1"]]'.
+        cwd: Checkout directory whose ``.beads/`` receives the writes.
+            Required — see module docstring.
+        dry_run: If True, compute dependencies without calling bd.
+
+    Returns:
+        DependencyWiringResult with dependencies and any errors.
+    """
+    from maverick.workspace import assert_checkout
+
+    assert_checkout(cwd)
+    from maverick.beads.client import BeadClient
+    from maverick.beads.models import BeadDefinition
+
+    work_defs = [BeadDefinition.model_validate(d) for d in work_definitions]
+    deps = _compute_dependencies(work_defs, created_map, extracted_deps)
+
     if dry_run:
         logger.info("dry_run_deps", count=len(deps))
         return DependencyWiringResult(
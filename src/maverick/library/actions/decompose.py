@@ -6,12 +6,20 @@ Actions for gathering codebase context and building decomposition prompts.
 from __future__ import annotations
 
 import asyncio
+import os
 import re
-from dataclasses import dataclass
+import time
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from enum import StrEnum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import pathspec
+
 from maverick.logging import get_logger
+from maverick.prompt_cache import PromptLayout, PromptSection, Stability
 
 if TYPE_CHECKING:
     from maverick.flight.models import WorkUnit
@@ -51,11 +59,14 @@ class FileContent:
 
     Attributes:
         path: Relative file path.
-        content: File text content.
+        content: File text content (an outline when ``outline`` is True).
+        outline: Whether the file was too large to include in full and
+            ``content`` holds only its signature lines.
     """
 
     path: str
     content: str
+    outline: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -66,11 +77,75 @@ class CodebaseContext:
         files: Tuple of file contents.
         missing_files: Files that couldn't be read.
         total_size: Total bytes of content.
+        omitted_files: Files left out because the context budget ran out.
     """
 
     files: tuple[FileContent, ...]
     missing_files: tuple[str, ...]
     total_size: int
+    omitted_files: tuple[str, ...] = ()
+
+
+#: Largest file included verbatim; bigger files are reduced to an outline
+MAX_CONTEXT_FILE_BYTES = 48 * 1024
+
+#: Total content budget for one gathered context
+MAX_CONTEXT_TOTAL_BYTES = 512 * 1024
+
+#: Smallest budget worth spending on an outline of a large file
+_MIN_OUTLINE_BYTES = 1024
+
+#: Files modified this recently rank above other directory contents
+_RECENT_CHANGE_SECONDS = 14 * 24 * 60 * 60
+
+#: Leading bytes inspected to detect binary files
+_BINARY_SNIFF_BYTES = 8192
+
+#: Directories never descended into when expanding a scope directory
+_SKIPPED_DIRS = frozenset(
+    {
+        ".git",
+        ".jj",
+        ".hg",
+        ".maverick",
+        ".venv",
+        "venv",
+        "node_modules",
+        "target",
+        "vendor",
+        "third_party",
+        "dist",
+        "build",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        ".next",
+    }
+)
+
+#: Generated or lock files skipped when expanding a scope directory
+_GENERATED_FILES = pathspec.PathSpec.from_lines(
+    "gitwildmatch",
+    [
+        "*.lock",
+        "package-lock.json",
+        "pnpm-lock.yaml",
+        "*.min.js",
+        "*.min.css",
+        "*.map",
+        "*.pyc",
+        "*.pb.go",
+        "*_pb2.py",
+    ],
+)
+
+#: Declaration lines kept when a large file is reduced to an outline
+_OUTLINE_RE = re.compile(
+    r"^\s*(?:#{1,6}\s|(?:export\s+|pub(?:\([\w:]+\))?\s+|async\s+|public\s+|private\s+)*"
+    r"(?:def|class|fn|func|function|interface|type|struct|enum|trait|impl|mod|module)\b)"
+)
 
 
 def _read_file_sync(file_path: Path) -> tuple[str, str | None]:
@@ -127,12 +202,32 @@ def _extract_path_from_scope_item(raw: str) -> str:
     return stripped
 
 
+@dataclass(frozen=True, slots=True)
+class _Candidate:
+    """A file considered for the codebase context."""
+
+    display_path: str
+    path: Path
+    size: int
+    mtime: float
+    explicit: bool
+
+
+def _resolve_scope_item(path_str: str, cwd: Path) -> Path:
+    # Extract bare path from descriptive scope items (e.g. "`src/foo.py` — description")
+    cleaned = _extract_path_from_scope_item(path_str)
+    if cleaned != path_str:
+        logger.debug("scope_item_path_extracted", raw=path_str, extracted=cleaned)
+    return (cwd / cleaned) if not Path(cleaned).is_absolute() else Path(cleaned)
+
+
 def _expand_path(path_str: str, cwd: Path) -> list[Path]:
     """Expand a path string to a list of file paths.
 
-    If path_str refers to a directory, expands to all contained files.
-    If path_str refers to a file, returns just that file.
-    Returns empty list if path doesn't exist.
+    If path_str refers to a directory, expands to the contained files,
+    honouring ``.gitignore`` files and skipping dependency/build directories
+    (see :func:`_walk_directory`). If path_str refers to a file, returns
+    just that file. Returns empty list if path doesn't exist.
 
     Args:
         path_str: File or directory path string.
@@ -141,16 +236,10 @@ def _expand_path(path_str: str, cwd: Path) -> list[Path]:
     Returns:
         List of resolved file paths.
     """
-    # Extract bare path from descriptive scope items (e.g. "`src/foo.py` — description")
-    cleaned = _extract_path_from_scope_item(path_str)
-    if cleaned != path_str:
-        logger.debug("scope_item_path_extracted", raw=path_str, extracted=cleaned)
-    p = (cwd / cleaned) if not Path(cleaned).is_absolute() else Path(cleaned)
-
+    p = _resolve_scope_item(path_str, cwd)
     try:
         if p.is_dir():
-            # Expand directory to all files recursively
-            return [f for f in p.rglob("*") if f.is_file()]
+            return _walk_directory(p, cwd)
         elif p.exists():
             return [p]
     except OSError:
@@ -159,64 +248,234 @@ def _expand_path(path_str: str, cwd: Path) -> list[Path]:
     return []
 
 
+def _load_ignore_spec(directory: Path) -> pathspec.PathSpec | None:
+    try:
+        lines = (directory / ".gitignore").read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return pathspec.PathSpec.from_lines("gitwildmatch", lines)
+
+
+def _walk_directory(root: Path, cwd: Path) -> list[Path]:
+    """List files under ``root`` that are not ignored, generated, or binary.
+
+    ``.gitignore`` files apply from ``cwd`` down (including those in
+    ancestors of ``root``); ignored directories are pruned, not filtered.
+    """
+    # (directory, spec) pairs; each spec matches paths relative to its directory.
+    specs: list[tuple[Path, pathspec.PathSpec]] = []
+    try:
+        rel_root = root.relative_to(cwd)
+    except ValueError:
+        ancestors: list[Path] = []  # outside cwd: only its own ignore files apply
+    else:
+        ancestors = [cwd / parent for parent in reversed(rel_root.parents)]
+    for directory in ancestors:
+        spec = _load_ignore_spec(directory)
+        if spec is not None:
+            specs.append((directory, spec))
+
+    def _ignored(path: Path, *, is_dir: bool) -> bool:
+        for base, spec in specs:
+            try:
+                rel = path.relative_to(base).as_posix()
+            except ValueError:
+                continue
+            if spec.match_file(rel + "/" if is_dir else rel):
+                return True
+        return False
+
+    files: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        spec = _load_ignore_spec(current)
+        if spec is not None:
+            specs.append((current, spec))
+        dirnames[:] = sorted(
+            d
+            for d in dirnames
+            if d not in _SKIPPED_DIRS and not _ignored(current / d, is_dir=True)
+        )
+        for name in sorted(filenames):
+            path = current / name
+            if _GENERATED_FILES.match_file(name) or _ignored(path, is_dir=False):
+                continue
+            if not _is_binary(path):
+                files.append(path)
+    return files
+
+
+def _is_binary(path: Path) -> bool:
+    """Cheap binary check: a NUL byte in the first few KiB."""
+    try:
+        with path.open("rb") as fh:
+            return b"\x00" in fh.read(_BINARY_SNIFF_BYTES)
+    except OSError:
+        return False
+
+
+def _collect_candidates(
+    in_scope: tuple[str, ...],
+    cwd: Path,
+) -> tuple[list[_Candidate], list[str]]:
+    """Expand scope items into unique candidate files plus missing items."""
+    candidates: dict[Path, _Candidate] = {}
+    missing: list[str] = []
+    for path_str in in_scope:
+        expanded = _expand_path(path_str, cwd)
+        if not expanded:
+            missing.append(path_str)
+            logger.debug("in_scope_path_not_found", path=path_str)
+            continue
+        explicit = len(expanded) == 1 and not _resolve_scope_item(path_str, cwd).is_dir()
+        for file_path in expanded:
+            if file_path in candidates:
+                if explicit:
+                    candidates[file_path] = replace(candidates[file_path], explicit=True)
+                continue
+            try:
+                display = str(file_path.relative_to(cwd))
+            except ValueError:
+                display = str(file_path)
+            try:
+                stat = file_path.stat()
+            except OSError:
+                size, mtime = 0, 0.0
+            else:
+                size, mtime = stat.st_size, stat.st_mtime
+            candidates[file_path] = _Candidate(display, file_path, size, mtime, explicit)
+    return list(candidates.values()), missing
+
+
+def _rank_candidates(candidates: list[_Candidate], reference_text: str) -> list[_Candidate]:
+    """Order candidates: explicit > recently changed > referenced > other."""
+    recent_cutoff = time.time() - _RECENT_CHANGE_SECONDS
+    referenced_words = set(re.findall(r"[\w.-]+", reference_text.lower()))
+
+    def _tier(candidate: _Candidate) -> int:
+        if candidate.explicit:
+            return 0
+        if candidate.mtime >= recent_cutoff:
+            return 1
+        name = candidate.path.name.lower()
+        if name in referenced_words or (
+            len(candidate.path.stem) >= 3 and candidate.path.stem.lower() in referenced_words
+        ):
+            return 2
+        return 3
+
+    return sorted(candidates, key=lambda c: (_tier(c), -c.mtime, c.display_path))
+
+
+def _outline_file_sync(file_path: Path, budget: int, size: int) -> tuple[str, str | None]:
+    """Build an outline of a large file in one streaming pass.
+
+    Keeps declaration lines (functions, classes, headings) until ``budget``
+    bytes are used; falls back to the head of the file when it has none.
+    """
+    header = f"# [outline: file is {size} bytes; only declarations shown]\n"
+    kept: list[str] = []
+    head: list[str] = []
+    used = head_used = len(header)
+    try:
+        with file_path.open(encoding="utf-8") as fh:
+            for line in fh:
+                if head_used + len(line) <= budget:
+                    head.append(line)
+                    head_used += len(line)
+                if _OUTLINE_RE.match(line):
+                    if used + len(line) > budget:
+                        break
+                    kept.append(line)
+                    used += len(line)
+    except UnicodeDecodeError:
+        return "", f"Binary file (not readable as text): {file_path}"
+    except OSError as e:
+        return "", f"Cannot read {file_path}: {e}"
+    return header + "".join(kept or head), None
+
+
 async def gather_codebase_context(
     in_scope: tuple[str, ...],
     cwd: Path | None = None,
+    *,
+    reference_text: str = "",
+    max_file_bytes: int = MAX_CONTEXT_FILE_BYTES,
+    max_total_bytes: int = MAX_CONTEXT_TOTAL_BYTES,
 ) -> CodebaseContext:
-    """Gather file contents for in-scope paths.
+    """Gather file contents for in-scope paths within a size budget.
 
-    Reads each file listed in in_scope. Directories are expanded to all
-    contained files. Missing files and unreadable files are noted as warnings.
+    Reads each file listed in in_scope. Directories are expanded to the
+    files they contain, skipping gitignored paths, dependency and build
+    directories, generated files, and binaries. Files are ranked (explicit
+    scope paths, then recently changed files, then files named in
+    ``reference_text``, then the rest) and included in that order until the
+    budget runs out. Files over ``max_file_bytes`` are reduced to an outline
+    of their declarations. Missing files and unreadable files are noted as
+    warnings.
 
     Args:
         in_scope: Tuple of file/directory paths from FlightPlan.scope.in_scope.
         cwd: Working directory for resolving relative paths. Defaults to cwd.
+        reference_text: Text (e.g. the flight plan) whose mentions of file
+            names raise those files' rank.
+        max_file_bytes: Largest file included verbatim.
+        max_total_bytes: Total content budget.
 
     Returns:
         CodebaseContext with files read, missing files noted.
     """
     resolved_cwd = cwd if cwd is not None else Path.cwd()
 
-    # Expand all paths to individual files
-    all_paths: list[tuple[str, Path]] = []
-    missing: list[str] = []
-
-    for path_str in in_scope:
-        expanded = await asyncio.to_thread(_expand_path, path_str, resolved_cwd)
-        if expanded:
-            for file_path in expanded:
-                # Use original path_str prefix for display in dirs, else path_str
-                try:
-                    rel = file_path.relative_to(resolved_cwd)
-                    all_paths.append((str(rel), file_path))
-                except ValueError:
-                    all_paths.append((str(file_path), file_path))
-        else:
-            missing.append(path_str)
-            logger.debug("in_scope_path_not_found", path=path_str)
+    candidates, missing = await asyncio.to_thread(_collect_candidates, in_scope, resolved_cwd)
 
-    if not all_paths:
+    if not candidates:
         logger.info("no_in_scope_files", in_scope_count=len(in_scope))
         return CodebaseContext(files=(), missing_files=tuple(missing), total_size=0)
 
-    logger.info("gathering_codebase_context", file_count=len(all_paths))
+    # Allocate the budget in rank order before reading anything.
+    plan: list[tuple[_Candidate, int | None]] = []  # (candidate, outline budget)
+    omitted: list[str] = []
+    remaining = max_total_bytes
+    for candidate in _rank_candidates(candidates, reference_text):
+        if candidate.size <= min(max_file_bytes, remaining):
+            plan.append((candidate, None))
+            remaining -= candidate.size
+        elif min(max_file_bytes, remaining) >= _MIN_OUTLINE_BYTES:
+            budget = min(max_file_bytes, remaining)
+            plan.append((candidate, budget))
+            remaining -= budget
+        else:
+            omitted.append(candidate.display_path)
+
+    logger.info(
+        "gathering_codebase_context",
+        file_count=len(plan),
+        omitted_count=len(omitted),
+    )
 
-    # Read all files concurrently using asyncio.to_thread
-    async def _read(display_path: str, file_path: Path) -> FileContent | str:
-        content, error = await asyncio.to_thread(_read_file_sync, file_path)
+    # Read the selected files concurrently using asyncio.to_thread
+    async def _read(candidate: _Candidate, outline_budget: int | None) -> FileContent | str:
+        if outline_budget is None:
+            content, error = await asyncio.to_thread(_read_file_sync, candidate.path)
+        else:
+            content, error = await asyncio.to_thread(
+                _outline_file_sync, candidate.path, outline_budget, candidate.size
+            )
         if error:
             return error  # str indicates missing/unreadable
-        return FileContent(path=display_path, content=content)
+        return FileContent(
+            path=candidate.display_path, content=content, outline=outline_budget is not None
+        )
 
-    results = await asyncio.gather(*[_read(dp, fp) for dp, fp in all_paths])
+    results = await asyncio.gather(*[_read(c, budget) for c, budget in plan])
 
     files: list[FileContent] = []
-    for i, result in enumerate(results):
+    for (candidate, _), result in zip(plan, results, strict=True):
         if isinstance(result, str):
             # Error message
-            display_path = all_paths[i][0]
-            missing.append(display_path)
-            logger.warning("file_read_failed", path=display_path, error=result)
+            missing.append(candidate.display_path)
+            logger.warning("file_read_failed", path=candidate.display_path, error=result)
         else:
             files.append(result)
 
@@ -225,6 +484,7 @@ async def gather_codebase_context(
         "codebase_context_gathered",
         file_count=len(files),
         missing_count=len(missing),
+        omitted_count=len(omitted),
         total_size=total_size,
     )
 
@@ -232,6 +492,7 @@ async def gather_codebase_context(
         files=tuple(files),
         missing_files=tuple(missing),
         total_size=total_size,
+        omitted_files=tuple(omitted),
     )
 
 
@@ -251,11 +512,16 @@ def _format_codebase_context(context: CodebaseContext) -> str:
 
     parts: list[str] = []
     for fc in context.files:
-        parts.append(f"### File: {fc.path}\n\n```\n{fc.content}\n```")
+        label = f"{fc.path} (outline)" if fc.outline else fc.path
+        parts.append(f"### File: {label}\n\n```\n{fc.content}\n```")
 
     result = "\n\n".join(parts)
     if context.missing_files:
         result += "\n\n### Missing Files\n\n" + "\n".join(f"- {p}" for p in context.missing_files)
+    if context.omitted_files:
+        result += "\n\n### Omitted Files (context budget exhausted)\n\n" + "\n".join(
+            f"- {p}" for p in context.omitted_files
+        )
 
     return result
 
@@ -435,6 +701,10 @@ def build_outline_prompt(
         context: Gathered codebase context.
         briefing: Optional synthesized briefing document (duck-typed).
 
+    The fixed role and rules come first and the run's flight plan,
+    codebase and briefing after them, so the prompt opens with the same
+    bytes on every run (see :mod:`maverick.prompt_cache`).
+
     Returns:
         Formatted prompt string for the outline pass.
     """
@@ -442,7 +712,6 @@ def build_outline_prompt(
 
     instructions = "\n".join(
         [
-            _work_unit_guidance(flight_plan_content),
             "- Each work unit = one logical change",
             "- CRITICAL CONSTRAINT — INDEPENDENT IMPLEMENTABILITY: Each work"
             " unit must be implementable in a single agent session without"
@@ -520,34 +789,39 @@ def build_outline_prompt(
         ]
     )
 
-    prompt = (
-        "You are a software decomposition expert. Given a flight plan and"
-        " codebase context, produce an ordered set of small, focused work units."
-        "\n\nThis is a TWO-PASS decomposition. In this first pass, produce ONLY"
-        " the structural outline: IDs, tasks, dependencies, and file scopes."
-        " Detailed instructions and acceptance criteria will be requested"
-        " separately for each work unit in a follow-up pass."
-        f"\n\n## Flight Plan\n\n{flight_plan_content}"
-        f"\n\n## Codebase Context\n\n{codebase_section}"
-    )
-
-    if briefing is not None:
-        prompt += f"\n\n{_format_briefing_section(briefing)}"
-
-    if runway_context:
-        prompt += (
-            "\n\n## Historical Context (Runway)\n\n"
+    layout = PromptLayout.of(
+        PromptSection(
+            "You are a software decomposition expert. Given a flight plan and"
+            " codebase context, produce an ordered set of small, focused work units."
+            "\n\nThis is a TWO-PASS decomposition. In this first pass, produce ONLY"
+            " the structural outline: IDs, tasks, dependencies, and file scopes."
+            " Detailed instructions and acceptance criteria will be requested"
+            " separately for each work unit in a follow-up pass."
+            f"\n\n## Instructions\n{instructions}",
+            Stability.STATIC,
+        ),
+        PromptSection(f"## Flight Plan\n\n{flight_plan_content}", Stability.RUN),
+        PromptSection(
+            f"## Work Unit Count\n{_work_unit_guidance(flight_plan_content)}", Stability.RUN
+        ),
+        PromptSection(f"## Codebase Context\n\n{codebase_section}", Stability.RUN),
+        PromptSection(_format_briefing_section(briefing), Stability.RUN)
+        if briefing is not None
+        else None,
+        PromptSection(
+            "## Historical Context (Runway)\n\n"
             f"{runway_context}\n\n"
             "Use this context to avoid repeating past mistakes and to "
             "create prerequisite beads for known gaps (e.g., if past "
             "reviews repeatedly flagged inadequate test mocks, create a "
             "dedicated bead for building proper test infrastructure "
-            "before the test beads)."
+            "before the test beads).",
+            Stability.RUN,
         )
-
-    prompt += f"\n\n## Instructions\n{instructions}"
-
-    return prompt
+        if runway_context
+        else None,
+    )
+    return layout.render()
 
 
 def _detail_rule_lines() -> list[str]:
@@ -633,7 +907,9 @@ def build_detail_seed_prompt(
 
     This prompt carries the large shared context once per seeded session.
     The actor may prepend this to the first detail turn of a session, then
-    use ``build_detail_turn_prompt`` for subsequent requests.
+    use ``build_detail_turn_prompt`` for subsequent requests. The rules
+    precede the flight plan and outline so every seed opens with the same
+    bytes.
     """
     instructions = "\n".join(
         [
@@ -648,10 +924,10 @@ def build_detail_seed_prompt(
     prompt = (
         "You are a software decomposition expert. This is the DETAIL pass"
         " of a two-pass decomposition."
+        f"\n\n## Detail Rules\n{instructions}"
         f"\n\n## Flight Plan\n\n{flight_plan_content}"
         f"\n\n## Full Outline\n\n```json\n{outline_json}\n```"
         f"{_verification_properties_section(verification_properties)}"
-        f"\n\n## Detail Rules\n{instructions}"
     )
 
     return prompt
@@ -717,7 +993,7 @@ def build_fix_seed_prompt(
     details_json: str,
     verification_properties: str = "",
 ) -> str:
-    """Build the durable seed context for a fix session."""
+    """Build the durable seed context for a fix session (rules before state)."""
     instructions = "\n".join(
         [
             "The current decomposition state is provided below. Use it for this"
@@ -731,10 +1007,10 @@ def build_fix_seed_prompt(
     prompt = (
         "You are a software decomposition expert repairing an existing"
         " decomposition after validation failures."
+        f"\n\n## Fix Rules\n{instructions}"
         f"\n\n## Current Outline\n\n```json\n{outline_json}\n```"
         f"\n\n## Current Details\n\n```json\n{details_json}\n```"
         f"{_verification_properties_section(verification_properties)}"
-        f"\n\n## Fix Rules\n{instructions}"
     )
 
     return prompt
@@ -743,6 +1019,7 @@ def build_fix_seed_prompt(
 def build_fix_turn_prompt(
     coverage_gaps: list[str] | None = None,
     overloaded: list[str] | None = None,
+    structural_gaps: list[str] | None = None,
 ) -> str:
     """Build the small per-turn request for a seeded fix session."""
     parts = [
@@ -765,6 +1042,18 @@ def build_fix_turn_prompt(
         for item in overloaded:
             parts.append(f"- {item}")
 
+    if structural_gaps:
+        parts.append("")
+        parts.append("## Structural Problems")
+        parts.append("")
+        parts.append(
+            "Each line is tagged with its kind and names the work units to"
+            " change. Resolve ALL of them in this one submission."
+        )
+        parts.append("")
+        for item in structural_gaps:
+            parts.append(f"- {item}")
+
     parts.extend(
         [
             "",
@@ -911,6 +1200,252 @@ def convert_specs_to_work_units(
     return units
 
 
+#: A work unit tracing more success criteria than this must be split
+HARD_SC_LIMIT = 12
+
+
+class GapKind(StrEnum):
+    """Kind of structural problem found in a decomposition.
+
+    Attributes:
+        DUPLICATE_ID: Two or more work units share an ID.
+        DANGLING_DEPENDENCY: A ``depends_on`` entry names no work unit.
+        CYCLE: Work units that (transitively) depend on each other.
+        OVERLOADED: A work unit traces more than :data:`HARD_SC_LIMIT`
+            success criteria.
+        SCOPE_CONFLICT: Work units whose file scopes collide — both create
+            the same file, or one modifies a file another creates without
+            depending on it.
+    """
+
+    DUPLICATE_ID = "duplicate_id"
+    DANGLING_DEPENDENCY = "dangling_dependency"
+    CYCLE = "cycle"
+    OVERLOADED = "overloaded"
+    SCOPE_CONFLICT = "scope_conflict"
+
+
+@dataclass(frozen=True, slots=True)
+class DecompositionGap:
+    """One structural problem, addressed to the work units that must change.
+
+    Attributes:
+        kind: What is wrong.
+        unit_ids: Work units involved, in decomposition order.
+        message: Human-readable description, including how to fix it.
+        target: The dangling dependency ID or conflicting file path, when
+            the gap has one.
+    """
+
+    kind: GapKind
+    unit_ids: tuple[str, ...]
+    message: str
+    target: str | None = None
+
+    def __str__(self) -> str:
+        return f"[{self.kind}] {self.message}"
+
+
+def _sc_refs(spec: WorkUnitSpec) -> set[str]:
+    """Success-criterion refs traced by *spec*'s acceptance criteria."""
+    refs: set[str] = set()
+    for ac in spec.acceptance_criteria:
+        if ac.trace_ref:
+            # Handle comma-separated refs (e.g., "SC-B1-default, SC-B1-linux")
+            for ref_part in ac.trace_ref.split(","):
+                refs.add(ref_part.strip())
+    return refs
+
+
+def _in_order(ids: Iterable[str], order: dict[str, int]) -> tuple[str, ...]:
+    """*ids* sorted by where each unit first appears in the decomposition."""
+    return tuple(sorted(ids, key=order.__getitem__))
+
+
+def _strongly_connected(graph: dict[str, list[str]]) -> list[list[str]]:
+    """Tarjan's SCCs of *graph*, iteratively (no recursion limit)."""
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components: list[list[str]] = []
+
+    for root in graph:
+        if root in index:
+            continue
+        # Each frame is (node, index of the next successor to visit).
+        frames: list[tuple[str, int]] = [(root, 0)]
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        while frames:
+            node, next_succ = frames[-1]
+            succs = graph[node]
+            if next_succ < len(succs):
+                frames[-1] = (node, next_succ + 1)
+                succ = succs[next_succ]
+                if succ not in index:
+                    index[succ] = lowlink[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    frames.append((succ, 0))
+                elif succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+                continue
+            frames.pop()
+            if frames:
+                parent = frames[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component: list[str] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    return components
+
+
+def find_structural_gaps(specs: list[WorkUnitSpec]) -> list[DecompositionGap]:
+    """Collect every structural problem in *specs* in a single pass.
+
+    Unlike :func:`~maverick.flight.resolver.resolve_execution_order`, which
+    stops at the first duplicate, dangling reference or cycle, this reports
+    all of them — plus overloaded units and file-scope conflicts — so one
+    fix round can address them together.
+
+    Args:
+        specs: Work units from the decomposition agent.
+
+    Returns:
+        Gaps grouped by :class:`GapKind` in declaration order, each group
+        in decomposition order (empty when the decomposition is sound).
+    """
+    order: dict[str, int] = {}
+    for i, spec in enumerate(specs):
+        order.setdefault(spec.id, i)
+
+    gaps: list[DecompositionGap] = []
+
+    for uid, count in Counter(s.id for s in specs).items():
+        if count > 1:
+            gaps.append(
+                DecompositionGap(
+                    GapKind.DUPLICATE_ID,
+                    (uid,),
+                    f"{count} work units share the ID {uid} — give each a unique ID",
+                )
+            )
+
+    graph: dict[str, list[str]] = {uid: [] for uid in order}
+    for spec in specs:
+        for dep_id in spec.depends_on:
+            if dep_id in graph:
+                graph[spec.id].append(dep_id)
+            else:
+                gaps.append(
+                    DecompositionGap(
+                        GapKind.DANGLING_DEPENDENCY,
+                        (spec.id,),
+                        f"{spec.id} depends on unknown unit {dep_id}"
+                        " — point it at an existing unit or drop it",
+                        target=dep_id,
+                    )
+                )
+
+    cycles = [
+        _in_order(component, order)
+        for component in _strongly_connected(graph)
+        if len(component) > 1 or component[0] in graph[component[0]]
+    ]
+    for members in sorted(cycles, key=lambda ids: order[ids[0]]):
+        gaps.append(
+            DecompositionGap(
+                GapKind.CYCLE,
+                members,
+                f"Circular dependency among {', '.join(members)}"
+                " — remove a depends_on edge so they can be ordered",
+            )
+        )
+
+    for spec in specs:
+        refs = _sc_refs(spec)
+        if len(refs) > HARD_SC_LIMIT:
+            gaps.append(
+                DecompositionGap(
+                    GapKind.OVERLOADED,
+                    (spec.id,),
+                    f"{spec.id} covers {len(refs)} SC refs"
+                    f" ({', '.join(sorted(refs))})"
+                    f" — max is {HARD_SC_LIMIT}. Split into smaller units"
+                    " with depends_on links",
+                )
+            )
+
+    gaps.extend(_scope_conflicts(specs, graph, order))
+    return gaps
+
+
+def _scope_conflicts(
+    specs: list[WorkUnitSpec],
+    graph: dict[str, list[str]],
+    order: dict[str, int],
+) -> list[DecompositionGap]:
+    """File-scope collisions: double creates, and modify-before-create."""
+    creators: dict[str, list[str]] = {}
+    for spec in specs:
+        for item in spec.file_scope.create:
+            path = _extract_path_from_scope_item(item)
+            if spec.id not in creators.setdefault(path, []):
+                creators[path].append(spec.id)
+
+    gaps: list[DecompositionGap] = []
+    for path, ids in creators.items():
+        if len(ids) > 1:
+            gaps.append(
+                DecompositionGap(
+                    GapKind.SCOPE_CONFLICT,
+                    _in_order(ids, order),
+                    f"{', '.join(_in_order(ids, order))} all create {path}"
+                    " — have one unit create it and the others modify it",
+                    target=path,
+                )
+            )
+
+    ancestors: dict[str, set[str]] = {}
+
+    def _depends_on(uid: str, other: str) -> bool:
+        if uid not in ancestors:
+            seen: set[str] = set()
+            pending = list(graph.get(uid, ()))
+            while pending:
+                dep = pending.pop()
+                if dep not in seen:
+                    seen.add(dep)
+                    pending.extend(graph.get(dep, ()))
+            ancestors[uid] = seen
+        return other in ancestors[uid]
+
+    for spec in specs:
+        for item in spec.file_scope.modify:
+            path = _extract_path_from_scope_item(item)
+            for creator in creators.get(path, ()):
+                if creator != spec.id and not _depends_on(spec.id, creator):
+                    gaps.append(
+                        DecompositionGap(
+                            GapKind.SCOPE_CONFLICT,
+                            _in_order([spec.id, creator], order),
+                            f"{spec.id} modifies {path}, which {creator} creates,"
+                            f" but does not depend on {creator}"
+                            " — add the dependency or move the change",
+                            target=path,
+                        )
+                    )
+    return gaps
+
+
 def validate_decomposition(
     specs: list[WorkUnitSpec],
     success_criteria_count: int,
@@ -918,11 +1453,13 @@ def validate_decomposition(
 ) -> list[str]:
     """Validate the decomposed work units.
 
-    Checks:
-    - Acyclic dependency graph via resolve_execution_order (cycle detection)
+    Checks, all in one pass (see :func:`find_structural_gaps`):
     - Unique work unit IDs
     - Dangling depends_on references
-    - SC coverage (fails if any SC is not traced by at least one work unit)
+    - Acyclic dependency graph (every cycle, not just the first)
+    - Overloaded work units (more than :data:`HARD_SC_LIMIT` SC refs)
+    - File-scope conflicts between work units
+    - SC coverage (every success criterion traced by a work unit)
 
     Args:
         specs: List of WorkUnitSpec from decomposition agent.
@@ -935,31 +1472,24 @@ def validate_decomposition(
         List of SC coverage gap descriptions (empty if all covered).
 
     Raises:
-        ValueError: If circular dependency, dangling depends_on, or
-            uncovered success criteria detected.
+        DecompositionGapsError: With every structural gap, when there is
+            at least one; untraced criteria ride along on ``untraced``.
+        SCTraceabilityError: If the structure is sound but some success
+            criteria are not traced by any work unit.
+        ValueError: If a work unit fails field validation (e.g. an ID
+            that is not kebab-case).
     """
-    from maverick.flight.errors import WorkUnitDependencyError
-    from maverick.flight.resolver import resolve_execution_order
-
-    # Convert specs to WorkUnit models for dependency validation
-    work_units = convert_specs_to_work_units(specs, flight_plan_name="validation")
-
-    # Use resolve_execution_order for cycle detection and dangling reference detection
-    try:
-        resolve_execution_order(work_units)
-    except WorkUnitDependencyError as e:
-        raise ValueError(str(e)) from e
+    # Field-level checks (kebab-case IDs, positive sequence, ...) live on
+    # the WorkUnit model and raise pydantic's ValidationError.
+    convert_specs_to_work_units(specs, flight_plan_name="validation")
+    structural = find_structural_gaps(specs)
 
     # Check SC coverage — every success criterion must be traced
     gaps: list[str] = []
     if success_criteria_count > 0:
         covered_refs: set[str] = set()
         for spec in specs:
-            for ac in spec.acceptance_criteria:
-                if ac.trace_ref:
-                    # Handle comma-separated refs (e.g., "SC-B1-default, SC-B1-linux")
-                    for ref_part in ac.trace_ref.split(","):
-                        covered_refs.add(ref_part.strip())
+            covered_refs |= _sc_refs(spec)
 
         # Build expected refs: use expected_sc_refs if provided, else
         # fall back to sequential SC-001..SC-NNN for backward compat.
@@ -982,49 +1512,29 @@ def validate_decomposition(
                 # of them in one validation pass (#135 subtask 5).
                 logger.debug("sc_not_covered", ref=ref)
 
+    # Structural gaps first: untraced criteria are advisory, and raising
+    # on them first used to hide an overloaded unit from the fixer.
+    if structural:
+        raise DecompositionGapsError(
+            f"Decomposition has {len(structural)} structural gap(s) — "
+            + "; ".join(str(g) for g in structural),
+            structural=structural,
+            untraced=gaps,
+        )
+
     if gaps:
         raise SCTraceabilityError(
             f"Incomplete SC coverage: {len(gaps)} success criteria not traced — {'; '.join(gaps)}",
             gaps=gaps,
         )
 
-    # --- Hard check: grossly overloaded beads (>6 SCs) ---
-    # This is a hard error. 6+ SCs in one bead is always too large.
-    hard_sc_limit = 12
-    overloaded: list[str] = []
-    for spec in specs:
-        sc_refs = set()
-        for ac in spec.acceptance_criteria:
-            if ac.trace_ref:
-                for ref_part in ac.trace_ref.split(","):
-                    sc_refs.add(ref_part.strip())
-        if len(sc_refs) > hard_sc_limit:
-            overloaded.append(
-                f"{spec.id} covers {len(sc_refs)} SC refs"
-                f" ({', '.join(sorted(sc_refs))})"
-                f" — max is {hard_sc_limit}"
-            )
-
-    if overloaded:
-        raise SCCoverageError(
-            f"Overloaded work units: {len(overloaded)} work unit(s) cover"
-            f" more than {hard_sc_limit} success criteria — "
-            + "; ".join(overloaded)
-            + ". Split into smaller units with depends_on links.",
-            gaps=overloaded,
-        )
-
     # --- Soft checks: advisory warnings fed back to decomposer ---
     warnings: list[str] = []
 
     # Soft SC count warning (>5 is a yellow flag, not a hard error)
     soft_sc_warn = 5
     for spec in specs:
-        sc_refs = set()
-        for ac in spec.acceptance_criteria:
-            if ac.trace_ref:
-                for ref_part in ac.trace_ref.split(","):
-                    sc_refs.add(ref_part.strip())
+        sc_refs = _sc_refs(spec)
         if len(sc_refs) > soft_sc_warn:
             warnings.append(
                 f"Advisory: {spec.id} covers {len(sc_refs)} SCs"
@@ -1103,3 +1613,28 @@ class SCTraceabilityError(SCCoverageError):
     So callers should record these gaps and show them to the human, but
     must not fail validation or drive the fix loop on them alone.
     """
+
+
+class DecompositionGapsError(SCCoverageError):
+    """The decomposition has structural gaps the fixer must resolve.
+
+    Carries every gap :func:`find_structural_gaps` found, so one fix round
+    sees all of them. Subclasses :class:`SCCoverageError` because an
+    overloaded work unit used to raise that directly.
+
+    Attributes:
+        structural: The gaps, as :class:`DecompositionGap` records.
+        gaps: The same gaps rendered as strings.
+        untraced: Untraced success criteria found in the same pass
+            (advisory, as for :class:`SCTraceabilityError`).
+    """
+
+    def __init__(
+        self,
+        message: str,
+        structural: list[DecompositionGap],
+        untraced: list[str] | None = None,
+    ) -> None:
+        super().__init__(message, gaps=[str(g) for g in structural])
+        self.structural = structural
+        self.untraced = list(untraced or [])
@@ -746,6 +746,8 @@ async def curate_history(
 async def gather_curation_context(
     base_revision: str = "main",
     cwd: Path | None = None,
+    *,
+    with_stats: bool = True,
 ) -> dict[str, Any]:
     """Gather commit log and per-commit stats for curation.
 
@@ -755,6 +757,10 @@ async def gather_curation_context(
     Args:
         base_revision: Revision marking the start of the work.
         cwd: Working directory. Defaults to ``Path.cwd()``.
+        with_stats: Collect the diff stats. ``False`` lists the commits
+            with a single ``jj log`` and leaves ``stats`` and
+            ``log_summary`` empty — enough to decide whether there is
+            anything to land before paying one subprocess per commit.
 
     Returns:
         Dict with:
@@ -793,6 +799,21 @@ async def gather_curation_context(
                 "error": None,
             }
 
+        if not with_stats:
+            return {
+                "success": True,
+                "commits": [
+                    {
+                        "change_id": change.change_id,
+                        "description": change.description,
+                        "stats": "",
+                    }
+                    for change in log_result.changes
+                ],
+                "log_summary": "",
+                "error": None,
+            }
+
         # 2. Get summary log with file stats
         try:
             stat_result = await client.diff_stat(revision="@-", from_rev=base_revision)
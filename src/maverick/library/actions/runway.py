@@ -24,6 +24,7 @@ __all__ = [
     "record_bead_outcome",
     "record_fix_attempt",
     "record_review_findings",
+    "retrieve_review_context",
     "retrieve_runway_context",
 ]
 
@@ -293,6 +294,89 @@ async def retrieve_runway_context(
         )
 
 
+async def retrieve_review_context(
+    *,
+    changed_files: list[str],
+    max_findings: int = 20,
+    max_outcomes: int = 5,
+    max_context_chars: int = 4000,
+    cwd: str | Path | None = None,
+) -> str:
+    """Collect runway history relevant to a set of changed files.
+
+    Reads the episodic review findings and bead outcomes once each and
+    keeps only the records that touch ``changed_files``, deduplicating
+    repeated findings. The result is meant to be computed once per bead
+    and shared inline with every reviewer, so reviewers do not each
+    re-explore ``.maverick/runway/`` through tool calls.
+
+    Best-effort — returns an empty string on any failure or when the
+    runway store is not initialized.
+
+    Args:
+        changed_files: Paths changed by the bead (repo-relative).
+        max_findings: Maximum prior findings to include.
+        max_outcomes: Maximum prior bead outcomes to include.
+        max_context_chars: Maximum characters in the returned text.
+        cwd: Working directory for runway store resolution.
+
+    Returns:
+        Formatted markdown, or empty string when nothing is relevant.
+    """
+    if not changed_files:
+        return ""
+    try:
+        store = _get_store(cwd)
+        if store is None:
+            return ""
+        wanted = set(changed_files)
+        findings = await store.get_review_findings()
+        outcomes = await store.get_bead_outcomes()
+    except Exception as exc:
+        logger.warning("runway_review_context_failed", error=str(exc))
+        return ""
+
+    seen: set[tuple[str, str]] = set()
+    relevant_findings: list[RunwayReviewFinding] = []
+    # Newest first: the most recent occurrence of a repeated finding wins
+    for finding in reversed(findings):
+        key = (finding.file_path, finding.description.strip())
+        if finding.file_path not in wanted or key in seen:
+            continue
+        seen.add(key)
+        relevant_findings.append(finding)
+        if len(relevant_findings) >= max_findings:
+            break
+
+    relevant_outcomes = [o for o in reversed(outcomes) if wanted.intersection(o.files_changed)][
+        :max_outcomes
+    ]
+
+    sections: list[str] = []
+    if relevant_findings:
+        lines = ["### Prior Review Findings on Changed Files"]
+        for f in relevant_findings:
+            line = f"- `{f.file_path}` [{f.severity or 'unknown'}] {f.description}"
+            if f.resolution:
+                line += f" (resolution: {f.resolution})"
+            lines.append(line)
+        sections.append("\n".join(lines))
+    if relevant_outcomes:
+        lines = ["### Prior Beads Touching These Files"]
+        for o in relevant_outcomes:
+            validation = "passed" if o.validation_passed else "failed"
+            lines.append(
+                f'- **{o.bead_id}** "{o.title}": validation {validation}, '
+                f"{o.review_findings_count} findings ({o.review_fixed_count} fixed)"
+            )
+        sections.append("\n".join(lines))
+
+    result = "\n\n".join(sections)
+    if len(result) > max_context_chars:
+        result = result[: max_context_chars - 3] + "..."
+    return result
+
+
 def _format_runway_context(
     outcomes: list[BeadOutcome],
     passages: list[Any],
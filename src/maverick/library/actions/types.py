@@ -738,12 +738,17 @@ class BeadCreationResult:
         work_beads: Serialized CreatedBeads for work beads.
         created_map: Mapping from bead title to bd_id.
         errors: Errors encountered during creation.
+        dependencies: Serialized BeadDependency objects wired in the same
+            transaction as the beads, or None when none were requested or
+            creation fell back to one bead at a time (the caller still
+            has to run ``wire_dependencies``).
     """
 
     epic: dict[str, Any] | None
     work_beads: tuple[dict[str, Any], ...]
     created_map: dict[str, str]
     errors: tuple[str, ...]
+    dependencies: tuple[dict[str, Any], ...] | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
@@ -752,6 +757,7 @@ class BeadCreationResult:
             "work_beads": list(self.work_beads),
             "created_map": dict(self.created_map),
             "errors": list(self.errors),
+            "dependencies": None if self.dependencies is None else list(self.dependencies),
         }
 
 
@@ -565,6 +565,14 @@ class SubmitCorrectionPayload(SupervisorInboxPayload):
         return self
 
 
+class ConflictHunkResolution(SupervisorInboxPayload):
+    """Replacement text for one conflict hunk shown as an excerpt."""
+
+    path: str = Field(min_length=1, description="Repo-relative path of the conflicted file.")
+    hunk: int = Field(ge=1, description="1-based hunk number from the excerpt header.")
+    resolution: str = Field(description="Text replacing the whole marker block (markers removed).")
+
+
 class SubmitConflictResolutionPayload(SupervisorInboxPayload):
     """Typed payload for ``submit_conflict_resolution``.
 
@@ -580,6 +588,13 @@ class SubmitConflictResolutionPayload(SupervisorInboxPayload):
         default_factory=tuple,
         description="Files the agent declines to resolve.",
     )
+    resolved_hunks: tuple[ConflictHunkResolution, ...] = Field(
+        default_factory=tuple,
+        description=(
+            "Per-hunk resolutions for files shown as excerpts; the workflow "
+            "splices them into the file."
+        ),
+    )
     notes: str = Field(default="", description="Optional free-form notes on the resolution.")
 
 
@@ -659,6 +674,7 @@ __all__ = [
     "AcceptanceCriterionPayload",
     "ArchitectureDecisionPayload",
     "AssumptionPayload",
+    "ConflictHunkResolution",
     "ContrarianChallengePayload",
     "ContrarianSimplificationPayload",
     "CurationStepPayload",
@@ -0,0 +1,192 @@
+"""Prompt layout for provider prompt caches, and cache hit-rate accounting.
+
+Providers cache a prompt's *prefix*: a later call whose leading bytes match
+an earlier one's is billed (and processed) at the cached rate up to the
+first differing byte. A prompt that opens with a bead id or a timestamp
+therefore misses even when everything after it is identical. A
+:class:`PromptLayout` assembles a prompt from :class:`PromptSection`\\ s
+tagged with how long their text stays byte-identical and renders them
+most stable first:
+
+* ``STATIC`` — fixed text: role, rules, output schema.
+* ``RUN`` — shared by every call of a workflow run: flight plan, outline,
+  codebase context, briefing.
+* ``CALL`` — specific to one call: work unit ids, feedback, diffs.
+
+Everything before the first ``CALL`` section is the cacheable prefix; its
+fingerprint becomes the ``CacheConfig`` key on runtimes that advertise
+``Feature.PROMPT_CACHE_CONTROL``, so calls sharing a prefix (detail
+fan-out, review rounds, fix loops) are routed to the same cache entry.
+Runtimes without an explicit cache channel still benefit from the
+ordering alone. Shared seeds serialized to JSON go through
+:func:`canonical_json`, so two calls over the same data send the same
+bytes.
+
+:func:`cache_usage_by_actor` reads recorded
+:class:`~maverick.runway.models.CostEntry` rows back into a per-agent hit
+ratio.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from maverick.runway.models import CostEntry
+
+__all__ = [
+    "CacheUsage",
+    "PromptLayout",
+    "PromptSection",
+    "Stability",
+    "cache_usage_by_actor",
+    "canonical_json",
+]
+
+#: Providers whose ``input_tokens`` exclude cache reads and writes
+#: (Anthropic-style usage); elsewhere cached tokens are a subset of input
+_CACHE_EXCLUSIVE_PROVIDERS = frozenset({"bedrock", "claude", "opencode"})
+
+
+class Stability(StrEnum):
+    """How long a prompt section's text stays byte-identical.
+
+    Attributes:
+        STATIC: Never changes between calls.
+        RUN: Fixed for the length of one workflow run.
+        CALL: Differs from call to call.
+    """
+
+    STATIC = "static"
+    RUN = "run"
+    CALL = "call"
+
+
+_RANK = {Stability.STATIC: 0, Stability.RUN: 1, Stability.CALL: 2}
+
+
+@dataclass(frozen=True, slots=True)
+class PromptSection:
+    """One block of prompt text.
+
+    Attributes:
+        text: The rendered block, headings included.
+        stability: How long ``text`` stays byte-identical.
+    """
+
+    text: str
+    stability: Stability = Stability.CALL
+
+
+@dataclass(frozen=True, slots=True)
+class PromptLayout:
+    """Prompt sections rendered most stable first.
+
+    Sections of equal stability keep the order they were given in. Empty
+    sections are dropped.
+
+    Attributes:
+        sections: The sections, in any order.
+        separator: Text placed between rendered sections.
+    """
+
+    sections: tuple[PromptSection, ...]
+    separator: str = "\n\n"
+
+    @classmethod
+    def of(cls, *sections: PromptSection | None) -> PromptLayout:
+        """Build a layout, skipping ``None`` (absent optional) sections."""
+        return cls(tuple(s for s in sections if s is not None))
+
+    def ordered(self) -> tuple[PromptSection, ...]:
+        """Non-empty sections, most stable first."""
+        present = (s for s in self.sections if s.text)
+        return tuple(sorted(present, key=lambda s: _RANK[s.stability]))
+
+    def render(self) -> str:
+        """The full prompt text."""
+        return self.separator.join(s.text for s in self.ordered())
+
+    def cacheable_prefix(self) -> str:
+        """The rendered text before the first ``CALL`` section.
+
+        This is the cache breakpoint: every byte before it is identical
+        across calls that share the same ``STATIC``/``RUN`` sections.
+        """
+        stable = [s.text for s in self.ordered() if s.stability is not Stability.CALL]
+        return self.separator.join(stable)
+
+    def cache_key(self, namespace: str) -> str | None:
+        """A provider cache key naming :meth:`cacheable_prefix`.
+
+        Returns:
+            ``"<namespace>:<16 hex chars>"``, or ``None`` when nothing in
+            the prompt is cacheable.
+        """
+        prefix = self.cacheable_prefix()
+        if not prefix:
+            return None
+        return f"{namespace}:{hashlib.sha256(prefix.encode('utf-8')).hexdigest()[:16]}"
+
+
+def canonical_json(value: Any) -> str:
+    """Serialize *value* the same way every time (sorted keys, fixed indent)."""
+    return json.dumps(value, indent=2, sort_keys=True, ensure_ascii=False, default=str)
+
+
+@dataclass(frozen=True, slots=True)
+class CacheUsage:
+    """Prompt-cache totals over a set of sends.
+
+    Attributes:
+        sends: Sends counted.
+        prompt_tokens: Prompt tokens, cached or not.
+        cache_read_tokens: Prompt tokens served from the provider's cache.
+        cache_write_tokens: Prompt tokens written to the provider's cache.
+    """
+
+    sends: int = 0
+    prompt_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of prompt tokens read from the cache (0.0 with no tokens)."""
+        if not self.prompt_tokens:
+            return 0.0
+        return self.cache_read_tokens / self.prompt_tokens
+
+    def add(self, entry: CostEntry) -> CacheUsage:
+        """Totals with *entry* counted in.
+
+        ``input_tokens`` is normalized to the full prompt size: providers
+        in :data:`_CACHE_EXCLUSIVE_PROVIDERS` report cached tokens
+        separately from it, the rest include them.
+        """
+        prompt = entry.input_tokens
+        if entry.provider_id in _CACHE_EXCLUSIVE_PROVIDERS:
+            prompt += entry.cache_read_tokens + entry.cache_write_tokens
+        return CacheUsage(
+            sends=self.sends + 1,
+            prompt_tokens=self.prompt_tokens + prompt,
+            cache_read_tokens=self.cache_read_tokens + entry.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens + entry.cache_write_tokens,
+        )
+
+
+def cache_usage_by_actor(entries: Iterable[CostEntry]) -> dict[str, CacheUsage]:
+    """Group recorded sends by ``actor`` and total their cache usage.
+
+    Returns:
+        Usage per actor tag, in order of each actor's first send.
+    """
+    usage: dict[str, CacheUsage] = {}
+    for entry in entries:
+        usage[entry.actor] = usage.get(entry.actor, CacheUsage()).add(entry)
+    return usage
@@ -2,37 +2,62 @@
 
 from __future__ import annotations
 
-from maverick.runners.parsers.base import OutputParser
+from maverick.runners.parsers.base import (
+    LineParser,
+    OutputParser,
+    ParseSession,
+    fold_duplicates,
+)
+from maverick.runners.parsers.cargo import CargoTestParser
 from maverick.runners.parsers.eslint import ESLintJSONParser
+from maverick.runners.parsers.go import GoParser
+from maverick.runners.parsers.mypy import MypyParser
+from maverick.runners.parsers.pytest_report import PytestParser
 from maverick.runners.parsers.python import PythonTracebackParser
+from maverick.runners.parsers.registry import (
+    ErrorCollector,
+    get_parser,
+    get_parsers,
+    parse_output,
+    register_parser,
+    registered_parsers,
+)
+from maverick.runners.parsers.ruff import RuffParser
 from maverick.runners.parsers.rust import RustCompilerParser
+from maverick.runners.parsers.typescript import TypeScriptCompilerParser
 
 __all__ = [
+    "CargoTestParser",
+    "ESLintJSONParser",
+    "ErrorCollector",
+    "GoParser",
+    "LineParser",
+    "MypyParser",
     "OutputParser",
+    "ParseSession",
+    "PytestParser",
     "PythonTracebackParser",
+    "RuffParser",
     "RustCompilerParser",
-    "ESLintJSONParser",
+    "TypeScriptCompilerParser",
+    "fold_duplicates",
     "get_parser",
     "get_parsers",
+    "parse_output",
+    "register_parser",
+    "registered_parsers",
 ]
 
-_PARSERS: list[OutputParser] = [
+for _parser in (
     PythonTracebackParser(),
     RustCompilerParser(),
     ESLintJSONParser(),
-]
-
-
-def get_parsers(output: str) -> list[OutputParser]:
-    """Get all parsers that can handle the given output."""
-    matching_parsers = []
-    for parser in _PARSERS:
-        if parser.can_parse(output):
-            matching_parsers.append(parser)
-    return matching_parsers
-
-
-def get_parser(output: str) -> OutputParser | None:
-    """Get the first parser that can handle the given output."""
-    parsers = get_parsers(output)
-    return parsers[0] if parsers else None
+    PytestParser(),
+    MypyParser(),
+    RuffParser(),
+    TypeScriptCompilerParser(),
+    GoParser(),
+    CargoTestParser(),
+):
+    register_parser(_parser)
+del _parser
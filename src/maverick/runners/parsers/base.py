@@ -1,13 +1,26 @@
-"""Base protocol for output parsers."""
+"""Base protocols and helpers for output parsers.
+
+Parsers consume tool output one line at a time through a
+:class:`ParseSession`, so a whole validation run is parsed in a single
+linear pass — whether the lines come from a finished ``CommandResult`` or
+straight from ``CommandRunner.stream``.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
     from maverick.runners.models import ParsedError
 
-__all__ = ["OutputParser"]
+__all__ = [
+    "LineParser",
+    "OutputParser",
+    "ParseSession",
+    "fold_duplicates",
+    "parse_lines",
+]
 
 
 class OutputParser(Protocol):
@@ -20,3 +33,47 @@ class OutputParser(Protocol):
     def parse(self, output: str) -> list[ParsedError]:
         """Parse output and return list of errors."""
         ...
+
+
+class ParseSession(Protocol):
+    """Incremental parsing state for one tool run.
+
+    ``feed`` must do constant work per line (amortized), so parsing stays
+    linear in the size of the output.
+    """
+
+    def feed(self, line: str) -> None:
+        """Consume one line of output (without its trailing newline)."""
+        ...
+
+    def finish(self) -> list[ParsedError]:
+        """Flush any pending state and return every error found, in order."""
+        ...
+
+
+class LineParser(OutputParser, Protocol):
+    """Output parser that can also parse incrementally, line by line."""
+
+    #: Registry key (e.g. ``"python"``, ``"mypy"``)
+    name: str
+
+    def session(self) -> ParseSession:
+        """Start a fresh incremental parse."""
+        ...
+
+
+def parse_lines(session: ParseSession, lines: Iterable[str]) -> list[ParsedError]:
+    """Feed ``lines`` through ``session`` and return the folded errors."""
+    for line in lines:
+        session.feed(line)
+    return fold_duplicates(session.finish())
+
+
+def fold_duplicates(errors: Iterable[ParsedError]) -> list[ParsedError]:
+    """Drop repeated errors, keeping the first occurrence of each.
+
+    Test runners and compilers often report the same failure several times
+    (per parametrized case, per frame, in a closing summary); the fix loop
+    only needs to see it once.
+    """
+    return list(dict.fromkeys(errors))
@@ -0,0 +1,72 @@
+"""Cargo test panic parser."""
+
+from __future__ import annotations
+
+import re
+
+from maverick.runners.models import ParsedError
+from maverick.runners.parsers.base import ParseSession, parse_lines
+
+__all__ = ["CargoTestParser"]
+
+#: Rust >= 1.73: ``thread 'name' panicked at src/lib.rs:10:5:`` + message line
+_PANIC = re.compile(r"^thread '([^']*)' panicked at ([^:\s]+):(\d+):(\d+):$")
+#: Older toolchains: ``thread 'name' panicked at 'message', src/lib.rs:10:5``
+_LEGACY_PANIC = re.compile(r"^thread '([^']*)' panicked at '(.*)', ([^:\s]+):(\d+):(\d+)$")
+
+
+class CargoTestParser:
+    """Parse ``cargo test`` panics (compile errors are handled by the rust parser)."""
+
+    name = "cargo"
+
+    def can_parse(self, output: str) -> bool:
+        """Check if output contains cargo test panics."""
+        return "panicked at" in output
+
+    def parse(self, output: str) -> list[ParsedError]:
+        """Extract failing tests from cargo test output."""
+        return parse_lines(self.session(), output.splitlines())
+
+    def session(self) -> ParseSession:
+        """Start an incremental cargo test output parse."""
+        return _CargoSession()
+
+
+class _CargoSession:
+    __slots__ = ("_errors", "_pending")
+
+    def __init__(self) -> None:
+        self._errors: list[ParsedError] = []
+        # Panic location awaiting its message on the following line
+        self._pending: re.Match[str] | None = None
+
+    def feed(self, line: str) -> None:
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            self._add(*pending.group(1, 2, 3, 4), message=line.strip() or "panicked")
+            return
+        if not line.startswith("thread '"):
+            return
+        legacy = _LEGACY_PANIC.match(line)
+        if legacy:
+            self._add(*legacy.group(1, 3, 4, 5), message=legacy.group(2))
+            return
+        self._pending = _PANIC.match(line)
+
+    def finish(self) -> list[ParsedError]:
+        if self._pending is not None:
+            self._add(*self._pending.group(1, 2, 3, 4), message="panicked")
+            self._pending = None
+        return self._errors
+
+    def _add(self, test_name: str, file: str, line: str, column: str, *, message: str) -> None:
+        self._errors.append(
+            ParsedError(
+                file=file,
+                line=int(line),
+                column=int(column),
+                message=f"{test_name}: {message}",
+                severity="error",
+            )
+        )
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import json
+from typing import Any
 
 from maverick.runners.models import ParsedError
+from maverick.runners.parsers.base import ParseSession
 
 __all__ = ["ESLintJSONParser"]
 
@@ -12,36 +14,75 @@ __all__ = ["ESLintJSONParser"]
 class ESLintJSONParser:
     """Parse ESLint JSON format output."""
 
+    name = "eslint"
+
     def can_parse(self, output: str) -> bool:
         """Check if output is ESLint JSON format."""
-        try:
-            data = json.loads(output.strip())
-            return isinstance(data, list) and all(
-                "filePath" in item for item in data if isinstance(item, dict)
-            )
-        except (json.JSONDecodeError, TypeError):
-            return False
+        return _load_report(output) is not None
 
     def parse(self, output: str) -> list[ParsedError]:
         """Extract errors from ESLint JSON output."""
-        errors: list[ParsedError] = []
-
-        try:
-            data = json.loads(output.strip())
-            for file_result in data:
-                file_path = file_result.get("filePath", "")
-                for msg in file_result.get("messages", []):
-                    errors.append(
-                        ParsedError(
-                            file=file_path,
-                            line=msg.get("line", 1),
-                            column=msg.get("column"),
-                            message=msg.get("message", "Unknown error"),
-                            severity="error" if msg.get("severity", 2) == 2 else "warning",
-                            code=msg.get("ruleId"),
-                        )
-                    )
-        except (json.JSONDecodeError, TypeError, KeyError):
-            pass
+        return _report_errors(_load_report(output) or [])
+
+    def session(self) -> ParseSession:
+        """Start an incremental parse (JSON is decoded once, at the end)."""
+        return _ESLintSession()
+
+
+class _ESLintSession:
+    """Buffers lines only while the output still looks like a JSON array."""
+
+    __slots__ = ("_lines", "_rejected")
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+        self._rejected = False
 
-        return errors
+    def feed(self, line: str) -> None:
+        if self._rejected:
+            return
+        if not self._lines and not line.strip():
+            return
+        if not self._lines and not line.lstrip().startswith("["):
+            self._rejected = True
+            return
+        self._lines.append(line)
+
+    def finish(self) -> list[ParsedError]:
+        if self._rejected or not self._lines:
+            return []
+        return _report_errors(_load_report("\n".join(self._lines)) or [])
+
+
+def _load_report(output: str) -> list[Any] | None:
+    """Decode an ESLint JSON report, or None if ``output`` is not one."""
+    try:
+        data = json.loads(output.strip())
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if isinstance(data, list) and all(
+        "filePath" in item for item in data if isinstance(item, dict)
+    ):
+        return data
+    return None
+
+
+def _report_errors(data: list[Any]) -> list[ParsedError]:
+    errors: list[ParsedError] = []
+    try:
+        for file_result in data:
+            file_path = file_result.get("filePath", "")
+            for msg in file_result.get("messages", []):
+                errors.append(
+                    ParsedError(
+                        file=file_path,
+                        line=msg.get("line", 1),
+                        column=msg.get("column"),
+                        message=msg.get("message", "Unknown error"),
+                        severity="error" if msg.get("severity", 2) == 2 else "warning",
+                        code=msg.get("ruleId"),
+                    )
+                )
+    except (TypeError, KeyError, AttributeError):
+        pass
+    return errors
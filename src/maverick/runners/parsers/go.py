@@ -0,0 +1,85 @@
+"""Go toolchain (build, vet, test) output parser."""
+
+from __future__ import annotations
+
+import re
+
+from maverick.runners.models import ParsedError
+from maverick.runners.parsers.base import ParseSession, parse_lines
+
+__all__ = ["GoParser"]
+
+#: ``./pkg/a.go:12:5: message`` from build/vet, or an indented
+#: ``    a_test.go:12: message`` from ``t.Errorf`` in ``go test``
+_DIAGNOSTIC = re.compile(r"^\s*(\S+\.go):(\d+)(?::(\d+))?: (.+)$")
+#: ``--- FAIL: TestName (0.00s)``
+_TEST_FAILURE = re.compile(r"^\s*--- FAIL: (\S+)")
+
+
+class GoParser:
+    """Parse ``go build``/``go vet`` diagnostics and ``go test`` failures.
+
+    Test assertion messages are prefixed with the failing test's name, which
+    ``go test`` prints after the messages it belongs to.
+    """
+
+    name = "go"
+
+    def can_parse(self, output: str) -> bool:
+        """Check if output contains Go diagnostics."""
+        return ".go:" in output
+
+    def parse(self, output: str) -> list[ParsedError]:
+        """Extract diagnostics and test failures from Go output."""
+        return parse_lines(self.session(), output.splitlines())
+
+    def session(self) -> ParseSession:
+        """Start an incremental Go output parse."""
+        return _GoSession()
+
+
+class _GoSession:
+    __slots__ = ("_errors", "_test_messages")
+
+    def __init__(self) -> None:
+        self._errors: list[ParsedError] = []
+        # Indented test-log diagnostics awaiting their ``--- FAIL`` line
+        self._test_messages: list[ParsedError] = []
+
+    def feed(self, line: str) -> None:
+        failure = _TEST_FAILURE.match(line)
+        if failure:
+            test_name = failure.group(1)
+            for error in self._test_messages:
+                self._errors.append(
+                    ParsedError(
+                        file=error.file,
+                        line=error.line,
+                        column=error.column,
+                        message=f"{test_name}: {error.message}",
+                        severity="error",
+                    )
+                )
+            self._test_messages = []
+            return
+        if ".go:" not in line:
+            return
+        match = _DIAGNOSTIC.match(line)
+        if match is None:
+            return
+        error = ParsedError(
+            file=match.group(1),
+            line=int(match.group(2)),
+            column=int(match.group(3)) if match.group(3) else None,
+            message=match.group(4),
+            severity="error",
+        )
+        if line[:1].isspace():
+            self._test_messages.append(error)
+        else:
+            self._errors.append(error)
+
+    def finish(self) -> list[ParsedError]:
+        self._errors.extend(self._test_messages)
+        self._test_messages = []
+        return self._errors
@@ -0,0 +1,57 @@
+"""Mypy type checker output parser."""
+
+from __future__ import annotations
+
+import re
+
+from maverick.runners.models import ParsedError
+from maverick.runners.parsers.base import ParseSession, parse_lines
+
+__all__ = ["MypyParser"]
+
+#: ``path.py:12[:5]: error: message  [code]`` (notes are context, not errors)
+_DIAGNOSTIC = re.compile(
+    r"^(\S+\.pyi?):(\d+)(?::(\d+))?: (error|warning): (.+?)(?:  \[([\w-]+)\])?$"
+)
+
+
+class MypyParser:
+    """Parse mypy's default (and ``--show-column-numbers``) output."""
+
+    name = "mypy"
+
+    def can_parse(self, output: str) -> bool:
+        """Check if output contains mypy diagnostics."""
+        return ": error: " in output or "Found " in output and " in " in output
+
+    def parse(self, output: str) -> list[ParsedError]:
+        """Extract diagnostics from mypy output."""
+        return parse_lines(self.session(), output.splitlines())
+
+    def session(self) -> ParseSession:
+        """Start an incremental mypy output parse."""
+        return _MypySession()
+
+
+class _MypySession:
+    __slots__ = ("_errors",)
+
+    def __init__(self) -> None:
+        self._errors: list[ParsedError] = []
+
+    def feed(self, line: str) -> None:
+        match = _DIAGNOSTIC.match(line)
+        if match:
+            self._errors.append(
+                ParsedError(
+                    file=match.group(1),
+                    line=int(match.group(2)),
+                    column=int(match.group(3)) if match.group(3) else None,
+                    message=match.group(5),
+                    severity=match.group(4),
+                    code=match.group(6),
+                )
+            )
+
+    def finish(self) -> list[ParsedError]:
+        return self._errors
@@ -0,0 +1,109 @@
+"""Pytest failure report parser."""
+
+from __future__ import annotations
+
+import re
+
+from maverick.runners.models import ParsedError
+from maverick.runners.parsers.base import ParseSession, parse_lines
+
+__all__ = ["PytestParser"]
+
+#: ``--tb=long``/``auto``: closing ``path.py:42: AssertionError`` line
+_LONG_LOCATION = re.compile(r"^(\S+\.py):(\d+): (\w+(?:\.\w+)*)$")
+#: ``--tb=short``: ``path.py:42: in test_name`` frame line
+_SHORT_LOCATION = re.compile(r"^(\S+\.py):(\d+): in \S+")
+#: ``E   <message>`` explanation lines
+_EXPLANATION = re.compile(r"^E\s+(.*)$")
+#: ``____ test_name ____`` per-failure header or ``==== section ====`` rule
+_SECTION_RULE = re.compile(r"^(?:_{3,}|={3,})")
+#: Short test summary: ``FAILED tests/x.py::test_y - message``
+_SUMMARY = re.compile(r"^(FAILED|ERROR) (\S+?\.py)(?:::\S+)?(?: - (.+))?$")
+
+
+class PytestParser:
+    """Parse pytest failure reports (long or short tracebacks, summaries).
+
+    Each failure's ``E`` lines are grouped under its location and reported
+    once. Short-summary lines are only used for files that had no detailed
+    report (e.g. ``--tb=no`` or collection errors).
+    """
+
+    name = "pytest"
+
+    def can_parse(self, output: str) -> bool:
+        """Check if output looks like a pytest report."""
+        return "FAILED " in output or "short test summary" in output or "\nE   " in output
+
+    def parse(self, output: str) -> list[ParsedError]:
+        """Extract failures from pytest output."""
+        return parse_lines(self.session(), output.splitlines())
+
+    def session(self) -> ParseSession:
+        """Start an incremental pytest report parse."""
+        return _PytestSession()
+
+
+class _PytestSession:
+    __slots__ = ("_errors", "_explanation", "_location", "_reported_files")
+
+    def __init__(self) -> None:
+        self._errors: list[ParsedError] = []
+        self._explanation: list[str] = []
+        self._location: tuple[str, int] | None = None
+        self._reported_files: set[str] = set()
+
+    def feed(self, line: str) -> None:
+        explanation = _EXPLANATION.match(line)
+        if explanation:
+            self._explanation.append(explanation.group(1).strip())
+            return
+
+        long_location = _LONG_LOCATION.match(line)
+        if long_location:
+            self._location = (long_location.group(1), int(long_location.group(2)))
+            self._flush(code=long_location.group(3))
+            return
+
+        short_location = _SHORT_LOCATION.match(line)
+        if short_location:
+            if self._explanation:
+                self._flush()
+            self._location = (short_location.group(1), int(short_location.group(2)))
+            return
+
+        if _SECTION_RULE.match(line):
+            self._flush()
+            return
+
+        summary = _SUMMARY.match(line)
+        if summary and summary.group(2) not in self._reported_files:
+            self._errors.append(
+                ParsedError(
+                    file=summary.group(2),
+                    line=1,
+                    message=summary.group(3) or f"test {summary.group(1).lower()}",
+                    severity="error",
+                )
+            )
+
+    def finish(self) -> list[ParsedError]:
+        self._flush()
+        return self._errors
+
+    def _flush(self, code: str | None = None) -> None:
+        if self._location is not None and (self._explanation or code):
+            file_path, line_num = self._location
+            message = next((text for text in self._explanation if text), code or "")
+            self._errors.append(
+                ParsedError(
+                    file=file_path,
+                    line=line_num,
+                    message=message,
+                    severity="error",
+                    code=code,
+                )
+            )
+            self._reported_files.add(file_path)
+        self._explanation = []
+        self._location = None
@@ -5,43 +5,78 @@ from __future__ import annotations
 import re
 
 from maverick.runners.models import ParsedError
+from maverick.runners.parsers.base import ParseSession, parse_lines
 
 __all__ = ["PythonTracebackParser"]
 
+_TRACEBACK_HEADER = "Traceback (most recent call last)"
+_FRAME_PATTERN = re.compile(r'File "([^"]+)", line (\d+)(?:, in (\w+))?')
+_ERROR_PATTERN = re.compile(r"^(\w+Error|\w+Exception): (.+)$")
+
+#: Frames under these path fragments are library code, not the project's
+_LIBRARY_MARKERS = ("site-packages", "dist-packages", "<frozen ", "/lib/python")
+
 
 class PythonTracebackParser:
-    """Parse Python traceback and pytest output for errors."""
+    """Parse Python traceback and pytest output for errors.
+
+    Frames are grouped into their traceback and one error is reported per
+    traceback, located at the innermost frame in project code (falling back
+    to the innermost frame), with the exception line as its message.
+    """
 
-    _traceback_pattern = re.compile(r'File "([^"]+)", line (\d+)(?:, in (\w+))?')
-    _error_pattern = re.compile(r"^(\w+Error|\w+Exception): (.+)$", re.MULTILINE)
+    name = "python"
 
     def can_parse(self, output: str) -> bool:
         """Check if output contains Python traceback."""
-        return "Traceback (most recent call last)" in output or "Error:" in output
+        return _TRACEBACK_HEADER in output or "Error:" in output
 
     def parse(self, output: str) -> list[ParsedError]:
         """Extract file, line, message from Python tracebacks."""
-        errors: list[ParsedError] = []
-
-        # Find traceback locations
-        for match in self._traceback_pattern.finditer(output):
-            file_path = match.group(1)
-            line_num = int(match.group(2))
-
-            # Look for the error message
-            error_match = self._error_pattern.search(output[match.end() :])
-            if error_match:
-                message = f"{error_match.group(1)}: {error_match.group(2)}"
-            else:
-                message = "Python error"
-
-            errors.append(
-                ParsedError(
-                    file=file_path,
-                    line=line_num,
-                    message=message,
-                    severity="error",
-                )
-            )
-
-        return errors
+        return parse_lines(self.session(), output.splitlines())
+
+    def session(self) -> ParseSession:
+        """Start an incremental traceback parse."""
+        return _PythonSession()
+
+
+class _PythonSession:
+    __slots__ = ("_errors", "_frames")
+
+    def __init__(self) -> None:
+        self._errors: list[ParsedError] = []
+        self._frames: list[tuple[str, int]] = []
+
+    def feed(self, line: str) -> None:
+        if line.startswith(_TRACEBACK_HEADER):
+            # A chained traceback starts before the previous one resolved
+            self._flush("Python error")
+            return
+        frame = _FRAME_PATTERN.search(line)
+        if frame:
+            self._frames.append((frame.group(1), int(frame.group(2))))
+            return
+        if self._frames:
+            error = _ERROR_PATTERN.match(line)
+            if error:
+                self._flush(f"{error.group(1)}: {error.group(2)}")
+
+    def finish(self) -> list[ParsedError]:
+        self._flush("Python error")
+        return self._errors
+
+    def _flush(self, message: str) -> None:
+        if not self._frames:
+            return
+        file_path, line_num = next(
+            (
+                frame
+                for frame in reversed(self._frames)
+                if not any(marker in frame[0] for marker in _LIBRARY_MARKERS)
+            ),
+            self._frames[-1],
+        )
+        self._errors.append(
+            ParsedError(file=file_path, line=line_num, message=message, severity="error")
+        )
+        self._frames = []
@@ -0,0 +1,93 @@
+"""Registry of output parsers and single-pass multi-parser collection."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from maverick.runners.models import ParsedError
+from maverick.runners.parsers.base import LineParser, ParseSession, fold_duplicates
+
+__all__ = [
+    "ErrorCollector",
+    "get_parser",
+    "get_parsers",
+    "parse_output",
+    "register_parser",
+    "registered_parsers",
+]
+
+_PARSERS: dict[str, LineParser] = {}
+
+
+def register_parser(parser: LineParser, *, replace: bool = False) -> None:
+    """Add a parser to the registry under ``parser.name``.
+
+    Args:
+        parser: Parser to register.
+        replace: Allow replacing a parser already registered under that name.
+
+    Raises:
+        ValueError: If the name is taken and ``replace`` is False.
+    """
+    if parser.name in _PARSERS and not replace:
+        raise ValueError(f"Output parser '{parser.name}' is already registered")
+    _PARSERS[parser.name] = parser
+
+
+def registered_parsers() -> tuple[LineParser, ...]:
+    """Return registered parsers in registration order."""
+    return tuple(_PARSERS.values())
+
+
+def get_parsers(output: str) -> list[LineParser]:
+    """Get all parsers that can handle the given output."""
+    return [parser for parser in _PARSERS.values() if parser.can_parse(output)]
+
+
+def get_parser(output: str) -> LineParser | None:
+    """Get the first parser that can handle the given output."""
+    parsers = get_parsers(output)
+    return parsers[0] if parsers else None
+
+
+class ErrorCollector:
+    """Feed tool output through several parsers in one pass.
+
+    Lines can be fed as they arrive (e.g. from ``CommandRunner.stream``);
+    each line is offered once to every parser's session, so the total work
+    is linear in the output size.
+
+    Example:
+        ```python
+        collector = ErrorCollector()
+        async for line in runner.stream(["pytest", "-q"]):
+            collector.feed(line.content)
+        errors = collector.finish()
+        ```
+    """
+
+    def __init__(self, parsers: Iterable[LineParser] | None = None) -> None:
+        """Start a session for each parser (default: every registered parser)."""
+        chosen = registered_parsers() if parsers is None else tuple(parsers)
+        self._sessions: list[ParseSession] = [parser.session() for parser in chosen]
+
+    def feed(self, line: str) -> None:
+        """Consume one line of output (a trailing newline is ignored)."""
+        line = line.rstrip("\r\n")
+        for session in self._sessions:
+            session.feed(line)
+
+    def finish(self) -> list[ParsedError]:
+        """Return every error found, in parser order, duplicates folded."""
+        errors: list[ParsedError] = []
+        for session in self._sessions:
+            errors.extend(session.finish())
+        return fold_duplicates(errors)
+
+
+def parse_output(output: str) -> list[ParsedError]:
+    """Parse complete output with every parser that recognises it."""
+    collector = ErrorCollector(get_parsers(output))
+    for line in output.splitlines():
+        collector.feed(line)
+    return collector.finish()
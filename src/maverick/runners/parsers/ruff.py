@@ -0,0 +1,71 @@
+"""Ruff linter output parser."""
+
+from __future__ import annotations
+
+import re
+
+from maverick.runners.models import ParsedError
+from maverick.runners.parsers.base import ParseSession, parse_lines
+
+__all__ = ["RuffParser"]
+
+#: Concise format: ``path:12:5: F401 [*] message``
+_CONCISE = re.compile(r"^(\S+?):(\d+):(\d+): ([A-Z]+\d+) (?:\[\*\] )?(.+)$")
+#: Full format header: ``F401 [*] message`` followed by ``--> path:12:5``
+_FULL_HEADER = re.compile(r"^([A-Z]+\d+) (?:\[\*\] )?(.+)$")
+_FULL_LOCATION = re.compile(r"^\s*--> (\S+?):(\d+):(\d+)")
+
+
+class RuffParser:
+    """Parse ``ruff check`` output in its concise or full format."""
+
+    name = "ruff"
+
+    def can_parse(self, output: str) -> bool:
+        """Check if output contains ruff diagnostics."""
+        return "-->" in output or any(_CONCISE.match(line) for line in output.splitlines())
+
+    def parse(self, output: str) -> list[ParsedError]:
+        """Extract diagnostics from ruff output."""
+        return parse_lines(self.session(), output.splitlines())
+
+    def session(self) -> ParseSession:
+        """Start an incremental ruff output parse."""
+        return _RuffSession()
+
+
+class _RuffSession:
+    __slots__ = ("_errors", "_pending")
+
+    def __init__(self) -> None:
+        self._errors: list[ParsedError] = []
+        self._pending: re.Match[str] | None = None
+
+    def feed(self, line: str) -> None:
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            location = _FULL_LOCATION.match(line)
+            if location:
+                self._add(location, code=pending.group(1), message=pending.group(2))
+                return
+        concise = _CONCISE.match(line)
+        if concise:
+            self._add(concise, code=concise.group(4), message=concise.group(5))
+            return
+        self._pending = _FULL_HEADER.match(line)
+
+    def finish(self) -> list[ParsedError]:
+        return self._errors
+
+    def _add(self, location: re.Match[str], *, code: str, message: str) -> None:
+        """Record a diagnostic; ``location`` groups 1-3 are path, line, column."""
+        self._errors.append(
+            ParsedError(
+                file=location.group(1),
+                line=int(location.group(2)),
+                column=int(location.group(3)),
+                message=message,
+                severity="error",
+                code=code,
+            )
+        )
@@ -5,19 +5,18 @@ from __future__ import annotations
 import re
 
 from maverick.runners.models import ParsedError
+from maverick.runners.parsers.base import ParseSession, parse_lines
 
 __all__ = ["RustCompilerParser"]
 
+_HEADER_PATTERN = re.compile(r"^(error|warning)(?:\[E(\d+)\])?: (.+)$")
+_LOCATION_PATTERN = re.compile(r"^\s+--> ([^:]+):(\d+):(\d+)")
+
 
 class RustCompilerParser:
     """Parse rustc and cargo error output."""
 
-    _error_pattern = re.compile(
-        r"^error(?:\[E(\d+)\])?: (.+)\n\s+--> ([^:]+):(\d+):(\d+)", re.MULTILINE
-    )
-    _warning_pattern = re.compile(
-        r"^warning(?:\[E(\d+)\])?: (.+)\n\s+--> ([^:]+):(\d+):(\d+)", re.MULTILINE
-    )
+    name = "rust"
 
     def can_parse(self, output: str) -> bool:
         """Check if output contains Rust compiler messages."""
@@ -25,30 +24,40 @@ class RustCompilerParser:
 
     def parse(self, output: str) -> list[ParsedError]:
         """Extract structured errors from rustc output."""
-        errors: list[ParsedError] = []
-
-        for match in self._error_pattern.finditer(output):
-            errors.append(
-                ParsedError(
-                    file=match.group(3),
-                    line=int(match.group(4)),
-                    column=int(match.group(5)),
-                    message=match.group(2),
-                    severity="error",
-                    code=f"E{match.group(1)}" if match.group(1) else None,
-                )
-            )
-
-        for match in self._warning_pattern.finditer(output):
-            errors.append(
-                ParsedError(
-                    file=match.group(3),
-                    line=int(match.group(4)),
-                    column=int(match.group(5)),
-                    message=match.group(2),
-                    severity="warning",
-                    code=f"E{match.group(1)}" if match.group(1) else None,
+        return parse_lines(self.session(), output.splitlines())
+
+    def session(self) -> ParseSession:
+        """Start an incremental rustc diagnostic parse."""
+        return _RustSession()
+
+
+class _RustSession:
+    """A diagnostic is its header line immediately followed by a ``-->`` line."""
+
+    __slots__ = ("_errors", "_pending")
+
+    def __init__(self) -> None:
+        self._errors: list[ParsedError] = []
+        self._pending: re.Match[str] | None = None
+
+    def feed(self, line: str) -> None:
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            location = _LOCATION_PATTERN.match(line)
+            if location:
+                code = pending.group(2)
+                self._errors.append(
+                    ParsedError(
+                        file=location.group(1),
+                        line=int(location.group(2)),
+                        column=int(location.group(3)),
+                        message=pending.group(3),
+                        severity=pending.group(1),
+                        code=f"E{code}" if code else None,
+                    )
                 )
-            )
+                return
+        self._pending = _HEADER_PATTERN.match(line)
 
-        return errors
+    def finish(self) -> list[ParsedError]:
+        return self._errors
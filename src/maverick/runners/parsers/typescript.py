@@ -0,0 +1,63 @@
+"""TypeScript compiler (tsc) output parser."""
+
+from __future__ import annotations
+
+import re
+
+from maverick.runners.models import ParsedError
+from maverick.runners.parsers.base import ParseSession, parse_lines
+
+__all__ = ["TypeScriptCompilerParser"]
+
+#: Plain format: ``src/a.ts(12,5): error TS2322: message``
+_PLAIN = re.compile(r"^(\S.*?)\((\d+),(\d+)\): (error|warning) (TS\d+): (.+)$")
+#: ``--pretty`` format: ``src/a.ts:12:5 - error TS2322: message``
+_PRETTY = re.compile(r"^(\S.*?):(\d+):(\d+) - (error|warning) (TS\d+): (.+)$")
+#: ANSI colour codes emitted by ``--pretty``
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+
+
+class TypeScriptCompilerParser:
+    """Parse ``tsc`` diagnostics in plain or ``--pretty`` format."""
+
+    name = "tsc"
+
+    def can_parse(self, output: str) -> bool:
+        """Check if output contains TypeScript compiler diagnostics."""
+        return " TS" in output and ("error" in output or "warning" in output)
+
+    def parse(self, output: str) -> list[ParsedError]:
+        """Extract diagnostics from tsc output."""
+        return parse_lines(self.session(), output.splitlines())
+
+    def session(self) -> ParseSession:
+        """Start an incremental tsc output parse."""
+        return _TypeScriptSession()
+
+
+class _TypeScriptSession:
+    __slots__ = ("_errors",)
+
+    def __init__(self) -> None:
+        self._errors: list[ParsedError] = []
+
+    def feed(self, line: str) -> None:
+        if "TS" not in line:
+            return
+        if "\x1b" in line:
+            line = _ANSI.sub("", line)
+        match = _PLAIN.match(line) or _PRETTY.match(line)
+        if match:
+            self._errors.append(
+                ParsedError(
+                    file=match.group(1),
+                    line=int(match.group(2)),
+                    column=int(match.group(3)),
+                    message=match.group(6),
+                    severity=match.group(4),
+                    code=match.group(5),
+                )
+            )
+
+    def finish(self) -> list[ParsedError]:
+        return self._errors
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
 from maverick.logging import get_logger
 from maverick.runners.command import CommandRunner
 from maverick.runners.models import StageResult, ValidationOutput, ValidationStage
-from maverick.runners.parsers import get_parsers
+from maverick.runners.parsers import parse_output
 
 __all__ = ["ValidationRunner"]
 
@@ -197,10 +197,8 @@ class ValidationRunner:
                 timeout=stage.timeout_seconds,
             )
 
-        # Parse errors from output
-        errors = []
-        for parser in get_parsers(result.output):
-            errors.extend(parser.parse(result.output))
+        # Parse errors from output (single pass, duplicates folded)
+        errors = parse_output(result.output)
 
         duration_ms = int((time.monotonic() - start_time) * 1000)
 
@@ -40,6 +40,7 @@ __all__ = [
     "binding_for_role",
     "runtime_for_agent",
     "supports_permission_callback",
+    "supports_prompt_cache",
 ]
 
 
@@ -162,3 +163,21 @@ def supports_permission_callback(runtime: AgentRuntime) -> bool:
     from airframe.features import Feature
 
     return runtime.supports(Feature.PERMISSION_CALLBACK)
+
+
+def supports_prompt_cache(runtime: AgentRuntime) -> bool:
+    """Whether ``runtime`` advertises ``Feature.PROMPT_CACHE_CONTROL``.
+
+    Adapters without it drop ``cache=`` silently (airframe's soft
+    contract); probing first keeps their sends byte-for-byte unchanged.
+
+    Args:
+        runtime: The constructed airframe runtime to probe.
+
+    Returns:
+        ``True`` when ``execute(cache=...)`` / ``session(cache=...)``
+        reach a native vendor cache-key channel.
+    """
+    from airframe.features import Feature
+
+    return runtime.supports(Feature.PROMPT_CACHE_CONTROL)
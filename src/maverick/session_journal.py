@@ -4,6 +4,11 @@ Provides a ``SessionJournal`` that records every workflow progress event as
 one JSON object per line.  Users can run a workflow, watch it live, then
 come back later to analyse the log.
 
+Events recorded from async code are handed to a background writer task and
+written in groups (serialization and file I/O run off the event loop), so
+event-heavy phases do not pay a blocking syscall per event.  How much crash
+safety that buys is chosen explicitly via :class:`JournalDurability`.
+
 Usage::
 
     from maverick.session_journal import SessionJournal
@@ -13,23 +18,66 @@ Usage::
     async for event in executor.execute(workflow, inputs):
         await journal.record(event)
     journal.write_summary({"success": True, "duration_ms": 12345})
-    journal.close()
+    await journal.aclose()
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
+import os
+import threading
 import time
+from collections import deque
+from enum import StrEnum
 from pathlib import Path
 from typing import Any
 
 from maverick.events import ProgressEvent
 from maverick.logging import get_logger
 
-__all__ = ["SessionJournal"]
+__all__ = ["JournalDurability", "SessionJournal"]
 
 logger = get_logger(__name__)
 
+#: Default number of buffered records that triggers a group commit
+DEFAULT_BATCH_SIZE = 256
+
+#: Default longest time a record waits in the buffer before being written
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+#: Default bound on buffered records; ``record`` waits (or drops, in
+#: best-effort mode) when it is reached
+DEFAULT_MAX_PENDING = 4096
+
+
+class JournalDurability(StrEnum):
+    """How much crash safety the journal provides.
+
+    Attributes:
+        FSYNC: ``record`` returns only once its line is fsynced to disk.
+            Records arriving together still share one write and fsync.
+        BATCHED: Records are written and fsynced in groups, on size, time
+            or close.  A crash loses at most the last flush interval.
+        BEST_EFFORT: Groups are written without fsync, and records are
+            dropped rather than waited on when the buffer is full.
+    """
+
+    FSYNC = "fsync"
+    BATCHED = "batched"
+    BEST_EFFORT = "best_effort"
+
+
+class _Entry:
+    """A buffered record and, in FSYNC mode, the future its writer awaits."""
+
+    __slots__ = ("data", "done")
+
+    def __init__(self, data: dict[str, Any], done: asyncio.Future[None] | None = None) -> None:
+        self.data = data
+        self.done = done
+
 
 class SessionJournal:
     """Append-only JSONL writer for workflow progress events.
@@ -41,22 +89,50 @@ class SessionJournal:
     The journal can optionally filter out ``AgentStreamChunk`` events
     (which can be very high-volume) via *include_agent_text*.
 
+    The background writer starts on the first :meth:`record`.  Until then
+    (and in purely synchronous use) header and summary records are written
+    directly.  Async callers should finish with :meth:`aclose`, which
+    drains the buffer; :meth:`close` also writes anything still buffered.
+
     Args:
         path: Destination file path.  Parent directories are created
             automatically if they do not exist.
         include_agent_text: When ``False``, ``AgentStreamChunk`` events
             are silently dropped.  Defaults to ``True``.
+        durability: Crash-safety mode (default ``BATCHED``).
+        batch_size: Buffered records that trigger a group commit.
+        flush_interval: Seconds a record may wait before being written.
+        max_pending: Bound on buffered records.
     """
 
     def __init__(
         self,
         path: Path,
         include_agent_text: bool = True,
+        *,
+        durability: JournalDurability = JournalDurability.BATCHED,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_pending: int = DEFAULT_MAX_PENDING,
     ) -> None:
         self._path = path
         self._include_agent_text = include_agent_text
+        self._durability = durability
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._max_pending = max(self._batch_size, max_pending)
         self._file: Any = None
         self._event_count: int = 0
+        self._dropped_count: int = 0
+        # Serializes file access between the writer thread and close()
+        self._io_lock = threading.Lock()
+        self._pending: deque[_Entry] = deque()
+        # Batch handed to the writer thread but not yet written
+        self._inflight: list[_Entry] | None = None
+        self._writer: asyncio.Task[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._space: asyncio.Event | None = None
+        self._closing = False
         self._open()
 
     # ------------------------------------------------------------------
@@ -70,22 +146,50 @@ class SessionJournal:
         logger.info(
             "session_journal_opened",
             path=str(self._path),
+            durability=str(self._durability),
         )
 
-    def close(self) -> None:
-        """Flush and close the backing file.
+    async def aclose(self) -> None:
+        """Drain buffered records through the writer, then close the file.
 
         Safe to call multiple times.
         """
-        if self._file is not None and not self._file.closed:
-            self._file.flush()
-            self._file.close()
-            logger.info(
-                "session_journal_closed",
-                path=str(self._path),
-                event_count=self._event_count,
-            )
-        self._file = None
+        if self._file is not None and self._writer is not None and not self._writer.done():
+            self._closing = True
+            assert self._wakeup is not None
+            self._wakeup.set()
+            await self._writer
+        self.close()
+
+    def close(self) -> None:
+        """Write anything still buffered, flush and close the backing file.
+
+        Safe to call multiple times.  Prefer :meth:`aclose` from async code;
+        this synchronous variant stops the background writer without
+        waiting for it.
+        """
+        if self._writer is not None and not self._writer.done():
+            self._writer.cancel()
+        if self._space is not None:
+            self._space.set()  # release any record() waiting for room
+        with self._io_lock:
+            if self._file is not None and not self._file.closed:
+                remaining = list(self._inflight or ()) + list(self._pending)
+                self._inflight = None
+                self._pending.clear()
+                self._write_entries(remaining)
+                self._file.flush()
+                if self._durability is not JournalDurability.BEST_EFFORT:
+                    os.fsync(self._file.fileno())
+                self._file.close()
+                self._resolve(remaining)
+                logger.info(
+                    "session_journal_closed",
+                    path=str(self._path),
+                    event_count=self._event_count,
+                    dropped_count=self._dropped_count,
+                )
+            self._file = None
 
     # ------------------------------------------------------------------
     # Context-manager protocol
@@ -102,18 +206,35 @@ class SessionJournal:
     ) -> None:
         self.close()
 
+    async def __aenter__(self) -> SessionJournal:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any,
+    ) -> None:
+        await self.aclose()
+
     # ------------------------------------------------------------------
     # Writing records
     # ------------------------------------------------------------------
 
     def _write_line(self, data: dict[str, Any]) -> None:
-        """Serialize *data* as a single JSON line and write it."""
+        """Write *data* as one JSON line, via the writer when it is running."""
         if self._file is None or self._file.closed:
             return
-        line = json.dumps(data, default=str, ensure_ascii=False)
-        self._file.write(line + "\n")
-        # Flush after each line so the journal is crash-safe
-        self._file.flush()
+        if self._writer is not None and not self._writer.done():
+            # Keep ordering with buffered events; header/summary are not
+            # subject to the buffer bound.
+            self._pending.append(_Entry(data))
+            assert self._wakeup is not None
+            self._wakeup.set()
+            return
+        with self._io_lock:
+            self._write_entries([_Entry(data)])
+            self._file.flush()
 
     def write_header(
         self,
@@ -151,7 +272,7 @@ class SessionJournal:
         )
 
     async def record(self, event: ProgressEvent) -> None:
-        """Serialize and write a single workflow event.
+        """Buffer a single workflow event for the background writer.
 
         Events that expose a ``to_dict()`` method are serialized via that
         method.  For any other event type (e.g. ``RollbackError`` from
@@ -160,6 +281,11 @@ class SessionJournal:
         ``AgentStreamChunk`` events are skipped when *include_agent_text*
         is ``False``.
 
+        Returns immediately unless the buffer is full (``FSYNC`` and
+        ``BATCHED`` wait for room; ``BEST_EFFORT`` drops the event) or the
+        durability mode is ``FSYNC``, which waits for the group commit
+        containing this event.
+
         Args:
             event: The workflow progress event to record.
         """
@@ -167,6 +293,8 @@ class SessionJournal:
 
         if not self._include_agent_text and isinstance(event, AgentStreamChunk):
             return
+        if self._file is None or self._closing:
+            return
 
         if hasattr(event, "to_dict"):
             data = event.to_dict()
@@ -178,8 +306,104 @@ class SessionJournal:
             if hasattr(event, "error"):
                 data["error"] = event.error
 
-        self._write_line(data)
+        self._ensure_writer()
+        assert self._space is not None and self._wakeup is not None
+        while len(self._pending) >= self._max_pending:
+            if self._durability is JournalDurability.BEST_EFFORT:
+                self._dropped_count += 1
+                return
+            self._space.clear()
+            await self._space.wait()
+            if self._file is None:
+                return
+
+        entry = _Entry(data)
+        if self._durability is JournalDurability.FSYNC:
+            entry.done = asyncio.get_running_loop().create_future()
+        self._pending.append(entry)
         self._event_count += 1
+        # The first record into an empty buffer starts the writer's
+        # flush-interval linger; a full batch (or fsync) cuts it short.
+        if (
+            self._durability is JournalDurability.FSYNC
+            or len(self._pending) == 1
+            or len(self._pending) >= self._batch_size
+        ):
+            self._wakeup.set()
+        if entry.done is not None:
+            await asyncio.shield(entry.done)
+
+    # ------------------------------------------------------------------
+    # Background writer
+    # ------------------------------------------------------------------
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None:
+            self._wakeup = asyncio.Event()
+            self._space = asyncio.Event()
+            self._writer = asyncio.get_running_loop().create_task(
+                self._run_writer(), name="session-journal-writer"
+            )
+
+    async def _run_writer(self) -> None:
+        """Group-commit buffered records until the journal is closed."""
+        assert self._wakeup is not None and self._space is not None
+        while True:
+            if not self._pending and not self._closing:
+                await self._wakeup.wait()
+            self._wakeup.clear()
+            if (
+                self._durability is not JournalDurability.FSYNC
+                and not self._closing
+                and len(self._pending) < self._batch_size
+            ):
+                # Linger for the flush interval unless the batch fills up
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+                self._wakeup.clear()
+            if not self._pending:
+                if self._closing:
+                    return
+                continue
+
+            batch = list(self._pending)
+            self._pending.clear()
+            self._inflight = batch
+            self._space.set()
+            try:
+                await asyncio.to_thread(self._commit, batch)
+            except OSError as exc:
+                logger.warning(
+                    "session_journal_write_failed", path=str(self._path), error=str(exc)
+                )
+            self._resolve(batch)
+
+    def _commit(self, batch: list[_Entry]) -> None:
+        """Write one group to disk (runs in a worker thread)."""
+        with self._io_lock:
+            if self._inflight is not batch or self._file is None or self._file.closed:
+                return  # close() already wrote it
+            self._write_entries(batch)
+            self._file.flush()
+            if self._durability is not JournalDurability.BEST_EFFORT:
+                os.fsync(self._file.fileno())
+            self._inflight = None
+
+    def _write_entries(self, entries: list[_Entry]) -> None:
+        if entries:
+            self._file.write(
+                "".join(
+                    json.dumps(entry.data, default=str, ensure_ascii=False) + "\n"
+                    for entry in entries
+                )
+            )
+
+    @staticmethod
+    def _resolve(entries: list[_Entry]) -> None:
+        for entry in entries:
+            if entry.done is not None and not entry.done.done():
+                with contextlib.suppress(RuntimeError):  # loop already closed
+                    entry.done.get_loop().call_soon_threadsafe(_set_done, entry.done)
 
     # ------------------------------------------------------------------
     # Properties
@@ -190,12 +414,27 @@ class SessionJournal:
         """Return the path to the JSONL file."""
         return self._path
 
+    @property
+    def durability(self) -> JournalDurability:
+        """Return the journal's crash-safety mode."""
+        return self._durability
+
     @property
     def event_count(self) -> int:
         """Return the number of events recorded so far."""
         return self._event_count
 
+    @property
+    def dropped_count(self) -> int:
+        """Return the number of events dropped (``BEST_EFFORT`` only)."""
+        return self._dropped_count
+
     @property
     def is_open(self) -> bool:
         """Return whether the journal file is still open."""
         return self._file is not None and not self._file.closed
+
+
+def _set_done(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
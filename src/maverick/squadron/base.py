@@ -14,7 +14,8 @@ Wiring:
 * Use: ``squadron.coder_for(...)``, ``squadron.build_briefing_agent(...)``
   etc., depending on the subclass.
 * Bead boundary: ``with squadron.bead_context(bead_id=..., complexity=...):``
-  then ``await squadron.rotate_for_new_bead()``.
+  then ``await squadron.rotate_for_new_bead()`` — by default each agent
+  rotates lazily, on its first send of the new bead.
 * Close: ``__aexit__`` calls ``close()`` on every agent, which in turn
   closes each agent's airframe runtime.
 
@@ -40,6 +41,7 @@ produce.
 from __future__ import annotations
 
 import abc
+import asyncio
 from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from pathlib import Path
@@ -58,6 +60,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+#: Agents rotated at once by an eager :meth:`Squadron.rotate_for_new_bead`
+_MAX_CONCURRENT_ROTATIONS = 4
+
 
 class Squadron(abc.ABC):
     """Base class: owns a set of airframe-backed agents.
@@ -231,23 +236,48 @@ class Squadron(abc.ABC):
         with tagged(bead_id=bead_id, **extra_tags):
             yield
 
-    async def rotate_for_new_bead(self) -> None:
+    async def rotate_for_new_bead(self, *, lazy: bool = True) -> None:
         """Rotate every agent's session — called between beads.
 
         Each agent's :meth:`Agent.rotate_session` resets its airframe
         runtime's scope; runtime-wide resources (HTTP clients,
         subprocess pools) survive.
+
+        Args:
+            lazy: Defer each rotation to the agent's next send
+                (:meth:`Agent.defer_rotation`), so an agent that does not
+                run for this bead never closes and reopens its session.
+                ``False`` rotates now, up to ``_MAX_CONCURRENT_ROTATIONS``
+                agents at a time. Either way a failing agent is logged and
+                skipped without affecting the others.
         """
-        for agent in self._all_agents():
-            try:
-                await agent.rotate_session()
-            except Exception as exc:  # noqa: BLE001 — rotation is best-effort
-                logger.debug(
-                    "squadron.agent_rotate_failed",
-                    squadron=type(self).__name__,
-                    agent=agent.tag,
-                    error=str(exc),
-                )
+        agents = list(self._all_agents())
+        if lazy:
+            for agent in agents:
+                try:
+                    agent.defer_rotation()
+                except Exception as exc:  # noqa: BLE001 — rotation is best-effort
+                    self._log_rotate_failure(agent, exc)
+            return
+
+        limit = asyncio.Semaphore(_MAX_CONCURRENT_ROTATIONS)
+
+        async def _rotate(agent: Agent) -> None:
+            async with limit:
+                try:
+                    await agent.rotate_session()
+                except Exception as exc:  # noqa: BLE001 — rotation is best-effort
+                    self._log_rotate_failure(agent, exc)
+
+        await asyncio.gather(*(_rotate(agent) for agent in agents))
+
+    def _log_rotate_failure(self, agent: Agent, exc: Exception) -> None:
+        logger.debug(
+            "squadron.agent_rotate_failed",
+            squadron=type(self).__name__,
+            agent=agent.tag,
+            error=str(exc),
+        )
 
     # ------------------------------------------------------------------
     # Subclass hooks
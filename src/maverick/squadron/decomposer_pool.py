@@ -13,14 +13,26 @@ Behaviour:
    close + drop the LRU idle agent, then spawn fresh for ``tier``.
 4. **Wait**: at cap with no idle agents → block until ``release``.
 
+Only slot bookkeeping happens under the pool's lock: a spawn reserves its
+slot, then builds, opens and seeds the agent with the lock released, and
+an eviction closes its victim the same way. Concurrent acquirers
+therefore cold-start in parallel instead of queueing behind one another's
+``open``/``close``.
+
 ``set_context`` broadcasts to every live agent and is replayed onto
 every freshly-spawned agent so the seeded prompt cache is consistent
 across the pool.
+
+:meth:`DecomposerAgentPool.start_prewarm` opens up to ``prewarm`` agents
+of one tier in the background (the refuel workflow starts it when the
+outline pass begins), so the detail fan-out starts at full width rather
+than paying its cold starts on the first wave.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from collections.abc import Awaitable, Callable
 from typing import Any
 
@@ -41,9 +53,14 @@ class DecomposerAgentPool:
         *,
         cap: int,
         factory: DecomposerAgentFactory,
+        prewarm: int = 0,
     ) -> None:
         self._cap = max(1, cap)
         self._factory = factory
+        self._prewarm = max(0, prewarm)
+        # Slots reserved by spawns whose agent is still being opened
+        self._spawning = 0
+        self._prewarm_task: asyncio.Task[None] | None = None
         # tier_name → list of idle agents (LIFO; tail is most recent)
         self._idle: dict[str, list[DecomposerAgent]] = {}
         # agent → tier_name (every live agent, idle or busy)
@@ -88,6 +105,7 @@ class DecomposerAgentPool:
             await asyncio.gather(*(a.set_context(**ctx) for a in agents))
 
     async def acquire(self, tier: str) -> DecomposerAgent:
+        victim: DecomposerAgent | None = None
         async with self._cond:
             while True:
                 # 1. Reuse an idle agent of this tier.
@@ -97,15 +115,20 @@ class DecomposerAgentPool:
                     self._lru.remove(agent)
                     return agent
                 # 2. Spawn fresh under the cap.
-                if self.total_live < self._cap:
-                    return await self._spawn(tier)
+                if self._occupied < self._cap:
+                    self._spawning += 1
+                    break
                 # 3. Evict an LRU idle agent of any tier and spawn fresh.
                 if self._lru:
                     victim = self._lru[0]
-                    await self._evict(victim)
-                    return await self._spawn(tier)
+                    self._forget(victim)
+                    self._spawning += 1
+                    break
                 # 4. At cap with everything busy — wait for a release.
                 await self._cond.wait()
+        if victim is not None:
+            await self._close(victim, event="decomposer_agent_pool.evict_close_failed")
+        return await self._spawn(tier)
 
     async def release(self, agent: DecomposerAgent, tier: str) -> None:
         async with self._cond:
@@ -113,46 +136,111 @@ class DecomposerAgentPool:
             self._lru.append(agent)
             self._cond.notify()
 
+    def start_prewarm(self, tier: str) -> None:
+        """Open up to ``prewarm`` idle agents of ``tier`` in the background.
+
+        Never waits and never raises: agents spawn concurrently, each
+        joining the idle set as soon as it is open, and a failed spawn is
+        logged and left for a later :meth:`acquire` to retry. Counts
+        agents already live toward the target and stays under the cap.
+        A no-op when ``prewarm`` is ``0`` or a prewarm is already running.
+        """
+        if self._prewarm == 0 or (
+            self._prewarm_task is not None and not self._prewarm_task.done()
+        ):
+            return
+        self._prewarm_task = asyncio.create_task(self._prewarm_tier(tier))
+
     async def teardown(self) -> None:
         """Close every live agent and drop bookkeeping."""
+        if self._prewarm_task is not None:
+            self._prewarm_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._prewarm_task
+            self._prewarm_task = None
         async with self._cond:
             agents = list(self._agent_tier)
             self._idle.clear()
             self._lru.clear()
             self._agent_tier.clear()
         for a in agents:
-            try:
-                await a.close()
-            except Exception as exc:  # noqa: BLE001 — teardown must not raise
-                logger.debug(
-                    "decomposer_agent_pool.close_failed",
-                    tag=getattr(a, "tag", "?"),
-                    error=str(exc),
+            await self._close(a, event="decomposer_agent_pool.close_failed")
+
+    @property
+    def _occupied(self) -> int:
+        """Slots counted against the cap: live agents plus spawns in flight."""
+        return len(self._agent_tier) + self._spawning
+
+    async def _prewarm_tier(self, tier: str) -> None:
+        async with self._cond:
+            live = sum(1 for t in self._agent_tier.values() if t == tier)
+            count = min(self._prewarm - live, self._cap - self._occupied)
+            if count <= 0:
+                return
+            self._spawning += count
+        logger.debug("decomposer_agent_pool.prewarm_started", tier=tier, count=count)
+        results = await asyncio.gather(
+            *(self._spawn(tier, idle=True) for _ in range(count)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "decomposer_agent_pool.prewarm_failed", tier=tier, error=str(result)
                 )
 
-    async def _spawn(self, tier: str) -> DecomposerAgent:
-        """Build + register a fresh agent for ``tier``. Caller holds cond."""
-        agent = await self._factory(tier)
-        self._agent_tier[agent] = tier
-        if self._context is not None:
-            await agent.set_context(**self._context)
-        return agent
+    async def _spawn(self, tier: str, *, idle: bool = False) -> DecomposerAgent:
+        """Build, open and seed an agent for ``tier`` in a reserved slot.
 
-    async def _evict(self, victim: DecomposerAgent) -> None:
-        """Close ``victim`` and remove from bookkeeping. Caller holds cond."""
+        The caller has reserved the slot (``_spawning``); this runs
+        without the lock and always gives the reservation back. The agent
+        is registered only once it carries the current broadcast context —
+        a ``set_context`` that lands mid-spawn is replayed before it is.
+        With ``idle=True`` it joins the idle set instead of being returned
+        to a caller.
+        """
+        try:
+            agent = await self._factory(tier)
+        except BaseException:
+            async with self._cond:
+                self._spawning -= 1
+                self._cond.notify()
+            raise
+        applied: dict[str, Any] | None = None
+        try:
+            while True:
+                async with self._cond:
+                    if self._context is applied:
+                        self._spawning -= 1
+                        self._agent_tier[agent] = tier
+                        if idle:
+                            self._idle.setdefault(tier, []).append(agent)
+                            self._lru.append(agent)
+                            self._cond.notify()
+                        return agent
+                    applied = self._context
+                if applied is not None:
+                    await agent.set_context(**applied)
+        except BaseException:
+            async with self._cond:
+                self._spawning -= 1
+                self._cond.notify()
+            await self._close(agent, event="decomposer_agent_pool.spawn_close_failed")
+            raise
+
+    def _forget(self, victim: DecomposerAgent) -> None:
+        """Remove ``victim`` from bookkeeping. Caller holds cond."""
         victim_tier = self._agent_tier.pop(victim, None)
         if victim_tier is not None and victim in self._idle.get(victim_tier, []):
             self._idle[victim_tier].remove(victim)
         if victim in self._lru:
             self._lru.remove(victim)
+
+    async def _close(self, agent: DecomposerAgent, *, event: str) -> None:
+        """Close ``agent`` without the lock held; failures are only logged."""
         try:
-            await victim.close()
-        except Exception as exc:  # noqa: BLE001
-            logger.debug(
-                "decomposer_agent_pool.evict_close_failed",
-                tag=getattr(victim, "tag", "?"),
-                error=str(exc),
-            )
+            await agent.close()
+        except Exception as exc:  # noqa: BLE001 — close must not raise
+            logger.debug(event, tag=getattr(agent, "tag", "?"), error=str(exc))
 
     def snapshot(self) -> dict[str, Any]:
         """Read-only view of pool state for tests / diagnostics."""
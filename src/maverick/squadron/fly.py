@@ -245,15 +245,9 @@ class FlySquadron(Squadron):
 
         for agent in self._all_agents():
             agent.rebind_protection(policy, baseline_manifest=baseline)
-            try:
-                await agent.rotate_session()
-            except Exception as exc:  # noqa: BLE001 — rotation is best-effort, mirrors rotate_for_new_bead
-                logger.debug(
-                    "squadron.isolated_protection_rotate_failed",
-                    squadron=type(self).__name__,
-                    agent=agent.tag,
-                    error=str(exc),
-                )
+            # Layer 1's gate is rebuilt when the session reopens, on the
+            # agent's next send — agents idle for this bead skip it.
+            agent.defer_rotation()
 
 
 __all__ = ["DEFAULT_TIER", "TIER_ORDER", "FlySquadron"]
@@ -7,7 +7,7 @@
 
 Both agents are fixed (no per-tier fan-out) and built eagerly at
 ``open()`` time — see ``specs/051-reconcile-changed-answers/research.md``
-R11. ``Squadron.rotate_for_new_bead()`` (inherited, unchanged) rotates
+R11. ``Squadron.rotate_for_new_bead()`` (inherited) rotates
 both agents' sessions between answers.
 """
 
@@ -50,12 +50,14 @@ class RefuelSquadron(Squadron):
         config: MaverickConfig,
         cost_sink: CostSink | None = None,
         decomposer_pool_cap: int = 3,
+        decomposer_prewarm: int = 0,
         detail_session_max_turns: int = 5,
         fix_session_max_turns: int = 1,
         decomposer_tiers: Any = None,
     ) -> None:
         super().__init__(cwd=cwd, config=config, cost_sink=cost_sink)
         self._decomposer_pool_cap = decomposer_pool_cap
+        self._decomposer_prewarm = decomposer_prewarm
         self._detail_session_max_turns = detail_session_max_turns
         self._fix_session_max_turns = fix_session_max_turns
         # ``None`` here is the "caller didn't decide" signal, so fall back
@@ -81,10 +83,12 @@ class RefuelSquadron(Squadron):
         )
         await self.generator.open()
 
-        # Decomposer pool — agents are built lazily on first acquire.
+        # Decomposer pool — agents are built lazily on first acquire, or
+        # ahead of the detail fan-out when ``decomposer_prewarm`` is set.
         self.decomposer_pool = DecomposerAgentPool(
             cap=self._decomposer_pool_cap,
             factory=self._build_decomposer,
+            prewarm=self._decomposer_prewarm,
         )
 
     def decomposer_escalation_ladder(self) -> tuple[str, ...]:
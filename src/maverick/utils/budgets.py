@@ -6,9 +6,10 @@ context for AI agents, ensuring content fits within model limits.
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from typing import Any
 
-from maverick.utils.text import estimate_tokens
+from maverick.utils.tokens import TokenCounter, get_token_counter
 
 __all__ = [
     "fit_to_budget",
@@ -17,6 +18,17 @@ __all__ = [
 # Default values
 DEFAULT_TOKEN_BUDGET = 32000
 DEFAULT_MIN_SECTION_TOKENS = 100
+DEFAULT_PRIORITY = 0
+
+#: Marker appended to a section that was cut to fit the budget
+TRUNCATION_MARKER = "\n... [content truncated to fit budget]"
+
+#: Boundaries preferred over plain line breaks when cutting diff-like text
+_HUNK_BOUNDARIES = ("\ndiff --git ", "\n@@ ")
+
+#: A hunk/line boundary is only used if it keeps at least this share of the
+#: token-exact prefix; otherwise the cut falls back to a finer boundary.
+_MIN_SNAP_RATIO = 0.5
 
 
 def fit_to_budget(
@@ -24,16 +36,27 @@ def fit_to_budget(
     budget: int = DEFAULT_TOKEN_BUDGET,
     *,
     min_section_tokens: int = DEFAULT_MIN_SECTION_TOKENS,
+    priorities: Mapping[str, int] | None = None,
 ) -> dict[str, Any]:
-    """Proportionally truncate sections to fit within token budget.
+    """Truncate sections so their combined token count fits the budget.
 
-    Allocates tokens to each section proportionally based on its original size,
-    ensuring each section gets at least min_section_tokens.
+    Each section is encoded once (encodings are cached, so re-budgeting the
+    same content across fix rounds does not re-encode it). Budget is handed
+    out by priority tier, highest first: a tier that fits is kept whole,
+    and the tier where the budget runs out is shared proportionally to
+    section size, with each section getting at least ``min_section_tokens``
+    where the budget allows. Lower tiers are then dropped. Sections are cut
+    at exact token offsets, snapped back to a hunk or line boundary, so the
+    result (markers included) never exceeds the budget.
 
     Args:
         sections: Dict mapping section names to their text content.
         budget: Total token budget (default 32000).
         min_section_tokens: Minimum tokens per section (default 100).
+        priorities: Optional section name -> priority; higher values are
+            kept first (e.g. recent hunks above old file bodies). Sections
+            not listed get priority 0. When omitted, all sections share
+            the budget proportionally.
 
     Returns:
         Dict with same keys as input, values truncated to fit budget.
@@ -48,48 +71,43 @@ def fit_to_budget(
     if not sections:
         return {}
 
-    # Estimate tokens for each section
-    section_tokens: dict[str, int] = {
-        name: estimate_tokens(content) for name, content in sections.items()
-    }
-    total_tokens = sum(section_tokens.values())
+    counter = get_token_counter()
+
+    # Cheap check first: skip encoding when the calibrated estimate is
+    # clearly under budget
+    estimate = sum(counter.approximate(content) for content in sections.values())
+    if counter.calibrated and estimate * (1 + counter.margin) < budget:
+        return dict(sections)
 
-    # If under budget, return unchanged
-    if total_tokens <= budget:
+    # Encode each section exactly once
+    section_tokens = {name: counter.encode(content) for name, content in sections.items()}
+    sizes = {name: len(tokens) for name, tokens in section_tokens.items()}
+    if sum(sizes.values()) <= budget:
         return dict(sections)
 
-    # Calculate proportional allocation
+    allocations = _allocate(sizes, budget, min_section_tokens, priorities or {})
+    marker_tokens = counter.count(TRUNCATION_MARKER)
+
     result: dict[str, Any] = {}
     sections_affected: list[str] = []
     original_lines = 0
     kept_lines = 0
 
     for name, content in sections.items():
-        original_tokens = section_tokens[name]
         original_lines += content.count("\n") + 1
+        allowance = allocations[name]
 
-        # Calculate this section's budget (proportional)
-        if total_tokens > 0:
-            section_budget = max(
-                min_section_tokens,
-                int(budget * original_tokens / total_tokens),
-            )
-        else:
-            section_budget = min_section_tokens
-
-        # If section fits in its budget, keep it unchanged
-        if original_tokens <= section_budget:
+        if sizes[name] <= allowance:
             result[name] = content
-            kept_lines += content.count("\n") + 1
         else:
-            # Truncate to fit budget (estimate chars from tokens)
-            max_chars = section_budget * 4
-            truncated_content = content[:max_chars]
-            if len(content) > max_chars:
-                truncated_content += "\n... [content truncated to fit budget]"
-            result[name] = truncated_content
-            kept_lines += truncated_content.count("\n") + 1
+            keep = allowance - marker_tokens
+            if keep > 0:
+                kept = _cut_at_boundary(counter, content, section_tokens[name], keep)
+                result[name] = kept + TRUNCATION_MARKER
+            else:
+                result[name] = ""
             sections_affected.append(name)
+        kept_lines += result[name].count("\n") + 1 if result[name] else 0
 
     # Add metadata if truncation occurred
     if sections_affected:
@@ -101,3 +119,82 @@ def fit_to_budget(
         }
 
     return result
+
+
+def _allocate(
+    sizes: dict[str, int],
+    budget: int,
+    min_section_tokens: int,
+    priorities: Mapping[str, int],
+) -> dict[str, int]:
+    """Split ``budget`` across sections by priority tier, then by size.
+
+    The returned allocations never sum to more than ``budget``.
+    """
+    allocations = dict.fromkeys(sizes, 0)
+    remaining = budget
+
+    for tier in sorted({priorities.get(n, DEFAULT_PRIORITY) for n in sizes}, reverse=True):
+        if remaining <= 0:
+            break
+        names = [n for n in sizes if priorities.get(n, DEFAULT_PRIORITY) == tier]
+        tier_total = sum(sizes[n] for n in names)
+
+        if tier_total <= remaining:
+            for name in names:
+                allocations[name] = sizes[name]
+            remaining -= tier_total
+            continue
+
+        # Budget runs out in this tier: floors first, then proportional shares
+        floors = {n: min(sizes[n], min_section_tokens) for n in names}
+        if sum(floors.values()) >= remaining:
+            floors = {n: remaining * sizes[n] // tier_total for n in names}
+        shared = remaining - sum(floors.values())
+        extra_total = sum(sizes[n] - floors[n] for n in names)
+        for name in names:
+            extra = sizes[name] - floors[name]
+            allocations[name] = floors[name] + (
+                shared * extra // extra_total if extra_total else 0
+            )
+        remaining = 0
+
+    return allocations
+
+
+def _cut_at_boundary(
+    counter: TokenCounter,
+    content: str,
+    tokens: Sequence[int],
+    keep: int,
+) -> str:
+    """Return the longest boundary-aligned prefix of ``content`` within ``keep`` tokens.
+
+    The token-exact prefix is decoded from the section's existing encoding,
+    then snapped back to the last hunk boundary (diff text) or line break
+    that preserves most of it. Only the kept prefix is re-encoded to verify
+    the count, so the cost is bounded by the budget, not the section size.
+    """
+    prefix = counter.decode(tokens[:keep]).rstrip("\ufffd")
+    # Decoding a token prefix reproduces a true prefix of the content, except
+    # for a trailing partial multi-byte character (stripped above).
+    prefix = content[: len(prefix)]
+
+    cut = len(prefix)
+    floor = int(len(prefix) * _MIN_SNAP_RATIO)
+    for boundary in _HUNK_BOUNDARIES:
+        pos = prefix.rfind(boundary)
+        if pos >= floor:
+            cut = pos
+            break
+    else:
+        pos = prefix.rfind("\n")
+        if pos >= floor:
+            cut = pos
+
+    kept = content[:cut]
+    # BPE merges can differ at the new edge; step back a line until it fits.
+    while kept and counter.count(kept) > keep:
+        pos = kept.rfind("\n")
+        kept = kept[:pos] if pos > 0 else kept[: len(kept) * 3 // 4]
+    return kept
@@ -1,7 +1,8 @@
 """Review context builder for Maverick agents.
 
 This module provides the build_review_context function which compiles diff output,
-changed file contents, and project conventions for code review agents.
+changed file contents, and project conventions for code review agents within a
+token budget.
 """
 
 from __future__ import annotations
@@ -10,8 +11,11 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeAlias
 
 from maverick.logging import get_logger
+from maverick.utils.budgets import DEFAULT_TOKEN_BUDGET
+from maverick.utils.diff_stream import read_diff_within_budget
 from maverick.utils.files import _read_conventions, _read_file_safely
 from maverick.utils.secrets import detect_secrets
+from maverick.utils.text import estimate_tokens
 
 if TYPE_CHECKING:
     from maverick.git import GitRepository
@@ -35,21 +39,28 @@ def build_review_context(
     *,
     conventions_path: Path | None = None,
     max_file_lines: int = DEFAULT_MAX_FILE_LINES_REVIEW,
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
 ) -> ContextDict:
     """Build context for code review agents.
 
     Compiles diff output, changed file contents, project conventions, and
-    diff statistics for code review.
+    diff statistics for code review. The diff is streamed hunk by hunk and
+    reading stops once ``token_budget`` is exhausted; changed files are then
+    read (relative to the repository root) only while budget remains, so
+    memory and time are bounded by the budget rather than by the diff size.
 
     Args:
         git: GitOperations instance for retrieving diff and file info.
         base_branch: Branch to diff against (e.g., "main", "origin/main").
         conventions_path: Optional explicit path to CLAUDE.md.
         max_file_lines: Files larger than this are truncated (default 500).
+        token_budget: Combined token budget for diff and changed files
+            (default 32000).
 
     Returns:
         ContextDict with keys:
-        - diff: Full diff output between base_branch and HEAD
+        - diff: Diff output between base_branch and HEAD, cut at a hunk
+          boundary when it exceeds the budget
         - changed_files: Dict mapping file paths to their current content
         - conventions: CLAUDE.md content
         - stats: Dict with files_changed, insertions, deletions counts
@@ -70,15 +81,21 @@ def build_review_context(
     """
     truncated = False
     sections_affected: list[str] = []
-    original_lines = 0
-    kept_lines = 0
 
-    # Get diff
+    # Stream the diff, stopping once the budget is spent
     try:
-        diff_content = git.diff(base=base_branch)
+        streamed = read_diff_within_budget(git.iter_diff(base=base_branch), token_budget)
+        diff_content = streamed.text
+        diff_tokens = streamed.tokens
+        diff_lines_read = streamed.lines_read
+        if streamed.truncated:
+            truncated = True
+            sections_affected.append("diff")
     except (OSError, RuntimeError, ValueError) as e:
         logger.warning("Failed to get diff against %s: %s", base_branch, e)
         diff_content = ""
+        diff_tokens = 0
+        diff_lines_read = 0
 
     # Get diff stats
     stats_dict: dict[str, int] = {"files_changed": 0, "insertions": 0, "deletions": 0}
@@ -95,23 +112,39 @@ def build_review_context(
         logger.warning("Failed to get diff stats: %s", e)
         stats_dict = {}  # Reset to empty on error
 
-    # Read changed files
+    # Read changed files (relative to the repo, not the cwd) with what is left
     changed_files: dict[str, str] = {}
+    remaining = token_budget - diff_tokens
     for file_path in changed_file_list:
-        path = Path(file_path)
+        if remaining <= 0:
+            truncated = True
+            if "changed_files" not in sections_affected:
+                sections_affected.append("changed_files")
+            break
+
+        path = Path(git.path) / file_path
         if not path.exists():
             continue
 
         # Skip binary files
         try:
             content, was_truncated = _read_file_safely(path, max_lines=max_file_lines)
-            if was_truncated:
-                truncated = True
-                if "changed_files" not in sections_affected:
-                    sections_affected.append("changed_files")
-            changed_files[file_path] = content
         except (OSError, RuntimeError, ValueError) as e:
             logger.warning("Failed to read changed file %s: %s", file_path, e)
+            continue
+
+        file_tokens = estimate_tokens(content)
+        if file_tokens > remaining:
+            truncated = True
+            if "changed_files" not in sections_affected:
+                sections_affected.append("changed_files")
+            break
+        if was_truncated:
+            truncated = True
+            if "changed_files" not in sections_affected:
+                sections_affected.append("changed_files")
+        changed_files[file_path] = content
+        remaining -= file_tokens
 
     # Read conventions
     conventions_content = _read_conventions(conventions_path)
@@ -131,12 +164,13 @@ def build_review_context(
                     pattern,
                 )
 
-    # Calculate line counts
+    # Calculate line counts (the diff's "original" size is what was read from
+    # the stream — the unread remainder is never materialized)
     diff_lines = diff_content.count("\n") + 1 if diff_content else 0
     conv_lines = conventions_content.count("\n") + 1 if conventions_content else 0
     files_lines = sum(c.count("\n") + 1 for c in changed_files.values())
-    original_lines = diff_lines + conv_lines + files_lines
-    kept_lines = original_lines  # Simplified - actual tracking would be more complex
+    kept_lines = diff_lines + conv_lines + files_lines
+    original_lines = max(diff_lines_read, diff_lines) + conv_lines + files_lines
 
     return {
         "diff": diff_content,
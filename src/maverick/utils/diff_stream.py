@@ -0,0 +1,234 @@
+"""Streaming unified-diff reading under a token budget.
+
+This module parses ``git diff`` output incrementally — one file patch at a
+time, hunk by hunk — and stops consuming the stream as soon as a token
+budget is exhausted. Memory and time are bounded by the prompt budget
+rather than by the size of the diff.
+
+Example:
+    ```python
+    from maverick.utils.diff_stream import read_diff_within_budget
+
+    streamed = read_diff_within_budget(repo.iter_diff("main"), budget=8000)
+    if streamed.truncated:
+        ...
+    ```
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from unidiff import PatchedFile, PatchSet
+from unidiff.errors import UnidiffParseError
+
+from maverick.logging import get_logger
+from maverick.utils.tokens import get_token_counter
+
+__all__ = [
+    "FilePatch",
+    "StreamedDiff",
+    "iter_file_patches",
+    "read_diff_within_budget",
+]
+
+logger = get_logger(__name__)
+
+#: Line prefix that opens a new file section in ``git diff`` output
+_FILE_HEADER_PREFIX = "diff --git "
+
+#: Marker appended when the diff is cut to fit the budget
+TRUNCATION_MARKER = "... [diff truncated to fit budget]\n"
+
+
+@dataclass(frozen=True, slots=True)
+class FilePatch:
+    """One file's section of a unified diff.
+
+    Attributes:
+        path: Target path of the patched file (empty for preamble text).
+        header: Section text preceding the first hunk (``diff --git``,
+            ``index``, ``---``/``+++`` lines).
+        hunks: Text of each hunk, in diff order.
+    """
+
+    path: str
+    header: str
+    hunks: tuple[str, ...]
+
+    @property
+    def text(self) -> str:
+        """Full section text (header followed by every hunk)."""
+        return self.header + "".join(self.hunks)
+
+
+@dataclass(frozen=True, slots=True)
+class StreamedDiff:
+    """Result of reading a diff stream under a token budget.
+
+    Attributes:
+        text: Diff text kept within the budget.
+        file_paths: Paths whose sections were (at least partially) kept.
+        tokens: Token count of ``text`` (exact near the budget boundary,
+            estimated well below it).
+        lines_read: Diff lines consumed from the stream.
+        truncated: True if the stream was abandoned before its end.
+    """
+
+    text: str
+    file_paths: tuple[str, ...]
+    tokens: int
+    lines_read: int
+    truncated: bool
+
+
+def _iter_pieces(lines: Iterable[str]) -> Iterator[tuple[bool, list[str]]]:
+    """Split a unified diff at file headers and ``@@`` hunk headers.
+
+    Yields ``(is_header, lines)`` pieces in diff order: each file section's
+    header (the text before its first hunk; for the first piece, whatever
+    precedes the first ``diff --git`` line) followed by each of its hunks.
+    Only the piece being read is held in memory.
+    """
+    piece: list[str] = []
+    is_header = True
+    for line in lines:
+        if line.startswith(_FILE_HEADER_PREFIX) or line.startswith("@@"):
+            if piece:
+                yield is_header, piece
+            piece = []
+            is_header = not line.startswith("@@")
+        piece.append(line)
+    if piece:
+        yield is_header, piece
+
+
+def _section_path(header: list[str]) -> str:
+    """Resolve the target path of a file section from its header lines.
+
+    ``unidiff`` is only used (in metadata-only mode) to resolve the path,
+    which handles renames, deletions and quoted names.
+    """
+    try:
+        parsed: list[PatchedFile] = list(PatchSet(header, metadata_only=True))
+    except UnidiffParseError as e:
+        logger.debug("Unparseable diff section, keeping raw text: %s", e)
+        parsed = []
+    if parsed:
+        return parsed[0].path
+    if header and header[0].startswith(_FILE_HEADER_PREFIX):
+        # "diff --git a/<path> b/<path>" — good enough for mode-only sections
+        return header[0].rstrip("\n").rsplit(" b/", 1)[-1]
+    return ""
+
+
+def iter_file_patches(lines: Iterable[str]) -> Iterator[FilePatch]:
+    """Incrementally split a unified diff into per-file patches.
+
+    Only one file section is held in memory at a time. Any text preceding
+    the first ``diff --git`` header is yielded as a patch with an empty path.
+    Hunk text is kept verbatim.
+
+    Args:
+        lines: Diff lines, each including its trailing newline.
+
+    Yields:
+        FilePatch for each file section, in diff order.
+    """
+    header: list[str] | None = None
+    hunks: list[str] = []
+    for is_header, piece in _iter_pieces(lines):
+        if not is_header:
+            hunks.append("".join(piece))
+            continue
+        if header is not None:
+            yield FilePatch(_section_path(header), "".join(header), tuple(hunks))
+        header, hunks = piece, []
+    if header is not None:
+        yield FilePatch(_section_path(header), "".join(header), tuple(hunks))
+
+
+def read_diff_within_budget(lines: Iterable[str], budget: int) -> StreamedDiff:
+    """Read a diff stream, keeping whole hunks until ``budget`` tokens are used.
+
+    The stream is read one file header or hunk at a time, so no more than
+    one hunk beyond the budget is ever held. Files are added whole when
+    they fit; otherwise their header and as many leading hunks as fit are
+    kept and reading stops. The underlying stream is closed (if it is a
+    generator) as soon as the budget is exhausted, so the rest of the diff
+    is never produced.
+
+    Args:
+        lines: Diff lines, e.g. from :meth:`GitRepository.iter_diff`.
+        budget: Maximum tokens of diff text to keep.
+
+    Returns:
+        StreamedDiff describing the kept text.
+    """
+    counter = get_token_counter()
+    counted = _CountingLines(lines)
+    parts: list[str] = []
+    paths: list[str] = []
+    used = 0
+    truncated = False
+    # The current file's header and the hunks of it kept so far
+    section: list[str] = []
+    section_path = ""
+    section_tokens = 0
+
+    def _keep_section() -> None:
+        nonlocal used
+        # A header whose hunks were all cut carries no change worth keeping.
+        if not section or (truncated and len(section) == 1):
+            return
+        parts.extend(section)
+        used += section_tokens
+        if section_path:
+            paths.append(section_path)
+
+    for is_header, piece in _iter_pieces(counted):
+        if is_header:
+            _keep_section()
+            section, section_path, section_tokens = [], _section_path(piece), 0
+        text = "".join(piece)
+        tokens = counter.bounded_count(text, budget - used - section_tokens)
+        if used + section_tokens + tokens > budget:
+            truncated = True
+            break
+        section.append(text)
+        section_tokens += tokens
+
+    _keep_section()
+    if truncated:
+        counted.close()
+        parts.append(TRUNCATION_MARKER)
+
+    return StreamedDiff(
+        text="".join(parts),
+        file_paths=tuple(paths),
+        tokens=used,
+        lines_read=counted.count,
+        truncated=truncated,
+    )
+
+
+class _CountingLines:
+    """Iterator wrapper that counts consumed lines and can close its source."""
+
+    __slots__ = ("_source", "_it", "count")
+
+    def __init__(self, source: Iterable[str]) -> None:
+        self._source = source
+        self._it = iter(source)
+        self.count = 0
+
+    def __iter__(self) -> Iterator[str]:
+        for line in self._it:
+            self.count += 1
+            yield line
+
+    def close(self) -> None:
+        close = getattr(self._source, "close", None)
+        if callable(close):
+            close()
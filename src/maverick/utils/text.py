@@ -6,7 +6,7 @@ and line truncation for managing large text content.
 
 from __future__ import annotations
 
-import tiktoken
+from maverick.utils.tokens import get_token_counter
 
 __all__ = [
     "estimate_tokens",
@@ -16,17 +16,13 @@ __all__ = [
 # Default values
 DEFAULT_MAX_LINE_CHARS = 2000
 
-# Create encoder once at module level for efficiency.
-# cl100k_base is used as an approximation - Claude's actual tokenizer differs
-# slightly but this provides sufficient accuracy for budget estimation.
-_ENCODER = tiktoken.get_encoding("cl100k_base")
-
 
 def estimate_tokens(text: str) -> int:
     """Estimate token count for text using tiktoken.
 
     Uses cl100k_base encoding which provides accurate token counting
-    compatible with modern LLMs.
+    compatible with modern LLMs. The encoding is loaded on first call and
+    counts are cached by content hash (see :mod:`maverick.utils.tokens`).
 
     Args:
         text: Text to estimate tokens for.
@@ -40,7 +36,7 @@ def estimate_tokens(text: str) -> int:
     """
     if not text:
         return 0
-    return len(_ENCODER.encode(text))
+    return get_token_counter().count(text)
 
 
 def truncate_line(line: str, max_chars: int = DEFAULT_MAX_LINE_CHARS) -> str:
@@ -0,0 +1,279 @@
+"""Lazy, cached token counting for Maverick.
+
+This module provides :class:`TokenCounter`, the process-wide tokenizer
+service behind :func:`maverick.utils.text.estimate_tokens`. It offers two
+kinds of count:
+
+- **Exact** counts via tiktoken's ``cl100k_base`` encoding. The encoding is
+  loaded on first use (never at import time — loading the BPE ranks can
+  block on a network fetch on a cold machine) and counts are cached by
+  content hash.
+- **Approximate** counts from a cheap character-class heuristic, calibrated
+  at runtime against the exact counts the service has already computed.
+
+Budget decisions should go through :meth:`TokenCounter.bounded_count` or
+:meth:`TokenCounter.fits`, which use the approximation when it is clearly
+on one side of the limit and only pay for exact encoding near the boundary.
+
+cl100k_base is used as an approximation - Claude's actual tokenizer differs
+slightly but this provides sufficient accuracy for budget estimation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import tiktoken
+
+__all__ = [
+    "TokenCounter",
+    "get_token_counter",
+]
+
+# Default values
+DEFAULT_ENCODING = "cl100k_base"
+DEFAULT_CACHE_SIZE = 4096
+
+#: Upper bound on token ids kept in the encoding cache (4 bytes each)
+DEFAULT_ENCODING_CACHE_TOKENS = 4_000_000
+
+#: Exact counts to collect before the approximation is trusted at all
+MIN_CALIBRATION_SAMPLES = 8
+
+#: Narrowest relative uncertainty band around a limit (see ``bounded_count``)
+MIN_APPROX_MARGIN = 0.15
+
+#: Weight of each new sample in the calibration moving averages
+_CALIBRATION_ALPHA = 0.1
+
+#: Texts shorter than this are always counted exactly (cheap, and the
+#: heuristic is noisiest on tiny inputs)
+_EXACT_BELOW_CHARS = 256
+
+#: ASCII punctuation that cl100k mostly splits into its own tokens
+_PUNCTUATION = "()[]{}<>.,;:=+-*/\\\"'`!?#@$%^&|~_"
+
+
+def _raw_estimate(text: str) -> float:
+    """Uncalibrated token estimate from character classes.
+
+    Starting coefficients: roughly four characters per token for ASCII
+    word characters, half a token per punctuation mark (operators and
+    brackets in code), and half a token per extra UTF-8 byte of non-ASCII
+    text. Every step is a C-level ``str`` operation, so this runs in a few
+    milliseconds on multi-MB inputs.
+    """
+    n_chars = len(text)
+    extra_bytes = len(text.encode("utf-8", errors="replace")) - n_chars
+    punct = sum(text.count(c) for c in _PUNCTUATION)
+    return max(1.0, (n_chars - punct) / 4 + punct * 0.5 + extra_bytes * 0.5)
+
+
+class TokenCounter:
+    """Tokenizer service with lazy encoding load and content-hash caching.
+
+    Thread-safe: agents and context builders call into it from worker
+    threads (``asyncio.to_thread``).
+
+    Example:
+        ```python
+        counter = get_token_counter()
+        counter.count("Hello world!")        # exact, cached
+        counter.approximate(big_context)     # calibrated heuristic
+        counter.fits(big_context, 32_000)    # exact only near the boundary
+        ```
+    """
+
+    def __init__(
+        self,
+        encoding_name: str = DEFAULT_ENCODING,
+        *,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        encoding_cache_tokens: int = DEFAULT_ENCODING_CACHE_TOKENS,
+    ) -> None:
+        """Initialize the counter without loading the encoding.
+
+        Args:
+            encoding_name: tiktoken encoding name (default ``cl100k_base``).
+            cache_size: Maximum number of cached exact counts.
+            encoding_cache_tokens: Maximum total token ids kept in the
+                encoding cache used by :meth:`encode`.
+        """
+        self._encoding_name = encoding_name
+        self._encoding: tiktoken.Encoding | None = None
+        self._cache: OrderedDict[bytes, int] = OrderedDict()
+        self._cache_size = cache_size
+        self._encodings: OrderedDict[bytes, array[int]] = OrderedDict()
+        self._encodings_tokens = 0
+        self._encoding_cache_tokens = encoding_cache_tokens
+        self._lock = threading.Lock()
+        # Calibration state: EMA of exact/raw and of its relative error
+        self._ratio = 1.0
+        self._error = 1.0
+        self._samples = 0
+
+    @property
+    def encoding(self) -> tiktoken.Encoding:
+        """The tiktoken encoding, loaded on first access."""
+        if self._encoding is None:
+            with self._lock:
+                if self._encoding is None:
+                    import tiktoken
+
+                    self._encoding = tiktoken.get_encoding(self._encoding_name)
+        return self._encoding
+
+    @property
+    def calibrated(self) -> bool:
+        """True once enough exact counts have been seen to trust estimates."""
+        return self._samples >= MIN_CALIBRATION_SAMPLES
+
+    @property
+    def margin(self) -> float:
+        """Current relative uncertainty of :meth:`approximate`."""
+        return max(MIN_APPROX_MARGIN, 2 * self._error)
+
+    def encode(self, text: str) -> Sequence[int]:
+        """Encode text to token ids (special tokens are treated as text).
+
+        Encodings are cached by content hash (bounded by total token ids),
+        so repeated budgeting of the same content — e.g. across fix rounds —
+        encodes it only once. Also records the count and calibrates the
+        estimator.
+
+        Args:
+            text: Text to encode.
+
+        Returns:
+            Compact sequence of token ids. Treat it as read-only.
+        """
+        key = self._key(text)
+        with self._lock:
+            cached = self._encodings.get(key)
+            if cached is not None:
+                self._encodings.move_to_end(key)
+                return cached
+        tokens = array("I", self.encoding.encode(text, disallowed_special=()))
+        self._remember(key, text, len(tokens))
+        with self._lock:
+            if len(tokens) <= self._encoding_cache_tokens and key not in self._encodings:
+                self._encodings[key] = tokens
+                self._encodings_tokens += len(tokens)
+                while self._encodings_tokens > self._encoding_cache_tokens:
+                    _, evicted = self._encodings.popitem(last=False)
+                    self._encodings_tokens -= len(evicted)
+        return tokens
+
+    def decode(self, tokens: Sequence[int]) -> str:
+        """Decode token ids back to text."""
+        return self.encoding.decode(list(tokens))
+
+    def count(self, text: str) -> int:
+        """Exact token count, cached by content hash.
+
+        Args:
+            text: Text to count.
+
+        Returns:
+            Number of cl100k_base tokens in ``text``.
+        """
+        if not text:
+            return 0
+        key = self._key(text)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+        return len(self.encode(text))
+
+    def approximate(self, text: str) -> int:
+        """Fast calibrated token estimate (no encoding).
+
+        Args:
+            text: Text to estimate.
+
+        Returns:
+            Estimated token count.
+        """
+        if not text:
+            return 0
+        return max(1, round(_raw_estimate(text) * self._ratio))
+
+    def bounded_count(self, text: str, limit: int) -> int:
+        """Token count that is exact wherever it matters relative to ``limit``.
+
+        If the calibrated estimate lies clearly below or above ``limit``
+        (outside the estimator's uncertainty band), the estimate is
+        returned; otherwise the text is encoded exactly. As long as the
+        estimator stays within its tracked error, the result is on the same
+        side of ``limit`` as the exact count would be.
+
+        Args:
+            text: Text to count.
+            limit: Budget the caller is comparing against.
+
+        Returns:
+            Estimated or exact token count.
+        """
+        if not text:
+            return 0
+        if len(text) < _EXACT_BELOW_CHARS or not self.calibrated:
+            return self.count(text)
+        with self._lock:
+            cached = self._cache.get(self._key(text))
+        if cached is not None:
+            return cached
+        estimate = self.approximate(text)
+        margin = self.margin
+        if estimate * (1 + margin) < limit or estimate * (1 - margin) > limit:
+            return estimate
+        return self.count(text)
+
+    def fits(self, text: str, budget: int) -> bool:
+        """Return True if ``text`` fits within ``budget`` tokens."""
+        return self.bounded_count(text, budget) <= budget
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.blake2b(
+            text.encode("utf-8", errors="surrogatepass"), digest_size=16
+        ).digest()
+
+    def _remember(self, key: bytes, text: str, exact: int) -> None:
+        """Cache an exact count and fold it into the estimator calibration."""
+        with self._lock:
+            self._cache[key] = exact
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+            if len(text) >= _EXACT_BELOW_CHARS:
+                observed = exact / _raw_estimate(text)
+                n = self._samples
+                if n == 0:
+                    self._ratio = observed
+                else:
+                    # Running mean while warming up, then an EMA that tracks drift
+                    error = abs(observed - self._ratio) / self._ratio
+                    self._error += max(_CALIBRATION_ALPHA, 1 / n) * (error - self._error)
+                    self._ratio += max(_CALIBRATION_ALPHA, 1 / (n + 1)) * (observed - self._ratio)
+                self._samples += 1
+
+
+_default_counter: TokenCounter | None = None
+
+
+def get_token_counter() -> TokenCounter:
+    """Return the process-wide :class:`TokenCounter`.
+
+    Creating it is free; the encoding is only loaded on first exact count.
+    """
+    global _default_counter
+    if _default_counter is None:
+        _default_counter = TokenCounter()
+    return _default_counter
@@ -18,6 +18,7 @@ from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Literal
 
+from maverick.event_bus import ProgressEventBus
 from maverick.events import (
     ProgressEvent,
     RollbackCompleted,
@@ -137,7 +138,7 @@ class PythonWorkflow(ABC):
             ProgressEvent instances. Final event is always WorkflowCompleted.
         """
         # Reset per-execution state
-        self._event_queue = asyncio.Queue()
+        self._event_queue = ProgressEventBus()
         self._step_results = []
         self._step_start_times = {}
         self._current_step = None
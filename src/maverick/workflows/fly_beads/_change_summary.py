@@ -0,0 +1,258 @@
+"""Cross-bead change summary for the epic-level aggregate review.
+
+Each committed bead's diff is reduced to a compact per-file record (status,
+line counts, top-level symbols added or removed) and folded into a running
+summary kept in workflow state. The aggregate review then receives an exact
+picture of what the whole epic changed — including modules deleted by one
+bead that another may still reference — without re-walking history or
+spending model turns on exploration.
+
+The summary is a plain JSON-serializable dict (it lives in Burr state)
+keyed by file path::
+
+    {
+        "src/foo.py": {
+            "status": "M",            # A(dded), M(odified), D(eleted), R(enamed)
+            "added": 12,
+            "removed": 4,
+            "beads": ["b-1", "b-3"],
+            "symbols_added": ["parse"],
+            "symbols_removed": ["legacy_parse"],
+            "renamed_from": "",       # original path when status is "R"
+        },
+    }
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from maverick.utils.diff_stream import FilePatch, iter_file_patches
+
+__all__ = [
+    "accumulate_changes",
+    "render_change_summary",
+    "summarize_bead_diff",
+]
+
+#: Default cap on the rendered summary, in characters
+DEFAULT_SUMMARY_CHARS = 6000
+
+#: Room reserved at the end of the rendered summary for the omission note
+_OMITTED_NOTE_CHARS = 40
+
+#: Symbols kept per file and direction; the rest are counted, not listed
+_MAX_SYMBOLS_PER_FILE = 12
+
+#: Definitions recognised on added/removed lines (Python, JS/TS, Go, Rust)
+_SYMBOL_RE = re.compile(
+    r"\s*(?:export\s+(?:default\s+)?)?(?:pub(?:\([^)]*\))?\s+)?(?:async\s+)?"
+    r"(?:def|class|function|fn|func|struct|enum|trait|interface|type)\s+"
+    r"(?:\([^)]*\)\s*)?([A-Za-z_][A-Za-z0-9_]*)"
+)
+
+#: Render order: deletions first — they are the likeliest cross-bead breakage
+_STATUS_ORDER = ("D", "R", "A", "M")
+_STATUS_LABELS = {"D": "Deleted", "R": "Renamed", "A": "Added", "M": "Modified"}
+
+
+def summarize_bead_diff(diff_text: str) -> dict[str, dict[str, Any]]:
+    """Reduce one bead's git-format diff to per-file change records.
+
+    Args:
+        diff_text: Output of ``jj diff --git`` (or ``git diff``) for the bead.
+
+    Returns:
+        Dict mapping file path to a change record (``beads`` left empty).
+    """
+    changes: dict[str, dict[str, Any]] = {}
+    for patch in iter_file_patches(diff_text.splitlines(keepends=True)):
+        if not patch.path:
+            continue
+        changes[patch.path] = _summarize_patch(patch)
+    return changes
+
+
+def _summarize_patch(patch: FilePatch) -> dict[str, Any]:
+    status = "M"
+    renamed_from = ""
+    for line in patch.header.splitlines():
+        if line.startswith("new file mode"):
+            status = "A"
+        elif line.startswith("deleted file mode"):
+            status = "D"
+        elif line.startswith("rename from "):
+            status = "R"
+            renamed_from = line[len("rename from ") :]
+
+    added = removed = 0
+    defined: list[str] = []
+    undefined: list[str] = []
+    for hunk in patch.hunks:
+        for line in hunk.splitlines():
+            if line.startswith("+"):
+                added += 1
+                match = _SYMBOL_RE.match(line, 1)
+                if match:
+                    defined.append(match.group(1))
+            elif line.startswith("-"):
+                removed += 1
+                match = _SYMBOL_RE.match(line, 1)
+                if match:
+                    undefined.append(match.group(1))
+
+    # A symbol on both sides was edited in place (e.g. a signature change)
+    both = set(defined) & set(undefined)
+    return {
+        "status": status,
+        "added": added,
+        "removed": removed,
+        "beads": [],
+        "symbols_added": _dedupe(s for s in defined if s not in both),
+        "symbols_removed": _dedupe(s for s in undefined if s not in both),
+        "renamed_from": renamed_from,
+    }
+
+
+def accumulate_changes(
+    summary: Mapping[str, Mapping[str, Any]],
+    bead_id: str,
+    bead_changes: Mapping[str, Mapping[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    """Fold one bead's change records into the running epic summary.
+
+    The result reflects the net effect of all beads: a file added and later
+    deleted within the epic disappears, a symbol added by one bead and
+    removed by another cancels out, and renames carry the file's history
+    to its new path.
+
+    Args:
+        summary: Running summary (not modified).
+        bead_id: Bead whose changes are being folded in.
+        bead_changes: Output of :func:`summarize_bead_diff` for that bead.
+
+    Returns:
+        New summary dict.
+    """
+    merged: dict[str, dict[str, Any]] = {path: dict(rec) for path, rec in summary.items()}
+    for path, change in bead_changes.items():
+        status = change["status"]
+        prev = merged.pop(path, None)
+        if status == "R" and change.get("renamed_from"):
+            prev = merged.pop(change["renamed_from"], prev)
+
+        if prev is None:
+            merged[path] = {**change, "beads": [bead_id]}
+            continue
+
+        prev_status = prev["status"]
+        if prev_status == "A" and status == "D":
+            continue  # transient file: created and removed within the epic
+        if prev_status == "A":
+            status = "A"
+        elif prev_status == "D" and status == "A":
+            status = "M"
+        elif prev_status == "R" and status == "M":
+            status = "R"
+
+        prev_added = set(prev["symbols_added"])
+        prev_removed = set(prev["symbols_removed"])
+        now_added = set(change["symbols_added"])
+        now_removed = set(change["symbols_removed"])
+        beads = list(prev["beads"])
+        if bead_id not in beads:
+            beads.append(bead_id)
+
+        merged[path] = {
+            "status": status,
+            "added": prev["added"] + change["added"],
+            "removed": prev["removed"] + change["removed"],
+            "beads": beads,
+            "symbols_added": _dedupe(
+                [s for s in prev["symbols_added"] if s not in now_removed]
+                + [s for s in change["symbols_added"] if s not in prev_removed]
+            ),
+            "symbols_removed": _dedupe(
+                [s for s in prev["symbols_removed"] if s not in now_added]
+                + [s for s in change["symbols_removed"] if s not in prev_added]
+            ),
+            # A file created within the epic has no meaningful prior path
+            "renamed_from": ""
+            if status == "A"
+            else prev.get("renamed_from") or change.get("renamed_from", ""),
+        }
+    return merged
+
+
+def render_change_summary(
+    summary: Mapping[str, Mapping[str, Any]],
+    max_chars: int = DEFAULT_SUMMARY_CHARS,
+) -> str:
+    """Render the epic summary as compact text for the aggregate review prompt.
+
+    Files are grouped deleted, renamed, added, modified, and within a group
+    ordered by churn. Output stops before ``max_chars``, noting how many
+    files were left out.
+
+    Args:
+        summary: Running summary from :func:`accumulate_changes`.
+        max_chars: Upper bound on the rendered length.
+
+    Returns:
+        Summary text, or empty string when nothing changed.
+    """
+    if not summary:
+        return ""
+
+    counts = dict.fromkeys(_STATUS_ORDER, 0)
+    beads: set[str] = set()
+    for rec in summary.values():
+        counts[rec["status"]] += 1
+        beads.update(rec["beads"])
+    totals = ", ".join(
+        f"{counts[s]} {_STATUS_LABELS[s].lower()}" for s in _STATUS_ORDER if counts[s]
+    )
+    lines = [f"{len(summary)} file(s) changed across {len(beads)} bead(s): {totals}"]
+    used = len(lines[0])
+
+    ordered = sorted(
+        summary.items(),
+        key=lambda item: (
+            _STATUS_ORDER.index(item[1]["status"]),
+            -(item[1]["added"] + item[1]["removed"]),
+            item[0],
+        ),
+    )
+    current_status = ""
+    for shown, (path, rec) in enumerate(ordered):
+        entry: list[str] = []
+        if rec["status"] != current_status:
+            current_status = rec["status"]
+            entry.append(f"\n{_STATUS_LABELS[current_status]}:")
+        entry.append(_render_entry(path, rec))
+        text = "\n".join(entry)
+        omitted = len(ordered) - shown
+        if used + len(text) + 1 > max_chars - _OMITTED_NOTE_CHARS:
+            lines.append(f"... and {omitted} more file(s)")
+            break
+        lines.append(text)
+        used += len(text) + 1
+    return "\n".join(lines)
+
+
+def _render_entry(path: str, rec: Mapping[str, Any]) -> str:
+    name = f"{path} (from {rec['renamed_from']})" if rec.get("renamed_from") else path
+    parts = [f"- {name} +{rec['added']}/-{rec['removed']} [{', '.join(rec['beads'])}]"]
+    for label, key in (("defines", "symbols_added"), ("drops", "symbols_removed")):
+        symbols = rec[key]
+        if symbols:
+            listed = ", ".join(symbols[:_MAX_SYMBOLS_PER_FILE])
+            extra = len(symbols) - _MAX_SYMBOLS_PER_FILE
+            parts.append(f"{label}: {listed}" + (f" (+{extra} more)" if extra > 0 else ""))
+    return "; ".join(parts)
+
+
+def _dedupe(symbols: Iterable[str]) -> list[str]:
+    return list(dict.fromkeys(symbols))
@@ -200,7 +200,7 @@ async def provision_workspace(
     unit = _unit_for(state)
     try:
         workspace_path = await workspace_lifecycle.provision(
-            checkout=checkout, policy=policy, unit=unit, jj_client=jj_client
+            checkout=checkout, policy=policy, unit=unit, jj_client=jj_client, pool=session.pool
         )
     except IsolationProvisioningError as exc:
         await _put_output(
@@ -499,7 +499,13 @@ async def teardown_workspace(
     if retain:
         await workspace_lifecycle.retain(checkout=checkout, policy=policy, unit=unit)
     else:
+        # Only a bead that went through cleanly hands its workspace back to
+        # the pool; an abandoned one is deleted as before.
         await workspace_lifecycle.teardown(
-            checkout=checkout, policy=policy, unit=unit, jj_client=jj_client
+            checkout=checkout,
+            policy=policy,
+            unit=unit,
+            jj_client=jj_client,
+            pool=None if state.get("bead_aborted") else session.pool,
         )
     return {"torn_down": True}, state.update(workspace_path="")
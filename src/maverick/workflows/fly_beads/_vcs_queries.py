@@ -30,6 +30,22 @@ async def _get_uncommitted_files(cwd: Path | None) -> list[str]:
     return []
 
 
+async def _get_uncommitted_diff_stat(cwd: Path | None) -> str:
+    """Get ``git diff --stat HEAD`` for the working copy, or empty on failure."""
+    from maverick.runners.command import CommandRunner
+
+    try:
+        runner = CommandRunner(cwd=cwd or Path.cwd())
+        result = await runner.run(
+            ["git", "diff", "--stat", "HEAD"],
+        )
+        if result.returncode == 0:
+            return result.stdout
+    except Exception as exc:
+        logger.debug("uncommitted_diff_stat_capture_failed", error=str(exc))
+    return ""
+
+
 async def _get_files_changed(cwd: Path | None) -> list[str]:
     """Get the list of files changed by the most recent commit.
 
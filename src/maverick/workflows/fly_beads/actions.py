@@ -30,8 +30,15 @@ from maverick.events import (
     ProgressEvent,
     StepOutput,
 )
+from maverick.logging import get_logger
 from maverick.payloads import dump_supervisor_payload
+from maverick.prompt_cache import PromptLayout, PromptSection, Stability
 from maverick.squadron.tiers import DEFAULT_TIER as _DEFAULT_TIER
+from maverick.workflows.fly_beads._change_summary import (
+    accumulate_changes,
+    render_change_summary,
+    summarize_bead_diff,
+)
 from maverick.workflows.fly_beads._plan_parsing import (
     ARTIFACT_LEVEL_VERIFICATION,
     ENVIRONMENT_LEVEL_VERIFICATION,
@@ -70,6 +77,8 @@ __all__ = [
     "spec_check",
 ]
 
+logger = get_logger(__name__)
+
 # Fix budgets — preserved from the pre-Burr supervisor.
 MAX_REVIEW_ROUNDS: int = 3
 MAX_GATE_FIX_ATTEMPTS: int = 2
@@ -434,16 +443,21 @@ async def _implement_impl(
     )
 
 
-def _build_implement_prompt(bead: dict[str, Any]) -> str:
-    """Mirror the retired xoscar-era ``FlySupervisor._build_implement_prompt``'s shape."""
+def _build_implement_prompt(bead: dict[str, Any]) -> PromptLayout:
+    """Fixed instruction first, then the ``## Bead: <id>`` section.
+
+    Keeping the bead's id, title and description last lets every
+    implement call share the instruction as a cacheable prefix.
+    """
     title = bead.get("title", "")
     description = bead.get("description", "")
-    return (
-        f"## Bead: {bead.get('bead_id', '?')}\n\n"
-        f"### {title}\n\n"
-        f"{description}\n\n"
-        "Implement this work unit. Submit your implementation summary "
-        "via the StructuredOutput tool when done."
+    return PromptLayout.of(
+        PromptSection(
+            "Implement the work unit below. Submit your implementation summary "
+            "via the StructuredOutput tool when done.",
+            Stability.STATIC,
+        ),
+        PromptSection(f"## Bead: {bead.get('bead_id', '?')}\n\n### {title}\n\n{description}"),
     )
 
 
@@ -466,11 +480,16 @@ async def _run_fix(
     failure). Transient failures bump the tier and retry; non-transient
     failures (or exhausted escalation) return ``(False, current_level, [])``.
     """
-    prompt = (
-        f"## Fix request — phase: {phase}, round {round_n}\n\n"
-        f"The {phase} check failed with:\n\n{failure_message}\n\n"
-        "Address the failure and submit a fix-result payload via the "
-        "StructuredOutput tool."
+    prompt = PromptLayout.of(
+        PromptSection(
+            "Address the check failure below and submit a fix-result payload "
+            "via the StructuredOutput tool.",
+            Stability.STATIC,
+        ),
+        PromptSection(
+            f"## Fix request — phase: {phase}, round {round_n}\n\n"
+            f"The {phase} check failed with:\n\n{failure_message}"
+        ),
     )
     label = f"Fix ({phase} r{round_n})"
     payload, new_level, _ = await _call_implementer_with_escalation(
@@ -1006,7 +1025,8 @@ async def review(
 
     On reviewer transient failures (airframe's ``RuntimeTransientError``
     — 5xx, rate limits, network blips, runtime hangs), the action
-    escalates to the next configured tier and retries the same round.
+    escalates the failing reviewer to the next configured tier and
+    retries it alone; a sibling's successful result is kept.
     The escalated tier sticks for the rest of the bead so we don't drop
     back to a reviewer we just learned is unreliable. If every tier has
     been tried and the failure persists, the action sets
@@ -1050,10 +1070,12 @@ async def _review_impl(
     rounds_with_findings = 0
     escalation_level = int(state.get("reviewer_escalation_level") or 0)
     implementer_level = int(state.get("implementer_escalation_level") or 0)
+    # One shared, deduplicated context for both reviewers, built once per bead.
+    shared_context, runway_included = await _prepare_shared_review_context()
     for round_n in range(1, MAX_REVIEW_ROUNDS + 1):
         # Run both reviewers in parallel (correctness + completeness),
-        # bumping the reviewer tier on transient failures until either
-        # a result lands or every tier has been tried.
+        # bumping only a failing reviewer's tier on transient failures
+        # until both results land or every tier has been tried.
         results, escalation_level, transient_exhausted = await _review_round_with_escalation(
             squadron=squadron,
             events=events,
@@ -1061,6 +1083,8 @@ async def _review_impl(
             description=description,
             work_unit_md=work_unit_md,
             initial_level=escalation_level,
+            shared_context=shared_context or None,
+            runway_included=runway_included,
         )
         if transient_exhausted:
             return {"approved": False}, state.update(
@@ -1184,7 +1208,7 @@ async def _call_implementer_with_escalation(
     squadron: FlySquadron,
     events: asyncio.Queue[ProgressEvent | None],
     bead_id: str,
-    prompt: str,
+    prompt: PromptLayout,
     op: Literal["implement", "fix"],
     label: str,
     initial_level: int,
@@ -1281,6 +1305,45 @@ async def _call_implementer_with_escalation(
         return payload, level, ""
 
 
+#: Reviewer pair sent each round: ``(event label, squadron tier getter)``.
+_REVIEWERS: tuple[tuple[str, str], ...] = (
+    ("Correctness", "correctness_reviewer_for"),
+    ("Completeness", "completeness_reviewer_for"),
+)
+
+
+async def _prepare_shared_review_context() -> tuple[str, bool]:
+    """Build the review context both reviewers receive inline.
+
+    Computed once per bead from the (already workspace-scoped) cwd: a diff
+    summary of the bead's working-copy changes plus deduplicated runway
+    history for the changed files. Sending it inline takes the repeated,
+    tool-driven ``.maverick/runway/`` exploration off the critical path of
+    every reviewer. Returns ``(context, runway_included)`` — the second
+    item says whether any runway history made it in, so reviewers are only
+    told to skip the runway when it is actually inline. Best-effort — the
+    context is an empty string on failure.
+    """
+    from maverick.library.actions.runway import retrieve_review_context
+    from maverick.workflows.fly_beads._vcs_queries import (
+        _get_uncommitted_diff_stat,
+        _get_uncommitted_files,
+    )
+
+    cwd = Path.cwd()
+    diff_stat, changed_files = await asyncio.gather(
+        _get_uncommitted_diff_stat(cwd), _get_uncommitted_files(cwd)
+    )
+    runway_context = await retrieve_review_context(changed_files=changed_files, cwd=cwd)
+
+    sections: list[str] = []
+    if diff_stat.strip():
+        sections.append(f"### Diff Summary\n\n```\n{diff_stat.strip()}\n```")
+    if runway_context:
+        sections.append(runway_context)
+    return "\n\n".join(sections), bool(runway_context)
+
+
 async def _review_round_with_escalation(
     *,
     squadron: FlySquadron,
@@ -1289,145 +1352,126 @@ async def _review_round_with_escalation(
     description: str,
     work_unit_md: str | None,
     initial_level: int,
+    shared_context: str | None = None,
+    runway_included: bool = False,
 ) -> tuple[tuple[Any, Any] | None, int, str]:
     """Send the correctness+completeness pair, escalating on transient failure.
 
+    Each reviewer is scheduled independently: a successful result is kept,
+    and only the reviewer that hit a transient failure is escalated to the
+    next tier and re-sent — its sibling's result is never discarded.
+
     Returns ``(results, new_level, transient_exhausted_msg)`` where:
 
     * ``results`` is the ``(correctness, completeness)`` payload tuple
       on success, or ``None`` on a non-transient crash.
-    * ``new_level`` is the escalation level the caller should persist
-      for the rest of the bead.
+    * ``new_level`` is the highest escalation level either reviewer
+      reached; the caller persists it for the rest of the bead.
     * ``transient_exhausted_msg`` is the empty string on success or a
       non-transient crash, and the carried transient-error message
-      when every reviewer tier has been exhausted.
+      when a reviewer has exhausted every tier.
     """
     from airframe.errors import RuntimeTransientError
 
-    level = max(0, initial_level)
-    last_transient_error = ""
     ladder = _ladder(squadron, "reviewer")
     max_level = len(ladder) - 1
+    levels = {label: max(0, initial_level) for label, _ in _REVIEWERS}
+    results: dict[str, Any] = {}
+
     while True:
-        tier_name = _tier_at(ladder, level)
-        correctness = squadron.correctness_reviewer_for(tier_name)
-        completeness = squadron.completeness_reviewer_for(tier_name)
+        reviewers = {
+            label: getattr(squadron, getter)(_tier_at(ladder, levels[label]))
+            for label, getter in _REVIEWERS
+            if label not in results
+        }
 
         with squadron.bead_context(bead_id=bead_id):
             t0 = time.monotonic()
-            await events.put(
-                AgentStarted(step_name="review", agent_name="Correctness", provider="")
-            )
-            await events.put(
-                AgentStarted(step_name="review", agent_name="Completeness", provider="")
-            )
-            try:
-                results = await asyncio.gather(
-                    correctness.review(
-                        bead_description=description,
-                        work_unit_md=work_unit_md,
-                        briefing_context=None,
-                    ),
-                    completeness.review(
+            for label in reviewers:
+                await events.put(AgentStarted(step_name="review", agent_name=label, provider=""))
+            outcomes = await asyncio.gather(
+                *(
+                    reviewer.review(
                         bead_description=description,
                         work_unit_md=work_unit_md,
                         briefing_context=None,
-                    ),
-                )
-            except RuntimeTransientError as exc:
-                last_transient_error = str(exc)
-                duration = time.monotonic() - t0
-                await events.put(
-                    AgentCompleted(
-                        step_name="review",
-                        agent_name="Correctness",
-                        duration_seconds=duration,
-                        success=False,
-                        error=last_transient_error,
+                        shared_context=shared_context,
+                        runway_included=runway_included,
                     )
-                )
+                    for reviewer in reviewers.values()
+                ),
+                return_exceptions=True,
+            )
+            duration = time.monotonic() - t0
+
+        exhausted_error = ""
+        crash: Exception | None = None
+        for label, outcome in zip(reviewers, outcomes, strict=True):
+            if not isinstance(outcome, BaseException):
+                results[label] = outcome
                 await events.put(
-                    AgentCompleted(
-                        step_name="review",
-                        agent_name="Completeness",
-                        duration_seconds=duration,
-                        success=False,
-                        error=last_transient_error,
-                    )
+                    AgentCompleted(step_name="review", agent_name=label, duration_seconds=duration)
                 )
-                if level >= max_level:
-                    await _put_output(
-                        events,
-                        "review",
-                        (
-                            f"Reviewer transient failure exhausted escalation at "
-                            f"tier '{tier_name}': {last_transient_error}"
-                        ),
-                        level="error",
-                        metadata={"tier": tier_name, "transient": True, "exhausted": True},
-                    )
-                    return None, level, last_transient_error
-                next_level = level + 1
-                next_tier = _tier_at(ladder, next_level)
+                continue
+            if not isinstance(outcome, Exception):
+                raise outcome  # cancellation / interpreter exit: never swallow
+            await events.put(
+                AgentCompleted(
+                    step_name="review",
+                    agent_name=label,
+                    duration_seconds=duration,
+                    success=False,
+                    error=str(outcome),
+                )
+            )
+            if not isinstance(outcome, RuntimeTransientError):
+                crash = crash or outcome
+                continue
+            tier_name = _tier_at(ladder, levels[label])
+            if levels[label] >= max_level:
+                exhausted_error = exhausted_error or str(outcome)
                 await _put_output(
                     events,
                     "review",
                     (
-                        f"Reviewer transient failure on tier '{tier_name}'; "
-                        f"escalating to '{next_tier}': {last_transient_error}"
+                        f"Reviewer transient failure exhausted escalation at "
+                        f"tier '{tier_name}': {outcome}"
                     ),
-                    level="warning",
+                    level="error",
                     metadata={
-                        "from_tier": tier_name,
-                        "to_tier": next_tier,
+                        "tier": tier_name,
+                        "reviewer": label,
                         "transient": True,
+                        "exhausted": True,
                     },
                 )
-                level = next_level
                 continue
-            except Exception as exc:  # noqa: BLE001 — non-transient → bail to needs-human-review
-                duration = time.monotonic() - t0
-                await events.put(
-                    AgentCompleted(
-                        step_name="review",
-                        agent_name="Correctness",
-                        duration_seconds=duration,
-                        success=False,
-                        error=str(exc),
-                    )
-                )
-                await events.put(
-                    AgentCompleted(
-                        step_name="review",
-                        agent_name="Completeness",
-                        duration_seconds=duration,
-                        success=False,
-                        error=str(exc),
-                    )
-                )
-                await _put_output(
-                    events,
-                    "review",
-                    f"Review failed: {exc}",
-                    level="error",
-                )
-                return None, level, ""
-            duration = time.monotonic() - t0
-        await events.put(
-            AgentCompleted(
-                step_name="review",
-                agent_name="Correctness",
-                duration_seconds=duration,
-            )
-        )
-        await events.put(
-            AgentCompleted(
-                step_name="review",
-                agent_name="Completeness",
-                duration_seconds=duration,
+            levels[label] += 1
+            next_tier = _tier_at(ladder, levels[label])
+            await _put_output(
+                events,
+                "review",
+                (
+                    f"{label} reviewer transient failure on tier '{tier_name}'; "
+                    f"escalating to '{next_tier}': {outcome}"
+                ),
+                level="warning",
+                metadata={
+                    "from_tier": tier_name,
+                    "to_tier": next_tier,
+                    "reviewer": label,
+                    "transient": True,
+                },
             )
-        )
-        return results, level, ""
+
+        level = max(levels.values())
+        if crash is not None:
+            await _put_output(events, "review", f"Review failed: {crash}", level="error")
+            return None, level, ""
+        if exhausted_error:
+            return None, level, exhausted_error
+        if len(results) == len(_REVIEWERS):
+            return (results["Correctness"], results["Completeness"]), level, ""
 
 
 def _payload_approved(payload: Any) -> bool:
@@ -1685,8 +1729,9 @@ async def record_assumptions(
         "needs_human_review",
         "review_rounds",
         "recorded_assumption_ids",
+        "epic_changes",
     ],
-    writes=["commit_ok", "commit_change_id"],
+    writes=["commit_ok", "commit_change_id", "epic_changes"],
 )
 async def commit(
     state: State,
@@ -1694,9 +1739,13 @@ async def commit(
     cwd: str,
     events: asyncio.Queue[ProgressEvent | None],
 ) -> tuple[dict[str, Any], State]:
-    """Commit the bead's changes, mark it complete, and stamp any ledger entries."""
+    """Commit the bead's changes, mark it complete, and stamp any ledger entries.
+
+    Also folds the committed change's diff into ``epic_changes``, the
+    running cross-bead summary the aggregate review is built from.
+    """
     from maverick.library.actions.beads import mark_bead_complete
-    from maverick.library.actions.jj import jj_commit_bead
+    from maverick.library.actions.jj import jj_commit_bead, jj_diff
     from maverick.workspace import CheckoutPath
 
     bead = state["current_bead"]
@@ -1720,6 +1769,18 @@ async def commit(
 
     change_id = commit_result.get("change_id") or ""
 
+    # The finalized change is ``@-`` after ``jj commit``. Advisory only: a
+    # failed diff just leaves this bead out of the aggregate summary.
+    epic_changes = dict(state.get("epic_changes") or {})
+    try:
+        diff_result = await jj_diff("@-", cwd=Path(cwd))
+        if diff_result.get("success"):
+            epic_changes = accumulate_changes(
+                epic_changes, bead_id, summarize_bead_diff(diff_result["output"])
+            )
+    except Exception as exc:  # noqa: BLE001 — advisory
+        logger.debug("epic_changes_capture_failed", bead_id=bead_id, error=str(exc))
+
     try:
         await mark_bead_complete(bead_id, cwd=CheckoutPath(Path(cwd)))
     except Exception as exc:  # noqa: BLE001
@@ -1748,7 +1809,9 @@ async def commit(
             )
 
     await _put_output(events, "commit", f"Committed bead {bead_id}", level="success")
-    return {"committed": True}, state.update(commit_ok=True, commit_change_id=change_id)
+    return {"committed": True}, state.update(
+        commit_ok=True, commit_change_id=change_id, epic_changes=epic_changes
+    )
 
 
 @action(reads=["current_bead_id"], writes=["bead_aborted", "bead_failed"])
@@ -1959,7 +2022,13 @@ async def reconcile_answers_final(
 
 
 @action(
-    reads=["completed_bead_ids", "bead_events", "succeeded_count", "protection_blocks"],
+    reads=[
+        "completed_bead_ids",
+        "bead_events",
+        "succeeded_count",
+        "protection_blocks",
+        "epic_changes",
+    ],
     writes=["aggregate_review_payload", "protection_blocks"],
 )
 async def aggregate_review(
@@ -2038,7 +2107,12 @@ async def _aggregate_review_impl(
     title_by_id: dict[str, str] = {e["bead_id"]: e.get("title", "") for e in bead_events}
     bead_list = "\n".join(f"- {bid}: {title_by_id.get(bid, '')}" for bid in completed_ids)
 
-    diff_stat = await _safe_diff_stat(cwd)
+    # Cross-bead summary accumulated at each commit; fall back to the last
+    # commit's stat when it is unavailable (e.g. a run resumed from a
+    # checkpoint that predates it).
+    diff_stat = render_change_summary(state.get("epic_changes") or {})
+    if not diff_stat:
+        diff_stat = await _safe_diff_stat(cwd)
 
     reviewer = squadron.correctness_reviewer_for(DEFAULT_TIER)
     label = "Aggregate review"
@@ -429,6 +429,9 @@ def build_fly_application(
             # Aggregate (cross-bead) review summary — None until the
             # post-loop ``aggregate_review`` action runs.
             aggregate_review_payload=None,
+            # Cross-bead change summary folded in at each commit and
+            # rendered into the aggregate review prompt.
+            epic_changes={},
             # Reviewer / implementer transient-failure escalation:
             # per-bead step counts up the tier ladder. Reset to 0 on
             # each new bead.
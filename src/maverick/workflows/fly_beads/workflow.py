@@ -496,6 +496,7 @@ async def _run_bead_loop(
 
     from maverick.burr import BurrWorkflowDriver
     from maverick.config import lookup_tiers_config
+    from maverick.event_bus import ProgressEventBus
     from maverick.events import ProgressEvent
     from maverick.squadron.fly import FlySquadron
     from maverick.workflows.fly_beads.burr_graph import (
@@ -538,12 +539,24 @@ async def _run_bead_loop(
         isolation_policy = build_isolation_policy(
             root=workspace_config.root, fold_exclusions=fold_exclusions
         )
+        isolation_jj_client = JjClient(cwd=cwd)
+        workspace_pool = None
+        if workspace_config.pool_size:
+            from maverick.workspace.pool import WorkspacePool
+
+            workspace_pool = WorkspacePool(
+                checkout=cwd,
+                policy=isolation_policy,
+                jj_client=isolation_jj_client,
+                size=workspace_config.pool_size,
+            )
         isolation_session = IsolationSession(
             checkout=CheckoutPath(cwd),
             policy=isolation_policy,
-            jj_client=JjClient(cwd=cwd),
+            jj_client=isolation_jj_client,
             run_id=run_id,
             now=_isolation_now,
+            pool=workspace_pool,
         )
 
     async with (
@@ -564,10 +577,14 @@ async def _run_bead_loop(
             # No workspace is ever meant to survive across runs (fly's
             # policy is reuse=False) — sweep clears anything an
             # interrupted prior run left behind before this one's own
-            # bead loop starts (FR-028, T092).
+            # bead loop starts (FR-028, T092). Idle pool workspaces are
+            # the exception: they hold no bead's work, and the pool adopts
+            # them so this run starts warm.
             await isolation_session.sweep(keep=set())
+            if isolation_session.pool is not None:
+                await isolation_session.pool.start()
 
-        event_queue: _asyncio.Queue[ProgressEvent | None] = _asyncio.Queue()
+        event_queue: _asyncio.Queue[ProgressEvent | None] = ProgressEventBus()
         app = build_fly_application(
             squadron=squadron,
             event_queue=event_queue,
@@ -592,8 +609,12 @@ async def _run_bead_loop(
             halt_after=FLY_TERMINAL_ACTIONS,
             event_queue=event_queue,
         )
-        async for evt in driver.events():
-            await workflow._event_queue.put(evt)
+        try:
+            async for evt in driver.events():
+                await workflow._event_queue.put(evt)
+        finally:
+            if isolation_session is not None and isolation_session.pool is not None:
+                await isolation_session.pool.close()
         _, _result, state = driver.result
 
     bead_events = list(state.get("bead_events") or ())
@@ -225,6 +225,7 @@ class GenerateFlightPlanWorkflow(PythonWorkflow):
         import asyncio
 
         from maverick.burr import BurrWorkflowDriver
+        from maverick.event_bus import ProgressEventBus
         from maverick.events import ProgressEvent
         from maverick.squadron.plan import PlanSquadron
         from maverick.types import StepType as _StepType
@@ -251,7 +252,7 @@ class GenerateFlightPlanWorkflow(PythonWorkflow):
         async with PlanSquadron(
             cwd=Path(cwd), config=self._config, cost_sink=cost_sink
         ) as squadron:
-            event_queue: asyncio.Queue[ProgressEvent | None] = asyncio.Queue()
+            event_queue: asyncio.Queue[ProgressEvent | None] = ProgressEventBus()
             app = build_plan_application(
                 squadron=squadron,
                 event_queue=event_queue,
@@ -9,6 +9,13 @@ from maverick.agents.reconciler import ReconcilerAgent
 from maverick.jj.client import JjClient
 from maverick.library.actions.jj import jj_list_conflicts, jj_new_child, jj_squash_into
 from maverick.logging import get_logger
+from maverick.payloads import ConflictHunkResolution
+from maverick.utils.atomic import atomic_write_text
+from maverick.workflows.reconcile.hunks import (
+    extract_conflict_hunks,
+    render_conflict_excerpt,
+    splice_resolutions,
+)
 from maverick.workflows.reconcile.models import ChangedAnswer
 
 logger = get_logger(__name__)
@@ -21,6 +28,10 @@ __all__ = ["ConflictOutcome", "resolve_conflicts"]
 #: file path per line, e.g. ``f.txt    2-sided conflict``.
 _CONFLICT_HEADER = "unresolved conflicts at these paths"
 
+#: Conflicted files up to this size are shown to the agent in full; larger
+#: ones as conflict hunks with surrounding context.
+_WHOLE_FILE_MAX_CHARS = 16_000
+
 
 @dataclass(frozen=True, slots=True)
 class ConflictOutcome:
@@ -96,14 +107,21 @@ async def resolve_conflicts(
        these paths" section — there is no dedicated conflicted-file-list
        client method) and then reads each file's on-disk content directly
        via :meth:`Path.read_text`, passing ``{path: content}`` to
-       ``reconciler.resolve_conflicts(...)``.
+       ``reconciler.resolve_conflicts(...)``. Files over
+       ``_WHOLE_FILE_MAX_CHARS`` are passed as conflict-hunk excerpts
+       (:func:`~maverick.workflows.reconcile.hunks.render_conflict_excerpt`)
+       instead; per-hunk answers in ``payload.resolved_hunks`` are spliced
+       back into those files by line range before folding.
     4. Non-empty ``payload.unresolvable`` stops the loop immediately
        (contract: budget-terminating; the round that produced it still
        counts against ``rounds_used``).
     5. Otherwise the resolution is folded via
        ``jj_squash_into(revision="@", into=conflicted_change_id)`` — jj
        propagates the resolution to downstream conflicts automatically.
-    6. After ``max_rounds`` rounds, if conflicts still exist, the loop
+    6. The re-list after a round is scoped to ``descendants()`` of that
+       round's conflicted changes: a fold only rewrites descendants of the
+       change it folds into, so no new conflict can appear elsewhere.
+    7. After ``max_rounds`` rounds, if conflicts still exist, the loop
        ends with ``resolved=False`` and no ``unresolvable`` (budget
        exhaustion, distinct from an agent-declared unresolvable set).
 
@@ -184,7 +202,7 @@ async def resolve_conflicts(
                 question=answer.question,
                 adopted_answer=answer.adopted_answer,
                 human_answer=answer.human_answer,
-                conflicted_files=conflicted_files,
+                conflicted_files=_prompt_view(conflicted_files),
             )
 
             if payload.unresolvable:
@@ -200,6 +218,9 @@ async def resolve_conflicts(
                     unresolvable=payload.unresolvable,
                 )
 
+            if payload.resolved_hunks:
+                _apply_hunk_resolutions(cwd, conflicted_files, payload.resolved_hunks)
+
             squash_result = await jj_squash_into(revision="@", into=conflicted_change_id, cwd=cwd)
             if not squash_result["success"]:
                 error = f"jj_squash_into failed: {squash_result['error']}"
@@ -215,7 +236,9 @@ async def resolve_conflicts(
                     error=error,
                 )
 
-        conflicted = await _list_conflicts_earliest_first(revset_scope, cwd)
+        conflicted = await _list_conflicts_earliest_first(
+            f"descendants({' | '.join(conflicted)})", cwd
+        )
         if conflicted is None:
             return ConflictOutcome(
                 resolved=False,
@@ -278,6 +301,44 @@ async def _read_conflicted_files(cwd: Path) -> dict[str, str]:
     return conflicted_files
 
 
+def _prompt_view(conflicted_files: dict[str, str]) -> dict[str, str]:
+    """Replace large conflicted files with excerpts of their conflict hunks."""
+    view: dict[str, str] = {}
+    for path, content in conflicted_files.items():
+        hunks = extract_conflict_hunks(content) if len(content) > _WHOLE_FILE_MAX_CHARS else ()
+        view[path] = render_conflict_excerpt(content, hunks) if hunks else content
+    return view
+
+
+def _apply_hunk_resolutions(
+    cwd: Path,
+    shown: dict[str, str],
+    resolutions: tuple[ConflictHunkResolution, ...],
+) -> None:
+    """Splice the agent's per-hunk resolutions into the working-copy files.
+
+    Only files still exactly as they were shown are spliced, so hunk numbers
+    mean what the agent saw. A file the agent also edited directly, one it
+    was never shown, or one whose resolutions name unknown hunks is left as
+    it is (logged) — any markers left behind show up in the next round's
+    conflict listing.
+    """
+    by_path: dict[str, dict[int, str]] = {}
+    for item in resolutions:
+        by_path.setdefault(item.path, {})[item.hunk] = item.resolution
+
+    for path, answers in by_path.items():
+        file_path = cwd / path
+        try:
+            content = file_path.read_text()
+            if path not in shown or content != shown[path]:
+                raise ValueError("file changed since its hunks were shown")
+            spliced = splice_resolutions(content, extract_conflict_hunks(content), answers)
+            atomic_write_text(file_path, spliced)
+        except (OSError, ValueError) as e:
+            logger.warning("resolve_conflicts_splice_failed", path=path, error=str(e))
+
+
 def _parse_conflicted_paths(status_output: str) -> tuple[str, ...]:
     """Extract conflicted file paths from ``jj status`` raw output.
 
@@ -0,0 +1,172 @@
+"""Conflict-marker hunks: extraction, prompt excerpts and deterministic splicing.
+
+A file materialized at a conflicted jj change carries one marker block per
+conflict::
+
+    <<<<<<< Conflict 1 of 2
+    %%%%%%% Changes from base to side #1
+    ...
+    +++++++ Contents of side #2
+    ...
+    >>>>>>> Conflict 1 of 2 ends
+
+(git-style ``<<<<<<<`` / ``=======`` / ``>>>>>>>`` blocks parse the same
+way). jj lengthens the markers when the file itself contains
+seven-character runs, so a block ends at the first closing marker at
+least as long as its opening one.
+
+Large conflicted files are shown to the reconciler as hunks with a few
+lines of surrounding context instead of in full; the agent may answer
+per hunk, and :func:`splice_resolutions` writes those answers back into
+the file by line range — no fuzzy matching, so the result is the same
+whoever applies it. Lines are split on ``\n`` only, as jj and editors
+number them, and every line outside a resolved hunk keeps its own ending
+(``\r\n`` included).
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+__all__ = [
+    "ConflictHunk",
+    "extract_conflict_hunks",
+    "render_conflict_excerpt",
+    "splice_resolutions",
+]
+
+_OPEN_RE = re.compile(r"^(<{7,})(?:\s|$)")
+_CLOSE_RE = re.compile(r"^(>{7,})(?:\s|$)")
+
+
+def _split_lines(content: str) -> list[str]:
+    """Split on ``\n`` only, each line keeping its ending."""
+    lines = [f"{line}\n" for line in content.split("\n")]
+    lines[-1] = lines[-1][:-1]
+    if not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def _ending(line: str) -> str:
+    """The line's ending: ``"\r\n"``, ``"\n"`` or ``""``."""
+    return line[len(line.rstrip("\r\n")) :]
+
+
+def _text(line: str) -> str:
+    """The line without its ending."""
+    return line[: len(line) - len(_ending(line))]
+
+
+@dataclass(frozen=True, slots=True)
+class ConflictHunk:
+    """One conflict-marker block within a file.
+
+    Attributes:
+        index: 1-based position of the hunk in the file.
+        start_line: 1-based line number of the opening marker.
+        end_line: 1-based line number of the closing marker (inclusive).
+        lines: The marker block itself, markers included, without line
+            endings.
+    """
+
+    index: int
+    start_line: int
+    end_line: int
+    lines: tuple[str, ...]
+
+
+def extract_conflict_hunks(content: str) -> tuple[ConflictHunk, ...]:
+    """Find every complete conflict-marker block in ``content`` (single pass).
+
+    An opening marker with no matching close is ignored, as are closing
+    markers outside a block.
+    """
+    hunks: list[ConflictHunk] = []
+    lines = [_text(line) for line in _split_lines(content)]
+    start: int | None = None
+    marker_len = 0
+    for number, line in enumerate(lines, start=1):
+        if start is None:
+            opening = _OPEN_RE.match(line)
+            if opening:
+                start, marker_len = number, len(opening.group(1))
+            continue
+        closing = _CLOSE_RE.match(line)
+        if closing and len(closing.group(1)) >= marker_len:
+            hunks.append(
+                ConflictHunk(
+                    index=len(hunks) + 1,
+                    start_line=start,
+                    end_line=number,
+                    lines=tuple(lines[start - 1 : number]),
+                )
+            )
+            start = None
+    return tuple(hunks)
+
+
+def render_conflict_excerpt(
+    content: str,
+    hunks: tuple[ConflictHunk, ...],
+    *,
+    context_lines: int = 5,
+) -> str:
+    """Render only the conflicted regions of ``content`` for a prompt.
+
+    Each hunk is shown with up to ``context_lines`` unconflicted lines on
+    either side, every line prefixed with its line number so edits can be
+    located in the full file. Elided stretches are marked with ``...``.
+    """
+    lines = [_text(line) for line in _split_lines(content)]
+    width = len(str(len(lines)))
+    parts = [f"[{len(lines)} lines; showing {len(hunks)} conflict hunk(s) with context]"]
+    shown_until = 0
+    for hunk in hunks:
+        first = max(hunk.start_line - context_lines, shown_until + 1)
+        last = min(hunk.end_line + context_lines, len(lines))
+        if first > shown_until + 1:
+            parts.append("...")
+        parts.append(f"--- hunk {hunk.index} (lines {hunk.start_line}-{hunk.end_line}) ---")
+        parts.extend(f"{n:>{width}}| {lines[n - 1]}" for n in range(first, last + 1))
+        shown_until = last
+    if shown_until < len(lines):
+        parts.append("...")
+    return "\n".join(parts)
+
+
+def splice_resolutions(
+    content: str,
+    hunks: tuple[ConflictHunk, ...],
+    resolutions: Mapping[int, str],
+) -> str:
+    """Replace resolved hunks (by ``index``) with their resolution text.
+
+    Hunks are replaced by line range, last first, so earlier line numbers
+    stay valid. Hunks without a resolution are left as they are, and every
+    line outside a resolved hunk is kept byte for byte. Resolution lines
+    take the ending of the hunk's opening marker; the last one takes the
+    closing marker's, so the file's trailing newline (or lack of one) is
+    preserved.
+
+    Raises:
+        ValueError: If ``resolutions`` names a hunk index not in ``hunks``.
+    """
+    by_index = {hunk.index: hunk for hunk in hunks}
+    unknown = sorted(set(resolutions) - set(by_index))
+    if unknown:
+        raise ValueError(f"No conflict hunk(s) {unknown} in file with {len(hunks)} hunk(s)")
+
+    lines = _split_lines(content)
+    for index in sorted(resolutions, reverse=True):
+        hunk = by_index[index]
+        inner = _ending(lines[hunk.start_line - 1])
+        last = _ending(lines[hunk.end_line - 1])
+        replacement = [_text(line) for line in _split_lines(resolutions[index])]
+        lines[hunk.start_line - 1 : hunk.end_line] = [
+            text + (last if n == len(replacement) else inner)
+            for n, text in enumerate(replacement, start=1)
+        ]
+    return "".join(lines)
@@ -23,7 +23,12 @@ Algorithm (research R6):
    flagged findings ends the pass successfully. Reaching ``max_rounds``
    with findings still flagged is budget exhaustion.
 4. Per round: capture each to-analyze descendant's diff via the same
-   ``jj_diff`` action ``correction.py`` uses, call
+   ``jj_diff`` action ``correction.py`` uses (a bounded number of captures
+   in flight at once), memoized by commit id for the whole pass: a
+   descendant is only re-diffed when its commit was rewritten — by a fix
+   folded into it, or by a fix folded into an ancestor — which is
+   detected by re-reading commit ids with one ``JjClient.log`` call after
+   each round's fixes. Then call
    ``SemanticDependentsAgent.analyze(...)``, then cross-check the
    contract's ids-subset rule ourselves (the payload validator only
    enforces per-finding shape, not fleet membership, per
@@ -73,6 +78,7 @@ Algorithm (research R6):
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING
 
@@ -93,6 +99,9 @@ logger = get_logger(__name__)
 
 __all__ = ["SemanticOutcome", "run_semantic_pass"]
 
+#: Upper bound on concurrent ``jj diff`` subprocesses per capture batch
+_MAX_CONCURRENT_DIFFS = 8
+
 
 @dataclass(frozen=True, slots=True)
 class SemanticOutcome:
@@ -170,12 +179,10 @@ async def run_semantic_pass(
     )
     target = answer.target_change_id
 
+    descendants_revset = f"descendants({target}) & mutable() & ~{target}"
     try:
         jj_client = JjClient(cwd=cwd)
-        log_result = await jj_client.log(
-            revset=f"descendants({target}) & mutable() & ~{target}",
-            limit=1000,
-        )
+        log_result = await jj_client.log(revset=descendants_revset, limit=1000)
     except (JjError, OSError) as exc:
         error = f"descendant enumeration failed: {exc}"
         logger.debug("run_semantic_pass_enumeration_failed", entry_id=answer.entry_id, error=error)
@@ -185,11 +192,16 @@ async def run_semantic_pass(
     if not all_descendant_ids:
         return SemanticOutcome(completed=True, rounds_used=0)
 
+    commit_ids = {change.change_id: change.commit_id for change in log_result.changes}
+    # change_id -> (commit_id the diff was taken at, diff text)
+    diff_cache: dict[str, tuple[str, str]] = {}
     fixed_descendants: list[str] = []
     to_analyze = all_descendant_ids
 
     for round_num in range(1, max_rounds + 1):
-        descendant_diffs = await _capture_diffs(to_analyze, cwd=cwd)
+        descendant_diffs = await _capture_diffs(
+            to_analyze, commit_ids=commit_ids, cache=diff_cache, cwd=cwd
+        )
 
         payload = await semantic.analyze(
             question=answer.question,
@@ -233,6 +245,8 @@ async def run_semantic_pass(
                 fixed_descendants.append(change_id)
 
         to_analyze = tuple(flagged)
+        if round_num < max_rounds:
+            await _refresh_commit_ids(jj_client, descendants_revset, commit_ids, answer.entry_id)
 
     return SemanticOutcome(
         completed=False,
@@ -244,30 +258,64 @@ async def run_semantic_pass(
 async def _capture_diffs(
     change_ids: tuple[str, ...],
     *,
+    commit_ids: dict[str, str],
+    cache: dict[str, tuple[str, str]],
     cwd: Path,
 ) -> tuple[tuple[str, str], ...]:
     """Capture ``(change_id, diff)`` pairs for a batch of descendants.
 
     Matches ``correction.py``'s exact diff-capture mechanism (the
-    ``jj_diff`` action wrapper). A capture failure for one descendant
-    degrades to an empty diff string for that descendant (logged) rather
-    than aborting the whole batch — mirrors ``apply_correction``'s
-    treatment of its own pre-agent target-diff capture.
+    ``jj_diff`` action wrapper). Diffs already in ``cache`` for the
+    descendant's current commit id are reused; the rest are captured
+    concurrently (at most ``_MAX_CONCURRENT_DIFFS`` at a time) and cached.
+    A capture failure for one descendant degrades to an empty diff string
+    for that descendant (logged, not cached) rather than aborting the whole
+    batch — mirrors ``apply_correction``'s treatment of its own pre-agent
+    target-diff capture.
     """
-    pairs: list[tuple[str, str]] = []
-    for change_id in change_ids:
-        diff_result = await jj_diff(revision=change_id, cwd=cwd)
-        if diff_result["success"]:
-            diff_text = diff_result["output"]
-        else:
-            diff_text = ""
+    limiter = asyncio.Semaphore(_MAX_CONCURRENT_DIFFS)
+
+    async def _diff(change_id: str) -> str:
+        commit_id = commit_ids.get(change_id, "")
+        cached = cache.get(change_id)
+        if cached is not None and commit_id and cached[0] == commit_id:
+            return cached[1]
+        async with limiter:
+            diff_result = await jj_diff(revision=change_id, cwd=cwd)
+        if not diff_result["success"]:
             logger.debug(
                 "run_semantic_pass_diff_capture_failed",
                 change_id=change_id,
                 error=diff_result["error"],
             )
-        pairs.append((change_id, diff_text))
-    return tuple(pairs)
+            return ""
+        cache[change_id] = (commit_id, diff_result["output"])
+        return diff_result["output"]
+
+    diffs = await asyncio.gather(*(_diff(change_id) for change_id in change_ids))
+    return tuple(zip(change_ids, diffs, strict=True))
+
+
+async def _refresh_commit_ids(
+    jj_client: JjClient,
+    revset: str,
+    commit_ids: dict[str, str],
+    entry_id: str,
+) -> None:
+    """Re-read descendant commit ids after fixes, in one ``jj log`` call.
+
+    Fixes rewrite the descendant they fold into and everything above it, so
+    their cached diffs stop matching. On failure every commit id is
+    forgotten, which forces the next round to re-diff.
+    """
+    try:
+        log_result = await jj_client.log(revset=revset, limit=1000)
+    except (JjError, OSError) as exc:
+        logger.debug("run_semantic_pass_refresh_failed", entry_id=entry_id, error=str(exc))
+        commit_ids.clear()
+        return
+    commit_ids.clear()
+    commit_ids.update({change.change_id: change.commit_id for change in log_result.changes})
 
 
 async def _apply_fix(
@@ -5,6 +5,12 @@ driver and no flag to select one.
 
 Behaviour worth knowing before changing anything here:
 
+* **Detail batching.** :func:`_plan_detail_batches` packs pending units
+  into multi-unit ``detail`` requests by estimated token cost, keeping
+  units linked by ``depends_on`` adjacent, and never forming fewer
+  batches than there are pool workers. A batch gets one attempt at the
+  base tier; whatever it did not return is split in half and retried,
+  down to single units, which take the per-unit path below.
 * **Detail fan-out retries.** Per-unit budget is
   ``MAX_DETAIL_RETRIES = 1`` at the current tier, and a
   ``RuntimeTransientError`` spends it before escalating. Timeouts and
@@ -15,6 +21,14 @@ Behaviour worth knowing before changing anything here:
   built a distinct provider/model binding for. With no
   ``actors.refuel.decomposer.tiers`` configured the ladder is a single
   rung and nothing escalates, because there is nothing to escalate *to*.
+* **Hedging.** With a :class:`~maverick.hedging.Hedger` bound (opt-in,
+  ``parallel.hedging``), a briefing or detail request that outlasts the
+  phase's learned latency percentile gets a duplicate — detail requests
+  on the next ladder tier when there is one — and the loser is
+  cancelled and charged the key's mean cost against the hedge budget.
+  A cancelled decomposer rotates its session before reuse. Briefing has
+  only one call per role, so its straggler may hedge once its siblings
+  have finished even when ``min_samples`` asks for more.
 * **Quota.** A provider limit is not a model-quality problem, so it
   neither retries nor escalates: the first unit to hit one aborts the
   whole fan-out with :class:`ProviderQuotaError` rather than letting
@@ -36,12 +50,14 @@ from __future__ import annotations
 
 import asyncio
 import json
+import math
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from burr.core import State, action
 
+from maverick.event_bus import INTERIM_METADATA_KEY
 from maverick.events import (
     AgentCompleted,
     AgentStarted,
@@ -57,15 +73,20 @@ from maverick.payloads import (
     SupervisorInboxPayload,
     dump_supervisor_payload,
 )
+from maverick.prompt_cache import canonical_json
 from maverick.squadron.tiers import DEFAULT_TIER
+from maverick.utils.tokens import get_token_counter
 
 if TYPE_CHECKING:
     from maverick.agents.decomposer import DecomposerAgent
+    from maverick.hedging import HedgeLeg, Hedger
     from maverick.squadron.refuel import RefuelSquadron
 
 
 __all__ = [
     "BRIEFING_CONFIG",
+    "DEFAULT_DETAIL_BATCH_UNITS",
+    "DETAIL_BATCH_TOKEN_BUDGET",
     "MAX_DETAIL_RETRIES",
     "MAX_FIX_ROUNDS",
     "PARALLEL_BRIEFING_AGENTS",
@@ -86,6 +107,15 @@ _SOURCE = "refuel-burr"
 MAX_FIX_ROUNDS: int = 3
 MAX_DETAIL_RETRIES: int = 1
 
+#: Most units one detail request asks for (``1`` disables batching)
+DEFAULT_DETAIL_BATCH_UNITS: int = 4
+
+#: Estimated tokens (outline entry in, detail out) one detail request may carry
+DETAIL_BATCH_TOKEN_BUDGET: int = 8000
+
+#: Estimated output tokens of one unit's detail, on top of its outline entry
+_DETAIL_OUTPUT_TOKENS_PER_UNIT: int = 1500
+
 
 #: ``(agent_name, display_label, mcp_tool, role_key)`` tuples — same
 #: layout as the legacy ``REFUEL_BRIEFING_CONFIG``.
@@ -124,18 +154,38 @@ async def _run_one_briefing(
     squadron: RefuelSquadron,
     events: asyncio.Queue[ProgressEvent | None],
     provider_label: str,
+    leg: HedgeLeg | None = None,
 ) -> tuple[str, dict[str, Any]]:
     """Build one briefing agent, run it, emit AgentStarted/Completed.
 
+    ``leg`` reports the call's cost to the hedger it runs under; for the
+    hedged duplicate its row is labelled as such and its cost counts
+    against that hedger's budget.
+
     Returns ``(role_key, payload_dict)``.
     """
     schema = _schema_for(agent_name)
-    label = _LABEL_FOR[agent_name]
+    label = _LABEL_FOR[agent_name] + (" (hedge)" if leg is not None and leg.hedge else "")
     agent = squadron.build_briefing_agent(agent_name=agent_name, result_model=schema)
 
     await events.put(AgentStarted(step_name="briefing", agent_name=label, provider=provider_label))
     t0 = time.monotonic()
-    payload = await agent.brief(prompt)
+    try:
+        payload = await agent.brief(prompt)
+    except asyncio.CancelledError:
+        # The other leg of a hedged pair won; close out this row.
+        await events.put(
+            AgentCompleted(
+                step_name="briefing",
+                agent_name=label,
+                duration_seconds=time.monotonic() - t0,
+                success=False,
+                error="cancelled",
+            )
+        )
+        raise
+    if leg is not None:
+        leg.spent(agent.last_cost_record)
     await events.put(
         AgentCompleted(
             step_name="briefing",
@@ -431,12 +481,16 @@ async def parallel_briefings(
     events: asyncio.Queue[ProgressEvent | None],
     max_concurrent: int,
     cache_dir: str = "",
+    hedger: Hedger | None = None,
 ) -> tuple[dict[str, Any], State]:
     """Run navigator + structuralist + recon in parallel.
 
     Roles already present in ``briefs`` (seeded from cache by
     :func:`init_state`) are skipped — a cached brief is the same
-    evidence at zero cost.
+    evidence at zero cost. With a ``hedger``, a briefing that outlasts
+    its siblings gets a duplicate agent racing it. There is one briefing
+    per role, so the sample requirement is capped at the number of
+    siblings: otherwise the policy's default would never let one hedge.
     """
     provider_labels: dict[str, str] = state["provider_labels"]
     existing: dict[str, Any] = dict(state["briefs"])
@@ -450,16 +504,28 @@ async def parallel_briefings(
         )
         return {"briefs_collected": list(existing), "from_cache": True}, state
     sem = asyncio.Semaphore(max(1, max_concurrent))
+    siblings = len(pending) - 1
 
     async def _bounded(name: str) -> tuple[str, dict[str, Any]] | None:
+        async def _brief(leg: HedgeLeg | None = None) -> tuple[str, dict[str, Any]]:
+            return await _run_one_briefing(
+                agent_name=name,
+                prompt=state["briefing_prompt"],
+                squadron=squadron,
+                events=events,
+                provider_label=provider_labels.get(_LABEL_FOR[name], ""),
+                leg=leg,
+            )
+
         async with sem:
             try:
-                return await _run_one_briefing(
-                    agent_name=name,
-                    prompt=state["briefing_prompt"],
-                    squadron=squadron,
-                    events=events,
-                    provider_label=provider_labels.get(_LABEL_FOR[name], ""),
+                if hedger is None:
+                    return await _brief()
+                return await hedger.run(
+                    "briefing",
+                    lambda: _brief(hedger.leg("briefing")),
+                    hedge=lambda: _brief(hedger.leg("briefing", hedge=True)),
+                    min_samples=min(hedger.policy.min_samples, siblings),
                 )
             except Exception as exc:  # noqa: BLE001 — see _briefing_failed
                 await _briefing_failed(events, name, exc)
@@ -589,7 +655,12 @@ async def outline(
     Short-circuits when :func:`init_state` already seeded an outline from
     ``<cache_dir>/outline.json``. Otherwise persists the outline payload
     there after the agent returns. Cache failures are non-fatal.
+
+    Either way it first starts the pool's background prewarm of the
+    detail fan-out's starting tier, so those cold starts overlap the
+    outline pass.
     """
+    squadron.decomposer_pool.start_prewarm(_tier_ladder(squadron)[0])
     if state["outline"] is not None:
         cached_units = len(state["outline"].get("work_units", ()))
         await _put_output(
@@ -657,19 +728,26 @@ def _tier_ladder(squadron: RefuelSquadron) -> tuple[str, ...]:
     return ladder() or (_DEFAULT_TIER,)
 
 
-async def _run_one_detail(
+async def _request_details(
     *,
-    unit_id: str,
+    unit_ids: tuple[str, ...],
     decomposer: DecomposerAgent,
     retries_remaining: int,
     events: asyncio.Queue[ProgressEvent | None],
-) -> tuple[dict[str, Any] | None, str]:
-    """Run detail for a single unit with retry-on-timeout budget.
+    leg: HedgeLeg | None = None,
+) -> tuple[dict[str, dict[str, Any]], str]:
+    """Run detail for one or more units with retry-on-timeout budget.
 
-    Returns ``(detail_or_None, failure_kind)`` where ``failure_kind`` is
-    one of ``""`` (success), ``"timeout"``, ``"transient"``, or
-    ``"no_payload"``. ``transient`` lets the caller escalate to the
-    next tier; the others propagate up as abandon.
+    ``leg`` reports each completed send's cost to the hedger the request
+    runs under, and labels the hedged duplicate's row.
+
+    Returns ``(details_by_unit_id, failure_kind)`` where
+    ``failure_kind`` is one of ``""`` (every unit answered),
+    ``"timeout"``, ``"transient"``, or ``"no_payload"``. Units answered
+    by an attempt are kept even when a later one fails, and each retry
+    asks only for the units still missing. ``transient`` lets the
+    caller escalate to the next tier; the others propagate up as
+    abandon.
 
     Transient errors consume the same-tier retry budget before they are
     reported. They used to short-circuit it and rely on the escalation
@@ -680,17 +758,20 @@ async def _run_one_detail(
     """
     from airframe.errors import RuntimeBudgetExceededError, RuntimeTransientError
 
-    label = unit_id
+    label = unit_ids[0] if len(unit_ids) == 1 else f"{unit_ids[0]} (+{len(unit_ids) - 1})"
+    if leg is not None and leg.hedge:
+        label += " (hedge)"
     await events.put(AgentStarted(step_name="decompose", agent_name=label, provider=""))
     t0 = time.monotonic()
     attempts = retries_remaining + 1
-    last_payload: dict[str, Any] | None = None
+    found: dict[str, dict[str, Any]] = {}
     failure_kind = "no_payload"
     last_error: str | None = None
     try:
         for attempt in range(attempts):
+            missing = tuple(uid for uid in unit_ids if uid not in found)
             try:
-                payload = await decomposer.detail(unit_ids=(unit_id,))
+                payload = await decomposer.detail(unit_ids=missing)
             except TimeoutError:
                 if attempt + 1 >= attempts:
                     failure_kind = "timeout"
@@ -698,13 +779,13 @@ async def _run_one_detail(
                     break
                 continue
             except RuntimeBudgetExceededError as exc:
-                raise ProviderQuotaError(str(exc), agent_name=f"decomposer:{unit_id}") from exc
+                raise ProviderQuotaError(str(exc), agent_name=f"decomposer:{label}") from exc
             except RuntimeTransientError as exc:
                 # Some providers report a hard quota as a transient
                 # 429/5xx. Retrying or escalating that burns wall-clock
                 # against a limit that won't move until it resets.
                 if is_quota_error(str(exc)):
-                    raise ProviderQuotaError(str(exc), agent_name=f"decomposer:{unit_id}") from exc
+                    raise ProviderQuotaError(str(exc), agent_name=f"decomposer:{label}") from exc
                 failure_kind = "transient"
                 last_error = str(exc)
                 if attempt + 1 >= attempts:
@@ -715,16 +796,20 @@ async def _run_one_detail(
                     f"decomposer.detail returned {type(payload).__name__}, "
                     f"expected SubmitDetailsPayload"
                 )
+            if leg is not None:
+                leg.spent(decomposer.last_cost_record)
             payload_dict = dump_supervisor_payload(payload)
-            details = payload_dict.get("details", []) or []
-            matching = [d for d in details if (d.get("id") or d.get("unit_id")) == unit_id]
-            if matching:
-                last_payload = matching[0]
+            for detail in payload_dict.get("details", []) or []:
+                uid = detail.get("id") or detail.get("unit_id")
+                if uid in missing and uid not in found:
+                    found[uid] = detail
+            if len(found) == len(unit_ids):
                 failure_kind = ""
                 break
+            failure_kind = "no_payload"
             if attempt + 1 >= attempts:
                 break
-    except ProviderQuotaError as exc:
+    except (ProviderQuotaError, asyncio.CancelledError) as exc:
         # Close out the agent's progress row before unwinding, or the
         # UI leaves a spinner running for a unit that will never finish.
         await events.put(
@@ -733,7 +818,7 @@ async def _run_one_detail(
                 agent_name=label,
                 duration_seconds=time.monotonic() - t0,
                 success=False,
-                error=str(exc),
+                error=str(exc) or "cancelled",
             )
         )
         raise
@@ -743,11 +828,60 @@ async def _run_one_detail(
             step_name="decompose",
             agent_name=label,
             duration_seconds=time.monotonic() - t0,
-            success=last_payload is not None,
-            error=last_error if last_payload is None else None,
+            success=not failure_kind,
+            error=last_error if failure_kind else None,
         )
     )
-    return last_payload, failure_kind
+    return found, failure_kind
+
+
+async def _request_on_tier(
+    *,
+    tier: str,
+    unit_ids: tuple[str, ...],
+    retries_remaining: int,
+    squadron: RefuelSquadron,
+    events: asyncio.Queue[ProgressEvent | None],
+    hedger: Hedger | None = None,
+) -> tuple[dict[str, dict[str, Any]], str]:
+    """:func:`_request_details` on a pooled decomposer of ``tier``.
+
+    With a ``hedger``, a request that outlasts earlier ones of the same
+    size races a duplicate on the next ladder tier (or ``tier`` itself
+    at the top of the ladder); a result with every unit answered wins.
+    """
+
+    async def _attempt(
+        on_tier: str, leg: HedgeLeg | None = None
+    ) -> tuple[dict[str, dict[str, Any]], str]:
+        decomposer = await squadron.decomposer_pool.acquire(on_tier)
+        try:
+            return await _request_details(
+                unit_ids=unit_ids,
+                decomposer=decomposer,
+                retries_remaining=retries_remaining,
+                events=events,
+                leg=leg,
+            )
+        except asyncio.CancelledError:
+            # Cancelled mid-send: its next user starts on a fresh session.
+            decomposer.defer_rotation()
+            raise
+        finally:
+            await squadron.decomposer_pool.release(decomposer, on_tier)
+
+    if hedger is None:
+        return await _attempt(tier)
+    ladder = _tier_ladder(squadron)
+    rung = ladder.index(tier) + 1 if tier in ladder else len(ladder)
+    fallback = ladder[rung] if rung < len(ladder) else tier
+    key = f"detail/{len(unit_ids)}"
+    return await hedger.run(
+        key,
+        lambda: _attempt(tier, hedger.leg(key)),
+        hedge=lambda: _attempt(fallback, hedger.leg(key, hedge=True)),
+        accept=lambda outcome: not outcome[1],
+    )
 
 
 async def _run_detail_with_escalation(
@@ -756,6 +890,7 @@ async def _run_detail_with_escalation(
     squadron: RefuelSquadron,
     retries_remaining: int,
     events: asyncio.Queue[ProgressEvent | None],
+    hedger: Hedger | None = None,
 ) -> dict[str, Any] | None:
     """Run one unit's detail pass with per-unit tier escalation.
 
@@ -774,18 +909,16 @@ async def _run_detail_with_escalation(
     """
     ladder = _tier_ladder(squadron)
     for level, tier in enumerate(ladder):
-        decomposer = await squadron.decomposer_pool.acquire(tier)
-        try:
-            detail, failure = await _run_one_detail(
-                unit_id=unit_id,
-                decomposer=decomposer,
-                retries_remaining=retries_remaining,
-                events=events,
-            )
-        finally:
-            await squadron.decomposer_pool.release(decomposer, tier)
-        if detail is not None:
-            return detail
+        found, failure = await _request_on_tier(
+            tier=tier,
+            unit_ids=(unit_id,),
+            retries_remaining=retries_remaining,
+            squadron=squadron,
+            events=events,
+            hedger=hedger,
+        )
+        if unit_id in found:
+            return found[unit_id]
         if failure != "transient" or level + 1 >= len(ladder):
             return None
         next_tier = ladder[level + 1]
@@ -799,8 +932,96 @@ async def _run_detail_with_escalation(
     return None
 
 
+def _plan_detail_batches(
+    units: list[dict[str, Any]],
+    *,
+    max_units: int,
+    min_batches: int,
+    token_budget: int = DETAIL_BATCH_TOKEN_BUDGET,
+) -> list[tuple[str, ...]]:
+    """Pack outline *units* into detail requests.
+
+    Units linked by ``depends_on`` (directly or transitively) are laid
+    out next to each other — each group in the position of its first
+    unit, members in outline order — and then packed in that order, a
+    new batch starting whenever the next unit would push the current one
+    past *token_budget* estimated tokens or the per-batch unit cap. The
+    cap is *max_units*, lowered so that at least *min_batches* batches
+    form when there are enough units: batching must not idle pool
+    workers a one-unit-per-request fan-out would have used.
+
+    Args:
+        units: Outline work-unit dicts (``id``, optional ``depends_on``).
+        max_units: Most units per request.
+        min_batches: Batches to aim for at least (the pool size).
+        token_budget: Estimated-token ceiling per request; a unit over
+            it on its own still gets a batch.
+
+    Returns:
+        Unit-id tuples, in the order they should be dispatched.
+    """
+    if not units:
+        return []
+    cap = max(1, min(max_units, math.ceil(len(units) / max(1, min_batches))))
+
+    # Union-find over depends_on edges between the units being planned.
+    parent = {unit["id"]: unit["id"] for unit in units}
+
+    def _root(uid: str) -> str:
+        while parent[uid] != uid:
+            parent[uid] = parent[parent[uid]]
+            uid = parent[uid]
+        return uid
+
+    for unit in units:
+        for dep in unit.get("depends_on") or ():
+            if dep in parent:
+                parent[_root(dep)] = _root(unit["id"])
+    groups: dict[str, list[dict[str, Any]]] = {}
+    for unit in units:
+        groups.setdefault(_root(unit["id"]), []).append(unit)
+
+    counter = get_token_counter()
+    batches: list[tuple[str, ...]] = []
+    batch: list[str] = []
+    batch_cost = 0
+    for unit in (unit for group in groups.values() for unit in group):
+        cost = counter.approximate(json.dumps(unit, sort_keys=True))
+        cost += _DETAIL_OUTPUT_TOKENS_PER_UNIT
+        if batch and (len(batch) >= cap or batch_cost + cost > token_budget):
+            batches.append(tuple(batch))
+            batch, batch_cost = [], 0
+        batch.append(unit["id"])
+        batch_cost += cost
+    batches.append(tuple(batch))
+    return batches
+
+
+async def _run_detail_batch(
+    *,
+    unit_ids: tuple[str, ...],
+    squadron: RefuelSquadron,
+    events: asyncio.Queue[ProgressEvent | None],
+    hedger: Hedger | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Ask for several units' details in one request, once, at the base tier.
+
+    No retry and no escalation: the caller re-splits whatever is missing
+    from the result, and single units get both.
+    """
+    found, _failure = await _request_on_tier(
+        tier=_tier_ladder(squadron)[0],
+        unit_ids=unit_ids,
+        retries_remaining=0,
+        squadron=squadron,
+        events=events,
+        hedger=hedger,
+    )
+    return found
+
+
 @action(
-    reads=["outline", "cached_details"],
+    reads=["raw_content", "outline", "cached_details"],
     writes=["accumulated_details", "abandoned_unit_ids"],
 )
 async def detail_fan_out(
@@ -810,9 +1031,15 @@ async def detail_fan_out(
     events: asyncio.Queue[ProgressEvent | None],
     pool_size: int,
     cache_dir: str = "",
+    max_batch_units: int = DEFAULT_DETAIL_BATCH_UNITS,
+    hedger: Hedger | None = None,
 ) -> tuple[dict[str, Any], State]:
-    """Fan out per-unit detail requests across the decomposer pool.
+    """Fan out batched detail requests across the decomposer pool.
 
+    Pending units are packed into requests of up to ``max_batch_units``
+    by :func:`_plan_detail_batches`. Units a batch request does not
+    return are split in half and requested again, down to single units.
+    A ``hedger`` races duplicates against straggling requests.
     Per-unit retry budget is ``MAX_DETAIL_RETRIES`` at the current
     tier; transient failures escalate via
     :func:`_run_detail_with_escalation`. When ``cache_dir`` is set,
@@ -821,7 +1048,8 @@ async def detail_fan_out(
     partially-successful fan-out is recoverable — and units already
     present in ``cached_details`` are not requested again. Cache reuse
     is per unit, so a run that abandoned half its units re-requests only
-    those.
+    those. Every pool agent is seeded with the same canonical outline
+    JSON first, so all detail requests open with one cacheable prefix.
     """
     outline_dict = state["outline"]
     if outline_dict is None:
@@ -851,6 +1079,11 @@ async def detail_fan_out(
             state.update(accumulated_details=list(reused), abandoned_unit_ids=[]),
         )
 
+    await squadron.decomposer_pool.set_context(
+        outline_json=canonical_json(outline_dict),
+        flight_plan_content=state["raw_content"],
+        verification_properties="",
+    )
     await _put_output(events, "decompose", f"Requesting details for {len(pending_ids)} units")
     sem = asyncio.Semaphore(max(1, pool_size))
     accumulated: list[dict[str, Any]] = list(reused)
@@ -858,51 +1091,85 @@ async def detail_fan_out(
     lock = asyncio.Lock()
     details_dir = Path(cache_dir) / "details" if cache_dir else None
 
-    # Set by the first unit to hit a provider limit. Once it is set,
+    # Set by the first request to hit a provider limit. Once it is set,
     # every other in-flight and queued unit gives up immediately: the
     # limit is account-wide, so the remaining requests would each burn a
     # round-trip to be told the same thing.
     quota_error: ProviderQuotaError | None = None
 
-    async def _one(unit_id: str) -> None:
-        nonlocal quota_error
-        if quota_error is not None:
-            async with lock:
-                abandoned.append(unit_id)
+    async def _settle(details: dict[str, dict[str, Any]], failed: tuple[str, ...]) -> None:
+        async with lock:
+            accumulated.extend(details.values())
+            abandoned.extend(failed)
+            settled = len(accumulated) - len(reused) + len(abandoned)
+        if not details and not failed:
             return
-        async with sem:
-            if quota_error is not None:
-                async with lock:
-                    abandoned.append(unit_id)
-                return
-            try:
-                detail = await _run_detail_with_escalation(
-                    unit_id=unit_id,
-                    squadron=squadron,
-                    retries_remaining=MAX_DETAIL_RETRIES,
+        # Interim: the event bus keeps only the newest queued count.
+        await _put_output(
+            events,
+            "decompose",
+            f"Detail {settled}/{len(pending_ids)} complete",
+            metadata={INTERIM_METADATA_KEY: "detail_progress"},
+        )
+        if details_dir is not None:
+            for unit_id, detail in details.items():
+                await _write_cache_json(
+                    details_dir / f"{unit_id}.json",
+                    detail,
+                    kind=CACHE_KIND_DETAIL,
                     events=events,
+                    label=f"detail/{unit_id}",
                 )
-            except ProviderQuotaError as exc:
-                async with lock:
-                    if quota_error is None:
-                        quota_error = exc
-                    abandoned.append(unit_id)
-                return
-        async with lock:
-            if detail is None:
-                abandoned.append(unit_id)
-            else:
-                accumulated.append(detail)
-        if detail is not None and details_dir is not None:
-            await _write_cache_json(
-                details_dir / f"{unit_id}.json",
-                detail,
-                kind=CACHE_KIND_DETAIL,
-                events=events,
-                label=f"detail/{unit_id}",
+
+    async def _run(batch: tuple[str, ...]) -> None:
+        nonlocal quota_error
+        found: dict[str, dict[str, Any]] = {}
+        async with sem:
+            if quota_error is None:
+                try:
+                    if len(batch) == 1:
+                        detail = await _run_detail_with_escalation(
+                            unit_id=batch[0],
+                            squadron=squadron,
+                            retries_remaining=MAX_DETAIL_RETRIES,
+                            events=events,
+                            hedger=hedger,
+                        )
+                        if detail is not None:
+                            found[batch[0]] = detail
+                    else:
+                        found = await _run_detail_batch(
+                            unit_ids=batch, squadron=squadron, events=events, hedger=hedger
+                        )
+                except ProviderQuotaError as exc:
+                    async with lock:
+                        if quota_error is None:
+                            quota_error = exc
+        missing = tuple(uid for uid in batch if uid not in found)
+        if missing and len(batch) > 1 and quota_error is None:
+            # Retry at finer grain, down to the per-unit escalation path.
+            await _settle(found, ())
+            half = (len(missing) + 1) // 2
+            await asyncio.gather(
+                *(_run(part) for part in (missing[:half], missing[half:]) if part)
             )
+            return
+        await _settle(found, missing)
 
-    await asyncio.gather(*(_one(u) for u in pending_ids))
+    pending = set(pending_ids)
+    batches = _plan_detail_batches(
+        [u for u in outline_dict.get("work_units", []) if u.get("id") in pending],
+        max_units=max_batch_units,
+        min_batches=pool_size,
+    )
+    if len(batches) < len(pending_ids):
+        await _put_output(
+            events,
+            "decompose",
+            f"Batched {len(pending_ids)} units into {len(batches)} detail requests",
+            metadata={"batches": len(batches), "pending": len(pending_ids)},
+        )
+    await asyncio.gather(*(_run(batch) for batch in batches))
 
     if quota_error is not None:
         reset_hint = (
@@ -983,7 +1250,10 @@ async def validate(
     if outline_dict is None:
         raise RuntimeError("validate ran without an outline")
 
-    from maverick.library.actions.decompose import SCTraceabilityError
+    from maverick.library.actions.decompose import (
+        DecompositionGapsError,
+        SCTraceabilityError,
+    )
 
     specs = _merge_to_specs(outline_dict, state["accumulated_details"])
     # ``validate_decomposition`` returns a list of soft warnings on
@@ -995,8 +1265,10 @@ async def validate(
     #   can never be traced to one work unit, so failing on them sends
     #   the fix loop after a gap it cannot close. Recorded and shown,
     #   but does not fail validation.
-    # * Everything else (cycles, dangling depends_on, overloaded units)
-    #   — genuinely fixable, so it still fails and drives the fix loop.
+    # * Everything else (cycles, dangling depends_on, overloaded units,
+    #   scope conflicts) — genuinely fixable, so it still fails and
+    #   drives the fix loop. ``DecompositionGapsError`` carries every
+    #   such gap at once, so one fix round can close them all.
     gaps: list[str] = []
     advisory: list[str] = []
     try:
@@ -1007,6 +1279,9 @@ async def validate(
             expected_sc_refs=list(expected_sc_refs) if expected_sc_refs else None,
         )
         gaps = list(result)
+    except DecompositionGapsError as exc:
+        gaps = list(exc.gaps)
+        advisory = list(exc.untraced)
     except SCTraceabilityError as exc:
         advisory = list(exc.gaps)
     except ValueError as exc:
@@ -1082,9 +1357,14 @@ async def request_fix(
     await events.put(AgentStarted(step_name="decompose", agent_name=label, provider=""))
     t0 = time.monotonic()
     try:
+        # Untraced criteria never reach this slot (see ``validate``): what
+        # is left are structural gaps, or a field-validation error.
         payload = await decomposer.fix(
-            coverage_gaps=tuple(state["validation_warnings"]),
+            coverage_gaps=(),
             overloaded=(),
+            structural_gaps=tuple(state["validation_warnings"]),
+            outline_json=canonical_json(state["outline"]),
+            details_json=canonical_json({"details": state["accumulated_details"]}),
         )
     finally:
         await squadron.decomposer_pool.release(decomposer, _DEFAULT_TIER)
@@ -1217,15 +1497,18 @@ async def create_beads(
         for s in specs
     ]
 
+    extracted_deps = _extract_deps(specs)
+    # Dependencies ride along in the creation transaction; only a bd
+    # without ``--graph`` leaves them for a separate wiring pass.
     creation = await create_beads_action(
         epic_definition=epic_def,
         work_definitions=work_defs,
         cwd=CheckoutPath(Path(cwd)),
+        extracted_deps=json.dumps(extracted_deps) if extracted_deps else None,
     )
 
-    extracted_deps = _extract_deps(specs)
-    wire_result = None
-    if extracted_deps:
+    wired_deps: list[dict[str, Any]] = list(creation.dependencies or ())
+    if extracted_deps and creation.dependencies is None:
         wire_result = await wire_dependencies(
             work_definitions=work_defs,
             created_map=creation.created_map,
@@ -1233,10 +1516,10 @@ async def create_beads(
             extracted_deps=json.dumps(extracted_deps),
             cwd=CheckoutPath(Path(cwd)),
         )
+        wired_deps = list(wire_result.dependencies)
 
     epic_dict = creation.epic if isinstance(creation.epic, dict) else None
     epic_id = (epic_dict or {}).get("bd_id", "") if epic_dict else ""
-    wired_deps = list(getattr(wire_result, "dependencies", ()) or ()) if wire_result else []
 
     await _put_output(
         events,
@@ -36,6 +36,7 @@ from maverick.workflows.refuel_maverick import actions as refuel_actions
 
 if TYPE_CHECKING:
     from maverick.events import ProgressEvent
+    from maverick.hedging import Hedger
     from maverick.squadron.refuel import RefuelSquadron
 
 
@@ -81,9 +82,11 @@ def build_refuel_application(
     provider_labels: dict[str, str] | None = None,
     max_briefing_agents: int = 3,
     decomposer_pool_size: int = 3,
+    decomposer_batch_units: int = refuel_actions.DEFAULT_DETAIL_BATCH_UNITS,
     success_criteria_count: int = 0,
     expected_sc_refs: tuple[str, ...] = (),
     cache_dir: str = "",
+    hedger: Hedger | None = None,
 ) -> Any:
     """Build the ``Application`` for one refuel run.
 
@@ -108,6 +111,7 @@ def build_refuel_application(
                 events=event_queue,
                 max_concurrent=max_briefing_agents,
                 cache_dir=cache_dir,
+                hedger=hedger,
             ),
             contrarian_briefing=refuel_actions.contrarian_briefing.bind(
                 squadron=squadron,
@@ -128,6 +132,8 @@ def build_refuel_application(
                 events=event_queue,
                 pool_size=decomposer_pool_size,
                 cache_dir=cache_dir,
+                max_batch_units=decomposer_batch_units,
+                hedger=hedger,
             ),
             validate=refuel_actions.validate.bind(
                 events=event_queue,
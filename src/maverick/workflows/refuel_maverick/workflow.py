@@ -306,6 +306,7 @@ class RefuelMaverickWorkflow(PythonWorkflow):
             codebase_context = await gather_codebase_context(
                 in_scope=flight_plan.scope.in_scope,
                 cwd=cwd,
+                reference_text=f"{flight_plan.objective}\n{flight_plan.context}",
             )
         except Exception as exc:
             await self.emit_step_failed(GATHER_CONTEXT, str(exc))
@@ -897,7 +898,9 @@ class RefuelMaverickWorkflow(PythonWorkflow):
         """
         from maverick.agents.briefing.prompts import build_briefing_prompt
         from maverick.burr import BurrWorkflowDriver
+        from maverick.event_bus import ProgressEventBus
         from maverick.events import ProgressEvent
+        from maverick.hedging import Hedger
         from maverick.squadron.refuel import RefuelSquadron
         from maverick.workflows.fly_beads.workflow import _cost_sink_for_cwd
         from maverick.workflows.refuel_maverick.burr_graph import (
@@ -925,10 +928,11 @@ class RefuelMaverickWorkflow(PythonWorkflow):
             config=self._config,
             cost_sink=cost_sink,
             decomposer_pool_cap=self._config.parallel.decomposer_pool_size,
+            decomposer_prewarm=self._config.parallel.decomposer_prewarm,
         ) as squadron:
             # ``decomposer_tiers`` is resolved from config inside the
             # squadron; nothing to thread here.
-            event_queue: asyncio.Queue[ProgressEvent | None] = asyncio.Queue()
+            event_queue: asyncio.Queue[ProgressEvent | None] = ProgressEventBus()
             # Per-plan refuel cache under
             # ``<cwd>/.maverick/plans/<plan>/refuel-cache/`` so a
             # later resume can read the raw artifacts. The actions
@@ -940,6 +944,8 @@ class RefuelMaverickWorkflow(PythonWorkflow):
             # not found, which is the correct outcome: they belong to a
             # directory with no flight plan in it.
             cache_dir = str(plan_dir / "refuel-cache")
+            hedge_policy = self._config.parallel.hedging.to_policy()
+            hedger = Hedger(hedge_policy) if hedge_policy is not None else None
             app = build_refuel_application(
                 squadron=squadron,
                 event_queue=event_queue,
@@ -955,6 +961,8 @@ class RefuelMaverickWorkflow(PythonWorkflow):
                 provider_labels={},
                 max_briefing_agents=self._config.parallel.max_briefing_agents,
                 decomposer_pool_size=self._config.parallel.decomposer_pool_size,
+                decomposer_batch_units=self._config.parallel.decomposer_batch_units,
+                hedger=hedger,
                 success_criteria_count=sc_count,
                 expected_sc_refs=sc_refs,
                 cache_dir=cache_dir,
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
 
     from maverick.jj.client import JjClient
     from maverick.workspace.models import IsolationPolicy, UnitOfWork
+    from maverick.workspace.pool import WorkspacePool
 
 __all__ = ["provision", "sweep", "teardown", "workspace_dir", "workspace_root"]
 
@@ -46,6 +47,7 @@ async def provision(
     policy: IsolationPolicy,
     unit: UnitOfWork,
     jj_client: JjClient,
+    pool: WorkspacePool | None = None,
 ) -> Path:
     """Create, reuse, or recreate the workspace for *unit*.
 
@@ -61,6 +63,9 @@ async def provision(
         unit: The unit being provisioned for — ``unit.key`` names the
             workspace directory and the jj workspace itself.
         jj_client: Injected :class:`JjClient` bound to *checkout*.
+        pool: Optional :class:`~maverick.workspace.pool.WorkspacePool`; a
+            ready workspace is claimed from it instead of running
+            ``workspace_add`` when one is idle.
 
     Returns:
         The resolved workspace directory path.
@@ -96,13 +101,17 @@ async def provision(
                 workspace_path=str(workspace_path),
             ) from exc
 
-        try:
-            await jj_client.workspace_add(workspace_path, revision="@")
-        except (JjError, OSError) as exc:
-            raise IsolationProvisioningError(
-                f"could not isolate: failed to create workspace at {workspace_path}: {exc}",
-                workspace_path=str(workspace_path),
-            ) from exc
+        pooled = pool is not None and await pool.claim(unit) is not None
+        if not pooled:
+            try:
+                await jj_client.workspace_add(workspace_path, revision="@")
+            except (JjError, OSError) as exc:
+                raise IsolationProvisioningError(
+                    f"could not isolate: failed to create workspace at {workspace_path}: {exc}",
+                    workspace_path=str(workspace_path),
+                ) from exc
+    else:
+        pooled = False
 
     await asyncio.to_thread(_seed_inputs, workspace_path, unit.seed_inputs)
 
@@ -112,6 +121,7 @@ async def provision(
         workflow=policy.workflow,
         workspace_path=str(workspace_path),
         reused=reused,
+        pooled=pooled,
     )
     return workspace_path
 
@@ -139,6 +149,7 @@ async def teardown(
     policy: IsolationPolicy,
     unit: UnitOfWork,
     jj_client: JjClient,
+    pool: WorkspacePool | None = None,
 ) -> None:
     """Un-register and delete *unit*'s workspace.
 
@@ -154,11 +165,17 @@ async def teardown(
         policy: This run's :class:`IsolationPolicy`.
         unit: The unit whose workspace is being torn down.
         jj_client: Injected :class:`JjClient` bound to *checkout*.
+        pool: Optional :class:`~maverick.workspace.pool.WorkspacePool` that
+            gets first refusal of the workspace. Pass it only for a unit
+            that succeeded.
     """
     workspace_path = workspace_dir(
         root=policy.root, checkout=checkout, workflow=policy.workflow, key=unit.key
     )
 
+    if pool is not None and await pool.release(unit):
+        return
+
     try:
         await jj_client.workspace_forget(workspace_path.name)
     except Exception as exc:  # noqa: BLE001 — cleanup must never sink a completed unit
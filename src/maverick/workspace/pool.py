@@ -0,0 +1,235 @@
+"""Warm pool of pre-provisioned workspaces.
+
+``jj workspace add`` materializes a full working copy, which on a large
+repository takes long enough to dominate a short unit. A
+:class:`WorkspacePool` creates workspaces ahead of time, in the background,
+under reserved ``_pool-*`` names beside the per-unit ones; claiming one for
+a unit is a rename plus a ``jj new`` onto the checkout's current working
+copy commit, and a unit that succeeded hands its workspace back instead of
+deleting it.
+
+A claimed workspace is exactly as clean as a fresh one as far as jj is
+concerned — ``jj new`` starts an empty change on the checkout's ``@`` and
+the previous (empty, already folded-back) change is discarded. Gitignored
+files a previous unit produced (build output, caches) do survive; that is
+the point of keeping the working copy warm. A unit that failed never goes
+back to the pool.
+
+Idle pool workspaces outlive the run so the next one starts warm;
+:meth:`WorkspacePool.start` adopts them (tearing down any beyond ``size``),
+and a session without a pool sweeps them like any other abandoned
+workspace.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from maverick.exceptions import JjError
+from maverick.jj.client import JjClient
+from maverick.logging import get_logger
+from maverick.workspace.lifecycle import teardown, workspace_dir, workspace_root
+
+if TYPE_CHECKING:
+    from maverick.workspace.models import IsolationPolicy, UnitOfWork
+
+__all__ = ["POOL_KEY_PREFIX", "WorkspacePool"]
+
+logger = get_logger(__name__)
+
+#: Key (directory and jj workspace name) prefix of idle pool workspaces
+POOL_KEY_PREFIX = "_pool-"
+
+
+class WorkspacePool:
+    """Keeps up to ``size`` idle workspaces ready for :meth:`claim`.
+
+    Args:
+        checkout: The user's checkout (source of every workspace).
+        policy: The run's :class:`IsolationPolicy`; pool workspaces live
+            under the same ``root/<project>/<workflow>/`` directory.
+        jj_client: :class:`JjClient` bound to *checkout*.
+        size: Idle workspaces to keep ready (``0`` disables the pool).
+    """
+
+    def __init__(
+        self,
+        *,
+        checkout: Path,
+        policy: IsolationPolicy,
+        jj_client: JjClient,
+        size: int,
+    ) -> None:
+        self._checkout = checkout
+        self._policy = policy
+        self._jj_client = jj_client
+        self._size = size
+        self._idle: list[str] = []
+        self._creating = 0
+        self._fill_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Target number of idle workspaces."""
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        """Idle workspaces ready to be claimed right now."""
+        return len(self._idle)
+
+    async def start(self) -> None:
+        """Adopt idle workspaces left by an earlier run, then fill in the background.
+
+        Adopted workspaces beyond ``size`` are torn down (the pool shrinks
+        when its configured size does).
+        """
+        root = workspace_root(
+            root=self._policy.root, checkout=self._checkout, workflow=self._policy.workflow
+        )
+
+        def _leftovers() -> list[str]:
+            if not root.is_dir():
+                return []
+            return sorted(
+                p.name for p in root.iterdir() if p.is_dir() and p.name.startswith(POOL_KEY_PREFIX)
+            )
+
+        for key in await asyncio.to_thread(_leftovers):
+            if len(self._idle) < self._size:
+                self._idle.append(key)
+            else:
+                await self._discard(key)
+        self._schedule_fill()
+
+    async def close(self) -> None:
+        """Stop filling. Idle workspaces stay on disk for the next run."""
+        self._closed = True
+        if self._fill_task is not None:
+            self._fill_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._fill_task
+            self._fill_task = None
+
+    async def claim(self, unit: UnitOfWork) -> Path | None:
+        """Hand an idle workspace to *unit*, positioned on the checkout's ``@``.
+
+        The workspace is moved to *unit*'s directory and renamed to its key,
+        so every other lifecycle call finds it where a freshly provisioned
+        one would be. The caller must already have cleared any stale
+        workspace for *unit*.
+
+        Returns:
+            The workspace path, or ``None`` when no idle workspace is ready
+            (or preparing one failed) — the caller provisions normally.
+        """
+        if not self._idle:
+            self._schedule_fill()
+            return None
+        key = self._idle.pop()
+        self._schedule_fill()
+
+        source = self._dir(key)
+        target = self._dir(unit.key)
+        try:
+            await asyncio.to_thread(os.rename, source, target)
+        except OSError as exc:
+            logger.warning("isolation_pool_claim_failed", pool_key=key, error=str(exc))
+            await self._discard(key)
+            return None
+
+        try:
+            workspace_client = JjClient(cwd=target)
+            # An idle workspace goes stale whenever the repo moves on.
+            with contextlib.suppress(JjError):
+                await workspace_client.workspace_update_stale()
+            await workspace_client.workspace_rename(unit.key)
+            head = await self._jj_client.log(revset="@", limit=1)
+            await workspace_client.new(parents=[head.changes[0].commit_id])
+        except (JjError, OSError, IndexError) as exc:
+            logger.warning("isolation_pool_claim_failed", pool_key=key, error=str(exc))
+            await teardown(
+                checkout=self._checkout, policy=self._policy, unit=unit, jj_client=self._jj_client
+            )
+            # The jj registration may still carry the pool name.
+            with contextlib.suppress(JjError):
+                await self._jj_client.workspace_forget(key)
+            return None
+
+        logger.info(
+            "isolation_pool_claimed",
+            unit_key=unit.key,
+            pool_key=key,
+            idle=len(self._idle),
+        )
+        return target
+
+    async def release(self, unit: UnitOfWork) -> bool:
+        """Take *unit*'s workspace back into the pool after a successful unit.
+
+        Returns:
+            True if the pool kept it; False if the pool is full, closed, or
+            the workspace could not be renamed — the caller tears it down.
+        """
+        if self._closed or len(self._idle) + self._creating >= self._size:
+            return False
+        key = f"{POOL_KEY_PREFIX}{uuid.uuid4().hex[:8]}"
+        source = self._dir(unit.key)
+        try:
+            await JjClient(cwd=source).workspace_rename(key)
+        except (JjError, OSError) as exc:
+            logger.debug("isolation_pool_release_failed", unit_key=unit.key, error=str(exc))
+            return False
+        try:
+            await asyncio.to_thread(os.rename, source, self._dir(key))
+        except OSError as exc:
+            logger.debug("isolation_pool_release_failed", unit_key=unit.key, error=str(exc))
+            await self._discard(key, path=source)
+            return True  # already un-registered under the unit's name; nothing left to tear down
+        self._idle.append(key)
+        logger.info("isolation_pool_released", unit_key=unit.key, pool_key=key)
+        return True
+
+    def _dir(self, key: str) -> Path:
+        return workspace_dir(
+            root=self._policy.root,
+            checkout=self._checkout,
+            workflow=self._policy.workflow,
+            key=key,
+        )
+
+    def _schedule_fill(self) -> None:
+        if self._closed or self._size == 0:
+            return
+        if self._fill_task is None or self._fill_task.done():
+            self._fill_task = asyncio.create_task(self._fill())
+
+    async def _fill(self) -> None:
+        """Create workspaces until ``size`` are idle, one at a time."""
+        while not self._closed and len(self._idle) + self._creating < self._size:
+            key = f"{POOL_KEY_PREFIX}{uuid.uuid4().hex[:8]}"
+            self._creating += 1
+            try:
+                await self._jj_client.workspace_add(self._dir(key), revision="@")
+            except (JjError, OSError) as exc:
+                logger.warning("isolation_pool_fill_failed", pool_key=key, error=str(exc))
+                await self._discard(key)
+                return
+            finally:
+                self._creating -= 1
+            self._idle.append(key)
+            logger.debug("isolation_pool_filled", pool_key=key, idle=len(self._idle))
+
+    async def _discard(self, key: str, *, path: Path | None = None) -> None:
+        """Forget and delete a pool workspace (best-effort)."""
+        with contextlib.suppress(JjError):
+            await self._jj_client.workspace_forget(key)
+        with contextlib.suppress(OSError):
+            await asyncio.to_thread(shutil.rmtree, path or self._dir(key))
@@ -24,6 +24,7 @@ from maverick.logging import get_logger
 from maverick.workspace import foldback, journal, lifecycle
 from maverick.workspace.journal import ApplicationRecord
 from maverick.workspace.models import FoldBackOutcome, IsolationLease
+from maverick.workspace.pool import POOL_KEY_PREFIX
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Callable, Container
@@ -36,6 +37,7 @@ if TYPE_CHECKING:
         IsolationPolicy,
         UnitOfWork,
     )
+    from maverick.workspace.pool import WorkspacePool
 
 __all__ = [
     "IsolationSession",
@@ -125,6 +127,7 @@ class IsolationSession:
         run_id: str,
         now: Callable[[], datetime],
         home: Path | None = None,
+        pool: WorkspacePool | None = None,
     ) -> None:
         self._checkout = checkout
         self._policy = policy
@@ -132,6 +135,7 @@ class IsolationSession:
         self._run_id = run_id
         self._now = now
         self._home = home
+        self._pool = pool
         #: Workspaces this session registered that have not been released
         #: yet, keyed by resolved root. `lease()` keeps this empty by
         #: construction; a consumer driving `provision`/`teardown` across
@@ -140,6 +144,11 @@ class IsolationSession:
         #: mid-unit, and `__aexit__` is where those get cleaned up.
         self._live_units: dict[Path, UnitOfWork] = {}
 
+    @property
+    def pool(self) -> WorkspacePool | None:
+        """The warm :class:`WorkspacePool` units are provisioned from, if any."""
+        return self._pool
+
     async def __aenter__(self) -> IsolationSession:
         """Acquire this checkout's run-scoped exclusivity (contract C1) and
         refuse on a stale, uncleared application journal (contract C2).
@@ -264,6 +273,7 @@ class IsolationSession:
             policy=self._policy,
             unit=unit,
             jj_client=self._jj_client,
+            pool=self._pool,
         )
         lease = IsolationLease(
             unit=unit,
@@ -289,6 +299,7 @@ class IsolationSession:
                     policy=self._policy,
                     unit=unit,
                     jj_client=self._jj_client,
+                    pool=None if failed else self._pool,
                 )
 
     async def fold_back(
@@ -420,10 +431,26 @@ class IsolationSession:
 
     async def sweep(self, *, keep: Container[str]) -> None:
         """Collect this checkout's abandoned workspaces under this
-        workflow. See contract C7."""
+        workflow. See contract C7.
+
+        Idle pool workspaces are left alone when this session has a pool —
+        :meth:`WorkspacePool.start` adopts (or trims) them instead.
+        """
         await lifecycle.sweep(
             checkout=self._checkout,
             policy=self._policy,
             jj_client=self._jj_client,
-            keep=keep,
+            keep=keep if self._pool is None else _KeepPooled(keep),
         )
+
+
+class _KeepPooled:
+    """``sweep`` keep-set that also spares every idle pool workspace."""
+
+    __slots__ = ("_keep",)
+
+    def __init__(self, keep: Container[str]) -> None:
+        self._keep = keep
+
+    def __contains__(self, key: object) -> bool:
+        return (isinstance(key, str) and key.startswith(POOL_KEY_PREFIX)) or key in self._keep
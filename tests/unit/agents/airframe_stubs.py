@@ -26,7 +26,8 @@ actor shell:
 
 Each stub exposes:
 
-* ``open()`` / ``close()`` / ``rotate_session()`` — recorded but no-op.
+* ``open()`` / ``close()`` / ``rotate_session()`` / ``defer_rotation()`` —
+  recorded but no-op.
 * Domain methods (``implement``, ``review``, ``brief``, etc.) — pop from
   the corresponding canned list, or raise ``raise_error`` when set.
 * ``calls`` — chronological record of method invocations
@@ -76,6 +77,7 @@ class StubAgentBase:
         self.open_calls = 0
         self.close_calls = 0
         self.rotate_calls = 0
+        self.last_cost_record: Any = None
         # Setting this makes the next domain call raise this exception.
         self.raise_error: BaseException | None = None
 
@@ -95,6 +97,9 @@ class StubAgentBase:
             err, self.raise_error = self.raise_error, None
             raise err
 
+    def defer_rotation(self) -> None:
+        self.rotate_calls += 1
+
     async def __aenter__(self) -> StubAgentBase:
         await self.open()
         return self
@@ -178,12 +183,16 @@ class StubReviewerAgent(StubAgentBase):
         bead_description: str,
         work_unit_md: str,
         briefing_context: str = "",
+        shared_context: str | None = None,
+        runway_included: bool = False,
     ) -> SubmitReviewPayload:
         self._record(
             "review",
             bead_description=bead_description,
             work_unit_md=work_unit_md,
             briefing_context=briefing_context,
+            shared_context=shared_context,
+            runway_included=runway_included,
         )
         self._maybe_raise()
         return self._pop(self.review_payloads, "review")
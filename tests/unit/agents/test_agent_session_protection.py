@@ -187,6 +187,52 @@ class TestRotateSessionClosesAndReopens:
         assert runtime.session_calls == []
 
 
+class TestDeferRotation:
+    async def test_deferred_rotation_runs_on_next_send_only(
+        self, policy: ProtectionPolicy
+    ) -> None:
+        runtime = _FakeRuntime(supports_permission_callback=True)
+        agent = Agent(runtime=runtime, cwd="/tmp", protection_policy=policy)
+        await agent.open()
+
+        agent.defer_rotation()
+        agent.defer_rotation()
+        assert len(runtime.sessions) == 1
+
+        await agent._execute_text_via_runtime("go")
+
+        assert runtime.sessions[0].closed is True
+        assert len(runtime.sessions) == 2
+        assert runtime.sessions[1].execute_calls[0]["prompt"] == "go"
+
+        await agent._execute_text_via_runtime("again")
+        assert len(runtime.sessions) == 2
+
+    async def test_deferred_rotation_without_policy_resets_runtime(self) -> None:
+        runtime = _FakeRuntime()
+        agent = Agent(runtime=runtime, cwd="/tmp")
+        await agent.open()
+
+        agent.defer_rotation()
+        assert runtime.reset_calls == 0
+        await agent._execute_text_via_runtime("go")
+
+        assert runtime.reset_calls == 1
+
+    async def test_explicit_rotate_satisfies_a_pending_deferral(
+        self, policy: ProtectionPolicy
+    ) -> None:
+        runtime = _FakeRuntime(supports_permission_callback=True)
+        agent = Agent(runtime=runtime, cwd="/tmp", protection_policy=policy)
+        await agent.open()
+
+        agent.defer_rotation()
+        await agent.rotate_session()
+        await agent._execute_text_via_runtime("go")
+
+        assert len(runtime.sessions) == 2
+
+
 class TestRebindProtection:
     """057-isolated-bead-workspaces: re-rooting an agent's protection at a
     new policy between beads (isolated `maverick fly`, research.md R11) —
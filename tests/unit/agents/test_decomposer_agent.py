@@ -211,3 +211,38 @@ async def test_detail_rotates_session_on_mode_change_from_outline() -> None:
 
     runtime.reset.assert_awaited()
     assert agent._session_mode == "detail"  # noqa: SLF001
+
+
+async def _detail_call(runtime: Any, unit_id: str) -> Any:
+    agent = DecomposerAgent(runtime=runtime, cwd="/tmp")
+    await agent.set_context(
+        outline_json='{"work_units": []}',
+        flight_plan_content="plan",
+        verification_properties="",
+    )
+    async with agent:
+        await agent.detail(unit_ids=[unit_id])
+    return runtime.execute.await_args
+
+
+async def test_detail_requests_over_one_outline_share_a_cache_key() -> None:
+    runtime = _make_runtime(_details_payload())
+    runtime.supports = MagicMock(return_value=True)
+
+    first = await _detail_call(runtime, "u-1")
+    second = await _detail_call(runtime, "u-2")
+
+    key = first.kwargs["cache"].key
+    assert key.startswith("maverick.decompose.maverick.decomposer:")
+    assert second.kwargs["cache"].key == key
+    prompt = first.args[0]
+    assert prompt.index("## Full Outline") < prompt.index('"u-1"')
+
+
+async def test_cache_key_is_not_sent_without_runtime_support() -> None:
+    runtime = _make_runtime(_details_payload())
+    runtime.supports = MagicMock(return_value=False)
+
+    call = await _detail_call(runtime, "u-1")
+
+    assert "cache" not in call.kwargs
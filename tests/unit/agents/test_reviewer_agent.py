@@ -91,6 +91,38 @@ async def test_review_first_round_includes_full_context() -> None:
     assert "Pre-Flight Briefing" in prompt
 
 
+async def test_review_shared_context_sent_inline() -> None:
+    runtime = _make_runtime(_approved_payload())
+    async with _make_agent(runtime) as agent:
+        await agent.review(
+            bead_description="bead text",
+            work_unit_md=None,
+            briefing_context=None,
+            shared_context="### Diff Summary\n\n src/a.py | 3 ++-",
+        )
+    prompt = runtime.execute.await_args.args[0]
+    assert "Shared Review Context" in prompt
+    assert "src/a.py | 3" in prompt
+    # Only a diff summary: the reviewer still has to read the runway.
+    assert "already included" not in prompt
+    assert "episodic/review-findings.jsonl" in prompt
+
+
+async def test_review_runway_hint_only_when_runway_included() -> None:
+    runtime = _make_runtime(_approved_payload())
+    async with _make_agent(runtime) as agent:
+        await agent.review(
+            bead_description="bead text",
+            work_unit_md=None,
+            briefing_context=None,
+            shared_context="### Runway History\n\n- prior finding",
+            runway_included=True,
+        )
+    prompt = runtime.execute.await_args.args[0]
+    assert "already included below; do not re-read it" in prompt
+    assert ".maverick/runway/semantic/" in prompt
+
+
 async def test_review_subsequent_round_sends_short_followup() -> None:
     runtime = _make_runtime(_approved_payload())
     async with _make_agent(runtime) as agent:
@@ -150,6 +182,28 @@ async def test_rotate_session_resets_review_count() -> None:
     assert "Work Unit Specification" in runtime.execute.await_args_list[1].args[0]
 
 
+async def test_defer_rotation_resets_review_count_before_next_review() -> None:
+    runtime = _make_runtime(_approved_payload())
+    async with _make_agent(runtime) as agent:
+        await agent.review(
+            bead_description="bead",
+            work_unit_md="md",
+            briefing_context=None,
+        )
+        agent.defer_rotation()
+        for _ in range(2):
+            await agent.review(
+                bead_description="bead",
+                work_unit_md="md",
+                briefing_context=None,
+            )
+    assert "Work Unit Specification" in runtime.execute.await_args_list[1].args[0]
+    # The deferred rotation runs inside round 1 and must not reset the count.
+    follow_up = runtime.execute.await_args_list[2].args[0]
+    assert "previous findings were addressed" in follow_up
+    runtime.reset.assert_awaited_once()
+
+
 async def test_aggregate_rotates_session_first() -> None:
     runtime = _make_runtime(_approved_payload())
     async with _make_agent(
@@ -195,3 +249,21 @@ async def test_persona_forwarded_in_send() -> None:
             briefing_context=None,
         )
     assert runtime.execute.await_args.kwargs["persona"] == "maverick.completeness-reviewer"
+
+
+def test_review_prompt_static_section_ignores_shared_context() -> None:
+    from maverick.prompt_cache import Stability
+
+    agent = _make_agent(_make_runtime(_approved_payload()))
+    agent._review_count = 1  # noqa: SLF001
+
+    def _static(shared: str | None) -> list[str]:
+        layout = agent._build_review_prompt(  # noqa: SLF001
+            bead_description="bead",
+            work_unit_md="md",
+            briefing_context=None,
+            shared_context=shared,
+        )
+        return [s.text for s in layout.sections if s.stability is Stability.STATIC]  # type: ignore[union-attr]
+
+    assert _static("src/a.py | 3") == _static(None)
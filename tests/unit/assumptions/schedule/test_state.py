@@ -26,6 +26,7 @@ from maverick.assumptions.models import (
     AssumptionRecord,
     AssumptionReportEntry,
     Severity,
+    SweptBead,
 )
 from maverick.assumptions.schedule.evaluate import evaluate
 from maverick.assumptions.schedule.models import DecisionKind
@@ -33,16 +34,20 @@ from maverick.assumptions.schedule.state import (
     DeliveryRecord,
     DeliveryState,
     DeliveryStateSchemaError,
+    EntrySnapshot,
     EntryTrackingRecord,
     TerminalOutcome,
     WindowDecisionRecord,
     acquire_lock,
     finalize_state,
+    known_beads,
     load_state,
     prune,
+    record_sweep,
     release_lock,
     save_state,
 )
+from maverick.beads.models import BeadDetails
 from maverick.config import AssumptionScheduleConfig
 
 
@@ -723,3 +728,63 @@ class TestFinalizeStatePrunesSurvivingState:
         result = finalize_state(outcome=outcome, prior_state=prior, failed_indices=(), now=_NOW)
 
         assert "mav-old" not in result.entry_tracking
+
+
+class TestEntrySnapshots:
+    """The ledger-sweep cache persisted between ``maverick notify`` runs."""
+
+    _NOW = datetime(2026, 8, 5, 13, 0, tzinfo=UTC)
+
+    def _state(self, evaluated_at: str) -> DeliveryState:
+        details = BeadDetails(id="mav-abc", title="Assumption: abc", labels=["assumption"])
+        return DeliveryState(
+            updated_at="2026-08-05T12:00:00Z",
+            entry_snapshots={
+                "mav-abc": EntrySnapshot(
+                    fingerprint="open@2026-08-05T10:00:00Z",
+                    evaluated_at=evaluated_at,
+                    details=details.model_dump(mode="json"),
+                ),
+                "mav-task": EntrySnapshot(
+                    fingerprint="closed@2026-08-01T00:00:00Z",
+                    evaluated_at=evaluated_at,
+                ),
+            },
+        )
+
+    def test_known_beads_rebuilds_details(self) -> None:
+        known = known_beads(self._state("2026-08-05T12:00:00Z"), self._NOW)
+
+        assert known["mav-abc"].details == BeadDetails(
+            id="mav-abc", title="Assumption: abc", labels=["assumption"]
+        )
+        assert known["mav-task"] == SweptBead(
+            fingerprint="closed@2026-08-01T00:00:00Z", details=None
+        )
+
+    def test_known_beads_drops_stale_watermarks(self) -> None:
+        assert known_beads(self._state("2026-08-04T12:00:00Z"), self._NOW) == {}
+        assert known_beads(self._state("not-a-timestamp"), self._NOW) == {}
+
+    def test_record_sweep_keeps_watermark_of_reused_beads_only(self) -> None:
+        state = self._state("2026-08-05T12:00:00Z")
+        known = known_beads(state, self._NOW)
+        swept = {
+            "mav-abc": known["mav-abc"],
+            "mav-task": SweptBead(fingerprint="open@2026-08-05T12:30:00Z", details=None),
+            "mav-new": SweptBead(fingerprint=None, details=None),
+        }
+
+        recorded = record_sweep(state, swept, known, self._NOW).entry_snapshots
+
+        assert recorded["mav-abc"] == state.entry_snapshots["mav-abc"]
+        assert recorded["mav-task"].evaluated_at == "2026-08-05T13:00:00Z"
+        # No fingerprint, nothing to compare against next run.
+        assert "mav-new" not in recorded
+
+    async def test_snapshots_round_trip(self, tmp_path: Path) -> None:
+        state = self._state("2026-08-05T12:00:00Z")
+
+        await save_state(state, tmp_path)
+
+        assert await load_state(tmp_path) == state
@@ -11,6 +11,7 @@ from maverick.assumptions.ledger import (
     open_blocking_entries,
     open_high_entries_before,
     report_entries,
+    sweep_ledger,
 )
 from maverick.assumptions.models import (
     ASSUMPTION_LABEL,
@@ -22,6 +23,7 @@ from maverick.assumptions.models import (
     STATUS_ANSWERED,
     STATUS_OPEN,
     Severity,
+    SweptBead,
 )
 from maverick.beads.client import BeadClient
 from maverick.beads.models import BeadDetails, BeadSummary
@@ -251,3 +253,64 @@ class TestReportEntriesCreatedAt:
         assert len(result) == 1
         assert result[0].record.is_legacy is True
         assert result[0].record.created_at == "2026-08-01T00:00:00Z"
+
+
+class TestSweepLedger:
+    """``sweep_ledger`` re-shows only beads whose fingerprint changed."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_unchanged_beads_and_reshows_the_rest(self) -> None:
+        client = _client()
+        stale = _entry("dea-2", "medium")
+        summaries = [
+            BeadSummary(id="dea-1", title="dea-1", updated_at="2026-08-05T10:00:00Z"),
+            BeadSummary(id="dea-2", title="dea-2", updated_at="2026-08-05T12:00:00Z"),
+            BeadSummary(id="dea-3", title="dea-3"),
+            BeadSummary(id="task-1", title="task-1", updated_at="2026-08-01T00:00:00Z"),
+        ]
+        known = {
+            "dea-1": SweptBead("open@2026-08-05T10:00:00Z", _entry("dea-1", "high")),
+            "dea-2": SweptBead("open@2026-08-05T09:00:00Z", stale),
+            "task-1": SweptBead("open@2026-08-01T00:00:00Z", None),
+        }
+        shown: list[str] = []
+
+        async def fake_query(self: BeadClient, filter_expr: str) -> list[BeadSummary]:
+            return summaries
+
+        async def fake_show(self: BeadClient, bead_id: str) -> BeadDetails:
+            shown.append(bead_id)
+            return _entry(bead_id, "low")
+
+        with (
+            patch.object(BeadClient, "query", new=fake_query),
+            patch.object(BeadClient, "show", new=fake_show),
+        ):
+            entries, swept = await sweep_ledger(client, known=known)
+
+        # dea-2 changed since it was loaded; dea-3 has no fingerprint.
+        assert shown == ["dea-2", "dea-3"]
+        assert [e.record.severity for e in entries] == [Severity.HIGH, Severity.LOW, Severity.LOW]
+        assert swept["dea-2"].fingerprint == "open@2026-08-05T12:00:00Z"
+        assert swept["dea-3"].fingerprint is None
+        assert swept["task-1"].details is None
+
+    @pytest.mark.asyncio
+    async def test_non_entries_are_remembered_without_details(self) -> None:
+        client = _client()
+        task = BeadDetails(id="task-1", title="plain task")
+
+        async def fake_query(self: BeadClient, filter_expr: str) -> list[BeadSummary]:
+            return [BeadSummary(id="task-1", title="t", updated_at="2026-08-01T00:00:00Z")]
+
+        async def fake_show(self: BeadClient, bead_id: str) -> BeadDetails:
+            return task
+
+        with (
+            patch.object(BeadClient, "query", new=fake_query),
+            patch.object(BeadClient, "show", new=fake_show),
+        ):
+            entries, swept = await sweep_ledger(client)
+
+        assert entries == ()
+        assert swept == {"task-1": SweptBead("open@2026-08-01T00:00:00Z", None)}
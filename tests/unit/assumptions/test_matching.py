@@ -6,9 +6,12 @@ the normative matching formula this module implements.
 
 from __future__ import annotations
 
+import random
+
 from maverick.assumptions.matching import (
     PRESENTATION_THRESHOLD,
     REJECTION_PENALTY,
+    CandidateIndex,
     base_score,
     effective_confidence,
     normalize_question,
@@ -172,3 +175,85 @@ class TestSelectBest:
     def test_single_candidate_at_exact_threshold_wins(self) -> None:
         candidates = [(0.75, "2026-08-01T00:00:00+00:00", "mv-1", "payload-1")]
         assert select_best(candidates) == candidates[0]
+
+
+class TestCandidateIndex:
+    _VOCABULARY = [
+        "should",
+        "retries",
+        "use",
+        "exponential",
+        "backoff",
+        "jitter",
+        "timeout",
+        "cache",
+        "the",
+        "api",
+        "client",
+        "store",
+        "tokens",
+        "in",
+        "keyring",
+        "config",
+        "file",
+        "database",
+        "schema",
+        "migration",
+        "rollback",
+        "logging",
+        "level",
+        "debug",
+        "info",
+        "which",
+        "port",
+        "does",
+        "service",
+        "listen",
+        "on",
+        "default",
+    ]
+
+    def _corpus(self, seed: int, size: int) -> list[str]:
+        rng = random.Random(seed)
+        base = [
+            " ".join(rng.sample(self._VOCABULARY, rng.randint(3, 9))) for _ in range(size // 4)
+        ]
+        questions = list(base)
+        # Near-duplicates: drop, swap, or punctuate a few words of a base question.
+        while len(questions) < size:
+            words = rng.choice(base).split()
+            if len(words) > 3 and rng.random() < 0.5:
+                words.pop(rng.randrange(len(words)))
+            if rng.random() < 0.5:
+                words.insert(rng.randrange(len(words) + 1), rng.choice(self._VOCABULARY))
+            questions.append(" ".join(words).capitalize() + "?")
+        return questions
+
+    def test_never_prunes_a_candidate_that_clears_the_threshold(self) -> None:
+        corpus = self._corpus(seed=7, size=200)
+        index = CandidateIndex([(q, i) for i, q in enumerate(corpus)])
+
+        for question in self._corpus(seed=11, size=40):
+            exhaustive = {
+                i
+                for i, q in enumerate(corpus)
+                if base_score(question, q) >= PRESENTATION_THRESHOLD
+            }
+            assert exhaustive <= set(index.candidates(question))
+
+    def test_prunes_most_of_the_corpus(self) -> None:
+        corpus = self._corpus(seed=3, size=400)
+        index = CandidateIndex([(q, i) for i, q in enumerate(corpus)])
+
+        probed = sum(len(index.candidates(q)) for q in corpus[:50])
+        assert probed < 50 * len(corpus) / 4
+
+    def test_candidates_keep_corpus_order(self) -> None:
+        index = CandidateIndex(
+            [("use exponential backoff", "a"), ("which port", "b"), ("exponential backoff", "c")]
+        )
+        assert index.candidates("Use exponential backoff?") == ["a", "c"]
+
+    def test_question_without_tokens_has_no_candidates(self) -> None:
+        index = CandidateIndex([("a b", "x"), ("", "y")])
+        assert index.candidates("?") == []
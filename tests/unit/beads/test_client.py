@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from unittest.mock import AsyncMock
 
 import pytest
 
 from maverick.beads.client import BeadClient, LifecycleAction
+from maverick.beads.graph import GraphNode, GraphPlan, blocks_edge
 from maverick.beads.models import BeadDefinition, BeadDependency
 from maverick.exceptions.beads import (
     BeadCloseError,
     BeadCreationError,
     BeadDependencyError,
     BeadError,
+    BeadGraphUnsupportedError,
     BeadLifecycleError,
     BeadQueryError,
 )
@@ -183,6 +186,76 @@ class TestBeadClientCreateBead:
         assert result.bd_id == "bead-alt"
 
 
+class TestBeadClientCreateGraph:
+    """Tests for BeadClient.create_graph()."""
+
+    @staticmethod
+    def _plan() -> GraphPlan:
+        return GraphPlan(
+            nodes=[
+                GraphNode(key="a", title="First"),
+                GraphNode(key="b", title="Second", labels=["phase:1", "x,y"]),
+            ],
+            edges=[blocks_edge(blocker="a", blocked="b", node_keys={"a", "b"})],
+        )
+
+    @pytest.mark.asyncio
+    async def test_single_invocation_with_plan_file(
+        self, mock_runner: AsyncMock, temp_dir: Path
+    ) -> None:
+        seen: dict[str, object] = {}
+
+        async def _run(cmd: list[str], **kwargs: object) -> CommandResult:
+            seen["cmd"] = cmd
+            seen["plan"] = json.loads(Path(cmd[3]).read_text())
+            return _ok('{"ids": {"a": "bd-1", "b": "bd-2"}}')
+
+        mock_runner.run.side_effect = _run
+        client = BeadClient(cwd=temp_dir, runner=mock_runner)
+
+        ids = await client.create_graph(self._plan())
+
+        assert ids == {"a": "bd-1", "b": "bd-2"}
+        cmd = seen["cmd"]
+        assert cmd[:3] == ["bd", "create", "--graph"] and cmd[4:] == ["--json"]
+        assert not Path(cmd[3]).exists()
+        assert seen["plan"] == {
+            "nodes": [
+                {"key": "a", "title": "First"},
+                {"key": "b", "title": "Second", "labels": ["phase:1", "x,y"]},
+            ],
+            "edges": [{"from_key": "b", "to_key": "a", "type": "blocks"}],
+        }
+        assert mock_runner.run.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_flag_is_unsupported(
+        self, mock_runner: AsyncMock, temp_dir: Path
+    ) -> None:
+        mock_runner.run.return_value = _fail("Error: unknown flag: --graph")
+        client = BeadClient(cwd=temp_dir, runner=mock_runner)
+
+        with pytest.raises(BeadGraphUnsupportedError):
+            await client.create_graph(self._plan())
+
+    @pytest.mark.asyncio
+    async def test_invalid_plan_never_runs_bd(
+        self, mock_runner: AsyncMock, temp_dir: Path
+    ) -> None:
+        plan = GraphPlan(
+            nodes=[GraphNode(key="a", title="First")],
+            edges=[blocks_edge(blocker="missing", blocked="a", node_keys={"a"})],
+        )
+        plan = plan.model_copy(
+            update={"edges": [plan.edges[0].model_copy(update={"to_key": "x"})]}
+        )
+        client = BeadClient(cwd=temp_dir, runner=mock_runner)
+
+        with pytest.raises(BeadCreationError, match="exactly one of to_key/to_id"):
+            await client.create_graph(plan)
+        mock_runner.run.assert_not_called()
+
+
 class TestBeadClientAddDependency:
     """Tests for BeadClient.add_dependency()."""
 
@@ -2,13 +2,28 @@
 
 from __future__ import annotations
 
+import json
+
 from maverick.checkpoint.data import CheckpointData
 from maverick.checkpoint.store import (
+    BLOBS_DIR,
+    MANIFEST_NAME,
+    CheckpointEncoding,
     FileCheckpointStore,
     MemoryCheckpointStore,
 )
 
 
+def _checkpoint(checkpoint_id: str, hour: int, steps: int = 0) -> CheckpointData:
+    return CheckpointData(
+        checkpoint_id=checkpoint_id,
+        workflow_name="wf1",
+        inputs_hash="hash123",
+        step_results=tuple({"name": f"step{i}", "output": i} for i in range(steps)),
+        saved_at=f"2024-01-01T{hour:02d}:00:00Z",
+    )
+
+
 class TestFileCheckpointStore:
     """Tests for FileCheckpointStore class."""
 
@@ -77,6 +92,84 @@ class TestFileCheckpointStore:
         assert await store.load("workflow_1", "cp1") is None
         assert await store.load("workflow_1", "cp2") is None
 
+    async def test_load_latest_follows_manifest(self, tmp_path) -> None:
+        """Latest is taken from the manifest, not from the files on disk."""
+        store = FileCheckpointStore(base_path=tmp_path)
+        await store.save("workflow_1", _checkpoint("b", hour=13))
+        await store.save("workflow_1", _checkpoint("a", hour=12))
+
+        latest = await store.load_latest("workflow_1")
+        assert latest is not None
+        assert latest.checkpoint_id == "b"
+        assert await store.list_checkpoints("workflow_1") == ["a", "b"]
+
+        manifest = json.loads((tmp_path / "workflow_1" / MANIFEST_NAME).read_text())
+        assert [entry["id"] for entry in manifest["checkpoints"]] == ["a", "b"]
+
+    async def test_step_results_shared_between_checkpoints(self, tmp_path) -> None:
+        """A growing run stores each step result once."""
+        store = FileCheckpointStore(base_path=tmp_path)
+        await store.save("workflow_1", _checkpoint("cp1", hour=12, steps=2))
+        await store.save("workflow_1", _checkpoint("cp2", hour=13, steps=3))
+
+        blobs = list((tmp_path / "workflow_1" / BLOBS_DIR).iterdir())
+        assert len(blobs) == 3
+        loaded = await store.load("workflow_1", "cp2")
+        assert loaded is not None
+        assert loaded.step_results == _checkpoint("cp2", hour=13, steps=3).step_results
+
+    async def test_retention_prunes_oldest_and_unshared_blobs(self, tmp_path) -> None:
+        """Only max_checkpoints survive; blobs they still use are kept."""
+        store = FileCheckpointStore(base_path=tmp_path, max_checkpoints=2)
+        for hour, steps in ((10, 1), (11, 2), (12, 2)):
+            await store.save(
+                "workflow_1",
+                CheckpointData(
+                    checkpoint_id=f"cp{hour}",
+                    workflow_name="wf1",
+                    inputs_hash="hash123",
+                    step_results=tuple({"hour": hour, "i": i} for i in range(steps)),
+                    saved_at=f"2024-01-01T{hour:02d}:00:00Z",
+                ),
+            )
+
+        assert await store.list_checkpoints("workflow_1") == ["cp11", "cp12"]
+        assert await store.load("workflow_1", "cp10") is None
+        assert not (tmp_path / "workflow_1" / "cp10.json").exists()
+        assert len(list((tmp_path / "workflow_1" / BLOBS_DIR).iterdir())) == 4
+
+    async def test_gzip_round_trip(self, tmp_path) -> None:
+        """Compressed checkpoints load back unchanged."""
+        store = FileCheckpointStore(base_path=tmp_path, encoding=CheckpointEncoding.GZIP_JSON)
+        data = _checkpoint("cp1", hour=12, steps=2)
+        await store.save("workflow_1", data)
+
+        assert (tmp_path / "workflow_1" / "cp1.json.gz").exists()
+        assert await FileCheckpointStore(base_path=tmp_path).load_latest("workflow_1") == data
+
+    async def test_reads_legacy_files_without_manifest(self, tmp_path) -> None:
+        """Pre-manifest checkpoint files are indexed on first access."""
+        workflow_dir = tmp_path / "workflow_1"
+        workflow_dir.mkdir()
+        for data in (_checkpoint("old", hour=9, steps=1), _checkpoint("new", hour=10, steps=1)):
+            (workflow_dir / f"{data.checkpoint_id}.json").write_text(
+                json.dumps(data.to_dict(), indent=2)
+            )
+
+        store = FileCheckpointStore(base_path=tmp_path)
+        latest = await store.load_latest("workflow_1")
+        assert latest == _checkpoint("new", hour=10, steps=1)
+        assert (workflow_dir / MANIFEST_NAME).exists()
+
+    async def test_corrupt_manifest_is_rebuilt(self, tmp_path) -> None:
+        """An unreadable manifest falls back to scanning the directory."""
+        store = FileCheckpointStore(base_path=tmp_path)
+        await store.save("workflow_1", _checkpoint("cp1", hour=12, steps=1))
+        (tmp_path / "workflow_1" / MANIFEST_NAME).write_text("{not json")
+
+        assert await store.list_checkpoints("workflow_1") == ["cp1"]
+        assert await store.load("workflow_1", "cp1") == _checkpoint("cp1", hour=12, steps=1)
+
 
 class TestMemoryCheckpointStore:
     """Tests for MemoryCheckpointStore class."""
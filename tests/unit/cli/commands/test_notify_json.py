@@ -3,7 +3,7 @@ specs/054-assumption-batch-scheduler/contracts/cli-notify-json.md.
 
 House pattern (mirrors ``test_reconcile_json.py`` / ``test_review_json.py``):
 mock ``BeadClient.verify_available``/``.query`` so no real ``bd`` invocation
-occurs, invoke via ``cli_runner``. ``report_entries`` runs for real against
+occurs, invoke via ``cli_runner``. ``sweep_ledger`` runs for real against
 the mocked ``BeadClient`` (returns an empty ledger sweep in every test here);
 the decision engine itself (``evaluate()``) is stubbed with a canned
 ``EvaluationOutcome`` — window/quiet-hours/DST evaluation logic is already
@@ -704,6 +704,42 @@ class TestPartialSuccessAcrossDecisions:
         assert persisted["entry_tracking"]["mav-hi"]["interrupt_delivered_at"] is None
 
 
+class TestConcurrentDelivery:
+    """Pushes overlap, bounded by the limiter, and each failure keeps the
+    index ``finalize_state`` needs to strip exactly that decision."""
+
+    async def test_bounded_overlap_and_per_index_failures(self) -> None:
+        import asyncio
+
+        from maverick.cli.commands.notify import _MAX_CONCURRENT_DELIVERIES, _deliver_all
+
+        decisions = [_delivery_decision(entry_ids=(f"mav-{i}",)) for i in range(6)]
+        failing = {1, 4}
+        in_flight = 0
+        peak = 0
+        started = 0
+
+        class _SlowDeliverer:
+            async def deliver(self, kind: DecisionKind, summary: BatchSummary) -> None:
+                # Pushes start in decision order (the limiter is FIFO).
+                nonlocal in_flight, peak, started
+                index = started
+                started += 1
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                if index in failing:
+                    raise DeliveryFailedError("ntfy delivery failed", kind=kind, status_code=503)
+
+        delivered, failed = await _deliver_all(_SlowDeliverer(), decisions)  # type: ignore[arg-type]
+
+        assert 1 < peak <= _MAX_CONCURRENT_DELIVERIES
+        assert [f.index for f in failed] == [1, 4]
+        assert [f.decision for f in failed] == [decisions[1], decisions[4]]
+        assert delivered == [d for i, d in enumerate(decisions) if i not in failing]
+
+
 class TestAutoWaiveEffects:
     """T026/T028: ``AutoWaiveDecision``s execute via
     ``assumptions.ledger.waive`` (research R10), recording a
@@ -986,7 +1022,7 @@ class TestLedgerReadFailure:
             AsyncMock(return_value=True),
         )
         monkeypatch.setattr(
-            "maverick.cli.commands.notify.report_entries",
+            "maverick.cli.commands.notify.sweep_ledger",
             AsyncMock(side_effect=AssumptionLedgerError("Failed to query task beads: boom")),
         )
         _stub_deliverer(monkeypatch, fail=False)
@@ -1114,6 +1150,46 @@ class TestRealEvaluateIdempotence:
         # No second ntfy push for the already-decided occurrence.
         assert len(_FakeDeliverer.calls) == 1
 
+    def test_second_run_does_not_reshow_unchanged_beads(
+        self,
+        cli_runner: CliRunner,
+        temp_dir: Path,
+        clean_env: None,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        _setup(temp_dir, monkeypatch, yaml_text=_REAL_EVAL_YAML)
+        _stub_real_ledger_sweep(monkeypatch, ["mav-1", "mav-2"])
+        monkeypatch.setattr(
+            "maverick.beads.client.BeadClient.query",
+            AsyncMock(
+                return_value=[
+                    BeadSummary(id=bid, title=bid, updated_at="2026-08-05T09:00:00Z")
+                    for bid in ("mav-1", "mav-2")
+                ]
+            ),
+        )
+        shown: list[str] = []
+
+        async def _fake_show(self: object, bead_id: str) -> BeadDetails:
+            shown.append(bead_id)
+            return _open_medium_bead_details(bead_id)
+
+        monkeypatch.setattr("maverick.beads.client.BeadClient.show", _fake_show)
+        _stub_deliverer(monkeypatch, fail=False)
+
+        first = _invoke(cli_runner, "--json")
+        assert first.exit_code == ExitCode.SUCCESS
+        assert shown == ["mav-1", "mav-2"]
+
+        second = _invoke(cli_runner, "--json")
+
+        assert second.exit_code == ExitCode.SUCCESS
+        # Both entries still evaluated (the occurrence is already decided)...
+        skips = json.loads(second.stdout)["result"]["skips"]
+        assert any(set(skip["entry_ids"]) == {"mav-1", "mav-2"} for skip in skips)
+        # ...from the persisted snapshots, without a second ``bd show``.
+        assert shown == ["mav-1", "mav-2"]
+
     def test_new_entry_after_delivery_waits_for_next_window(
         self,
         cli_runner: CliRunner,
@@ -7,6 +7,7 @@ mocking is gone — there is no workspace any more.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from typing import Any
@@ -29,6 +30,17 @@ from maverick.cli.commands.land import (
     land,
 )
 
+
+@pytest.fixture(autouse=True)
+def _land_in_tmp_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run every land invocation in a scratch directory.
+
+    ``land`` persists its report under ``<cwd>/.maverick/runs/``; without
+    this the reports land in the repository checkout.
+    """
+    monkeypatch.chdir(tmp_path)
+
+
 # ── Help-text tests ──────────────────────────────────────────────────
 
 
@@ -404,6 +416,99 @@ class TestAssumptionGate:
             assert flag not in result.output
 
 
+class TestLandPipeline:
+    """Commit listing overlaps the gate; curation overlaps consolidation."""
+
+    def test_blocked_gate_stops_before_diff_stats(self) -> None:
+        runner = CliRunner()
+        gather, curate, consolidate = _patch_curation()
+        entry = _report_entry(severity=Severity.LOW, status=STATUS_OPEN)
+        verify, entries_patch = _patch_gate(entries=[entry])
+        with gather as mock_gather, curate, consolidate, verify, entries_patch:
+            result = runner.invoke(land, ["--yes"])
+        assert result.exit_code != 0
+        mock_gather.assert_awaited_once()
+        assert mock_gather.await_args.kwargs["with_stats"] is False
+
+    def test_nothing_to_land_takes_precedence_over_blocked_gate(self) -> None:
+        runner = CliRunner()
+        gather, curate, consolidate = _patch_curation(commits=[])
+        entry = _report_entry(severity=Severity.LOW, status=STATUS_OPEN)
+        verify, entries_patch = _patch_gate(entries=[entry])
+        with gather, curate, consolidate, verify, entries_patch:
+            result = runner.invoke(land, ["--no-curate"])
+        assert result.exit_code == 0
+        assert "Nothing to land" in result.output
+
+    def test_untracked_runway_consolidates_alongside_curation(self) -> None:
+        runner = CliRunner()
+        gather, curate, consolidate = _patch_curation()
+        with (
+            gather,
+            curate as mock_curate,
+            consolidate as mock_consolidate,
+            patch(
+                "maverick.cli.commands.land._runway_untracked",
+                new=AsyncMock(return_value=True),
+            ),
+        ):
+            mock_curate.side_effect = _expect_started(mock_consolidate)
+            result = runner.invoke(land, ["--heuristic-only", "--yes"])
+        assert result.exit_code == 0, result.output
+        mock_consolidate.assert_awaited_once()
+
+    def test_consolidation_finishes_when_curation_fails(self) -> None:
+        runner = CliRunner()
+        gather, curate, consolidate = _patch_curation(
+            curate_result={
+                "success": False,
+                "absorb_ran": False,
+                "squashed_count": 0,
+                "error": "jj absorb failed",
+            },
+        )
+        with (
+            gather,
+            curate,
+            consolidate as mock_consolidate,
+            patch(
+                "maverick.cli.commands.land._runway_untracked",
+                new=AsyncMock(return_value=True),
+            ),
+        ):
+            result = runner.invoke(land, ["--heuristic-only", "--yes"])
+        assert result.exit_code != 0
+        mock_consolidate.assert_awaited_once()
+
+    def test_tracked_runway_consolidates_after_curation(self) -> None:
+        runner = CliRunner()
+        gather, curate, consolidate = _patch_curation()
+        with (
+            gather,
+            curate as mock_curate,
+            consolidate as mock_consolidate,
+            patch(
+                "maverick.cli.commands.land._runway_untracked",
+                new=AsyncMock(return_value=False),
+            ),
+        ):
+            result = runner.invoke(land, ["--heuristic-only", "--yes"])
+            mock_curate.assert_awaited_once()
+        assert result.exit_code == 0
+        mock_consolidate.assert_awaited_once()
+
+
+def _expect_started(task_mock: AsyncMock) -> Any:
+    """``curate_history`` side effect asserting *task_mock* is already running."""
+
+    async def _curate(*_args: Any, **_kwargs: Any) -> dict[str, Any]:
+        await asyncio.sleep(0)
+        task_mock.assert_called_once()
+        return {"success": True, "absorb_ran": False, "squashed_count": 0, "error": None}
+
+    return _curate
+
+
 class TestAgentCurateDryRunDoesNotPreemptGate:
     """T012 fix (analysis I1): `_agent_curate`'s dry-run branch used to raise
     ``SystemExit(SUCCESS)`` directly, pre-empting land()'s own gate-driven
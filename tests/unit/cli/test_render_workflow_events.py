@@ -9,7 +9,9 @@ from __future__ import annotations
 
 import io
 from typing import Any
+from unittest.mock import AsyncMock
 
+import pytest
 from rich.console import Console
 
 from maverick.events import (
@@ -542,3 +544,29 @@ class TestInterimPrefix:
         assert "Agent A started" in interim_lines[0]
         assert "Agent A done" in interim_lines[1]
         assert "Briefing complete" in interim_lines[2]
+
+
+class TestSinks:
+    """Journal and terminal consume the stream as separate sinks."""
+
+    async def test_journal_records_every_event_and_source_error_propagates(self) -> None:
+        """A crashing workflow still journals what it emitted, then re-raises."""
+        from maverick.cli.workflow_executor import render_workflow_events
+
+        emitted = [
+            WorkflowStarted(workflow_name="test-wf", inputs={}),
+            StepStarted(step_name="build", step_type=StepType.PYTHON),
+        ]
+
+        async def _event_iter():  # noqa: ANN202
+            for event in emitted:
+                yield event
+            raise RuntimeError("workflow crashed")
+
+        journal = AsyncMock()
+        test_console = Console(file=io.StringIO(), force_terminal=False, no_color=True)
+
+        with pytest.raises(RuntimeError, match="workflow crashed"):
+            await render_workflow_events(_event_iter(), test_console, session_journal=journal)
+
+        assert [c.args[0] for c in journal.record.await_args_list] == emitted
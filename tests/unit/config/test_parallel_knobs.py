@@ -23,7 +23,7 @@ from __future__ import annotations
 import pytest
 from pydantic import ValidationError
 
-from maverick.config import ParallelConfig
+from maverick.config import HedgingConfig, ParallelConfig
 
 
 def test_defaults_match_legacy_behaviour() -> None:
@@ -33,6 +33,10 @@ def test_defaults_match_legacy_behaviour() -> None:
     assert p.max_tasks == 5
     # Legacy hardcoded DECOMPOSER_POOL_SIZE was 4 = 1 primary + 3 pool workers.
     assert p.decomposer_pool_size == 3
+    # Decomposers open on demand unless prewarm is asked for.
+    assert p.decomposer_prewarm == 0
+    # Small refuel units share detail requests; ``1`` restores one per unit.
+    assert p.decomposer_batch_units == 4
     # Legacy briefing room was navigator/structuralist/recon in parallel.
     assert p.max_briefing_agents == 3
     # Legacy review fan-out was completeness + correctness in parallel.
@@ -94,8 +98,26 @@ def test_yaml_round_trip_preserves_new_knobs() -> None:
         "max_agents": 2,
         "max_tasks": 4,
         "decomposer_pool_size": 1,
+        "decomposer_prewarm": 1,
+        "decomposer_batch_units": 1,
         "max_briefing_agents": 1,
         "max_parallel_reviewers": 1,
+        "hedging": {
+            "enabled": True,
+            "percentile": 0.75,
+            "min_samples": 2,
+            "max_hedges": 3,
+            "max_cost_usd": 1.5,
+        },
     }
     p = ParallelConfig(**raw)
     assert p.model_dump() == raw
+
+
+def test_hedging_is_opt_in() -> None:
+    assert ParallelConfig().hedging.to_policy() is None
+
+    policy = HedgingConfig(enabled=True, percentile=0.75, max_cost_usd=2.0).to_policy()
+    assert policy is not None
+    assert (policy.percentile, policy.max_cost_usd) == (0.75, 2.0)
+    assert HedgingConfig(enabled=True, max_hedges=0).to_policy() is None
@@ -11,6 +11,8 @@ Tests cover:
 - Missing dependency detection (WorkUnitDependencyError with missing_id)
 - Empty list returns empty batches
 - Single unit returns single batch
+- Deep chains resolve without recursion
+- WorkUnitScheduler ready queue and critical-path priority
 """
 
 from __future__ import annotations
@@ -25,7 +27,7 @@ from maverick.flight.models import (
     FileScope,
     WorkUnit,
 )
-from maverick.flight.resolver import resolve_execution_order
+from maverick.flight.resolver import WorkUnitScheduler, resolve_execution_order
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -434,3 +436,93 @@ class TestMissingDependency:
         with pytest.raises(WorkUnitDependencyError) as exc_info:
             resolve_execution_order([a])
         assert "ghost-unit" in str(exc_info.value)
+
+
+class TestDeepChains:
+    """Dependency depth is not limited by the interpreter's recursion limit."""
+
+    def test_chain_deeper_than_recursion_limit(self) -> None:
+        depth = 3000
+        units = [_make_work_unit("unit-0")] + [
+            _make_work_unit(f"unit-{i}", depends_on=(f"unit-{i - 1}",)) for i in range(1, depth)
+        ]
+        order = resolve_execution_order(list(reversed(units)))
+        assert len(order.batches) == depth
+        assert order.batches[-1].units[0].id == f"unit-{depth - 1}"
+
+
+# ---------------------------------------------------------------------------
+# WorkUnitScheduler
+# ---------------------------------------------------------------------------
+
+
+class TestWorkUnitScheduler:
+    """Ready-queue scheduling without tier barriers."""
+
+    def test_unit_ready_as_soon_as_own_deps_done(self) -> None:
+        """A dependent of a fast unit does not wait for a slow sibling."""
+        fast = _make_work_unit("fast")
+        slow = _make_work_unit("slow")
+        after_fast = _make_work_unit("after-fast", depends_on=("fast",))
+        scheduler = WorkUnitScheduler([fast, slow, after_fast])
+
+        assert {u.id for u in scheduler.get_ready()} == {"fast", "slow"}
+        scheduler.done("fast")
+        assert [u.id for u in scheduler.get_ready()] == ["after-fast"]
+        assert scheduler.is_active()
+
+        scheduler.done("after-fast")
+        scheduler.done("slow")
+        assert not scheduler.is_active()
+        assert scheduler.get_ready() == ()
+
+    def test_ready_units_ordered_by_longest_remaining_path(self) -> None:
+        short = _make_work_unit("short")
+        head = _make_work_unit("head")
+        tail = _make_work_unit("tail", depends_on=("head",))
+        scheduler = WorkUnitScheduler([short, head, tail])
+
+        assert [u.id for u in scheduler.get_ready()] == ["head", "short"]
+
+    def test_durations_weight_priority(self) -> None:
+        quick_chain = _make_work_unit("quick")
+        quick_next = _make_work_unit("quick-next", depends_on=("quick",))
+        big = _make_work_unit("big")
+        scheduler = WorkUnitScheduler(
+            [quick_chain, quick_next, big],
+            durations={"quick": 1.0, "quick-next": 1.0, "big": 10.0},
+        )
+
+        assert scheduler.priority("big") == 10.0
+        assert scheduler.priority("quick") == 2.0
+        assert [u.id for u in scheduler.get_ready(limit=1)] == ["big"]
+        assert [u.id for u in scheduler.get_ready()] == ["quick"]
+
+    def test_critical_path(self) -> None:
+        a = _make_work_unit("unit-a")
+        b = _make_work_unit("unit-b", depends_on=("unit-a",))
+        c = _make_work_unit("unit-c", depends_on=("unit-a",))
+        d = _make_work_unit("unit-d", depends_on=("unit-c",))
+        scheduler = WorkUnitScheduler([a, b, c, d], durations={"unit-b": 5.0})
+
+        assert scheduler.critical_path == ("unit-a", "unit-b")
+        assert scheduler.critical_path_length == 6.0
+
+    def test_done_requires_started_unit(self) -> None:
+        a = _make_work_unit("unit-a")
+        b = _make_work_unit("unit-b", depends_on=("unit-a",))
+        scheduler = WorkUnitScheduler([a, b])
+
+        with pytest.raises(ValueError, match="unit-b"):
+            scheduler.done("unit-b")
+        scheduler.get_ready()
+        scheduler.done("unit-a")
+        with pytest.raises(ValueError, match="unit-a"):
+            scheduler.done("unit-a")
+
+    def test_rejects_cycles(self) -> None:
+        a = _make_work_unit("unit-a", depends_on=("unit-b",))
+        b = _make_work_unit("unit-b", depends_on=("unit-a",))
+        with pytest.raises(WorkUnitDependencyError) as exc_info:
+            WorkUnitScheduler([a, b])
+        assert exc_info.value.cycle == ["unit-a", "unit-b", "unit-a"]
@@ -27,6 +27,7 @@ from maverick.git import (
     GitRepository,
     GitStatus,
 )
+from maverick.git.repository import _parse_porcelain_v2
 
 # =============================================================================
 # Fixtures
@@ -274,6 +275,74 @@ class TestStatus:
         assert "README.md" in status.unstaged
         assert "untracked.txt" in status.untracked
 
+    def test_status_untracked_no_skips_untracked_files(self, temp_git_repo: Path) -> None:
+        """Test untracked="no" reports tracked changes but no untracked files."""
+        repo = GitRepository(temp_git_repo)
+        (temp_git_repo / "README.md").write_text("# Modified\n")
+        (temp_git_repo / "untracked.txt").write_text("untracked")
+
+        status = repo.status(untracked="no")
+
+        assert status.unstaged == ("README.md",)
+        assert status.untracked == ()
+
+    def test_status_reports_ahead_and_behind(
+        self, temp_git_repo_with_remote: tuple[Path, Path], tmp_path: Path
+    ) -> None:
+        """Test ahead/behind come from the tracking branch."""
+        local_path, remote_path = temp_git_repo_with_remote
+        other = Repo.clone_from(str(remote_path), tmp_path / "other", branch="main")
+        other.config_writer().set_value("user", "email", "test@example.com").release()
+        other.config_writer().set_value("user", "name", "Test User").release()
+        (tmp_path / "other" / "remote.txt").write_text("remote")
+        other.index.add(["remote.txt"])
+        other.index.commit("Remote commit")
+        other.remotes.origin.push("HEAD:main")
+
+        repo = GitRepository(local_path)
+        repo.fetch()
+        (local_path / "local.txt").write_text("local")
+        repo.commit("Local commit", add_all=True)
+
+        status = repo.status()
+
+        assert (status.ahead, status.behind) == (1, 1)
+
+    def test_parse_porcelain_v2_entry_kinds(self) -> None:
+        """Test renames, unmerged entries and paths with spaces parse correctly."""
+        output = "\0".join(
+            [
+                "# branch.oid 0123456789abcdef0123456789abcdef01234567",
+                "# branch.head feature",
+                "# branch.upstream origin/feature",
+                "# branch.ab +2 -1",
+                "1 MM N... 100644 100644 100644 aaaa bbbb both changed.py",
+                "2 R. N... 100644 100644 100644 aaaa bbbb R100 new name.py",
+                "old name.py",
+                "u UU N... 100644 100644 100644 100644 aaaa bbbb cccc conflict.py",
+                "? new dir/file.txt",
+                "",
+            ]
+        )
+
+        status = _parse_porcelain_v2(output)
+
+        assert status.branch == "feature"
+        assert (status.ahead, status.behind) == (2, 1)
+        assert status.staged == ("both changed.py", "new name.py", "conflict.py")
+        assert status.unstaged == ("both changed.py", "conflict.py")
+        assert status.untracked == ("new dir/file.txt",)
+
+    def test_parse_porcelain_v2_detached_head_uses_oid(self) -> None:
+        """Test a detached HEAD reports the commit SHA as the branch."""
+        sha = "0123456789abcdef0123456789abcdef01234567"
+        output = f"# branch.oid {sha}\0# branch.head (detached)\0"
+
+        status = _parse_porcelain_v2(output)
+
+        assert status.branch == sha
+        assert (status.ahead, status.behind) == (0, 0)
+
 
 class TestLog:
     """Tests for log() method."""
@@ -477,6 +546,30 @@ class TestDiff:
         assert diff_output == ""
 
 
+class TestIterDiff:
+    """Tests for iter_diff() method."""
+
+    def test_iter_diff_matches_diff(self, temp_git_repo: Path) -> None:
+        """Test streamed lines reassemble into the diff output."""
+        repo = GitRepository(temp_git_repo)
+        (temp_git_repo / "README.md").write_text("# Modified Repo\nNew line\n")
+
+        streamed = "".join(repo.iter_diff())
+
+        assert streamed.rstrip("\n") == repo.diff()
+
+    def test_iter_diff_early_close(self, temp_git_repo: Path) -> None:
+        """Test closing the stream early does not raise."""
+        repo = GitRepository(temp_git_repo)
+        (temp_git_repo / "README.md").write_text("".join(f"line {i}\n" for i in range(5000)))
+
+        lines = repo.iter_diff()
+        first = next(lines)
+        lines.close()
+
+        assert first.startswith("diff --git")
+
+
 class TestDiffStatsMethod:
     """Tests for diff_stats() method."""
 
@@ -8,7 +8,9 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from maverick.beads.graph import GraphPlan
 from maverick.beads.models import BeadDefinition
+from maverick.exceptions.beads import BeadCreationError, BeadGraphUnsupportedError
 from maverick.library.actions.beads import (
     create_beads,
     wire_dependencies,
@@ -65,6 +67,7 @@ class TestCreateBeads:
         from maverick.beads.models import CreatedBead
 
         mock_client = AsyncMock()
+        mock_client.create_graph.side_effect = BeadGraphUnsupportedError("unknown flag: --graph")
         epic_def_obj = BeadDefinition.model_validate(self._make_epic_def())
         work_def_obj = BeadDefinition.model_validate(self._make_work_def())
 
@@ -90,6 +93,7 @@ class TestCreateBeads:
     @pytest.mark.asyncio
     async def test_handles_epic_creation_failure(self) -> None:
         mock_client = AsyncMock()
+        mock_client.create_graph.side_effect = BeadGraphUnsupportedError("unknown flag: --graph")
         mock_client.create_bead.side_effect = RuntimeError("bd not found")
 
         with patch("maverick.beads.client.BeadClient", return_value=mock_client):
@@ -109,6 +113,7 @@ class TestCreateBeads:
         from maverick.beads.models import CreatedBead
 
         mock_client = AsyncMock()
+        mock_client.create_graph.side_effect = BeadGraphUnsupportedError("unknown flag: --graph")
         epic_def_obj = BeadDefinition.model_validate(self._make_epic_def())
 
         mock_client.create_bead.side_effect = [
@@ -128,6 +133,73 @@ class TestCreateBeads:
         assert len(result.work_beads) == 0
         assert len(result.errors) == 1
 
+    @pytest.mark.asyncio
+    async def test_creates_epic_children_and_edges_in_one_graph(self) -> None:
+        mock_client = AsyncMock()
+        mock_client.create_graph.return_value = {
+            "EPIC": "epic-1",
+            "EPIC.1": "bead-1",
+            "EPIC.2": "bead-2",
+        }
+        story_a = {**self._make_work_def("Story A"), "category": "user_story"}
+        story_b = {**self._make_work_def("Story B"), "category": "user_story"}
+        story_a["user_story_id"], story_b["user_story_id"] = "US1", "US2"
+
+        with patch("maverick.beads.client.BeadClient", return_value=mock_client):
+            result = await create_beads(
+                epic_definition=self._make_epic_def(),
+                work_definitions=[story_a, story_b],
+                cwd=Path("/tmp"),
+                extracted_deps=json.dumps([["US2", "US1"]]),
+            )
+
+        mock_client.create_bead.assert_not_awaited()
+        mock_client.add_dependency.assert_not_awaited()
+        (plan,) = mock_client.create_graph.await_args.args
+        assert isinstance(plan, GraphPlan)
+        assert [n.parent_key for n in plan.nodes] == [None, "EPIC", "EPIC"]
+        # US1 blocks US2: bd's ``to`` side is the blocker.
+        assert [(e.from_key, e.to_key) for e in plan.edges] == [("EPIC.2", "EPIC.1")]
+        assert result.epic == {"bd_id": "epic-1", "title": "test-project"}
+        assert result.created_map == {"Story A": "bead-1", "Story B": "bead-2"}
+        assert result.dependencies == (
+            {"blocker_id": "bead-1", "blocked_id": "bead-2", "dep_type": "blocks"},
+        )
+        assert result.errors == ()
+
+    @pytest.mark.asyncio
+    async def test_graph_reports_each_missing_id(self) -> None:
+        mock_client = AsyncMock()
+        mock_client.create_graph.return_value = {"EPIC": "epic-1", "EPIC.1": "bead-1"}
+
+        with patch("maverick.beads.client.BeadClient", return_value=mock_client):
+            result = await create_beads(
+                epic_definition=self._make_epic_def(),
+                work_definitions=[self._make_work_def("A"), self._make_work_def("B")],
+                cwd=Path("/tmp"),
+            )
+
+        assert result.created_map == {"A": "bead-1"}
+        assert result.errors == ("bd create --graph returned no ID for 'B'",)
+        assert result.dependencies is None
+
+    @pytest.mark.asyncio
+    async def test_graph_failure_creates_nothing(self) -> None:
+        mock_client = AsyncMock()
+        mock_client.create_graph.side_effect = BeadCreationError("dolt: conflict")
+
+        with patch("maverick.beads.client.BeadClient", return_value=mock_client):
+            result = await create_beads(
+                epic_definition=self._make_epic_def(),
+                work_definitions=[self._make_work_def()],
+                cwd=Path("/tmp"),
+            )
+
+        mock_client.create_bead.assert_not_awaited()
+        assert result.epic is None
+        assert result.work_beads == ()
+        assert "dolt: conflict" in result.errors[0]
+
 
 # =============================================================================
 # wire_dependencies
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 
 from maverick.library.actions.decompose import (
     CodebaseContext,
+    DecompositionGapsError,
     FileContent,
+    GapKind,
     _extract_path_from_scope_item,
+    _format_codebase_context,
     build_decomposition_prompt,
     build_detail_prompt,
     build_detail_seed_prompt,
@@ -17,6 +21,7 @@ from maverick.library.actions.decompose import (
     build_fix_seed_prompt,
     build_fix_turn_prompt,
     convert_specs_to_work_units,
+    find_structural_gaps,
     gather_codebase_context,
     validate_decomposition,
 )
@@ -37,6 +42,8 @@ def make_work_unit_spec(
     depends_on: list[str] | None = None,
     trace_refs: list[str | None] | None = None,
     parallel_group: str | None = None,
+    create: list[str] | None = None,
+    modify: list[str] | None = None,
 ) -> WorkUnitSpec:
     criteria = []
     for ref in trace_refs or []:
@@ -48,7 +55,9 @@ def make_work_unit_spec(
         parallel_group=parallel_group,
         task=f"Task for {wu_id}",
         acceptance_criteria=criteria,
-        file_scope=FileScopeSpec(create=[], modify=[], protect=["src/config.py"]),
+        file_scope=FileScopeSpec(
+            create=create or [], modify=modify or [], protect=["src/config.py"]
+        ),
         instructions="Do the thing",
         verification=["make test"],
     )
@@ -248,6 +257,86 @@ class TestGatherCodebaseContext:
         assert any("top.py" in p for p in paths)
         assert any("nested.py" in p for p in paths)
 
+    async def test_directory_walk_honours_gitignore(self, tmp_path: Path) -> None:
+        """Gitignored paths under a scope directory are not read."""
+        (tmp_path / ".gitignore").write_text("*.log\ngenerated/\n", encoding="utf-8")
+        src = tmp_path / "src"
+        (src / "generated").mkdir(parents=True)
+        (src / "keep.py").write_text("keep = 1", encoding="utf-8")
+        (src / "debug.log").write_text("noise", encoding="utf-8")
+        (src / "generated" / "out.py").write_text("gen = 1", encoding="utf-8")
+
+        ctx = await gather_codebase_context(in_scope=("src",), cwd=tmp_path)
+
+        assert [f.path for f in ctx.files] == ["src/keep.py"]
+
+    async def test_directory_walk_skips_dependency_dirs_and_binaries(self, tmp_path: Path) -> None:
+        """node_modules, target/, lock files and binaries are skipped silently."""
+        (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+        (tmp_path / "node_modules" / "lib" / "index.js").write_text("x", encoding="utf-8")
+        (tmp_path / "target").mkdir()
+        (tmp_path / "target" / "out.rs").write_text("x", encoding="utf-8")
+        (tmp_path / "Cargo.lock").write_text("x", encoding="utf-8")
+        (tmp_path / "logo.png").write_bytes(b"\x89PNG\x00\x00")
+        (tmp_path / "main.rs").write_text("fn main() {}", encoding="utf-8")
+
+        ctx = await gather_codebase_context(in_scope=(".",), cwd=tmp_path)
+
+        assert [f.path for f in ctx.files] == ["main.rs"]
+        assert ctx.missing_files == ()
+
+    async def test_large_file_reduced_to_outline(self, tmp_path: Path) -> None:
+        """Files over the per-file budget keep only their declarations."""
+        body = "".join(f"def func_{i}():\n    return {i}\n" for i in range(400))
+        (tmp_path / "big.py").write_text(body, encoding="utf-8")
+
+        ctx = await gather_codebase_context(
+            in_scope=("big.py",), cwd=tmp_path, max_file_bytes=4096
+        )
+
+        (big,) = ctx.files
+        assert big.outline
+        assert "def func_0():" in big.content
+        assert "return 0" not in big.content
+        assert len(big.content) <= 4096
+        assert "big.py (outline)" in _format_codebase_context(ctx)
+
+    async def test_total_budget_ranks_explicit_then_recent(self, tmp_path: Path) -> None:
+        """Explicit paths win the budget, then recently changed files; the rest are omitted."""
+        src = tmp_path / "src"
+        src.mkdir()
+        for name in ("old.py", "recent.py", "named.py"):
+            (src / name).write_text("x" * 1500, encoding="utf-8")
+        old_time = 1_000_000_000
+        os.utime(src / "old.py", (old_time, old_time))
+        os.utime(src / "named.py", (old_time, old_time))
+
+        ctx = await gather_codebase_context(
+            in_scope=("src", "src/named.py"),
+            cwd=tmp_path,
+            max_total_bytes=3500,
+        )
+
+        assert [f.path for f in ctx.files] == ["src/named.py", "src/recent.py"]
+        assert ctx.omitted_files == ("src/old.py",)
+        assert ctx.total_size <= 3500
+
+    async def test_reference_text_raises_rank(self, tmp_path: Path) -> None:
+        """Files named in the reference text rank above other old files."""
+        for name in ("alpha.py", "resolver.py"):
+            (tmp_path / name).write_text("x" * 1500, encoding="utf-8")
+            os.utime(tmp_path / name, (1_000_000_000, 1_000_000_000))
+
+        ctx = await gather_codebase_context(
+            in_scope=(".",),
+            cwd=tmp_path,
+            reference_text="Rework the resolver module.",
+            max_total_bytes=2000,
+        )
+
+        assert [f.path for f in ctx.files] == ["resolver.py"]
+        assert ctx.omitted_files == ("alpha.py",)
+
 
 # ---------------------------------------------------------------------------
 # build_decomposition_prompt tests
@@ -412,6 +501,7 @@ class TestSeededRefuelPrompts:
         assert "## Fix Request" in prompt
         assert "SC-001 missing from unit-1" in prompt
         assert "unit-2 covers too many criteria" in prompt
+        assert "## Structural Problems" not in prompt
         assert "## Current Outline" not in prompt
         assert "## Current Details" not in prompt
 
@@ -546,6 +636,88 @@ class TestValidateDecomposition:
         with pytest.raises(ValueError):
             validate_decomposition(specs, success_criteria_count=0)
 
+    def test_every_structural_gap_is_reported_at_once(self) -> None:
+        """One raise carries all gaps, so one fix round can close them."""
+        specs = [
+            make_work_unit_spec("unit-a", depends_on=["ghost"]),
+            make_work_unit_spec("unit-b", depends_on=["unit-c"]),
+            make_work_unit_spec("unit-c", depends_on=["unit-b"]),
+            make_work_unit_spec("unit-d", trace_refs=[f"SC-{i:03d}" for i in range(1, 14)]),
+        ]
+
+        with pytest.raises(DecompositionGapsError) as exc_info:
+            validate_decomposition(specs, success_criteria_count=14)
+
+        kinds = [g.kind for g in exc_info.value.structural]
+        assert kinds == [GapKind.DANGLING_DEPENDENCY, GapKind.CYCLE, GapKind.OVERLOADED]
+        assert len(exc_info.value.gaps) == 3
+        # Untraced criteria found in the same pass ride along, advisory.
+        assert exc_info.value.untraced == ["SC-014 not explicitly covered by any work unit"]
+
+
+class TestFindStructuralGaps:
+    """Tests for find_structural_gaps()."""
+
+    def test_sound_decomposition_has_no_gaps(self) -> None:
+        specs = [
+            make_work_unit_spec("unit-a", create=["src/a.py"]),
+            make_work_unit_spec("unit-b", depends_on=["unit-a"], modify=["src/a.py"]),
+        ]
+
+        assert find_structural_gaps(specs) == []
+
+    def test_every_dangling_reference_is_reported(self) -> None:
+        specs = [
+            make_work_unit_spec("unit-a", depends_on=["ghost-1", "ghost-2"]),
+            make_work_unit_spec("unit-b", depends_on=["ghost-1"]),
+        ]
+
+        gaps = find_structural_gaps(specs)
+
+        assert [(g.unit_ids, g.target) for g in gaps] == [
+            (("unit-a",), "ghost-1"),
+            (("unit-a",), "ghost-2"),
+            (("unit-b",), "ghost-1"),
+        ]
+
+    def test_each_cycle_is_one_gap_naming_its_members(self) -> None:
+        specs = [
+            make_work_unit_spec("unit-a", depends_on=["unit-c"]),
+            make_work_unit_spec("unit-b", depends_on=["unit-a"]),
+            make_work_unit_spec("unit-c", depends_on=["unit-b"]),
+            make_work_unit_spec("unit-d", depends_on=["unit-d"]),
+            make_work_unit_spec("unit-e", depends_on=["unit-a"]),
+        ]
+
+        gaps = find_structural_gaps(specs)
+
+        assert all(g.kind is GapKind.CYCLE for g in gaps)
+        assert [g.unit_ids for g in gaps] == [("unit-a", "unit-b", "unit-c"), ("unit-d",)]
+
+    def test_duplicate_ids_are_reported(self) -> None:
+        specs = [make_work_unit_spec("unit-a"), make_work_unit_spec("unit-a")]
+
+        (gap,) = find_structural_gaps(specs)
+
+        assert gap.kind is GapKind.DUPLICATE_ID
+        assert "2 work units share the ID unit-a" in str(gap)
+
+    def test_scope_conflicts(self) -> None:
+        specs = [
+            make_work_unit_spec("unit-a", create=["`src/a.py` — models"]),
+            make_work_unit_spec("unit-b", create=["src/a.py"]),
+            make_work_unit_spec("unit-c", modify=["src/a.py"], depends_on=["unit-a"]),
+        ]
+
+        gaps = find_structural_gaps(specs)
+
+        assert all(g.kind is GapKind.SCOPE_CONFLICT for g in gaps)
+        assert [(g.unit_ids, g.target) for g in gaps] == [
+            (("unit-a", "unit-b"), "src/a.py"),
+            # unit-c waits for unit-a, but not for unit-b.
+            (("unit-b", "unit-c"), "src/a.py"),
+        ]
+
 
 # ---------------------------------------------------------------------------
 # convert_specs_to_work_units tests
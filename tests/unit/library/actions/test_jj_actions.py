@@ -607,6 +607,26 @@ class TestGatherCurationContext:
         assert result["log_summary"] == "summary stats"
         assert result["error"] is None
 
+    @pytest.mark.asyncio
+    async def test_without_stats_lists_commits_only(self) -> None:
+        """Test with_stats=False skips every diff stat call."""
+        mock_client = make_mock_client()
+        mock_client.log.return_value = JjLogResult(
+            success=True,
+            output="",
+            changes=(JjChangeInfo(change_id="abc123", commit_id="c1", description="add auth"),),
+        )
+
+        with patch(MOCK_CLIENT, return_value=mock_client):
+            result = await gather_curation_context(with_stats=False)
+
+        assert result["success"] is True
+        assert result["commits"] == [
+            {"change_id": "abc123", "description": "add auth", "stats": ""}
+        ]
+        assert result["log_summary"] == ""
+        mock_client.diff_stat.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_empty_revset_returns_empty(self) -> None:
         """Test returns empty commits list when revset has no results."""
@@ -6,8 +6,8 @@ from pathlib import Path
 
 import pytest
 
-from maverick.library.actions.runway import retrieve_runway_context
-from maverick.runway.models import BeadOutcome
+from maverick.library.actions.runway import retrieve_review_context, retrieve_runway_context
+from maverick.runway.models import BeadOutcome, RunwayReviewFinding
 from maverick.runway.store import RunwayStore
 
 
@@ -182,3 +182,36 @@ class TestRetrieveRunwayContext:
         # Should return without raising
         assert result.success is True
         assert result.context_text == ""
+
+
+class TestRetrieveReviewContext:
+    async def test_returns_empty_when_not_initialized(self, tmp_path: Path) -> None:
+        """No runway dir → empty string."""
+        assert await retrieve_review_context(changed_files=["a.py"], cwd=tmp_path) == ""
+
+    async def test_filters_and_dedupes_by_changed_files(self, initialized_runway: Path) -> None:
+        """Only findings/outcomes on changed files appear, repeated findings once."""
+        store = RunwayStore(initialized_runway / ".maverick" / "runway")
+        for i, path in enumerate(["src/auth.py", "src/auth.py", "src/other.py"]):
+            await store.append_review_finding(
+                RunwayReviewFinding(
+                    finding_id=f"F{i}",
+                    bead_id=f"b{i}",
+                    severity="major",
+                    file_path=path,
+                    description="token not validated" if path == "src/auth.py" else "unrelated",
+                )
+            )
+        await store.append_bead_outcome(
+            BeadOutcome(bead_id="b9", epic_id="e1", title="Auth", files_changed=["src/auth.py"])
+        )
+        await store.append_bead_outcome(
+            BeadOutcome(bead_id="b8", epic_id="e1", title="Other", files_changed=["README.md"])
+        )
+
+        text = await retrieve_review_context(changed_files=["src/auth.py"], cwd=initialized_runway)
+
+        assert text.count("token not validated") == 1
+        assert "unrelated" not in text
+        assert "b9" in text
+        assert "b8" not in text
@@ -0,0 +1,39 @@
+"""Tests for cargo test panic parser."""
+
+from __future__ import annotations
+
+from maverick.runners.parsers.cargo import CargoTestParser
+
+
+class TestCargoTestParser:
+    def test_parse_current_panic_format(self):
+        output = """running 2 tests
+test tests::adds ... FAILED
+
+---- tests::adds stdout ----
+thread 'tests::adds' panicked at src/lib.rs:10:9:
+assertion `left == right` failed
+  left: 3
+ right: 4"""
+        parser = CargoTestParser()
+        assert parser.can_parse(output) is True
+
+        errors = parser.parse(output)
+
+        assert len(errors) == 1
+        assert (errors[0].file, errors[0].line, errors[0].column) == ("src/lib.rs", 10, 9)
+        assert errors[0].message == "tests::adds: assertion `left == right` failed"
+
+    def test_parse_legacy_panic_format(self):
+        output = "thread 'main' panicked at 'index out of bounds', src/main.rs:4:5"
+        errors = CargoTestParser().parse(output)
+
+        assert len(errors) == 1
+        assert errors[0].file == "src/main.rs"
+        assert errors[0].message == "main: index out of bounds"
+
+    def test_clean_run(self):
+        output = "test result: ok. 2 passed; 0 failed"
+        parser = CargoTestParser()
+        assert parser.can_parse(output) is False
+        assert parser.parse(output) == []
@@ -0,0 +1,38 @@
+"""Tests for Go toolchain output parser."""
+
+from __future__ import annotations
+
+from maverick.runners.parsers.go import GoParser
+
+
+class TestGoParser:
+    def test_parse_build_errors(self):
+        output = """# example.com/app
+./main.go:12:2: undefined: foo
+./util/strings.go:4:10: imported and not used: "fmt\""""
+        parser = GoParser()
+        assert parser.can_parse(output) is True
+
+        errors = parser.parse(output)
+
+        assert [(e.file, e.line, e.column) for e in errors] == [
+            ("./main.go", 12, 2),
+            ("./util/strings.go", 4, 10),
+        ]
+        assert errors[0].message == "undefined: foo"
+
+    def test_parse_test_failures_named_by_test(self):
+        output = """=== RUN   TestAdd
+    add_test.go:9: got 3, want 4
+--- FAIL: TestAdd (0.00s)
+FAIL
+FAIL	example.com/app	0.002s"""
+        errors = GoParser().parse(output)
+
+        assert len(errors) == 1
+        assert (errors[0].file, errors[0].line, errors[0].column) == ("add_test.go", 9, None)
+        assert errors[0].message == "TestAdd: got 3, want 4"
+
+    def test_clean_run(self):
+        parser = GoParser()
+        assert parser.can_parse("ok  \texample.com/app\t0.002s") is False
@@ -0,0 +1,31 @@
+"""Tests for mypy output parser."""
+
+from __future__ import annotations
+
+from maverick.runners.parsers.mypy import MypyParser
+
+
+class TestMypyParser:
+    def test_parse_errors_and_skip_notes(self):
+        output = """src/app.py:12: error: Incompatible return value type  [return-value]
+src/app.py:12: note: See https://mypy.readthedocs.io
+src/util.py:3:5: error: Name "foo" is not defined  [name-defined]
+Found 2 errors in 2 files (checked 10 source files)"""
+        parser = MypyParser()
+        assert parser.can_parse(output) is True
+
+        errors = parser.parse(output)
+
+        assert len(errors) == 2
+        assert errors[0].file == "src/app.py"
+        assert errors[0].line == 12
+        assert errors[0].column is None
+        assert errors[0].code == "return-value"
+        assert errors[0].message.startswith("Incompatible return value type")
+        assert (errors[1].line, errors[1].column, errors[1].code) == (3, 5, "name-defined")
+
+    def test_clean_run(self):
+        output = "Success: no issues found in 10 source files"
+        parser = MypyParser()
+        assert parser.can_parse(output) is False
+        assert parser.parse(output) == []
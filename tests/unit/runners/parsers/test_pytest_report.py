@@ -0,0 +1,65 @@
+"""Tests for pytest failure report parser."""
+
+from __future__ import annotations
+
+from maverick.runners.parsers.pytest_report import PytestParser
+
+
+class TestPytestParser:
+    def test_long_traceback(self):
+        output = """=============================== FAILURES ===============================
+___________________________________ test_add ___________________________________
+
+    def test_add():
+>       assert add(1, 2) == 4
+E       assert 3 == 4
+E        +  where 3 = add(1, 2)
+
+tests/test_math.py:5: AssertionError
+=========================== short test summary info ============================
+FAILED tests/test_math.py::test_add - assert 3 == 4"""
+        parser = PytestParser()
+        assert parser.can_parse(output) is True
+
+        errors = parser.parse(output)
+
+        assert len(errors) == 1
+        assert errors[0].file == "tests/test_math.py"
+        assert errors[0].line == 5
+        assert errors[0].message == "assert 3 == 4"
+        assert errors[0].code == "AssertionError"
+
+    def test_short_traceback_uses_innermost_location(self):
+        output = """___________________________________ test_a ___________________________________
+tests/test_a.py:9: in test_a
+    helper()
+tests/helpers.py:3: in helper
+    raise ValueError("bad")
+E   ValueError: bad
+___________________________________ test_b ___________________________________
+tests/test_b.py:4: in test_b
+    assert False
+E   assert False"""
+        errors = PytestParser().parse(output)
+
+        assert [(e.file, e.line, e.message) for e in errors] == [
+            ("tests/helpers.py", 3, "ValueError: bad"),
+            ("tests/test_b.py", 4, "assert False"),
+        ]
+
+    def test_summary_only(self):
+        output = """FAILED tests/test_x.py::test_one - AssertionError: boom
+FAILED tests/test_x.py::test_two - AssertionError: boom
+ERROR tests/test_y.py"""
+        errors = PytestParser().parse(output)
+
+        assert [(e.file, e.message) for e in errors] == [
+            ("tests/test_x.py", "AssertionError: boom"),
+            ("tests/test_y.py", "test error"),
+        ]
+
+    def test_passing_run(self):
+        output = "....                                      [100%]\n4 passed in 0.01s"
+        parser = PytestParser()
+        assert parser.can_parse(output) is False
+        assert parser.parse(output) == []
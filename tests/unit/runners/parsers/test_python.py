@@ -26,3 +26,50 @@ ValueError: test error"""
         assert errors[0].file == "test.py"
         assert errors[0].line == 10
         assert "ValueError" in errors[0].message
+
+    def test_frames_grouped_into_one_error_per_traceback(self):
+        output = """Traceback (most recent call last):
+  File "app/main.py", line 5, in <module>
+    run()
+  File "app/main.py", line 2, in run
+    helper()
+  File "/usr/lib/python3.12/site-packages/lib/core.py", line 9, in helper
+    raise KeyError("k")
+KeyError: 'k'"""
+        errors = PythonTracebackParser().parse(output)
+
+        assert len(errors) == 1
+        # Innermost frame in project code, not the library frame
+        assert (errors[0].file, errors[0].line) == ("app/main.py", 2)
+        assert errors[0].message == "KeyError: 'k'"
+
+    def test_chained_tracebacks_and_duplicates(self):
+        block = """Traceback (most recent call last):
+  File "a.py", line 1, in f
+ValueError: first
+"""
+        output = (
+            block
+            + "\nDuring handling of the above exception:\n\n"
+            + block.replace("a.py", "b.py").replace("ValueError: first", "TypeError: second")
+        )
+        errors = PythonTracebackParser().parse(output + block)
+
+        assert [(e.file, e.message) for e in errors] == [
+            ("a.py", "ValueError: first"),
+            ("b.py", "TypeError: second"),
+        ]
+
+    def test_unterminated_traceback(self):
+        errors = PythonTracebackParser().parse('  File "x.py", line 3, in g\n    g()\n')
+
+        assert [(e.file, e.line, e.message) for e in errors] == [("x.py", 3, "Python error")]
+
+    def test_parse_is_linear_in_frame_count(self):
+        frame = '  File "src/mod.py", line 7, in fn\n    fn()\n'
+        output = "Traceback (most recent call last):\n" + frame * 50_000 + "RecursionError: deep\n"
+
+        errors = PythonTracebackParser().parse(output)
+
+        assert len(errors) == 1
+        assert errors[0].message == "RecursionError: deep"
@@ -0,0 +1,83 @@
+"""Tests for the output parser registry and ErrorCollector."""
+
+from __future__ import annotations
+
+import pytest
+
+from maverick.runners.models import ParsedError
+from maverick.runners.parsers import (
+    ErrorCollector,
+    MypyParser,
+    get_parsers,
+    parse_output,
+    register_parser,
+    registered_parsers,
+)
+from maverick.runners.parsers import registry as registry_mod
+
+
+class TestRegistry:
+    def test_builtin_parsers_registered(self):
+        names = [parser.name for parser in registered_parsers()]
+        assert names == [
+            "python",
+            "rust",
+            "eslint",
+            "pytest",
+            "mypy",
+            "ruff",
+            "tsc",
+            "go",
+            "cargo",
+        ]
+
+    def test_duplicate_name_rejected(self):
+        with pytest.raises(ValueError, match="already registered"):
+            register_parser(MypyParser())
+
+    def test_register_custom_parser(self, monkeypatch):
+        monkeypatch.setattr(registry_mod, "_PARSERS", dict(registry_mod._PARSERS))
+
+        class _Session:
+            def __init__(self) -> None:
+                self.errors: list[ParsedError] = []
+
+            def feed(self, line: str) -> None:
+                if line.startswith("BOOM "):
+                    self.errors.append(ParsedError(file=line[5:], line=1, message="boom"))
+
+            def finish(self) -> list[ParsedError]:
+                return self.errors
+
+        class _BoomParser:
+            name = "boom"
+
+            def can_parse(self, output: str) -> bool:
+                return "BOOM " in output
+
+            def parse(self, output: str) -> list[ParsedError]:
+                return []
+
+            def session(self) -> _Session:
+                return _Session()
+
+        register_parser(_BoomParser())
+
+        assert [p.name for p in get_parsers("BOOM x.c")] == ["boom"]
+        assert parse_output("BOOM x.c") == [ParsedError(file="x.c", line=1, message="boom")]
+
+
+class TestErrorCollector:
+    def test_streamed_lines_match_whole_output(self):
+        output = """src/app.py:3: error: Name "x" is not defined  [name-defined]
+src/app.py:1:8: F401 [*] `os` imported but unused
+src/app.py:3: error: Name "x" is not defined  [name-defined]
+"""
+        collector = ErrorCollector()
+        for line in output.splitlines(keepends=True):
+            collector.feed(line)
+        streamed = collector.finish()
+
+        # The repeated mypy diagnostic is folded
+        assert [(e.code, e.line) for e in streamed] == [("name-defined", 3), ("F401", 1)]
+        assert streamed == parse_output(output)
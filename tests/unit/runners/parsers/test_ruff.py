@@ -0,0 +1,44 @@
+"""Tests for ruff output parser."""
+
+from __future__ import annotations
+
+from maverick.runners.parsers.ruff import RuffParser
+
+
+class TestRuffParser:
+    def test_parse_concise_format(self):
+        output = """src/app.py:1:8: F401 [*] `os` imported but unused
+src/app.py:10:89: E501 Line too long (120 > 88)
+Found 2 errors."""
+        parser = RuffParser()
+        assert parser.can_parse(output) is True
+
+        errors = parser.parse(output)
+
+        assert [(e.file, e.line, e.column, e.code) for e in errors] == [
+            ("src/app.py", 1, 8, "F401"),
+            ("src/app.py", 10, 89, "E501"),
+        ]
+        assert errors[0].message == "`os` imported but unused"
+
+    def test_parse_full_format(self):
+        output = """F401 [*] `os` imported but unused
+ --> src/app.py:1:8
+  |
+1 | import os
+  |        ^^
+  |
+help: Remove unused import: `os`
+
+Found 1 error."""
+        errors = RuffParser().parse(output)
+
+        assert len(errors) == 1
+        assert (errors[0].file, errors[0].line, errors[0].column) == ("src/app.py", 1, 8)
+        assert errors[0].code == "F401"
+        assert errors[0].message == "`os` imported but unused"
+
+    def test_clean_run(self):
+        parser = RuffParser()
+        assert parser.can_parse("All checks passed!") is False
+        assert parser.parse("All checks passed!") == []
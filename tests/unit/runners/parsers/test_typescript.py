@@ -0,0 +1,33 @@
+"""Tests for TypeScript compiler output parser."""
+
+from __future__ import annotations
+
+from maverick.runners.parsers.typescript import TypeScriptCompilerParser
+
+
+class TestTypeScriptCompilerParser:
+    def test_parse_plain_format(self):
+        output = "src/index.ts(12,5): error TS2322: Type 'string' is not assignable to 'number'."
+        parser = TypeScriptCompilerParser()
+        assert parser.can_parse(output) is True
+
+        errors = parser.parse(output)
+
+        assert len(errors) == 1
+        assert (errors[0].file, errors[0].line, errors[0].column) == ("src/index.ts", 12, 5)
+        assert errors[0].code == "TS2322"
+        assert errors[0].severity == "error"
+        assert errors[0].message == "Type 'string' is not assignable to 'number'."
+
+    def test_parse_pretty_format_with_colors(self):
+        output = (
+            "\x1b[96msrc/a.ts\x1b[0m:\x1b[93m3\x1b[0m:\x1b[93m7\x1b[0m - "
+            "\x1b[91merror\x1b[0m\x1b[90m TS2304: \x1b[0mCannot find name 'foo'.\n"
+            "\n3 const x = foo;\n\nFound 1 error in src/a.ts:3"
+        )
+        errors = TypeScriptCompilerParser().parse(output)
+
+        assert len(errors) == 1
+        assert (errors[0].file, errors[0].line, errors[0].column) == ("src/a.ts", 3, 7)
+        assert errors[0].code == "TS2304"
+        assert errors[0].message == "Cannot find name 'foo'."
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -118,7 +119,7 @@ async def test_rotate_for_new_bead_resets_each_runtime(
     config_with_agents: MaverickConfig,
     tmp_path: Path,
 ) -> None:
-    """rotate_for_new_bead rotates every agent's session.
+    """rotate_for_new_bead(lazy=False) rotates every agent's session now.
 
     Every squadron now builds a real ``ProtectionPolicy`` at open time
     (056-context-file-protection), so ``Agent.rotate_session`` is a
@@ -127,7 +128,7 @@ async def test_rotate_for_new_bead_resets_each_runtime(
     ``open()`` gets closed and a fresh one takes its place.
     """
     async with FlySquadron(cwd=tmp_path, config=config_with_agents) as squadron:
-        await squadron.rotate_for_new_bead()
+        await squadron.rotate_for_new_bead(lazy=False)
         # All three constructed runtimes (coder + correctness + completeness)
         # opened a session at squadron-open and closed-and-reopened it
         # during rotate — checked before the `async with` exit closes
@@ -140,14 +141,39 @@ async def test_rotate_for_new_bead_resets_each_runtime(
     assert all(r.reset_calls == 0 for r in stub_airframe_runtime["constructed"])
 
 
+async def test_rotate_for_new_bead_defers_until_next_send(
+    stub_airframe_runtime: dict[str, Any],
+    config_with_agents: MaverickConfig,
+    tmp_path: Path,
+) -> None:
+    """By default rotation waits for each agent's next send, so an agent
+    that sits the bead out keeps its session untouched."""
+    async with FlySquadron(cwd=tmp_path, config=config_with_agents) as squadron:
+        await squadron.rotate_for_new_bead()
+        agents = list(squadron._all_agents())
+        assert all(a._rotation_pending for a in agents)
+        for runtime in stub_airframe_runtime["constructed"]:
+            assert len(runtime.sessions) == 1, runtime.sessions
+
+        # A second bead boundary before any send still rotates once.
+        await squadron.rotate_for_new_bead()
+        coder = squadron.coder_for(DEFAULT_TIER)
+        sent = AsyncMock(return_value=None)
+        await coder._execute_protected(sent)
+        sent.assert_awaited_once()
+        assert not coder._rotation_pending
+        assert len(coder._runtime.sessions) == 2
+
+
 async def test_retarget_protection_for_isolation_rebinds_every_agent(
     stub_airframe_runtime: dict[str, Any],
     config_with_agents: MaverickConfig,
     tmp_path: Path,
 ) -> None:
     """057-isolated-bead-workspaces: retargeting re-roots every agent's
-    protection policy at the workspace and rotates its session (research.md
-    R11) — the same close-and-reopen `rotate_for_new_bead` already exercises."""
+    protection policy at the workspace and defers a session rotation
+    (research.md R11) to each agent's next send, as `rotate_for_new_bead`
+    does by default."""
     workspace = tmp_path / "workspace"
     workspace.mkdir()
 
@@ -160,16 +186,16 @@ async def test_retarget_protection_for_isolation_rebinds_every_agent(
 
         assert all(a._protection_policy is not None for a in agents)
         assert all(a._protection_policy.root == workspace.resolve() for a in agents)
-        # Every agent rotated its session so Layer 1's gate rebuilds
-        # against the new policy immediately (Agent.rebind_protection's
+        # Every agent owes a rotation so Layer 1's gate rebuilds against
+        # the new policy before its next send (Agent.rebind_protection's
         # own contract — it doesn't reopen on its own).
+        assert all(a._rotation_pending for a in agents)
         for runtime in stub_airframe_runtime["constructed"]:
-            assert len(runtime.sessions) == 2
+            assert len(runtime.sessions) == 1
 
         await squadron.retarget_protection_for_isolation(None)
         assert all(a._protection_policy.root == tmp_path.resolve() for a in agents)
-        for runtime in stub_airframe_runtime["constructed"]:
-            assert len(runtime.sessions) == 3
+        assert all(a._rotation_pending for a in agents)
 
 
 async def test_close_tears_down_all_runtimes(
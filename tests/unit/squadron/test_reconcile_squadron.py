@@ -96,7 +96,7 @@ async def test_rotate_for_new_bead_resets_both_runtimes(
     ``runtime.reset()`` (research.md R4).
     """
     async with ReconcileSquadron(cwd=tmp_path, config=config_with_agents) as squadron:
-        await squadron.rotate_for_new_bead()
+        await squadron.rotate_for_new_bead(lazy=False)
         constructed = stub_airframe_runtime["constructed"]
         assert len(constructed) == 2
         for runtime in constructed:
@@ -9,6 +9,7 @@ no real adapter SDK is touched.
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Any
 
@@ -161,6 +162,100 @@ async def test_pool_teardown_closes_everything() -> None:
     assert all(a.closed for a in spawned)
 
 
+async def test_pool_spawns_concurrently_outside_the_lock() -> None:
+    """Cold starts of concurrent acquirers overlap instead of queueing."""
+    gate = asyncio.Event()
+    started: list[str] = []
+
+    async def factory(tier: str) -> Any:
+        started.append(tier)
+        await gate.wait()
+        return _FakeDecomposer(tier)
+
+    pool = DecomposerAgentPool(cap=3, factory=factory)  # type: ignore[arg-type]
+    acquirers = [asyncio.create_task(pool.acquire("simple")) for _ in range(3)]
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    # All three factories are in flight at once; none holds the others up.
+    assert started == ["simple"] * 3
+    gate.set()
+    agents = await asyncio.gather(*acquirers)
+    assert len(set(agents)) == 3
+    assert pool.total_live == 3
+
+
+async def test_pool_context_set_mid_spawn_is_replayed() -> None:
+    gate = asyncio.Event()
+
+    async def factory(tier: str) -> Any:
+        await gate.wait()
+        return _FakeDecomposer(tier)
+
+    pool = DecomposerAgentPool(cap=2, factory=factory)  # type: ignore[arg-type]
+    acquirer = asyncio.create_task(pool.acquire("simple"))
+    await asyncio.sleep(0)
+    await pool.set_context(
+        outline_json="{}", flight_plan_content="plan", verification_properties="vp"
+    )
+    gate.set()
+
+    agent = await acquirer
+    assert agent.contexts == [  # type: ignore[attr-defined]
+        {"outline_json": "{}", "flight_plan_content": "plan", "verification_properties": "vp"}
+    ]
+
+
+async def test_pool_prewarm_fills_idle_set_under_cap() -> None:
+    spawned: list[_FakeDecomposer] = []
+
+    async def factory(tier: str) -> Any:
+        a = _FakeDecomposer(tier)
+        spawned.append(a)
+        return a
+
+    pool = DecomposerAgentPool(cap=3, factory=factory, prewarm=5)  # type: ignore[arg-type]
+    pool.start_prewarm("simple")
+    await pool._prewarm_task  # type: ignore[misc]
+
+    assert pool.snapshot()["idle"] == {"simple": 3}
+    acquired = [await pool.acquire("simple") for _ in range(3)]
+    assert len(spawned) == 3
+    assert set(acquired) == set(spawned)
+
+
+async def test_pool_acquire_waits_for_prewarming_agent() -> None:
+    """With every slot reserved by prewarm, acquire takes the first one ready."""
+    gate = asyncio.Event()
+
+    async def factory(tier: str) -> Any:
+        await gate.wait()
+        return _FakeDecomposer(tier)
+
+    pool = DecomposerAgentPool(cap=2, factory=factory, prewarm=2)  # type: ignore[arg-type]
+    pool.start_prewarm("simple")
+    await asyncio.sleep(0)
+    acquirer = asyncio.create_task(pool.acquire("simple"))
+    await asyncio.sleep(0)
+    assert not acquirer.done()
+
+    gate.set()
+    agent = await acquirer
+    assert agent.tier == "simple"  # type: ignore[attr-defined]
+    assert pool.total_live == 2
+
+
+async def test_pool_failed_spawn_returns_its_slot() -> None:
+    async def factory(tier: str) -> Any:
+        raise RuntimeError("open failed")
+
+    pool = DecomposerAgentPool(cap=1, factory=factory)  # type: ignore[arg-type]
+    with pytest.raises(RuntimeError, match="open failed"):
+        await pool.acquire("simple")
+
+    assert pool._occupied == 0
+
+
 async def test_squadron_closes_tracked_briefings(
     stub_airframe_runtime: dict[str, Any],
     config_with_agents: MaverickConfig,
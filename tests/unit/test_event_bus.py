@@ -0,0 +1,162 @@
+"""Unit tests for the bounded, coalescing progress event bus."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from maverick.event_bus import (
+    INTERIM_METADATA_KEY,
+    ProgressEventBus,
+    broadcast,
+    drain,
+)
+from maverick.events import AgentStreamChunk, StepOutput, StepStarted
+from maverick.types import StepType
+
+
+def _chunk(text: str, agent: str = "implementer") -> AgentStreamChunk:
+    return AgentStreamChunk(
+        step_name="implement", agent_name=agent, text=text, chunk_type="output"
+    )
+
+
+def _progress(done: int, total: int = 10) -> StepOutput:
+    return StepOutput(
+        step_name="decompose",
+        message=f"Detail {done}/{total} complete",
+        metadata={INTERIM_METADATA_KEY: "detail_progress"},
+    )
+
+
+def _lifecycle(name: str = "build") -> StepStarted:
+    return StepStarted(step_name=name, step_type=StepType.PYTHON)
+
+
+def _queued(bus: ProgressEventBus) -> list[object]:
+    items = []
+    while not bus.empty():
+        items.append(bus.get_nowait())
+    return items
+
+
+class TestAdmission:
+    def test_consecutive_chunks_coalesce(self) -> None:
+        bus = ProgressEventBus()
+        for text in ("Hel", "lo ", "world"):
+            bus.put_nowait(_chunk(text))
+
+        (merged,) = _queued(bus)
+        assert isinstance(merged, AgentStreamChunk)
+        assert merged.text == "Hello world"
+        assert bus.coalesced_count == 2
+
+    def test_chunks_do_not_coalesce_across_events_or_tool_calls(self) -> None:
+        bus = ProgressEventBus()
+        bus.put_nowait(_chunk("a"))
+        bus.put_nowait(_chunk("b", agent="reviewer"))
+        bus.put_nowait(_chunk("c"))
+        bus.put_nowait(_chunk("[TOOL] Read"))
+        bus.put_nowait(_chunk("d"))
+
+        texts = [e.text for e in _queued(bus)]  # type: ignore[attr-defined]
+        assert texts == ["a", "b", "c", "[TOOL] Read", "d"]
+
+    def test_interim_line_supersedes_queued_one_in_place(self) -> None:
+        bus = ProgressEventBus()
+        bus.put_nowait(_progress(1))
+        bus.put_nowait(_lifecycle())
+        bus.put_nowait(_progress(2))
+
+        first, second = _queued(bus)
+        assert isinstance(first, StepOutput)
+        assert first.message == "Detail 2/10 complete"
+        assert isinstance(second, StepStarted)
+
+    def test_interim_line_after_consumption_is_queued(self) -> None:
+        bus = ProgressEventBus()
+        bus.put_nowait(_progress(1))
+        assert bus.get_nowait().message == "Detail 1/10 complete"  # type: ignore[union-attr]
+
+        bus.put_nowait(_progress(2))
+
+        assert bus.qsize() == 1
+
+    def test_full_bus_drops_interim_and_merges_chunks(self) -> None:
+        bus = ProgressEventBus(maxsize=2)
+        bus.put_nowait(_chunk("a"))
+        bus.put_nowait(_lifecycle())
+
+        bus.put_nowait(_progress(1))
+        bus.put_nowait(_chunk("b"))
+
+        chunk, started = _queued(bus)
+        assert chunk.text == "ab"  # type: ignore[union-attr]
+        assert isinstance(started, StepStarted)
+        assert bus.dropped_count == 1
+
+    def test_full_bus_refuses_lifecycle_but_admits_sentinel(self) -> None:
+        bus = ProgressEventBus(maxsize=1)
+        bus.put_nowait(_lifecycle("a"))
+
+        with pytest.raises(asyncio.QueueFull):
+            bus.put_nowait(_lifecycle("b"))
+        bus.put_nowait(None)
+
+        assert _queued(bus)[-1] is None
+
+    async def test_put_waits_for_space_for_lifecycle_events(self) -> None:
+        bus = ProgressEventBus(maxsize=1)
+        await bus.put(_lifecycle("a"))
+
+        waiter = asyncio.create_task(bus.put(_lifecycle("b")))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        assert bus.get_nowait().step_name == "a"  # type: ignore[union-attr]
+        await waiter
+        assert bus.get_nowait().step_name == "b"  # type: ignore[union-attr]
+
+
+class TestBroadcast:
+    async def test_every_bus_receives_events_then_sentinel(self) -> None:
+        async def _source():  # noqa: ANN202
+            yield _lifecycle("a")
+            yield _lifecycle("b")
+
+        buses = [ProgressEventBus(), ProgressEventBus()]
+        await broadcast(_source(), *buses)
+
+        for bus in buses:
+            assert [e.step_name async for e in drain(bus)] == ["a", "b"]  # type: ignore[union-attr]
+
+    async def test_source_error_still_closes_buses(self) -> None:
+        async def _source():  # noqa: ANN202
+            yield _lifecycle("a")
+            raise RuntimeError("workflow crashed")
+
+        bus = ProgressEventBus()
+        with pytest.raises(RuntimeError, match="workflow crashed"):
+            await broadcast(_source(), bus)
+
+        assert [e.step_name async for e in drain(bus)] == ["a"]  # type: ignore[union-attr]
+
+    async def test_full_bus_holds_lifecycle_events_back_from_every_bus(self) -> None:
+        async def _source():  # noqa: ANN202
+            yield _lifecycle("a")
+            yield _progress(1)
+            yield _lifecycle("b")
+
+        slow, fast = ProgressEventBus(maxsize=1), ProgressEventBus()
+        pump = asyncio.create_task(broadcast(_source(), slow, fast))
+        await asyncio.sleep(0.01)
+
+        # "b" waits for room on the slow bus; the interim line dropped there did not.
+        assert not pump.done()
+        assert [e.step_name for e in _queued(fast)] == ["a", "decompose"]  # type: ignore[attr-defined]
+        assert slow.dropped_count == 1
+
+        assert slow.get_nowait().step_name == "a"  # type: ignore[union-attr]
+        await pump
+        assert [e.step_name async for e in drain(fast)] == ["b"]  # type: ignore[union-attr]
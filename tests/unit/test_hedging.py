@@ -0,0 +1,182 @@
+"""Unit tests for hedged straggler calls."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from airframe.cost import CostRecord
+
+from maverick.hedging import HedgePolicy, Hedger, LatencyTracker
+
+
+def _hedger(**policy: object) -> Hedger:
+    hedger = Hedger(HedgePolicy(**{"min_samples": 2, **policy}))  # type: ignore[arg-type]
+    for seconds in (0.01, 0.01, 0.02):
+        hedger.tracker.record("k", seconds)
+    return hedger
+
+
+def _cost(usd: float) -> CostRecord:
+    return CostRecord(
+        provider_id="p",
+        model_id="m",
+        cost_usd=usd,
+        input_tokens=1,
+        output_tokens=1,
+        cache_read_tokens=0,
+        cache_write_tokens=0,
+        finish="end_turn",
+    )
+
+
+async def _after(seconds: float, value: str) -> str:
+    await asyncio.sleep(seconds)
+    return value
+
+
+class TestLatencyTracker:
+    def test_nearest_rank_percentile(self) -> None:
+        tracker = LatencyTracker()
+        for seconds in (4.0, 1.0, 3.0, 2.0):
+            tracker.record("k", seconds)
+
+        assert tracker.percentile("k", 0.5) == 2.0
+        assert tracker.percentile("k", 0.9) == 4.0
+        assert tracker.percentile("k", 0.9, min_samples=5) is None
+        assert tracker.percentile("other", 0.9) is None
+
+    def test_window_forgets_oldest(self) -> None:
+        tracker = LatencyTracker(window=2)
+        for seconds in (9.0, 1.0, 1.0):
+            tracker.record("k", seconds)
+
+        assert tracker.count("k") == 2
+        assert tracker.percentile("k", 1.0) == 1.0
+
+
+class TestHedger:
+    async def test_fast_primary_is_not_hedged(self) -> None:
+        hedger = _hedger()
+        hedge_started = False
+
+        async def _hedge() -> str:
+            nonlocal hedge_started
+            hedge_started = True
+            return "hedge"
+
+        assert await hedger.run("k", lambda: _after(0, "primary"), hedge=_hedge) == "primary"
+        assert not hedge_started
+        assert hedger.tracker.count("k") == 4
+
+    async def test_straggler_loses_to_hedge_and_is_cancelled(self) -> None:
+        hedger = _hedger()
+        primary = asyncio.Event()
+
+        async def _stall() -> str:
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                primary.set()
+                raise
+            return "primary"
+
+        result = await hedger.run("k", _stall, hedge=lambda: _after(0, "hedge"))
+
+        assert result == "hedge"
+        assert primary.is_set()
+        assert (hedger.hedges_launched, hedger.hedges_won) == (1, 1)
+
+    async def test_no_history_waits_for_a_sibling_sample(self) -> None:
+        hedger = Hedger(HedgePolicy(min_samples=1))
+
+        async def _sibling() -> None:
+            await asyncio.sleep(0.01)
+            hedger.tracker.record("k", 0.01)
+
+        sibling = asyncio.create_task(_sibling())
+        result = await hedger.run("k", lambda: _after(30, "primary"), hedge=lambda: _after(0, "h"))
+        await sibling
+
+        assert result == "h"
+
+    async def test_budget_caps_hedges(self) -> None:
+        hedger = _hedger(max_hedges=1)
+        await hedger.run("k", lambda: _after(0.2, "p"), hedge=lambda: _after(0, "h"))
+
+        assert not hedger.can_hedge()
+        assert (
+            await hedger.run("k", lambda: _after(0.05, "p"), hedge=lambda: _after(0, "h")) == "p"
+        )
+        assert hedger.hedges_launched == 1
+
+    async def test_concurrent_stragglers_respect_the_hedge_cap(self) -> None:
+        hedger = _hedger(max_hedges=2)
+
+        results = await asyncio.gather(
+            *(
+                hedger.run("k", lambda: _after(0.1, "p"), hedge=lambda: _after(0, "h"))
+                for _ in range(8)
+            )
+        )
+
+        assert hedger.hedges_launched == 2
+        assert sorted(results) == ["h", "h", *["p"] * 6]
+
+    def test_spend_cap(self) -> None:
+        hedger = _hedger(max_cost_usd=0.5)
+        hedger.charge(_cost(0.6))
+
+        assert hedger.spent_usd == 0.6
+        assert not hedger.can_hedge()
+
+    async def test_cancelled_leg_is_charged_the_keys_mean_cost(self) -> None:
+        hedger = _hedger()
+        hedger.record_cost("k", _cost(0.2))
+
+        async def _hedge() -> str:
+            hedger.leg("k", hedge=True).spent(_cost(0.4))
+            return "hedge"
+
+        assert await hedger.run("k", lambda: _after(30, "primary"), hedge=_hedge) == "hedge"
+
+        # The completed duplicate at its cost, the cancelled primary at the mean.
+        assert hedger.spent_usd == pytest.approx(0.4 + 0.3)
+
+    async def test_min_samples_override(self) -> None:
+        hedger = Hedger(HedgePolicy(min_samples=3))
+        hedger.tracker.record("k", 0.01)
+
+        result = await hedger.run(
+            "k", lambda: _after(30, "primary"), hedge=lambda: _after(0, "h"), min_samples=1
+        )
+
+        assert result == "h"
+
+    async def test_rejected_result_waits_for_the_other_leg(self) -> None:
+        hedger = _hedger()
+
+        result = await hedger.run(
+            "k",
+            lambda: _after(0.1, "good"),
+            hedge=lambda: _after(0, "bad"),
+            accept=lambda value: value == "good",
+        )
+
+        assert result == "good"
+        assert hedger.hedges_won == 0
+
+    async def test_every_leg_failing_raises_the_first_error(self) -> None:
+        hedger = _hedger()
+
+        async def _fail(message: str, delay: float) -> str:
+            await asyncio.sleep(delay)
+            raise RuntimeError(message)
+
+        with pytest.raises(RuntimeError, match="primary"):
+            await hedger.run("k", lambda: _fail("primary", 0.1), hedge=lambda: _fail("hedge", 0.2))
+
+
+def test_policy_rejects_bad_percentile() -> None:
+    with pytest.raises(ValueError, match="percentile"):
+        HedgePolicy(percentile=0.0)
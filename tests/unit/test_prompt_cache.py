@@ -0,0 +1,79 @@
+"""Unit tests for prompt-cache layout and hit-rate accounting."""
+
+from __future__ import annotations
+
+from maverick.prompt_cache import (
+    CacheUsage,
+    PromptLayout,
+    PromptSection,
+    Stability,
+    cache_usage_by_actor,
+    canonical_json,
+)
+from maverick.runway.models import CostEntry
+
+
+def _layout(turn: str) -> PromptLayout:
+    return PromptLayout.of(
+        PromptSection(turn),
+        PromptSection("## Flight Plan", Stability.RUN),
+        None,
+        PromptSection("## Rules", Stability.STATIC),
+        PromptSection("", Stability.RUN),
+    )
+
+
+class TestPromptLayout:
+    def test_renders_most_stable_first_and_drops_empty_sections(self) -> None:
+        assert _layout("## Turn").render() == "## Rules\n\n## Flight Plan\n\n## Turn"
+
+    def test_cacheable_prefix_stops_before_call_sections(self) -> None:
+        assert _layout("## Turn").cacheable_prefix() == "## Rules\n\n## Flight Plan"
+
+    def test_cache_key_ignores_call_sections(self) -> None:
+        key = _layout("unit a").cache_key("ns")
+
+        assert key is not None and key.startswith("ns:")
+        assert _layout("unit b").cache_key("ns") == key
+        changed = PromptLayout.of(PromptSection("## Other rules", Stability.STATIC))
+        assert changed.cache_key("ns") != key
+
+    def test_no_cache_key_without_a_stable_section(self) -> None:
+        assert PromptLayout.of(PromptSection("only the turn")).cache_key("ns") is None
+
+
+def test_canonical_json_is_independent_of_key_order() -> None:
+    assert canonical_json({"b": 1, "a": [2]}) == canonical_json({"a": [2], "b": 1})
+
+
+class TestCacheUsage:
+    def test_hit_ratio_normalizes_provider_input_tokens(self) -> None:
+        usage = cache_usage_by_actor(
+            [
+                # Cached tokens reported apart from input_tokens.
+                CostEntry(
+                    actor="decomposer",
+                    provider_id="claude",
+                    input_tokens=100,
+                    cache_read_tokens=300,
+                ),
+                # Cached tokens counted inside input_tokens.
+                CostEntry(
+                    actor="reviewer",
+                    provider_id="openai",
+                    input_tokens=400,
+                    cache_read_tokens=100,
+                ),
+                CostEntry(actor="decomposer", provider_id="claude", input_tokens=400),
+            ]
+        )
+
+        assert list(usage) == ["decomposer", "reviewer"]
+        assert usage["decomposer"] == CacheUsage(
+            sends=2, prompt_tokens=800, cache_read_tokens=300, cache_write_tokens=0
+        )
+        assert usage["decomposer"].hit_ratio == 0.375
+        assert usage["reviewer"].hit_ratio == 0.25
+
+    def test_hit_ratio_without_tokens_is_zero(self) -> None:
+        assert CacheUsage().hit_ratio == 0.0
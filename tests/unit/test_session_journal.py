@@ -7,6 +7,7 @@ Tests cover:
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 
@@ -33,7 +34,7 @@ from maverick.events import (
     WorkflowStarted,
 )
 from maverick.results import RollbackError
-from maverick.session_journal import SessionJournal
+from maverick.session_journal import JournalDurability, SessionJournal
 from maverick.types import StepType
 
 # =========================================================================
@@ -548,9 +549,9 @@ class TestSessionJournal:
 
     @pytest.mark.asyncio
     async def test_crash_safety_flush(self, tmp_path: Path) -> None:
-        """Each record is flushed immediately so data survives crashes."""
+        """In FSYNC mode each record is on disk before record() returns."""
         log_path = tmp_path / "session.jsonl"
-        journal = SessionJournal(log_path)
+        journal = SessionJournal(log_path, durability=JournalDurability.FSYNC)
 
         journal.write_header("wf", {})
         await journal.record(StepStarted("s1", StepType.PYTHON, 1.0))
@@ -561,3 +562,96 @@ class TestSessionJournal:
         assert len(lines) == 2
 
         journal.close()
+
+    @pytest.mark.asyncio
+    async def test_batched_mode_group_commits(self, tmp_path: Path) -> None:
+        """BATCHED buffers records until the batch fills or the journal closes."""
+        log_path = tmp_path / "session.jsonl"
+        journal = SessionJournal(log_path, batch_size=3, flush_interval=60.0)
+
+        journal.write_header("wf", {})
+        await journal.record(StepStarted("s1", StepType.PYTHON, 1.0))
+        await journal.record(StepStarted("s2", StepType.PYTHON, 1.0))
+        await asyncio.sleep(0.05)
+        assert len(log_path.read_text().splitlines()) == 1  # header only
+
+        await journal.record(StepStarted("s3", StepType.PYTHON, 1.0))
+        for _ in range(100):  # batch is full: writer commits without lingering
+            if len(log_path.read_text().splitlines()) == 4:
+                break
+            await asyncio.sleep(0.01)
+        assert len(log_path.read_text().splitlines()) == 4
+
+        await journal.record(StepStarted("s4", StepType.PYTHON, 1.0))
+        journal.write_summary({"success": True})
+        await journal.aclose()
+
+        events = [json.loads(line)["event"] for line in log_path.read_text().splitlines()]
+        assert events == ["session_start"] + ["StepStarted"] * 4 + ["session_end"]
+        assert not journal.is_open
+
+    @pytest.mark.asyncio
+    async def test_flush_interval_bounds_latency(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "session.jsonl"
+        journal = SessionJournal(log_path, flush_interval=0.01)
+
+        async def _lines_within_a_second(expected: int) -> int:
+            for _ in range(100):
+                if len(log_path.read_text().splitlines()) >= expected:
+                    break
+                await asyncio.sleep(0.01)
+            return len(log_path.read_text().splitlines())
+
+        await journal.record(StepStarted("s1", StepType.PYTHON, 1.0))
+        assert await _lines_within_a_second(1) == 1
+
+        # A second burst after the writer has gone idle is flushed too.
+        await asyncio.sleep(0.05)
+        for i in range(5):
+            await journal.record(StepStarted(f"s{i + 2}", StepType.PYTHON, 1.0))
+        assert await _lines_within_a_second(6) == 6
+        await journal.aclose()
+
+    @pytest.mark.asyncio
+    async def test_sync_close_writes_buffered_records(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "session.jsonl"
+        journal = SessionJournal(log_path, flush_interval=60.0)
+
+        for i in range(5):
+            await journal.record(StepStarted(f"s{i}", StepType.PYTHON, 1.0))
+        journal.close()
+
+        assert len(log_path.read_text().splitlines()) == 5
+        await journal.aclose()  # idempotent after close()
+
+    @pytest.mark.asyncio
+    async def test_best_effort_drops_when_buffer_full(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "session.jsonl"
+        journal = SessionJournal(
+            log_path,
+            durability=JournalDurability.BEST_EFFORT,
+            batch_size=2,
+            max_pending=2,
+            flush_interval=60.0,
+        )
+
+        # No awaits between records, so the writer never gets to run
+        for i in range(5):
+            await journal.record(StepStarted(f"s{i}", StepType.PYTHON, 1.0))
+
+        assert journal.event_count == 2
+        assert journal.dropped_count == 3
+        await journal.aclose()
+        assert len(log_path.read_text().splitlines()) == 2
+
+    @pytest.mark.asyncio
+    async def test_batched_waits_for_room_instead_of_dropping(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "session.jsonl"
+        journal = SessionJournal(log_path, batch_size=2, max_pending=2, flush_interval=60.0)
+
+        for i in range(7):
+            await journal.record(StepStarted(f"s{i}", StepType.PYTHON, 1.0))
+        await journal.aclose()
+
+        assert journal.dropped_count == 0
+        assert len(log_path.read_text().splitlines()) == 7
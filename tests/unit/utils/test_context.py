@@ -62,9 +62,10 @@ class MockDiffStats:
 
 
 @pytest.fixture
-def mock_git() -> MagicMock:
+def mock_git(tmp_path: Path) -> MagicMock:
     """Create a mock GitRepository instance."""
     git = MagicMock()
+    git.path = tmp_path
     git.current_branch.return_value = "feature/test-branch"
 
     git.log.return_value = [
@@ -85,6 +86,7 @@ def mock_git() -> MagicMock:
     ]
 
     git.diff.return_value = "diff --git a/file.py b/file.py\n+new line"
+    git.iter_diff.side_effect = lambda **_: iter(["diff --git a/file.py b/file.py\n", "+new line"])
 
     git.diff_stats.return_value = MockDiffStats(
         files_changed=2,
@@ -680,7 +682,8 @@ class TestBuildReviewContext:
 
         # Create mock with specific file list for this test
         mock_git = MagicMock()
-        mock_git.diff.return_value = "diff --git a/file.py b/file.py\n+new line"
+        mock_git.path = tmp_path
+        mock_git.iter_diff.return_value = iter(["diff --git a/file.py b/file.py\n", "+new line"])
         mock_git.diff_stats.return_value = MockDiffStats(
             files_changed=2,
             insertions=10,
@@ -716,7 +719,8 @@ class TestBuildReviewContext:
         large_file.write_text(large_content)
 
         mock_git = MagicMock()
-        mock_git.diff.return_value = "diff content"
+        mock_git.path = tmp_path
+        mock_git.iter_diff.return_value = iter(["diff content\n"])
         mock_git.diff_stats.return_value = MockDiffStats(
             files_changed=1,
             insertions=1000,
@@ -736,7 +740,7 @@ class TestBuildReviewContext:
     def test_no_changes_empty_diff(self) -> None:
         """No changes returns empty diff with stats (T027)."""
         mock_git = MagicMock()
-        mock_git.diff.return_value = ""
+        mock_git.iter_diff.return_value = iter([])
         mock_git.diff_stats.return_value = MockDiffStats(
             files_changed=0,
             insertions=0,
@@ -760,7 +764,8 @@ class TestBuildReviewContext:
         binary_file.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
 
         mock_git = MagicMock()
-        mock_git.diff.return_value = "diff content"
+        mock_git.path = tmp_path
+        mock_git.iter_diff.return_value = iter(["diff content\n"])
         mock_git.diff_stats.return_value = MockDiffStats(
             files_changed=1,
             insertions=0,
@@ -774,10 +779,57 @@ class TestBuildReviewContext:
         # The implementation reads with errors='replace' so it won't crash
         assert "_metadata" in context
 
+    def test_changed_files_read_relative_to_repo(self, tmp_path: Path) -> None:
+        """Changed files are resolved against the repo root, not the cwd."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "mod.py").write_text("VALUE = 1\n")
+
+        mock_git = MagicMock()
+        mock_git.path = tmp_path
+        mock_git.iter_diff.return_value = iter([])
+        mock_git.diff_stats.return_value = MockDiffStats(
+            files_changed=1,
+            insertions=1,
+            deletions=0,
+            file_list=("pkg/mod.py",),
+        )
+
+        context = build_review_context(git=mock_git, base_branch="main")
+
+        assert context["changed_files"] == {"pkg/mod.py": "VALUE = 1"}
+
+    def test_diff_stream_stops_at_budget(self, tmp_path: Path) -> None:
+        """The diff stream is abandoned once the token budget is spent."""
+        consumed: list[int] = []
+
+        def diff_lines():
+            for i in range(10_000):
+                consumed.append(i)
+                yield f"diff --git a/f{i}.py b/f{i}.py\n"
+                yield f"@@ -1 +1 @@\n-old {i}\n+new {i}\n"
+
+        mock_git = MagicMock()
+        mock_git.path = tmp_path
+        mock_git.iter_diff.return_value = diff_lines()
+        mock_git.diff_stats.return_value = MockDiffStats(
+            files_changed=10_000,
+            insertions=10_000,
+            deletions=10_000,
+            file_list=("f0.py",),
+        )
+
+        context = build_review_context(git=mock_git, base_branch="main", token_budget=500)
+
+        assert len(consumed) < 10_000
+        assert estimate_tokens(context["diff"]) <= 500 + 20
+        assert context["_metadata"]["truncated"] is True
+        assert "diff" in context["_metadata"]["sections_affected"]
+        assert context["changed_files"] == {}
+
     def test_build_review_context_git_errors(self) -> None:
         """Test graceful handling of git errors in build_review_context."""
         mock_git = MagicMock()
-        mock_git.diff.side_effect = RuntimeError("Git diff failed")
+        mock_git.iter_diff.side_effect = RuntimeError("Git diff failed")
         mock_git.diff_stats.side_effect = RuntimeError("Git stats failed")
 
         context = build_review_context(mock_git, "main")
@@ -1122,6 +1174,41 @@ class TestFitToBudget:
 
         assert estimate_tokens(result["only"]) <= 1100  # Allow some tolerance
 
+    def test_never_exceeds_budget(self) -> None:
+        """Truncated sections, markers included, land within the budget."""
+        code = "".join(f"def func_{i}(arg):\n    return arg * {i}\n" for i in range(2000))
+        prose = "The quick brown fox jumps over the lazy dog. " * 2000
+        budget = 3000
+        result = fit_to_budget({"code": code, "prose": prose}, budget=budget)
+
+        total = estimate_tokens(result["code"]) + estimate_tokens(result["prose"])
+        assert total <= budget
+        assert total >= budget * 0.9
+
+    def test_cut_snaps_to_line_boundary(self) -> None:
+        """Truncated content ends on a whole line before the marker."""
+        content = "\n".join(f"line number {i} with some text" for i in range(5000))
+        result = fit_to_budget({"only": content}, budget=500)
+
+        kept = result["only"].split("\n... [content truncated")[0]
+        assert content.startswith(kept)
+        assert content[len(kept)] == "\n"
+
+    def test_priorities_keep_high_priority_whole(self) -> None:
+        """Higher-priority sections are kept before lower-priority ones."""
+        recent = "\n".join(f"+recent change {i}" for i in range(200))
+        old = "\n".join(f"old body line {i}" for i in range(5000))
+        budget = estimate_tokens(recent) + 200
+        result = fit_to_budget(
+            {"old_files": old, "recent_hunks": recent},
+            budget=budget,
+            priorities={"recent_hunks": 1},
+        )
+
+        assert result["recent_hunks"] == recent
+        assert result["_metadata"]["sections_affected"] == ["old_files"]
+        assert estimate_tokens(result["old_files"]) <= 200
+
 
 # =============================================================================
 # Integration Tests
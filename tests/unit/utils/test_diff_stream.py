@@ -0,0 +1,105 @@
+"""Tests for streaming diff reading under a token budget."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from maverick.utils.diff_stream import (
+    TRUNCATION_MARKER,
+    iter_file_patches,
+    read_diff_within_budget,
+)
+from maverick.utils.text import estimate_tokens
+
+
+def _file_section(name: str, hunks: int = 1) -> list[str]:
+    lines = [
+        f"diff --git a/{name} b/{name}\n",
+        "index 1111111..2222222 100644\n",
+        f"--- a/{name}\n",
+        f"+++ b/{name}\n",
+    ]
+    for h in range(hunks):
+        start = h * 10 + 1
+        lines += [f"@@ -{start},1 +{start},1 @@\n", f"-old {name} {h}\n", f"+new {name} {h}\n"]
+    return lines
+
+
+class TestIterFilePatches:
+    """Tests for iter_file_patches."""
+
+    def test_splits_files_and_hunks(self) -> None:
+        lines = _file_section("a.py", hunks=2) + _file_section("b.py")
+
+        patches = list(iter_file_patches(lines))
+
+        assert [p.path for p in patches] == ["a.py", "b.py"]
+        assert len(patches[0].hunks) == 2
+        assert patches[0].header.startswith("diff --git a/a.py")
+        assert "".join(p.text for p in patches) == "".join(lines)
+
+    def test_unparseable_section_kept_verbatim(self) -> None:
+        lines = ["diff --git a/x.py b/x.py\n", "+stray line\n"]
+
+        patches = list(iter_file_patches(lines))
+
+        assert len(patches) == 1
+        assert patches[0].path == "x.py"
+        assert patches[0].text == "".join(lines)
+
+
+class TestReadDiffWithinBudget:
+    """Tests for read_diff_within_budget."""
+
+    def test_small_diff_kept_whole(self) -> None:
+        lines = _file_section("a.py") + _file_section("b.py")
+
+        streamed = read_diff_within_budget(lines, budget=10_000)
+
+        assert streamed.text == "".join(lines)
+        assert streamed.truncated is False
+        assert streamed.file_paths == ("a.py", "b.py")
+        assert streamed.lines_read == len(lines)
+
+    def test_cuts_at_hunk_boundary(self) -> None:
+        lines = _file_section("a.py", hunks=50)
+        header_and_first = "".join(lines[:7])
+
+        streamed = read_diff_within_budget(lines, budget=estimate_tokens(header_and_first) + 1)
+
+        assert streamed.truncated is True
+        assert streamed.text == header_and_first + TRUNCATION_MARKER
+        assert streamed.file_paths == ("a.py",)
+
+    def test_stops_consuming_and_closes_stream(self) -> None:
+        state = {"yielded": 0, "closed": False}
+
+        def source() -> Iterator[str]:
+            try:
+                for i in range(100_000):
+                    for line in _file_section(f"f{i}.py"):
+                        state["yielded"] += 1
+                        yield line
+            finally:
+                state["closed"] = True
+
+        streamed = read_diff_within_budget(source(), budget=200)
+
+        assert streamed.truncated is True
+        assert streamed.tokens <= 200
+        assert state["closed"] is True
+        assert state["yielded"] < 1000
+
+    def test_stops_inside_an_oversized_file_section(self) -> None:
+        state = {"yielded": 0}
+
+        def source() -> Iterator[str]:
+            for line in _file_section("huge.py", hunks=100_000):
+                state["yielded"] += 1
+                yield line
+
+        streamed = read_diff_within_budget(source(), budget=200)
+
+        assert streamed.truncated is True
+        assert streamed.file_paths == ("huge.py",)
+        assert state["yielded"] < 1000
@@ -0,0 +1,123 @@
+"""Tests for the lazy, cached token counter."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+import tiktoken
+
+from maverick.utils.tokens import MIN_CALIBRATION_SAMPLES, TokenCounter
+
+
+class _FakeEncoding:
+    """Deterministic stand-in: one token per 4 characters (rounded up)."""
+
+    def __init__(self) -> None:
+        self.encode_calls = 0
+
+    def encode(self, text: str, disallowed_special: tuple[str, ...] = ()) -> list[int]:
+        self.encode_calls += 1
+        return list(range((len(text) + 3) // 4))
+
+    def decode(self, tokens: list[int]) -> str:
+        return "x" * (len(tokens) * 4)
+
+
+@pytest.fixture
+def fake_encoding(monkeypatch: pytest.MonkeyPatch) -> _FakeEncoding:
+    fake = _FakeEncoding()
+    loads: list[str] = []
+
+    def get_encoding(name: str) -> _FakeEncoding:
+        loads.append(name)
+        return fake
+
+    monkeypatch.setattr(tiktoken, "get_encoding", get_encoding)
+    fake.loads = loads  # type: ignore[attr-defined]
+    return fake
+
+
+def _sample_text(rng: random.Random, n_chars: int) -> str:
+    words = ["alpha", "beta", "gamma", "def", "return", "x", "(", ")", ":", "self."]
+    parts: list[str] = []
+    length = 0
+    while length < n_chars:
+        word = rng.choice(words)
+        parts.append(word)
+        length += len(word) + 1
+    return " ".join(parts)
+
+
+class TestLazyLoading:
+    """The encoding is loaded on first exact count, not at construction."""
+
+    def test_construction_does_not_load(self, fake_encoding: _FakeEncoding) -> None:
+        TokenCounter()
+        assert fake_encoding.loads == []  # type: ignore[attr-defined]
+
+    def test_first_count_loads_once(self, fake_encoding: _FakeEncoding) -> None:
+        counter = TokenCounter()
+        counter.count("hello world")
+        counter.count("another text")
+        assert fake_encoding.loads == ["cl100k_base"]  # type: ignore[attr-defined]
+
+    def test_approximate_does_not_load(self, fake_encoding: _FakeEncoding) -> None:
+        counter = TokenCounter()
+        assert counter.approximate("some text " * 100) > 0
+        assert fake_encoding.loads == []  # type: ignore[attr-defined]
+
+
+class TestCount:
+    """Exact counts are cached by content hash."""
+
+    def test_empty(self, fake_encoding: _FakeEncoding) -> None:
+        assert TokenCounter().count("") == 0
+
+    def test_cached(self, fake_encoding: _FakeEncoding) -> None:
+        counter = TokenCounter()
+        text = "x" * 1000
+        assert counter.count(text) == 250
+        assert counter.count(text) == 250
+        assert fake_encoding.encode_calls == 1
+
+    def test_cache_bounded(self, fake_encoding: _FakeEncoding) -> None:
+        counter = TokenCounter(cache_size=2, encoding_cache_tokens=0)
+        for text in ("a", "bb", "ccc"):
+            counter.count(text)
+        counter.count("a")
+        assert fake_encoding.encode_calls == 4
+
+
+class TestBoundedCount:
+    """Estimates are used away from the limit, exact counts near it."""
+
+    def test_uncalibrated_is_exact(self, fake_encoding: _FakeEncoding) -> None:
+        counter = TokenCounter()
+        text = "word " * 1000
+        assert counter.bounded_count(text, 10) == counter.count(text)
+
+    def test_calibrated_skips_encoding_far_from_limit(self, fake_encoding: _FakeEncoding) -> None:
+        rng = random.Random(0)
+        counter = TokenCounter()
+        for _ in range(MIN_CALIBRATION_SAMPLES * 2):
+            counter.count(_sample_text(rng, 2000))
+        assert counter.calibrated
+
+        calls = fake_encoding.encode_calls
+        text = _sample_text(rng, 40_000)
+        assert counter.fits(text, 1_000_000)
+        assert not counter.fits(text, 10)
+        assert fake_encoding.encode_calls == calls
+
+    def test_decisions_match_exact(self, fake_encoding: _FakeEncoding) -> None:
+        rng = random.Random(1)
+        counter = TokenCounter()
+        for _ in range(MIN_CALIBRATION_SAMPLES * 2):
+            counter.count(_sample_text(rng, 2000))
+
+        for _ in range(50):
+            text = _sample_text(rng, rng.randint(300, 20_000))
+            exact = (len(text) + 3) // 4
+            budget = rng.randint(50, 6000)
+            assert counter.fits(text, budget) == (exact <= budget)
@@ -840,6 +840,10 @@ class TestFlyBurrReviewerTransientEscalation:
         assert state["approved"] is True
         assert state["succeeded_count"] == 1
         assert state["needs_human_review"] is False
+        # Only the failing reviewer was re-sent; the sibling's tier-0
+        # result was kept rather than re-run on the escalated tier.
+        assert len(default_completeness.calls) == 1
+        assert squadron.completeness.calls == []
 
     async def test_transient_failure_exhausts_escalation_marks_human_review(
         self, tmp_path: Path
@@ -1022,6 +1026,81 @@ class TestFlyBurrAggregateReview:
         assert state["aggregate_review_payload"] is not None
         assert state["aggregate_review_payload"]["approved"] is False
 
+    async def test_aggregate_uses_cross_bead_change_summary(self, tmp_path: Path) -> None:
+        """Each commit's diff is folded into the summary the aggregate sees."""
+        from maverick.workflows.fly_beads.graceful_stop import reset_graceful_stop
+
+        reset_graceful_stop()
+
+        diffs = [
+            "diff --git a/src/old.py b/src/old.py\n"
+            "deleted file mode 100644\n"
+            "--- a/src/old.py\n+++ /dev/null\n"
+            "@@ -1 +0,0 @@\n-def legacy():\n",
+            "diff --git a/src/new.py b/src/new.py\n"
+            "new file mode 100644\n"
+            "--- /dev/null\n+++ b/src/new.py\n"
+            "@@ -0,0 +1 @@\n+def modern():\n",
+        ]
+        diff_stats: list[str] = []
+
+        async def _fake_aggregate(
+            *, objective: str, bead_list: str, diff_stat: str
+        ) -> SubmitReviewPayload:
+            diff_stats.append(diff_stat)
+            return SubmitReviewPayload(approved=True)
+
+        coder = StubCodingAgent(
+            implement_payloads=[
+                SubmitImplementationPayload(summary="i1"),
+                SubmitImplementationPayload(summary="i2"),
+            ],
+            fix_payloads=[SubmitFixResultPayload(summary="f") for _ in range(5)],
+        )
+        squadron = StubFlySquadron(coder=coder)
+        squadron.correctness.aggregate = _fake_aggregate  # type: ignore[attr-defined]
+
+        queue: asyncio.Queue[ProgressEvent | None] = asyncio.Queue()
+        with (
+            patch(
+                "maverick.library.actions.beads.select_next_bead",
+                new=AsyncMock(side_effect=[_bead("b-1"), _bead("b-2"), _NO_MORE]),
+            ),
+            patch(
+                "maverick.library.actions.validation.run_independent_gate",
+                new=AsyncMock(return_value=_gate_passed()),
+            ),
+            patch(
+                "maverick.library.actions.jj.jj_commit_bead",
+                new=AsyncMock(return_value={"change_id": "c", "success": True}),
+            ),
+            patch(
+                "maverick.library.actions.jj.jj_diff",
+                new=AsyncMock(side_effect=[{"success": True, "output": d} for d in diffs]),
+            ),
+            patch(
+                "maverick.library.actions.beads.mark_bead_complete",
+                new=AsyncMock(
+                    return_value=MarkBeadCompleteResult(success=True, bead_id="x", error=None)
+                ),
+            ),
+        ):
+            app = build_fly_application(
+                squadron=squadron,  # type: ignore[arg-type]
+                event_queue=queue,
+                epic_id="e-1",
+                cwd=str(tmp_path),
+                max_beads=10,
+            )
+            driver = BurrWorkflowDriver(app, halt_after=FLY_TERMINAL_ACTIONS, event_queue=queue)
+            await _collect(driver)
+
+        assert len(diff_stats) == 1
+        summary = diff_stats[0]
+        assert "2 file(s) changed across 2 bead(s)" in summary
+        assert "src/old.py +0/-1 [b-1]; drops: legacy" in summary
+        assert "src/new.py +1/-0 [b-2]; defines: modern" in summary
+
     async def test_single_bead_skips_aggregate(self, tmp_path: Path) -> None:
         """1 successful bead → aggregate is below threshold → no-op."""
         from maverick.workflows.fly_beads.graceful_stop import reset_graceful_stop
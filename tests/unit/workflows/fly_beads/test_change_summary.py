@@ -0,0 +1,159 @@
+"""Unit tests for the cross-bead change summary."""
+
+from __future__ import annotations
+
+from maverick.workflows.fly_beads._change_summary import (
+    accumulate_changes,
+    render_change_summary,
+    summarize_bead_diff,
+)
+
+_MODIFY = """\
+diff --git a/src/app.py b/src/app.py
+index 1111111..2222222 100644
+--- a/src/app.py
++++ b/src/app.py
+@@ -1,4 +1,5 @@
+-def legacy_parse(text):
++def parse(text):
++    return text
+ class App:
+-    def run(self, x):
++    def run(self, x, y):
+"""
+
+_ADD = """\
+diff --git a/src/util.py b/src/util.py
+new file mode 100644
+index 0000000..3333333
+--- /dev/null
++++ b/src/util.py
+@@ -0,0 +1,2 @@
++async def helper():
++    pass
+"""
+
+_DELETE = """\
+diff --git a/src/old.py b/src/old.py
+deleted file mode 100644
+index 4444444..0000000
+--- a/src/old.py
++++ /dev/null
+@@ -1,2 +0,0 @@
+-class OldThing:
+-    pass
+"""
+
+_DELETE_UTIL = """\
+diff --git a/src/util.py b/src/util.py
+deleted file mode 100644
+index 3333333..0000000
+--- a/src/util.py
++++ /dev/null
+@@ -1,2 +0,0 @@
+-async def helper():
+-    pass
+"""
+
+_RENAME = """\
+diff --git a/src/app.py b/src/core.py
+similarity index 90%
+rename from src/app.py
+rename to src/core.py
+index 2222222..5555555 100644
+--- a/src/app.py
++++ b/src/core.py
+@@ -1,2 +1,2 @@
+-def parse(text):
++def parse_text(text):
+"""
+
+
+class TestSummarizeBeadDiff:
+    def test_statuses_counts_and_symbols(self) -> None:
+        changes = summarize_bead_diff(_MODIFY + _ADD + _DELETE)
+
+        app = changes["src/app.py"]
+        assert app["status"] == "M"
+        assert (app["added"], app["removed"]) == (3, 2)
+        assert app["symbols_added"] == ["parse"]
+        assert app["symbols_removed"] == ["legacy_parse"]  # run() edited in place
+
+        assert changes["src/util.py"]["status"] == "A"
+        assert changes["src/util.py"]["symbols_added"] == ["helper"]
+        assert changes["src/old.py"]["status"] == "D"
+        assert changes["src/old.py"]["symbols_removed"] == ["OldThing"]
+
+    def test_rename(self) -> None:
+        changes = summarize_bead_diff(_RENAME)
+
+        assert changes["src/core.py"]["status"] == "R"
+        assert changes["src/core.py"]["renamed_from"] == "src/app.py"
+
+    def test_empty(self) -> None:
+        assert summarize_bead_diff("") == {}
+
+
+class TestAccumulateChanges:
+    def test_merges_across_beads(self) -> None:
+        summary = accumulate_changes({}, "b-1", summarize_bead_diff(_MODIFY + _ADD))
+        summary = accumulate_changes(summary, "b-2", summarize_bead_diff(_RENAME + _DELETE))
+
+        assert "src/app.py" not in summary
+        core = summary["src/core.py"]
+        assert core["status"] == "R"
+        assert core["renamed_from"] == "src/app.py"
+        assert core["beads"] == ["b-1", "b-2"]
+        assert (core["added"], core["removed"]) == (4, 3)
+        # parse was added by b-1 then renamed away by b-2: net effect only
+        assert core["symbols_added"] == ["parse_text"]
+        assert core["symbols_removed"] == ["legacy_parse"]
+        assert summary["src/old.py"]["beads"] == ["b-2"]
+
+    def test_file_added_then_deleted_disappears(self) -> None:
+        summary = accumulate_changes({}, "b-1", summarize_bead_diff(_ADD))
+        summary = accumulate_changes(summary, "b-2", summarize_bead_diff(_DELETE_UTIL))
+
+        assert summary == {}
+
+    def test_input_not_mutated(self) -> None:
+        first = accumulate_changes({}, "b-1", summarize_bead_diff(_MODIFY))
+        snapshot = {path: dict(rec) for path, rec in first.items()}
+
+        accumulate_changes(first, "b-2", summarize_bead_diff(_MODIFY))
+
+        assert first == snapshot
+
+
+class TestRenderChangeSummary:
+    def test_deleted_listed_first(self) -> None:
+        summary = accumulate_changes({}, "b-1", summarize_bead_diff(_MODIFY + _ADD + _DELETE))
+
+        text = render_change_summary(summary)
+
+        assert text.startswith("3 file(s) changed across 1 bead(s): 1 deleted, 1 added")
+        assert text.index("Deleted:") < text.index("Added:") < text.index("Modified:")
+        assert "src/old.py +0/-2 [b-1]; drops: OldThing" in text
+        assert "defines: parse; drops: legacy_parse" in text
+
+    def test_bounded(self) -> None:
+        summary = {
+            f"src/mod_{i}.py": {
+                "status": "M",
+                "added": i,
+                "removed": 0,
+                "beads": ["b-1"],
+                "symbols_added": [],
+                "symbols_removed": [],
+                "renamed_from": "",
+            }
+            for i in range(500)
+        }
+
+        text = render_change_summary(summary, max_chars=1000)
+
+        assert len(text) <= 1000
+        assert "more file(s)" in text
+
+    def test_empty(self) -> None:
+        assert render_change_summary({}) == ""
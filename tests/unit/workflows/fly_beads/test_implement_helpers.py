@@ -70,3 +70,43 @@ class TestBuildBeadCommitMessage:
 
         msg = build_bead_commit_message("project-x.42", "Refactor authn")
         assert "Bead: project-x.42" in msg.split("\n\n", 1)[1]
+
+
+class TestImplementerPrompts:
+    """The implement and fix prompts open with their fixed instruction."""
+
+    def test_implement_prompt_keeps_bead_header_after_instruction(self) -> None:
+        import re
+
+        from maverick.workflows.fly_beads.actions import _build_implement_prompt
+
+        first = _build_implement_prompt({"bead_id": "B-1", "title": "A", "description": "x"})
+        second = _build_implement_prompt({"bead_id": "B-2", "title": "B", "description": "y"})
+
+        rendered = first.render()
+        assert rendered.startswith("Implement the work unit below.")
+        assert re.search(r"^## Bead: (\S+)", rendered, re.MULTILINE).group(1) == "B-1"  # type: ignore[union-attr]
+        assert first.cache_key("ns") == second.cache_key("ns")
+
+    async def test_fix_rounds_share_a_cacheable_prefix(self) -> None:
+        from maverick.workflows.fly_beads import actions
+
+        with patch.object(
+            actions,
+            "_call_implementer_with_escalation",
+            new_callable=AsyncMock,
+            return_value=(None, 0, ""),
+        ) as call:
+            for round_n, failure in ((1, "lint failed"), (2, "tests failed")):
+                await actions._run_fix(
+                    squadron=MagicMock(),
+                    events=MagicMock(),
+                    bead_id="B-1",
+                    phase="gate",
+                    round_n=round_n,
+                    failure_message=failure,
+                )
+
+        first, second = (c.kwargs["prompt"] for c in call.await_args_list)
+        assert "tests failed" in second.render()
+        assert first.cache_key("ns") == second.cache_key("ns")
@@ -390,3 +390,60 @@ async def test_transitively_cleared_change_is_skipped_not_escalated() -> None:
     assert new_child.await_count == 2
     assert reconciler.resolve_conflicts.await_count == 1
     assert squash.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_relist_is_scoped_to_this_rounds_conflicted_changes() -> None:
+    """After a round only descendants of the changes it touched are re-checked."""
+    p = _Patches(list_conflicts_sequence=[("c2", "c1"), ()])
+    reconciler = _make_reconciler(_resolution_payload(), _resolution_payload())
+
+    await _run_with_patches(p, reconciler, _make_answer(target_change_id="base"), max_rounds=3)
+
+    scopes = [c.kwargs["revset_scope"] for c in p.jj_list_conflicts.await_args_list]
+    assert scopes == ["descendants(base)", "descendants(c1 | c2)"]
+
+
+def _large_conflicted_file() -> str:
+    filler = [f"line {i}" for i in range(3000)]
+    return (
+        "\n".join(filler[:1000])
+        + "\n<<<<<<< Conflict 1 of 1\n%%%%%%% side 1\n-old\n+mine\n+++++++ side 2\ntheirs\n"
+        + ">>>>>>> Conflict 1 of 1 ends\n"
+        + "\n".join(filler[1000:])
+        + "\n"
+    )
+
+
+@pytest.mark.asyncio
+async def test_large_file_sent_as_hunks_and_resolution_spliced(tmp_path: Path) -> None:
+    """Large conflicted files reach the agent as excerpts; hunk answers are spliced in."""
+    content = _large_conflicted_file()
+    (tmp_path / "f.txt").write_text(content)
+    payload = SubmitConflictResolutionPayload(
+        resolved_files=("f.txt",),
+        resolved_hunks=({"path": "f.txt", "hunk": 1, "resolution": "merged"},),
+    )
+    reconciler = _make_reconciler(payload)
+    p = _Patches(list_conflicts_sequence=[("c1",), ()])
+
+    with (
+        patch(f"{CONFLICTS_MODULE}.jj_list_conflicts", p.jj_list_conflicts),
+        patch(f"{CONFLICTS_MODULE}.jj_new_child", p.jj_new_child),
+        patch(f"{CONFLICTS_MODULE}.jj_squash_into", p.jj_squash_into),
+        patch(f"{CONFLICTS_MODULE}.JjClient", return_value=p.make_client()),
+    ):
+        result = await resolve_conflicts(
+            reconciler, _make_answer(target_change_id="base"), cwd=tmp_path, max_rounds=3
+        )
+
+    assert result.resolved is True
+    shown = reconciler.resolve_conflicts.await_args.kwargs["conflicted_files"]["f.txt"]
+    assert "--- hunk 1 (lines 1001-1007) ---" in shown
+    assert "line 2500" not in shown
+    assert len(shown) < len(content) // 10
+
+    spliced = (tmp_path / "f.txt").read_text()
+    assert "<<<<<<<" not in spliced
+    assert spliced.splitlines()[1000] == "merged"
+    assert spliced.endswith("line 2999\n")
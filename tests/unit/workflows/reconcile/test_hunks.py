@@ -0,0 +1,91 @@
+"""Unit tests for conflict-hunk extraction, excerpts and splicing."""
+
+from __future__ import annotations
+
+import pytest
+
+from maverick.workflows.reconcile.hunks import (
+    extract_conflict_hunks,
+    render_conflict_excerpt,
+    splice_resolutions,
+)
+
+_JJ_CONFLICT = """\
+header
+<<<<<<< Conflict 1 of 2
+%%%%%%% Changes from base to side #1
+-a
++b
++++++++ Contents of side #2
+c
+>>>>>>> Conflict 1 of 2 ends
+middle
+<<<<<<<
+mine
+=======
+theirs
+>>>>>>>
+footer
+"""
+
+
+def test_extracts_jj_and_git_style_blocks() -> None:
+    hunks = extract_conflict_hunks(_JJ_CONFLICT)
+
+    assert [(h.index, h.start_line, h.end_line) for h in hunks] == [(1, 2, 8), (2, 10, 14)]
+    assert hunks[1].lines == ("<<<<<<<", "mine", "=======", "theirs", ">>>>>>>")
+
+
+def test_longer_markers_close_only_on_matching_length() -> None:
+    content = "<<<<<<<<<<< Conflict 1 of 1\n>>>>>>> not the end\n>>>>>>>>>>> ends\n"
+
+    (hunk,) = extract_conflict_hunks(content)
+
+    assert (hunk.start_line, hunk.end_line) == (1, 3)
+
+
+def test_unterminated_block_is_ignored() -> None:
+    assert extract_conflict_hunks("<<<<<<< Conflict 1 of 1\nmine\n") == ()
+
+
+def test_excerpt_shows_numbered_context_only() -> None:
+    content = "\n".join(f"l{i}" for i in range(1, 21)) + "\n<<<<<<<\nx\n>>>>>>>\nafter\n"
+    hunks = extract_conflict_hunks(content)
+
+    excerpt = render_conflict_excerpt(content, hunks, context_lines=2)
+
+    assert "--- hunk 1 (lines 21-23) ---" in excerpt
+    assert "19| l19" in excerpt
+    assert "l17" not in excerpt
+    assert excerpt.splitlines()[1] == "..."
+
+
+def test_splice_replaces_by_line_range_and_keeps_trailing_newline() -> None:
+    hunks = extract_conflict_hunks(_JJ_CONFLICT)
+
+    spliced = splice_resolutions(_JJ_CONFLICT, hunks, {1: "b\nc", 2: "ours"})
+
+    assert spliced == "header\nb\nc\nmiddle\nours\nfooter\n"
+
+
+def test_splice_leaves_unanswered_hunks() -> None:
+    hunks = extract_conflict_hunks(_JJ_CONFLICT)
+
+    spliced = splice_resolutions(_JJ_CONFLICT, hunks, {2: "ours"})
+
+    assert extract_conflict_hunks(spliced)[0].lines == hunks[0].lines
+
+
+def test_splice_rejects_unknown_hunk() -> None:
+    with pytest.raises(ValueError, match="3"):
+        splice_resolutions(_JJ_CONFLICT, extract_conflict_hunks(_JJ_CONFLICT), {3: "x"})
+
+
+def test_splice_keeps_untouched_line_endings() -> None:
+    content = "a\r\nb\x0cpage\r\n<<<<<<< Conflict 1 of 1\r\nx\r\n>>>>>>> ends\ntail\r\n"
+    (hunk,) = extract_conflict_hunks(content)
+
+    assert (hunk.start_line, hunk.end_line) == (3, 5)
+    assert hunk.lines == ("<<<<<<< Conflict 1 of 1", "x", ">>>>>>> ends")
+    spliced = splice_resolutions(content, (hunk,), {1: "one\ntwo"})
+    assert spliced == "a\r\nb\x0cpage\r\none\r\ntwo\ntail\r\n"
@@ -364,3 +364,58 @@ async def test_missing_supplied_id_in_response_treated_as_dependent_false() -> N
     assert result.completed is True
     assert result.fixed_descendants == ()
     apply_correction_mock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_commit_reuses_cached_diff_across_rounds() -> None:
+    """A descendant whose commit id did not change is not re-diffed next round."""
+    reconciler = AsyncMock()
+    semantic = _make_semantic_agent(
+        _payload(_finding("d1", dependent=True)),
+        _payload(_finding("d1", dependent=False)),
+    )
+    no_change = CorrectionResult(applied=True, no_change_required=True, correction_diff="")
+    diff_mock = _diff_side_effect()
+
+    with (
+        patch.object(JjClient, "log", new=AsyncMock(return_value=_log_result("d1", "d2"))),
+        patch(f"{SEMANTIC_MODULE}.jj_diff", new=diff_mock),
+        patch(f"{SEMANTIC_MODULE}.apply_correction", new=AsyncMock(return_value=no_change)),
+    ):
+        result = await run_semantic_pass(
+            reconciler, semantic, _answer(), "diff", cwd=Path("/repo"), max_rounds=3
+        )
+
+    assert result.completed is True
+    assert sorted(call.kwargs["revision"] for call in diff_mock.await_args_list) == ["d1", "d2"]
+    round1_call, round2_call = semantic.analyze.await_args_list
+    assert round2_call.kwargs["descendants"][0] == round1_call.kwargs["descendants"][0]
+
+
+@pytest.mark.asyncio
+async def test_rewritten_commit_is_rediffed() -> None:
+    """A fix that rewrites the descendant's commit invalidates its cached diff."""
+    reconciler = AsyncMock()
+    semantic = _make_semantic_agent(
+        _payload(_finding("d1", dependent=True)),
+        _payload(_finding("d1", dependent=False)),
+    )
+    applied = CorrectionResult(applied=True, no_change_required=False, correction_diff="d")
+    rewritten = JjLogResult(
+        success=True,
+        output="",
+        changes=(JjChangeInfo(change_id="d1", commit_id="d1rewritten", description="d1"),),
+    )
+    diff_mock = _diff_side_effect()
+
+    with (
+        patch.object(JjClient, "log", new=AsyncMock(side_effect=[_log_result("d1"), rewritten])),
+        patch(f"{SEMANTIC_MODULE}.jj_diff", new=diff_mock),
+        patch(f"{SEMANTIC_MODULE}.apply_correction", new=AsyncMock(return_value=applied)),
+    ):
+        result = await run_semantic_pass(
+            reconciler, semantic, _answer(), "diff", cwd=Path("/repo"), max_rounds=3
+        )
+
+    assert result.completed is True
+    assert [call.kwargs["revision"] for call in diff_mock.await_args_list] == ["d1", "d1"]
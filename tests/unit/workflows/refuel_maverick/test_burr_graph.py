@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
+from burr.core import State
+
 from maverick.burr import BurrWorkflowDriver
 from maverick.events import (
     AgentCompleted,
@@ -19,6 +21,7 @@ from maverick.events import (
     StepCompleted,
     StepStarted,
 )
+from maverick.hedging import HedgePolicy, Hedger
 from maverick.library.actions.types import BeadCreationResult, DependencyWiringResult
 from maverick.payloads import (
     AcceptanceCriterionPayload,
@@ -32,9 +35,15 @@ from maverick.payloads import (
     SubmitStructuralistBriefPayload,
     WorkUnitDetailPayload,
     WorkUnitOutlinePayload,
+    dump_supervisor_payload,
 )
 from maverick.squadron.tiers import DEFAULT_TIER
-from maverick.workflows.refuel_maverick.actions import CACHE_SCHEMA_VERSION
+from maverick.workflows.refuel_maverick.actions import (
+    CACHE_SCHEMA_VERSION,
+    _plan_detail_batches,
+    detail_fan_out,
+    parallel_briefings,
+)
 from maverick.workflows.refuel_maverick.burr_graph import (
     REFUEL_TERMINAL_ACTIONS,
     build_refuel_application,
@@ -117,6 +126,7 @@ class _StubDecomposerPool:
         self._agent = agent
         self.acquire_calls: list[str] = []
         self.release_calls: list[str] = []
+        self.prewarm_calls: list[str] = []
 
     async def acquire(self, tier: str) -> StubDecomposerAgent:
         self.acquire_calls.append(tier)
@@ -125,6 +135,9 @@ class _StubDecomposerPool:
     async def release(self, agent: StubDecomposerAgent, tier: str) -> None:
         self.release_calls.append(tier)
 
+    def start_prewarm(self, tier: str) -> None:
+        self.prewarm_calls.append(tier)
+
     async def set_context(self, *args: Any, **kwargs: Any) -> None:
         return None
 
@@ -951,6 +964,148 @@ class TestRefuelBurrCacheReadBack:
         assert {d["id"] for d in state["accumulated_details"]} == {"u-1"}
 
 
+class TestRefuelDetailBatching:
+    """Pending units share detail requests; unanswered units are re-split."""
+
+    @staticmethod
+    async def _fan_out(
+        squadron: StubRefuelSquadron, outline: SubmitOutlinePayload, **kwargs: Any
+    ) -> State:
+        _, state = await detail_fan_out(
+            State(
+                {
+                    "raw_content": "# Plan",
+                    "outline": dump_supervisor_payload(outline),
+                    "cached_details": {},
+                }
+            ),
+            squadron=squadron,  # type: ignore[arg-type]
+            events=asyncio.Queue(),
+            **kwargs,
+        )
+        return state
+
+    async def test_small_units_share_one_request(self) -> None:
+        unit_ids = ("u-1", "u-2", "u-3", "u-4")
+        outline = _make_outline(unit_ids=unit_ids)
+        squadron = StubRefuelSquadron(
+            outline_payload=outline, detail_payloads=[_make_details(unit_ids)]
+        )
+
+        state = await self._fan_out(squadron, outline, pool_size=1)
+
+        assert [c[1]["unit_ids"] for c in squadron._decomposer.calls if c[0] == "detail"] == [
+            unit_ids
+        ]
+        assert sorted(d["id"] for d in state["accumulated_details"]) == list(unit_ids)
+        assert state["abandoned_unit_ids"] == []
+
+    async def test_unanswered_units_are_split_and_retried(self) -> None:
+        unit_ids = ("u-1", "u-2", "u-3", "u-4")
+        outline = _make_outline(unit_ids=unit_ids)
+        squadron = StubRefuelSquadron(
+            outline_payload=outline,
+            detail_payloads=[
+                _make_details(("u-1", "u-2")),
+                _make_details(("u-3",)),
+                _make_details(("u-4",)),
+            ],
+        )
+
+        state = await self._fan_out(squadron, outline, pool_size=1)
+
+        requests = [c[1]["unit_ids"] for c in squadron._decomposer.calls if c[0] == "detail"]
+        assert requests == [unit_ids, ("u-3",), ("u-4",)]
+        assert sorted(d["id"] for d in state["accumulated_details"]) == list(unit_ids)
+
+    async def test_straggling_request_is_hedged(self) -> None:
+        outline = _make_outline(unit_ids=("u-1",))
+        squadron = StubRefuelSquadron(outline_payload=outline)
+        original_detail = squadron._decomposer.detail
+        calls = {"n": 0}
+
+        async def _first_stalls(**kwargs: Any) -> SubmitDetailsPayload:
+            calls["n"] += 1
+            if calls["n"] == 1:
+                await asyncio.sleep(30)
+            return await original_detail(**kwargs)
+
+        squadron._decomposer.detail = _first_stalls  # type: ignore[assignment]
+        hedger = Hedger(HedgePolicy(min_samples=1))
+        hedger.tracker.record("detail/1", 0.01)
+
+        state = await self._fan_out(squadron, outline, pool_size=1, hedger=hedger)
+
+        assert [d["id"] for d in state["accumulated_details"]] == ["u-1"]
+        assert hedger.hedges_won == 1
+        # The cancelled leg's decomposer rotates before its next use.
+        assert squadron._decomposer.rotate_calls == 1
+
+    def test_planner_keeps_enough_batches_for_the_pool(self) -> None:
+        units = [{"id": f"u-{i}"} for i in range(6)]
+
+        assert _plan_detail_batches(units, max_units=4, min_batches=3) == [
+            ("u-0", "u-1"),
+            ("u-2", "u-3"),
+            ("u-4", "u-5"),
+        ]
+        assert len(_plan_detail_batches(units, max_units=1, min_batches=1)) == 6
+
+    def test_planner_groups_dependents_with_their_dependency(self) -> None:
+        units = [
+            {"id": "a"},
+            {"id": "b"},
+            {"id": "c"},
+            {"id": "d", "depends_on": ["a"]},
+        ]
+
+        assert _plan_detail_batches(units, max_units=2, min_batches=2) == [
+            ("a", "d"),
+            ("b", "c"),
+        ]
+
+    def test_planner_splits_on_token_budget(self) -> None:
+        units = [{"id": "big", "task": "x " * 1000}, {"id": "small"}]
+
+        assert _plan_detail_batches(units, max_units=4, min_batches=1, token_budget=2500) == [
+            ("big",),
+            ("small",),
+        ]
+
+
+class TestRefuelBriefingHedging:
+    async def test_last_straggler_is_hedged_under_the_default_policy(self) -> None:
+        squadron = StubRefuelSquadron()
+        build = squadron.build_briefing_agent
+
+        def _recon_stalls_once(*, agent_name: str, result_model: Any) -> StubBriefingAgent:
+            agent = build(agent_name=agent_name, result_model=result_model)
+            if agent_name == "recon" and len(squadron.built_briefings) <= 3:
+                brief = agent.brief
+
+                async def _stall(prompt: str) -> Any:
+                    await asyncio.sleep(30)
+                    return await brief(prompt)
+
+                agent.brief = _stall  # type: ignore[method-assign]
+            return agent
+
+        squadron.build_briefing_agent = _recon_stalls_once  # type: ignore[method-assign]
+        # Three briefings per run can never meet the default min_samples=3.
+        hedger = Hedger(HedgePolicy())
+
+        _, state = await parallel_briefings(
+            State({"briefing_prompt": "x", "provider_labels": {}, "briefs": {}}),
+            squadron=squadron,  # type: ignore[arg-type]
+            events=asyncio.Queue(),
+            max_concurrent=3,
+            hedger=hedger,
+        )
+
+        assert hedger.hedges_won == 1
+        assert len(state["briefs"]) == 3
+
+
 class TestRefuelBurrQuotaHandling:
     """Provider quota aborts the run; it does not walk the tier ladder (#135).
 
@@ -1096,12 +1251,11 @@ class TestRefuelBurrQuotaHandling:
         cache_dir = tmp_path / "refuel-cache"
         squadron = StubRefuelSquadron(outline_payload=outline)
         original_detail = squadron._decomposer.detail
-        seen: list[str] = []
+        requests: list[tuple[str, ...]] = []
 
         async def _one_then_quota(**kwargs: Any) -> SubmitDetailsPayload:
-            unit_ids = kwargs.get("unit_ids") or ()
-            seen.extend(unit_ids)
-            if len(seen) > 1:
+            requests.append(tuple(kwargs.get("unit_ids") or ()))
+            if len(requests) > 1:
                 _raise_budget("you have no quota left")
             return await original_detail(**kwargs)
 
@@ -1109,7 +1263,8 @@ class TestRefuelBurrQuotaHandling:
 
         from maverick.exceptions.quota import ProviderQuotaError
 
-        # pool_size=1 so the two units are strictly ordered.
+        # pool_size=1 so both units share one batch; the stub answers it
+        # for u-1 only, and the follow-up request for u-2 hits the limit.
         exc = await self._run_expecting_quota(
             squadron, tmp_path, cache_dir=str(cache_dir), decomposer_pool_size=1
         )
@@ -1120,6 +1275,7 @@ class TestRefuelBurrQuotaHandling:
         # ...and the half that did complete survived the abort.
         cached = sorted(p.name for p in (cache_dir / "details").glob("*.json"))
         assert cached == ["u-1.json"]
+        assert requests == [("u-1", "u-2"), ("u-2",)]
 
 
 class TestRefuelBurrGraphValidationLoop:
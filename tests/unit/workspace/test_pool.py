@@ -0,0 +1,192 @@
+"""Unit tests for the warm workspace pool.
+
+The `JjClient` is mocked (no subprocess, matching `tests/unit/jj/`);
+`workspace_add` creates the target directory so the pool's filesystem
+renames run for real under `tmp_path`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from maverick.exceptions import JjError
+from maverick.jj.client import JjClient
+from maverick.workspace import IsolationPolicy, UnitOfWork
+from maverick.workspace.lifecycle import provision, teardown, workspace_root
+from maverick.workspace.pool import POOL_KEY_PREFIX, WorkspacePool
+
+
+def _checkout_client() -> AsyncMock:
+    client = AsyncMock(spec=JjClient)
+
+    async def _add(target: Path, revision: str | None = None) -> Path:
+        target.mkdir(parents=True)
+        return target
+
+    client.workspace_add.side_effect = _add
+    client.log.return_value = SimpleNamespace(changes=[SimpleNamespace(commit_id="c0ffee")])
+    return client
+
+
+def _pool(tmp_path: Path, client: AsyncMock, size: int = 2) -> WorkspacePool:
+    return WorkspacePool(
+        checkout=tmp_path / "repo",
+        policy=IsolationPolicy(workflow="fly", root=tmp_path / "ws"),
+        jj_client=client,
+        size=size,
+    )
+
+
+def _root(pool_: WorkspacePool) -> Path:
+    return workspace_root(root=pool_._policy.root, checkout=pool_._checkout, workflow="fly")
+
+
+async def _settle(pool_: WorkspacePool) -> None:
+    for _ in range(20):
+        await asyncio.sleep(0)
+    if pool_._fill_task is not None:
+        await pool_._fill_task
+
+
+@pytest.fixture
+def workspace_clients():
+    """Patch the per-workspace `JjClient(cwd=...)` the pool constructs."""
+    created: list[AsyncMock] = []
+
+    def _factory(*, cwd: Path) -> AsyncMock:
+        client = AsyncMock(spec=JjClient)
+        client.cwd = cwd
+        created.append(client)
+        return client
+
+    with patch("maverick.workspace.pool.JjClient", side_effect=_factory):
+        yield created
+
+
+async def test_start_fills_in_background(tmp_path: Path) -> None:
+    client = _checkout_client()
+    pool_ = _pool(tmp_path, client)
+
+    await pool_.start()
+    await _settle(pool_)
+
+    assert pool_.idle_count == 2
+    names = sorted(p.name for p in _root(pool_).iterdir())
+    assert all(name.startswith(POOL_KEY_PREFIX) for name in names)
+    assert client.workspace_add.await_count == 2
+
+
+async def test_start_adopts_leftovers_and_trims_extras(tmp_path: Path) -> None:
+    client = _checkout_client()
+    pool_ = _pool(tmp_path, client, size=1)
+    for suffix in ("a", "b"):
+        (_root(pool_) / f"{POOL_KEY_PREFIX}{suffix}").mkdir(parents=True)
+
+    await pool_.start()
+    await _settle(pool_)
+
+    assert pool_.idle_count == 1
+    client.workspace_add.assert_not_awaited()
+    client.workspace_forget.assert_awaited_once_with(f"{POOL_KEY_PREFIX}b")
+    assert not (_root(pool_) / f"{POOL_KEY_PREFIX}b").exists()
+
+
+async def test_provision_claims_idle_workspace(tmp_path: Path, workspace_clients) -> None:
+    client = _checkout_client()
+    pool_ = _pool(tmp_path, client, size=1)
+    await pool_.start()
+    await _settle(pool_)
+    client.workspace_add.reset_mock()
+    unit = UnitOfWork(key="bead-1", label="bead-1")
+
+    path = await provision(
+        checkout=pool_._checkout, policy=pool_._policy, unit=unit, jj_client=client, pool=pool_
+    )
+
+    assert path == _root(pool_) / "bead-1"
+    assert path.is_dir()
+    ws_client = workspace_clients[0]
+    ws_client.workspace_rename.assert_awaited_once_with("bead-1")
+    ws_client.new.assert_awaited_once_with(parents=["c0ffee"])
+    # Provisioning itself never waited on `workspace_add`; only the refill did.
+    await _settle(pool_)
+    assert client.workspace_add.await_count == 1
+    assert pool_.idle_count == 1
+
+
+async def test_provision_falls_back_when_pool_is_empty(tmp_path: Path) -> None:
+    client = _checkout_client()
+    pool_ = _pool(tmp_path, client, size=0)
+    unit = UnitOfWork(key="bead-1", label="bead-1")
+
+    path = await provision(
+        checkout=pool_._checkout, policy=pool_._policy, unit=unit, jj_client=client, pool=pool_
+    )
+
+    client.workspace_add.assert_awaited_once_with(path, revision="@")
+
+
+async def test_failed_claim_cleans_up_and_falls_back(tmp_path: Path, workspace_clients) -> None:
+    client = _checkout_client()
+    pool_ = _pool(tmp_path, client, size=1)
+    await pool_.start()
+    await _settle(pool_)
+    await pool_.close()
+    (pool_key,) = [p.name for p in _root(pool_).iterdir()]
+    unit = UnitOfWork(key="bead-1", label="bead-1")
+
+    with patch("maverick.workspace.pool.JjClient") as factory:
+        factory.return_value.workspace_rename = AsyncMock(side_effect=JjError("name taken"))
+        factory.return_value.workspace_update_stale = AsyncMock()
+        path = await provision(
+            checkout=pool_._checkout,
+            policy=pool_._policy,
+            unit=unit,
+            jj_client=client,
+            pool=pool_,
+        )
+
+    assert path.is_dir()
+    client.workspace_forget.assert_any_await(pool_key)
+    assert client.workspace_add.await_args.args == (path,)
+    assert [p.name for p in _root(pool_).iterdir()] == ["bead-1"]
+
+
+async def test_teardown_returns_workspace_to_pool(tmp_path: Path, workspace_clients) -> None:
+    client = _checkout_client()
+    pool_ = _pool(tmp_path, client, size=1)
+    unit = UnitOfWork(key="bead-1", label="bead-1")
+    (_root(pool_) / "bead-1").mkdir(parents=True)
+
+    await teardown(
+        checkout=pool_._checkout, policy=pool_._policy, unit=unit, jj_client=client, pool=pool_
+    )
+
+    assert pool_.idle_count == 1
+    (name,) = [p.name for p in _root(pool_).iterdir()]
+    assert name.startswith(POOL_KEY_PREFIX)
+    workspace_clients[0].workspace_rename.assert_awaited_once_with(name)
+    client.workspace_forget.assert_not_awaited()
+
+
+async def test_teardown_deletes_when_pool_is_full(tmp_path: Path, workspace_clients) -> None:
+    client = _checkout_client()
+    pool_ = _pool(tmp_path, client, size=1)
+    await pool_.start()
+    await _settle(pool_)
+    unit = UnitOfWork(key="bead-1", label="bead-1")
+    (_root(pool_) / "bead-1").mkdir(parents=True)
+
+    await teardown(
+        checkout=pool_._checkout, policy=pool_._policy, unit=unit, jj_client=client, pool=pool_
+    )
+
+    assert pool_.idle_count == 1
+    assert not (_root(pool_) / "bead-1").exists()
+    client.workspace_forget.assert_awaited_once_with("bead-1")
+    assert workspace_clients == []